@@ -0,0 +1,14 @@
+# Function to run all benchmarks
+def run():
+    import benchmarks.bench_type_check as bench_type_check
+    import benchmarks.bench_prepare_svg as bench_prepare_svg
+    import benchmarks.bench_render as bench_render
+    import benchmarks.bench_hot_paths as bench_hot_paths
+    import benchmarks.bench_compress as bench_compress
+
+    results = {'type_check': bench_type_check.run(), 'prepare_svg': bench_prepare_svg.run(),
+               'render': bench_render.run(), 'hot_paths': bench_hot_paths.run(), 'compress': bench_compress.run()}
+    return results
+
+if __name__ == '__main__':
+    run()
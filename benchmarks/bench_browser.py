@@ -0,0 +1,170 @@
+import os
+import shutil
+import statistics
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.bench_hot_paths import gen_meta, save_results
+from benchmarks.model_generator import ModelInputs
+
+# Model sizes of increasing element count and frame count
+_cases = {
+    'small': {'n_elements': 10, 'n_frames': 100, 'grid': 5, 'n_svg_nodes': 100},
+    'medium': {'n_elements': 50, 'n_frames': 1000, 'grid': 10, 'n_svg_nodes': 1000},
+    'large': {'n_elements': 200, 'n_frames': 1000, 'grid': 20, 'n_svg_nodes': 5000},
+    'long': {'n_elements': 50, 'n_frames': 20000, 'grid': 10, 'n_svg_nodes': 1000},
+    'xlarge': {'n_elements': 200, 'n_frames': 20000, 'grid': 40, 'n_svg_nodes': 20000},
+}
+# Seconds to wait for a page to draw its first frame
+_load_timeout = 300
+_n_updates = 100
+
+# Page load and initialization timings (ms since navigation start) from the Navigation Timing API and the
+# performance marks of ssv_main - marks are null for bundles built before they were added
+_timings_script = """
+    var mark = function(name) {
+        var entries = performance.getEntriesByName(name, "mark");
+        return entries.length ? entries[0].startTime : null;
+    };
+    var navigation = performance.getEntriesByType("navigation")[0];
+    return {
+        dom_content_loaded_ms: navigation ? navigation.domContentLoadedEventEnd : null,
+        load_ms: navigation ? navigation.loadEventEnd : null,
+        init_start_ms: mark("ssv-init-start"),
+        elements_ready_ms: mark("ssv-elements-ready"),
+        first_frame_ms: mark("ssv-first-frame")
+    };
+"""
+
+# Step through n frames and return the duration of each update_elements call and of each animation frame
+# (update, style, layout and paint) in ms
+_updates_script = """
+    var n = arguments[0], done = arguments[arguments.length - 1];
+    var context = ssv.get_element_context ?
+        ssv.get_element_context(document.querySelector(".ssv-panel").id) : null;
+    if (!context || !context.controls) {
+        done(null);
+        return;
+    }
+    var n_x = context.controls.x_series.length, update = [], frame = [], i = 0, last = performance.now();
+    var step = function() {
+        var start = performance.now();
+        context.update_elements((i * 7919) % n_x, 0);
+        update.push(performance.now() - start);
+        requestAnimationFrame(function() {
+            var now = performance.now();
+            frame.push(now - last);
+            last = now;
+            if (++i < n) {
+                step();
+            } else {
+                done({update: update, frame: frame});
+            }
+        });
+    };
+    step();
+"""
+
+# JS heap after garbage collection (performance.memory is Chrome-only)
+_heap_script = """
+    if (window.gc) {
+        window.gc();
+    }
+    return performance.memory ? {used: performance.memory.usedJSHeapSize, total: performance.memory.totalJSHeapSize}
+        : null;
+"""
+
+
+def gen_cases():
+    return {case: dict(params) for case, params in _cases.items()}
+
+
+def create_driver():
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    # Unquantized heap sizes and an exposed garbage collector
+    options.add_argument('--enable-precise-memory-info')
+    options.add_argument('--js-flags=--expose-gc')
+    options.add_argument('--window-size=1600,1000')
+    return webdriver.Chrome(options=options)
+
+
+def _summarize(durations):
+    if not durations:
+        return None
+
+    durations = sorted(durations)
+    return {'mean_ms': statistics.mean(durations), 'median_ms': statistics.median(durations),
+            'p95_ms': durations[int(0.95 * (len(durations) - 1))], 'max_ms': durations[-1]}
+
+
+# Load a page and return its timings, update durations and heap size
+def measure_page(driver, path, n_updates=_n_updates, timeout=_load_timeout):
+    driver.get('file:///' + os.path.abspath(path).lstrip('/'))
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script(
+        'return document.readyState == "complete" && (performance.getEntriesByName("ssv-first-frame").length > 0 '
+        '|| !window.ssv || !ssv.get_element_context || document.body.hasAttribute("JSError"))'))
+
+    js_error = driver.execute_script('return document.body.getAttribute("JSError")')
+    if js_error is not None:
+        raise RuntimeError('JS error in %s: %s' % (path, js_error))
+
+    timings = driver.execute_script(_timings_script)
+    if timings['init_start_ms'] is not None and timings['first_frame_ms'] is not None:
+        timings['init_ms'] = timings['first_frame_ms'] - timings['init_start_ms']
+    else:
+        timings['init_ms'] = None
+
+    driver.set_script_timeout(timeout)
+    updates = driver.execute_async_script(_updates_script, n_updates) or {}
+    heap = driver.execute_script(_heap_script)
+
+    return {'timings': timings, 'update': _summarize(updates.get('update')),
+            'frame': _summarize(updates.get('frame')),
+            'js_heap_mb': heap['used'] / 1e6 if heap else None, 'page_mb': os.path.getsize(path) / 1e6}
+
+
+def run_case(driver, params, n_updates=_n_updates, **kwargs):
+    out_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(out_dir, 'model.html')
+        ModelInputs(**params).build().save_visualization(path, **kwargs)
+        return measure_page(driver, path, n_updates)
+    finally:
+        shutil.rmtree(out_dir)
+
+
+def run(cases=None, n_updates=_n_updates, save=True, driver=None, **kwargs):
+    cases = gen_cases() if cases is None else cases
+    own_driver = driver is None
+    driver = create_driver() if own_driver else driver
+
+    results = {'meta': dict(gen_meta(), browser=driver.capabilities.get('browserName'),
+                            browser_version=driver.capabilities.get('browserVersion'), render_kwargs=kwargs),
+               'cases': {}}
+    fmt = lambda value, spec='%9.1f': spec % value if value is not None else '%9s' % '-'
+
+    print('Browser page load and update (ms / MB):')
+    try:
+        for case, params in cases.items():
+            metrics = run_case(driver, params, n_updates, **kwargs)
+            results['cases'][case] = dict(params=params, **metrics)
+            timings, update, frame = metrics['timings'], metrics['update'] or {}, metrics['frame'] or {}
+            print('  %s %s' % (case, params))
+            print('    first frame %s  init %s  load %s  update %s (p95 %s)  frame %s  heap %s  page %s' % (
+                fmt(timings['first_frame_ms']), fmt(timings['init_ms']), fmt(timings['load_ms']),
+                fmt(update.get('mean_ms'), '%7.2f'), fmt(update.get('p95_ms'), '%7.2f'),
+                fmt(frame.get('mean_ms'), '%7.2f'), fmt(metrics['js_heap_mb']), fmt(metrics['page_mb'])))
+    finally:
+        if own_driver:
+            driver.quit()
+
+    if save:
+        print('Results saved to %s' % save_results(results, 'browser'))
+
+    return results
+
+if __name__ == '__main__':
+    run()
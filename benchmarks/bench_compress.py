@@ -0,0 +1,86 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from ssv import SSV
+
+_svg_path = os.path.join('tests', 'data', 'good_svg.svg')
+_payloads = [(payload, compress) for payload in ['json', 'binary'] for compress in [None, 'gzip', 'deflate']]
+
+# Time (ms) the page spent decoding element data (base64, binary payload, decompression and shared array store)
+# as recorded by the perf overlay
+_decode_script = """
+    var context = ssv.get_element_context(document.querySelector(".ssv-panel").id);
+    return context.perf ? context.perf.decode_ms : null;
+"""
+
+
+# Build a model of n_frames with a few float series and a 20 x 20 heatmap
+def gen_vis(n_frames):
+    with contextlib.redirect_stdout(io.StringIO()):
+        vis = SSV.create_vis(np.arange(n_frames) * 0.5, 's', _svg_path)
+        element = vis.add_element('cell', 'x')
+        for i in range(3):
+            element.add_condition('background', np.cumsum(np.random.randn(n_frames)), ['#FFFFFF', '#000000'],
+                                  [-100, 100], report=False)
+        heatmap = vis.add_element('heatmap', 'tank-1')
+        heatmap.add_condition('rect', np.random.rand(n_frames, 20, 20).round(3), ['#FFFFFF', '#000000'], [0, 1])
+
+    return vis
+
+
+# Return size (MB) and render time (ms) of the rendered page for each payload and compression combination
+def run(n_frames=5000):
+    vis = gen_vis(n_frames)
+    results = {}
+    for payload, compress in _payloads:
+        start = time.perf_counter()
+        html = vis.render_model(mode='html', payload=payload, compress=compress)
+        results['%s_%s' % (payload, compress or 'plain')] = (len(html.encode('utf-8')) / 1e6,
+                                                             (time.perf_counter() - start) * 1e3)
+
+    print('render_model page size and render time, %d frames:' % n_frames)
+    for k, (size, ms) in results.items():
+        print('  %-16s %8.2f MB %10.1f ms' % (k, size, ms))
+
+    return results
+
+
+# Return load, decode and first frame times (ms) of the saved page in a browser for each payload and compression
+# combination (pages are rendered with the perf overlay, which times decoding)
+def run_browser(n_frames=5000, driver=None):
+    from benchmarks.bench_browser import create_driver, measure_page
+
+    vis = gen_vis(n_frames)
+    own_driver = driver is None
+    driver = create_driver() if own_driver else driver
+    out_dir = tempfile.mkdtemp()
+    results = {}
+    try:
+        for payload, compress in _payloads:
+            path = os.path.join(out_dir, '%s_%s.html' % (payload, compress or 'plain'))
+            vis.save_visualization(path, payload=payload, compress=compress, perf_overlay=True)
+            timings = measure_page(driver, path, n_updates=1)['timings']
+            results['%s_%s' % (payload, compress or 'plain')] = (timings['load_ms'], driver.execute_script(
+                _decode_script), timings['first_frame_ms'])
+    finally:
+        shutil.rmtree(out_dir)
+        if own_driver:
+            driver.quit()
+
+    fmt = lambda value: '%10.1f' % value if value is not None else '%10s' % '-'
+    print('Browser page load, decode and first frame time (ms), %d frames:' % n_frames)
+    for k, (load_ms, decode_ms, first_frame_ms) in results.items():
+        print('  %-16s load %s  decode %s  first frame %s' % (k, fmt(load_ms), fmt(decode_ms), fmt(first_frame_ms)))
+
+    return results
+
+
+if __name__ == '__main__':
+    run()
+    run_browser()
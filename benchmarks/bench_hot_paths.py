@@ -0,0 +1,155 @@
+import datetime
+import glob
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.model_generator import ModelInputs
+
+_results_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+_results_file = '%s-%s.json'
+# Phases that take this much longer (or peak this much more memory) than the stored baseline are regressions,
+# unless the difference is below the noise floor of the measurement
+_regression_ratio = 1.2
+_noise_floor = {'time_s': 0.005, 'peak_mb': 1.0}
+
+# Model sizes - each case changes one parameter of the baseline model
+_baseline = {'n_elements': 50, 'n_frames': 1000, 'grid': 10, 'n_svg_nodes': 1000}
+_sweeps = {'n_elements': [10, 200], 'n_frames': [100, 10000], 'grid': [5, 40], 'n_svg_nodes': [5000, 40000]}
+
+
+def gen_cases():
+    cases = {'baseline': dict(_baseline)}
+    for param, values in _sweeps.items():
+        for value in values:
+            cases['%s_%d' % (param, value)] = dict(_baseline, **{param: value})
+
+    return cases
+
+
+# Phases of building and rendering a model as (setup, run) pairs - setup output is passed to run and
+# is neither timed nor traced
+def _phases(inputs, out_dir):
+    def prepared():
+        vis = inputs.build()
+        vis._prepare_svg()
+        return vis
+
+    return {
+        'vis_init': (inputs.copy_svg, inputs.create_vis),
+        'add_elements': (inputs.create_vis, inputs.add_elements),
+        'prepare_svg': (inputs.build, lambda vis: vis._prepare_svg()),
+        'render_model': (prepared, lambda vis: vis.render_model()),
+        'save_visualization': (prepared, lambda vis: vis.save_visualization(os.path.join(out_dir, 'model.html'))),
+    }
+
+
+# Return best-of-repeat time (s) and peak traced memory (MB) of a phase
+def measure(setup, run, repeat=3):
+    times = []
+    for i in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        times.append(time.perf_counter() - start)
+
+    # Tracing slows down allocations, so memory is measured in a separate run
+    arg = setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        run(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'time_s': min(times), 'peak_mb': peak / 1e6}
+
+
+def run_case(params, repeat=3):
+    inputs = ModelInputs(**params)
+    out_dir = tempfile.mkdtemp()
+    try:
+        return {name: measure(setup, run, repeat) for name, (setup, run) in _phases(inputs, out_dir).items()}
+    finally:
+        shutil.rmtree(out_dir)
+
+
+# Return the stored results of the latest run of a benchmark (None if no results are stored)
+def load_baseline(name='hot_paths', results_dir=_results_dir):
+    paths = sorted(glob.glob(os.path.join(results_dir, _results_file % (name, '*'))))
+    if not paths:
+        return None
+
+    with open(paths[-1]) as f:
+        return json.load(f)
+
+
+def save_results(results, name='hot_paths', results_dir=_results_dir):
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, _results_file % (name, results['meta']['timestamp']))
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    return path
+
+
+# Return (case, phase, metric, baseline, current) of measurements that regressed from the baseline results
+def compare(results, baseline, ratio=_regression_ratio):
+    regressions = []
+    for case, phases in results['cases'].items():
+        baseline_phases = baseline['cases'].get(case, {}).get('phases', {})
+        for phase, metrics in phases['phases'].items():
+            for metric, value in metrics.items():
+                baseline_value = baseline_phases.get(phase, {}).get(metric)
+                if baseline_value and value > baseline_value * ratio and \
+                        value - baseline_value > _noise_floor.get(metric, 0):
+                    regressions.append((case, phase, metric, baseline_value, value))
+
+    return regressions
+
+
+def gen_meta():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+
+    return {'timestamp': datetime.datetime.now().strftime('%Y%m%d-%H%M%S'), 'commit': commit,
+            'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform()}
+
+
+def run(cases=None, repeat=3, save=True):
+    cases = gen_cases() if cases is None else cases
+    results = {'meta': gen_meta(), 'cases': {}}
+
+    print('Build and render hot paths (time s / peak memory MB):')
+    for case, params in cases.items():
+        phases = run_case(params, repeat)
+        results['cases'][case] = {'params': params, 'phases': phases}
+        print('  %s %s' % (case, params))
+        for phase, metrics in phases.items():
+            print('    %-20s %9.4f s %9.2f MB' % (phase, metrics['time_s'], metrics['peak_mb']))
+
+    if save:
+        baseline = load_baseline()
+        if baseline is not None:
+            regressions = compare(results, baseline)
+            print('Regressions vs. %s (commit %s): %d' % (baseline['meta']['timestamp'], baseline['meta']['commit'],
+                                                           len(regressions)))
+            for case, phase, metric, baseline_value, value in regressions:
+                print('  %-24s %-20s %-8s %9.4f -> %9.4f' % (case, phase, metric, baseline_value, value))
+        print('Results saved to %s' % save_results(results))
+
+    return results
+
+if __name__ == '__main__':
+    run()
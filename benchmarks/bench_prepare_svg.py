@@ -0,0 +1,45 @@
+import contextlib
+import io
+import time
+import xml.etree.ElementTree as ET
+
+from ssv import SSV
+
+_svg_namespace = 'http://www.w3.org/2000/svg'
+
+
+# Build a synthetic svg layout with n_paths paths spread over groups of group_size paths
+def gen_svg(n_paths, group_size=50):
+    root = ET.Element('{%s}svg' % _svg_namespace, {'viewBox': '0 0 1000 1000'})
+    layer = ET.SubElement(root, '{%s}g' % _svg_namespace, {'id': 'layer1'})
+    for i in range(0, n_paths, group_size):
+        group = ET.SubElement(layer, '{%s}g' % _svg_namespace, {'id': 'group-%d' % i})
+        for j in range(i, min(i + group_size, n_paths)):
+            ET.SubElement(group, '{%s}path' % _svg_namespace, {'id': 'path-%d' % j, 'd': 'M 0,0 L 1,1'})
+
+    return root
+
+
+# Time Vis._prepare_svg for a layout of n_paths with every bind_every-th path bound to an element
+def time_prepare_svg(n_paths, bind_every=10):
+    with contextlib.redirect_stdout(io.StringIO()):
+        vis = SSV.create_vis([0, 1], 's', gen_svg(n_paths))
+        for i in range(0, n_paths, bind_every):
+            vis.add_element('cell', 'path-%d' % i)
+
+        start = time.perf_counter()
+        vis._prepare_svg()
+        return time.perf_counter() - start
+
+
+def run(sizes=(1000, 5000, 10000, 20000, 40000)):
+    results = {n: time_prepare_svg(n) for n in sizes}
+
+    print('Vis._prepare_svg time (10% of paths bound):')
+    for n, t in results.items():
+        print('  %6d paths  %8.4f s  %8.3f us/path' % (n, t, t / n * 1e6))
+
+    return results
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import os
+import time
+
+import numpy as np
+
+from ssv import SSV
+from ssv import resources
+
+_svg_path = os.path.join('tests', 'data', 'good_svg.svg')
+
+
+# Build a small visualization where fixed per-render overhead dominates
+def gen_small_vis():
+    with contextlib.redirect_stdout(io.StringIO()):
+        vis = SSV.create_vis(np.arange(10), 's', _svg_path)
+        element = vis.add_element('cell', 'tank-1')
+        element.add_condition('background', np.random.rand(10), ['#FFFFFF', '#000000'], [0, 1])
+
+    return vis
+
+
+# Return mean render_model time in ms, optionally clearing template and asset caches before each render
+def time_render(vis, n=20, cached=True, mode='full'):
+    total = 0
+    for i in range(n):
+        if not cached:
+            resources.clear_cache()
+        start = time.perf_counter()
+        vis.render_model(mode=mode)
+        total += time.perf_counter() - start
+
+    return total / n * 1e3
+
+
+def run():
+    vis = gen_small_vis()
+    results = {}
+    for mode in ['full', 'html']:
+        results['%s_uncached' % mode] = time_render(vis, cached=False, mode=mode)
+        results['%s_cached' % mode] = time_render(vis, cached=True, mode=mode)
+
+    print('render_model per-render latency, small model (ms):')
+    for k, v in results.items():
+        print('  %-16s %8.3f' % (k, v))
+
+    return results
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,47 @@
+import timeit
+
+import numpy as np
+
+from ssv.type_check import type_check
+
+
+class Bare:
+    def __init__(self, x_len, data, description='', unit='', **kwargs):
+        self.data = data
+
+
+class Checked:
+    @type_check()
+    def __init__(self, x_len, data, description='', unit='', **kwargs):
+        self.data = data
+
+
+class Validated:
+    @type_check("data.float.1.1&x_len")
+    def __init__(self, x_len, data, description='', unit='', **kwargs):
+        self.data = data
+
+
+# Return best-of-repeat time per call in microseconds
+def time_call(f, number=20000, repeat=5):
+    return min(timeit.repeat(f, number=number, repeat=repeat)) / number * 1e6
+
+
+def run():
+    data = np.random.rand(100)
+    results = {
+        'bare': time_call(lambda: Bare(100, data, description='d', unit='u', opacity=1.0)),
+        'type_check': time_call(lambda: Checked(100, data, description='d', unit='u', opacity=1.0)),
+        'type_check_validate_array': time_call(lambda: Validated(100, data, description='d', unit='u',
+                                                                 opacity=1.0)),
+    }
+
+    print('type_check per-call time (us):')
+    for k, v in results.items():
+        print('  %-28s %8.3f' % (k, v))
+    print('  %-28s %8.3f' % ('overhead vs bare', results['type_check'] - results['bare']))
+
+    return results
+
+if __name__ == '__main__':
+    run()
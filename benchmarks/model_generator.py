@@ -0,0 +1,80 @@
+import contextlib
+import copy
+import io
+
+import numpy as np
+
+from benchmarks.bench_prepare_svg import gen_svg
+from ssv import SSV
+
+_color_scale = ['#FFFFFF', '#AAAAAA', '#555555', '#000000']
+_color_levels = [-1, -1 / 3, 1 / 3, 1]
+
+
+class ModelInputs:
+    """Class representing the inputs of a synthetic visualization of scalable size.
+
+        Elements cycle through cells with a background, cells with a dynamic level, and toggles, and the model
+            has one heatmap of grid x grid cells.  Elements are bound to every n_svg_nodes // n_elements-th path of
+            a generated svg layout.  Data are random walks, so they change every frame like simulation output.
+
+        Args:
+            n_elements (int): Number of elements (including the heatmap).
+            n_frames (int): Number of x-series frames.
+            grid (int): Number of heatmap rows and columns.
+            n_svg_nodes (int): Number of svg paths (at least n_elements).
+            seed (int): Random seed of the generated data.
+    """
+
+    def __init__(self, n_elements=50, n_frames=1000, grid=10, n_svg_nodes=1000, seed=0):
+        if n_svg_nodes < n_elements:
+            raise ValueError('n_svg_nodes must be at least n_elements')
+
+        rng = np.random.RandomState(seed)
+        self.params = {'n_elements': n_elements, 'n_frames': n_frames, 'grid': grid, 'n_svg_nodes': n_svg_nodes}
+        self.x_series = np.arange(n_frames) * 0.5
+        self.svg = gen_svg(n_svg_nodes)
+
+        step = n_svg_nodes // n_elements
+        walk = lambda *shape: np.cumsum(rng.randn(n_frames, *shape), axis=0) / np.sqrt(n_frames)
+        # (element type, svg id, [(condition type, args, kwargs)])
+        self.elements = [('heatmap', 'path-0', [('rect', (walk(grid, grid), _color_scale, _color_levels), {})])]
+        for i in range(1, n_elements):
+            element_id = 'path-%d' % (i * step)
+            if i % 3 == 0:
+                conditions = [('background', (walk(), _color_scale, _color_levels), {'description': 'Temperature'})]
+                self.elements.append(('cell', element_id, conditions))
+            elif i % 3 == 1:
+                conditions = [('dynamiclevel', (np.abs(walk()), walk(), _color_scale, _color_levels, 0, 1),
+                               {'color_data_description': 'Level'})]
+                self.elements.append(('cell', element_id, conditions))
+            else:
+                self.elements.append(('toggle', element_id, [('showhide', (walk() > 0,), {})]))
+
+    def copy_svg(self):
+        """Method to return a copy of the svg layout (visualizations change their layout when rendered)."""
+
+        return copy.deepcopy(self.svg)
+
+    def create_vis(self, svg=None):
+        """Method to create the visualization without elements on svg (a copy of the svg layout by default)."""
+
+        # Vis prints the svg root on creation
+        with contextlib.redirect_stdout(io.StringIO()):
+            return SSV.create_vis(self.x_series, 's', self.copy_svg() if svg is None else svg,
+                                  title='Benchmark model')
+
+    def add_elements(self, vis):
+        """Method to add all elements and conditions to a visualization."""
+
+        for element_type, element_id, conditions in self.elements:
+            element = vis.add_element(element_type, element_id)
+            for condition_type, args, kwargs in conditions:
+                element.add_condition(condition_type, *args, **kwargs)
+
+        return vis
+
+    def build(self):
+        """Method to create the full visualization."""
+
+        return self.add_elements(self.create_vis())
@@ -36,10 +36,10 @@ for cls in elements.Element.__subclasses__():
                                         for c in cls._allowed_conditions}
 
 input_requirements = {}
-element_args_base = [a for a in inspect.getargspec(elements.Element.__init__).args if a not in invalid_args]
+element_args_base = [a for a in inspect.getfullargspec(elements.Element.__init__).args if a not in invalid_args]
 for cls in elements.Element.__subclasses__():
     input_requirements[cls.__name__] = {}
-    args = list(set([a for a in inspect.getargspec(cls.__init__).args
+    args = list(set([a for a in inspect.getfullargspec(cls.__init__).args
                                                          if a not in invalid_args] + element_args_base))
     args = {a: input_types[a] if a in input_types else None for a in args}
     input_requirements[cls.__name__]["args"] = args
@@ -28,11 +28,15 @@ setup(
         'Intended Audience :: End Users/Desktop',
         'Topic :: Scientific/Engineering :: Visualization',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
     keywords='simulation visualization',
+    python_requires='>=3.9',
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),
     install_requires=['pandas', 'jinja2', 'numpy'],
     extras_require={
@@ -0,0 +1,155 @@
+import mmap
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+# Largest number of bytes of a file-backed array that is read (or converted) at once
+_block_bytes = 2 ** 22
+_numeric_kinds = 'biuf'
+_npz_local_header = struct.Struct('<4s22xHH')
+
+
+def open_array(source, key=None):
+    """Function to open a file or buffer as an array without reading its data.
+
+        .npy files and members of .npz archives are memory-mapped read-only, so only the parts of the data that
+            are used (e.g., selected fields or frames) are ever read from disk.  .npz members must be stored
+            uncompressed (np.savez, not np.savez_compressed).  Objects supporting the buffer protocol (e.g.,
+            memoryview, array.array or mmap.mmap) are wrapped without a copy.
+
+        Args:
+            source (str, os.PathLike or buffer): Path of a .npy or .npz file, or a buffer.
+            key (Optional[str]): Name of the array in a .npz archive.  Defaults to the only array of the archive.
+
+        Returns:
+            ndarray: Read-only array backed by the file or buffer.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.npy':
+            return np.load(path, mmap_mode='r', allow_pickle=False)
+        elif ext == '.npz':
+            return _open_npz_member(path, key)
+
+        raise ValueError('Array file \'%s\' must be a .npy or .npz file' % path)
+
+    arr = np.asarray(memoryview(source))
+    if arr.flags.writeable:
+        arr = arr.view()
+        arr.flags.writeable = False
+
+    return arr
+
+
+# Memory-map an uncompressed .npz member at the offset of its .npy data within the archive
+def _open_npz_member(path, key):
+    with zipfile.ZipFile(path) as archive:
+        names = [name[:-4] for name in archive.namelist() if name.endswith('.npy')]
+        if key is None:
+            if len(names) != 1:
+                raise ValueError('Array file \'%s\' holds %d arrays - a key is required (one of: %s)' %
+                                 (path, len(names), ', '.join(names)))
+            key = names[0]
+        if key not in names:
+            raise KeyError('Array \'%s\' not found in \'%s\'' % (key, path))
+
+        info = archive.getinfo(key + '.npy')
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError('Array \'%s\' in \'%s\' is compressed and cannot be memory-mapped.  Save it with '
+                             'np.savez instead of np.savez_compressed.' % (key, path))
+
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset)
+        signature, name_len, extra_len = _npz_local_header.unpack(f.read(_npz_local_header.size))
+        if signature != b'PK\x03\x04':
+            raise ValueError('Array file \'%s\' is not a valid .npz archive' % path)
+        f.seek(info.header_offset + _npz_local_header.size + name_len + extra_len)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            raise ValueError('Array \'%s\' in \'%s\' has unsupported .npy format version %s' % (key, path, version))
+        offset = f.tell()
+
+    if dtype.hasobject:
+        raise ValueError('Array \'%s\' in \'%s\' holds Python objects and cannot be memory-mapped' % (key, path))
+
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
+
+def as_array_source(arr):
+    """Function to open paths and buffers as arrays (see open_array) and return any other input unchanged."""
+
+    if isinstance(arr, (str, os.PathLike)) and os.path.splitext(os.fspath(arr))[1].lower() in ('.npy', '.npz'):
+        return open_array(arr)
+    elif isinstance(arr, (memoryview, mmap.mmap)):
+        return open_array(arr)
+
+    return arr
+
+
+def is_file_backed(arr):
+    """Function to check whether the data of an array is a memory-mapped file (or a view of one)."""
+
+    while arr is not None:
+        if isinstance(arr, (np.memmap, mmap.mmap)):
+            return True
+        arr = arr.obj if isinstance(arr, memoryview) else getattr(arr, 'base', None)
+
+    return False
+
+
+def iter_blocks(arr, block_bytes=None):
+    """Function to iterate over an array in blocks of whole rows (along the first axis).
+
+    Args:
+        arr (ndarray): Array of at least one dimension.
+        block_bytes (Optional[int]): Largest size of a block in bytes (blocks hold at least one row).  Defaults to
+            4 MiB.
+
+    Yields:
+        tuple: Index of the first row and view of the rows of each block.
+    """
+
+    block_bytes = _block_bytes if block_bytes is None else block_bytes
+    row_bytes = arr.itemsize * int(np.prod(arr.shape[1:], dtype='int64'))
+    n_rows = max(block_bytes // row_bytes, 1) if row_bytes else max(arr.shape[0], 1)
+    for start in range(0, arr.shape[0], n_rows):
+        yield start, arr[start:start + n_rows]
+
+
+def validate_blocks(arr, arr_type):
+    """Function to validate a file-backed array one block of rows at a time.
+
+    Numeric arrays are returned as-is (a read-only view of the file) since every numeric dtype can be cast to
+        arr_type, so no data is read.  Other arrays are cast block by block, which reports invalid values without
+        a full-size temporary and returns the converted array.
+
+    Args:
+        arr (ndarray): File-backed array.
+        arr_type (str): Type the array must be castable to (e.g., 'float').
+
+    Returns:
+        ndarray: Validated array.
+    """
+
+    if arr.dtype.fields is not None:
+        raise ValueError("Input array must not be a structured array")
+    if arr.dtype.kind in _numeric_kinds:
+        return arr
+
+    out = np.empty(arr.shape, dtype=arr_type)
+    try:
+        for start, block in iter_blocks(arr):
+            out[start:start + len(block)] = np.asarray(block, dtype=arr_type)
+    except ValueError:
+        raise ValueError("Each element in input array must be allowed to be cast as type %s" % arr_type)
+
+    return out
@@ -0,0 +1,152 @@
+import gc
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Numeric arrays at least this large (in bytes) are passed to workers through shared memory instead of pickling
+_shared_memory_min_bytes = 2 ** 20
+_shared_kinds = 'biuf'
+
+# Key used in worker specs to mark an array held in shared memory
+_SHARED_REF = '__ssv_shared__'
+
+
+def render_many(specs, out_dir, workers=None, **kwargs):
+    """Function to build and save many visualizations in parallel.
+
+    Each spec is built and saved in a worker process.  Failures are recorded per item and do not abort the batch.
+
+    Args:
+        specs (list): Visualization specs.  Each spec is either
+            *dict: Visualization in the format accepted by SSV.from_json, with an optional 'file_name' entry.
+                Numeric ndarrays in the spec are passed to workers through shared memory.
+            *callable: Picklable function taking no arguments and returning a Vis (e.g., a functools.partial of a
+                module level function).
+        out_dir (str): Directory for saved html files.  Created if it does not exist.
+        workers (Optional[int]): Number of worker processes.  Defaults to the cpu count.  1 renders in this process.
+        **kwargs: Keyword arguments for Vis.save_visualization.
+
+    Returns:
+        list[dict]: Result for each spec (in order) with keys
+            *'file_path': Path of saved html file.
+            *'build_time': Seconds to build the visualization (None if building failed).
+            *'render_time': Seconds to render and save the visualization (None if it did not complete).
+            *'error': Formatted traceback of the failure, or None.
+    """
+
+    if not isinstance(specs, (list, tuple)):
+        raise TypeError('\'specs\' input must be a list.')
+    if not all(isinstance(spec, dict) or callable(spec) for spec in specs):
+        raise TypeError('\'specs\' entries must be dicts or callables.')
+    if not isinstance(out_dir, str):
+        raise TypeError('\'out_dir\' input must be a string.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError('\'workers\' input must be an int greater than 0.')
+
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+
+    jobs = []
+    for i, spec in enumerate(specs):
+        file_name = spec.get('file_name', 'vis_%04d' % i) if isinstance(spec, dict) else 'vis_%04d' % i
+        jobs.append((spec, os.path.join(out_dir, file_name)))
+
+    if workers == 1:
+        return [_render_job(spec, file_path, kwargs) for spec, file_path in jobs]
+
+    blocks = []
+    try:
+        jobs = [(_share_arrays(spec, blocks), file_path) for spec, file_path in jobs]
+        with ProcessPoolExecutor(max_workers=min(workers, max(len(jobs), 1))) as executor:
+            futures = [executor.submit(_render_job, spec, file_path, kwargs) for spec, file_path in jobs]
+            return [_future_result(future, file_path) for future, (_, file_path) in zip(futures, jobs)]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+# Build and save a single visualization, returning its result dict
+def _render_job(spec, file_path, kwargs):
+    from .ssv import SSV
+
+    result = {'file_path': None, 'build_time': None, 'render_time': None, 'error': None}
+    blocks = []
+    vis = None
+    try:
+        t0 = time.perf_counter()
+        if isinstance(spec, dict):
+            spec = _attach_arrays(spec, blocks)
+            spec.pop('file_name', None)
+            vis = SSV.from_json(spec)
+        else:
+            vis = spec()
+        result['build_time'] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ext = '.html'
+        file_path = file_path if file_path.endswith(ext) else file_path + ext
+        vis.save_visualization(file_path, **kwargs)
+        result['render_time'] = time.perf_counter() - t0
+        result['file_path'] = file_path
+    except Exception:
+        result['error'] = traceback.format_exc()
+    finally:
+        # Drop every view into shared memory before detaching from it
+        del vis, spec
+        if blocks:
+            gc.collect()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # A view is still referenced - the mapping is released when the worker exits
+                pass
+
+    return result
+
+
+# Return result of a finished job, recording failures of the worker process itself
+def _future_result(future, file_path):
+    try:
+        return future.result()
+    except Exception:
+        return {'file_path': None, 'build_time': None, 'render_time': None, 'error': traceback.format_exc()}
+
+
+# Return copy of spec with large numeric arrays moved to shared memory blocks (appended to blocks)
+def _share_arrays(value, blocks):
+    if isinstance(value, dict):
+        return {k: _share_arrays(v, blocks) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_share_arrays(v, blocks) for v in value]
+    elif isinstance(value, np.ndarray) and value.dtype.kind in _shared_kinds and \
+            value.nbytes >= max(_shared_memory_min_bytes, 1):
+        block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        blocks.append(block)
+        np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+        return {_SHARED_REF: {'name': block.name, 'shape': value.shape, 'dtype': value.dtype.str}}
+
+    return value
+
+
+# Return copy of spec with shared memory references replaced by ndarray views (attached blocks appended to blocks)
+def _attach_arrays(value, blocks):
+    if isinstance(value, dict):
+        if _SHARED_REF in value:
+            ref = value[_SHARED_REF]
+            # Blocks are owned (and unlinked) by the parent process
+            block = shared_memory.SharedMemory(name=ref['name'])
+            blocks.append(block)
+            return np.ndarray(ref['shape'], dtype=np.dtype(ref['dtype']), buffer=block.buf)
+        return {k: _attach_arrays(v, blocks) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_attach_arrays(v, blocks) for v in value]
+
+    return value
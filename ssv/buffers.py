@@ -0,0 +1,83 @@
+import numpy as np
+
+
+class GrowableArray:
+    """Class representing an array that grows along its first axis at amortized constant cost per row.
+
+        Rows are held in a buffer with spare capacity that doubles when full, so appending a series one step
+            at a time copies each row a constant number of times on average.  Rows are never changed once
+            appended, so serializers cache the JSON text of encoded rows on the buffer and only encode the rows
+            appended since the last render.
+
+        Args:
+            arr (array): Initial rows.
+            capacity (Optional[int]): Initial number of rows the buffer can hold without growing.
+    """
+
+    _min_capacity = 16
+
+    def __init__(self, arr, capacity=None):
+        arr = np.asarray(arr)
+        if arr.ndim < 1:
+            raise ValueError('Input array must have at least one dimension')
+
+        self._n = arr.shape[0]
+        capacity = max(capacity or 0, self._n, self._min_capacity)
+        self._data = np.empty((capacity,) + arr.shape[1:], dtype=arr.dtype)
+        self._data[:self._n] = arr
+
+        # JSON text segments of the first n_encoded rows (see serializers.iterencode)
+        self.json_segments = []
+        self.n_encoded = 0
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def capacity(self):
+        return self._data.shape[0]
+
+    def append(self, rows):
+        """Method to append rows to the end of the array.
+
+        Args:
+            rows (array): Rows with the same shape as the array along all but the first axis.
+
+        Returns:
+            BufferView: Read-only view of all rows.
+        """
+
+        rows = np.asarray(rows, dtype=self._data.dtype)
+        if rows.shape[1:] != self._data.shape[1:]:
+            raise ValueError('Appended rows must have shape %s along all but the first axis' %
+                             (self._data.shape[1:],))
+
+        n = self._n + rows.shape[0]
+        if n > self.capacity:
+            data = np.empty((max(n, 2 * self.capacity),) + self._data.shape[1:], dtype=self._data.dtype)
+            data[:self._n] = self._data[:self._n]
+            self._data = data
+        self._data[self._n:n] = rows
+        self._n = n
+
+        return self.view()
+
+    def view(self):
+        """Method to return a read-only view of all rows (no copy)."""
+
+        view = self._data[:self._n].view(BufferView)
+        view.flags.writeable = False
+        view.buffer = self
+
+        return view
+
+
+class BufferView(np.ndarray):
+    """Class representing a read-only view of the rows of a GrowableArray.
+
+        Arrays derived from a view (e.g., slices or arithmetic results) are plain arrays of this class without
+            a buffer.
+    """
+
+    def __array_finalize__(self, obj):
+        self.buffer = None
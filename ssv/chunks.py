@@ -0,0 +1,90 @@
+import os
+import tempfile
+
+import numpy as np
+
+from . import profiling, serializers
+from .decimation import take_frames
+
+# File name of the sidecar script holding each chunk
+_chunk_file = 'chunk_%05d.js'
+
+
+def write_chunks(element_data, n_frames, chunk_size, chunk_dir, chunk_url=None, uuid='', payload='json',
+                 payload_dtype='float64', quantize_colors=False, dedupe_arrays=False, stats=None):
+    """Function to write element data as time-chunked sidecar scripts.
+
+    Every x-series indexed value of the element data is sliced into consecutive chunks of chunk_size frames and
+        each chunk is written to its own script that passes the chunk to ssv.add_chunk when loaded.  Chunks are
+        loaded on demand by the rendered page, so browser memory scales with the viewed window instead of the
+        simulation length.  Scripts (unlike fetch requests) load from a local directory as well as over http.
+
+    Args:
+        element_data (list[dict]): Element data as returned by Element.dump_attr.
+        n_frames (int): Number of x-series frames.
+        chunk_size (int): Number of frames per chunk.
+        chunk_dir (str): Directory for chunk files.  Created if it does not exist.
+        chunk_url (Optional[str]): Url (or relative path) of chunk_dir as seen from the rendered page.  Defaults to
+            chunk_dir.
+        uuid (str): Id of the rendered visualization the chunks belong to.
+        payload (str): Element data encoding of each chunk ('json' or 'binary', see Vis.render_model).
+        payload_dtype (str): Float precision of 'binary' payload arrays.
+        quantize_colors (bool): Map color data to palette indices (see serializers.quantize_colors).
+        dedupe_arrays (bool): Store repeated arrays of each chunk a single time (see serializers.dedupe_arrays).
+        stats (Optional[RenderStats]): Stats of a profiled render.  The payload of each element is added up over all
+            chunks (see profiling.iterencode).
+
+    Returns:
+        dict: Chunk information for the rendered page with keys 'size', 'n_frames' and 'urls'.
+    """
+
+    if not os.path.isdir(chunk_dir):
+        os.makedirs(chunk_dir, exist_ok=True)
+    if chunk_url is None:
+        chunk_url = chunk_dir
+    chunk_url = chunk_url.replace(os.sep, '/').rstrip('/')
+
+    urls = []
+    for k, start in enumerate(range(0, n_frames, chunk_size)):
+        frames = np.arange(start, min(start + chunk_size, n_frames))
+        # Frame encodings (e.g., keyframes) and the store of shared arrays are built per chunk, so every chunk
+        # decodes on its own
+        chunk_data = serializers.encode_frames(take_frames(element_data, frames, n_frames))
+        if quantize_colors:
+            chunk_data = serializers.quantize_colors(chunk_data)
+        if dedupe_arrays:
+            chunk_data = serializers.dedupe_arrays(chunk_data)
+
+        file_name = _chunk_file % k
+        _write_chunk(os.path.join(chunk_dir, file_name), uuid, k, chunk_data, payload, payload_dtype, stats)
+        urls.append('%s/%s' % (chunk_url, file_name) if chunk_url else file_name)
+
+    return {'size': chunk_size, 'n_frames': n_frames, 'urls': urls}
+
+
+# Write a single chunk script atomically
+def _write_chunk(file_path, uuid, k, chunk_data, payload, payload_dtype, stats=None):
+    packer = None
+    if payload == 'binary':
+        packer = serializers.BinaryPayload(payload_dtype)
+        chunk_data = packer.pack(chunk_data)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write('ssv.add_chunk("%s", %d, ' % (uuid, k))
+            for text in profiling.iterencode(stats, chunk_data):
+                f.write(text)
+            f.write(', ')
+            if packer is None:
+                f.write('null')
+            else:
+                f.write('"')
+                for text in packer.iter_base64():
+                    f.write(text)
+                f.write('"')
+            f.write(');\n')
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -1,3 +1,4 @@
+from .registry import Registry
 from .type_check import type_check
 
 
@@ -11,6 +12,12 @@ class Condition:
             **kwargs: Arbitrary keyword arguments dependant on condition subclass.
     """
 
+    _registry = Registry('condition', 'ssv.conditions')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Condition._registry.register(cls)
+
     @staticmethod
     def create(cls_name, *args, **kwargs):
         """Class factory method for Condition subclasses.
@@ -22,12 +29,7 @@ class Condition:
                 Array of Condition subclass(es) of type cls_name.
         """
 
-        for cls in Condition.__subclasses__():
-            if cls_name.lower() == cls.__name__.lower():
-                return cls(*args, **kwargs)
-
-        # If we get to end of function raise error
-        raise ValueError('condition type \'%s\' is not a supported type.' % cls_name)
+        return Condition._registry.get(cls_name)(*args, **kwargs)
 
     @type_check()
     def __init__(self, id='', description='', unit='', opacity=1.0, report=True, overlay='',
@@ -238,16 +240,38 @@ class Rect(Condition):
             color_data (array): 3d input data representing heatmap data slices along x-series that map to a color
             color_scale (array): Data able to be cast as numeric by numpy to represent color scale
             color_levels (array): Data able to be cast as str by numpy to represent color levels
+            encoding (Optional[str]): Encoding of color data in the rendered visualization
+                *'full' sends every heatmap slice.
+                *'delta' sends a keyframe every keyframe_interval slices and only the changed cells of the slices
+                    in between.  Slices are rebuilt in the browser on demand.  Use this option for large heatmaps
+                    that change slowly.
+            keyframe_interval (Optional[int]): Number of slices between keyframes for 'delta' encoding.
+            delta_tolerance (Optional[int, float]): Changes in a cell no larger than this value (relative to the
+                last sent value) are not sent with 'delta' encoding.  0 is lossless.
             **kwargs: arbitrary keyword arguments for Condition super class.
     """
 
+    _encodings = ('full', 'delta')
+
     @type_check("color_data.float.3.3&x_len", "color_scale&color_levels")
-    def __init__(self, x_len, color_data, color_scale, color_levels, unit_description_prepend='color_data', **kwargs):
+    def __init__(self, x_len, color_data, color_scale, color_levels, unit_description_prepend='color_data',
+                 encoding='full', keyframe_interval=50, delta_tolerance=0, **kwargs):
         super(Rect, self).__init__(**kwargs)
         self.color_data = color_data
         self.color_scale = color_scale
         self.color_levels = color_levels
 
+        if encoding not in self._encodings:
+            raise ValueError('encoding must be one of: %s' % ', '.join(self._encodings))
+        if keyframe_interval < 1:
+            raise ValueError('keyframe_interval must be greater than 0')
+        if delta_tolerance < 0:
+            raise ValueError('delta_tolerance must not be negative')
+        self.encoding = encoding
+        if encoding == 'delta':
+            self.keyframe_interval = keyframe_interval
+            self.delta_tolerance = delta_tolerance
+
 
 #Toggle-specific classes
 class ShowHide(Condition):
@@ -2,20 +2,39 @@ import re
 
 import numpy as np
 
+from .array_sources import as_array_source, is_file_backed, validate_blocks
+
 try:
     import pandas as pd
 except ImportError:
     pd = None
 
+_hex_color_re = re.compile('#(?:[0-9a-fA-F]{3}){1,2}')
+
+# Validated color scales keyed by their raw contents, so a scale shared by many conditions is validated once
+_color_scale_cache = {}
+_color_scale_cache_size = 1024
+
 
 # Helper function to validate lists and array inputs, including color inputs
+# Returns a C-contiguous ndarray - input arrays that already have the requested dtype and layout are
+# returned as-is (no copy), so later changes to the input array are reflected in the visualization
+# Numeric inputs may also be .npy/.npz paths, buffers or memory-mapped arrays, which are validated in blocks and
+# kept in their file (in their own dtype and layout) until they are rendered - see array_sources
 def validate_array(arr, arr_type, min_dim, max_dim=None, dim1_len=None):
     # Check for pandas dataframe or series and if so convert to values
     if pd is not None and isinstance(arr, (pd.DataFrame, pd.Series)):
         arr = arr.values
+    if arr_type == 'float':
+        arr = as_array_source(arr)
 
     try:
-        arr = np.array(arr).astype(arr_type)
+        if arr_type == 'float' and isinstance(arr, np.ndarray) and is_file_backed(arr):
+            arr = validate_blocks(arr, arr_type)
+        else:
+            arr = np.asarray(arr, dtype=arr_type)
+            if not arr.flags.c_contiguous:
+                arr = np.ascontiguousarray(arr)
     except ValueError:
         raise ValueError("Each element in input array must be allowed to be cast as type %s" % arr_type)
 
@@ -37,7 +56,7 @@ def validate_array(arr, arr_type, min_dim, max_dim=None, dim1_len=None):
     if dim1_len is not None and arr.shape[0] != dim1_len:
         raise ValueError("Input array(s) should have size %d in dimension 0" % dim1_len)
 
-    return arr.tolist()
+    return arr
 
 
 # Helper function to validate array slices where slice dimensions may not be equal length
@@ -58,28 +77,58 @@ def validate_array_slices(arr, arr_type, dim1_len=None):
 
 
 # Helper function to validate colors in a given array
+# Strings are checked as a 2-d array of unicode code points, so no per-element Python calls are made
 def validate_colors(arr):
     # Check for pandas dataframe or series and if so convert to values
     if pd is not None and isinstance(arr, (pd.DataFrame, pd.Series)):
         arr = arr.values
-    arr = np.array(arr).astype('str')
+    arr = np.asarray(arr, dtype='str')
 
-    f = np.vectorize(lambda x: True if re.search('^#(?:[0-9a-fA-F]{3}){1,2}$', x) is None else False)
-    if np.any(f(arr)):
-        raise ValueError("Input array should include only hex colors")
+    if arr.size > 0:
+        n_chars = arr.dtype.itemsize // 4
+        codes = np.ascontiguousarray(arr).reshape(-1).view(np.uint32).reshape(-1, n_chars)
+        lengths = np.char.str_len(arr).reshape(-1)
+        digits = codes[:, 1:min(n_chars, 7)]
+        is_hex = (np.arange(1, digits.shape[1] + 1) >= lengths[:, None]) | ((digits >= 48) & (digits <= 57)) | \
+                 ((digits >= 65) & (digits <= 70)) | ((digits >= 97) & (digits <= 102))
+        if n_chars < 4 or not np.all((codes[:, 0] == ord('#')) & ((lengths == 4) | (lengths == 7))) or \
+                not np.all(is_hex):
+            raise ValueError("Input array should include only hex colors")
 
-    return arr.tolist()
+    return arr
 
 
 # Helper function to validate a color scale
 def validate_color_scale(color_scale, color_levels):
-    color_scale = validate_colors(validate_array(color_scale, 'str', 1, 1))
+    color_scale = _intern_color_scale(color_scale)
     if len(color_scale) != len(color_levels):
         raise ValueError("Length of color scale must match length of color levels")
 
     return color_scale
 
 
+# Helper function to validate a color scale once and return the same read-only array for repeated scales
+# Lists are keyed by their items, so cache hits skip the array conversion
+def _intern_color_scale(color_scale):
+    try:
+        key = tuple(color_scale) if isinstance(color_scale, (list, tuple)) else None
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is None or key not in _color_scale_cache:
+        arr = validate_array(color_scale, 'str', 1, 1)
+        key = (arr.dtype.str, arr.tobytes()) if key is None else key
+        if key not in _color_scale_cache:
+            arr = validate_colors(arr).copy()
+            arr.setflags(write=False)
+            if len(_color_scale_cache) >= _color_scale_cache_size:
+                _color_scale_cache.clear()
+            _color_scale_cache[key] = arr
+
+    return _color_scale_cache[key]
+
+
 # Helper function to validate a color scale
 def validate_color_levels(color_levels):
     color_levels = validate_array(color_levels, 'float', 1, 1)
@@ -89,8 +138,8 @@ def validate_color_levels(color_levels):
 
 # Helper function to validate single color
 def validate_color(color):
-    color_arr = [color]
-    validate_colors(color_arr)
+    if not isinstance(color, str) or _hex_color_re.fullmatch(color) is None:
+        raise ValueError("Input array should include only hex colors")
 
     return color
 
@@ -0,0 +1,185 @@
+import numpy as np
+
+from .array_sources import iter_blocks
+
+# Decimation methods accepted by select_frames
+methods = ('uniform', 'lttb', 'minmax')
+
+# Keys of element data values that are indexed along the x-series (first axis)
+x_keys = ('x_series', 'data', 'color_data', 'level_data', 'tabular_data')
+_numeric_kinds = 'biuf'
+
+
+def decimate(element_data, x_series, max_frames, method='lttb'):
+    """Function to reduce element data to a shared subset of at most max_frames x-series frames.
+
+    Frames are selected once from every numeric data series of every element (see select_frames) and every
+        x-series indexed value (1-d, 2-d and 3-d condition data, tabular data, popover data and x-series copies)
+        is sliced with the same frame indices.
+
+    Args:
+        element_data (list[dict]): Element data as returned by Element.dump_attr.
+        x_series (ndarray): X-series of the visualization.
+        max_frames (int): Maximum number of frames to keep (at least 2).
+        method (str): Frame selection method (see select_frames).
+
+    Returns:
+        tuple: Decimated copies of element_data and x_series.
+    """
+
+    n_frames = len(x_series)
+    if n_frames <= max_frames:
+        return element_data, x_series
+
+    signals = []
+    _collect_signals(element_data, n_frames, signals)
+    frames = select_frames(n_frames, signals, max_frames, method)
+
+    return take_frames(element_data, frames, n_frames), _take(x_series, frames)
+
+
+def select_frames(n_frames, signals, max_frames, method='lttb'):
+    """Function to select a sorted subset of frame indices shared by a set of data series.
+
+    The first and last frames are always kept.
+        *'uniform' keeps evenly spaced frames.
+        *'lttb' (largest triangle three buckets) keeps the frame of each bucket that forms the largest triangle
+            with the previously kept frame and the mean of the next bucket, using all signals as coordinates.
+        *'minmax' keeps the frames of the largest positive and negative excursion (across all signals) from the
+            signal means of each bucket.
+
+    Args:
+        n_frames (int): Number of frames.
+        signals (list[array]): Data series with n_frames values along their first axis.  Multi-dimensional
+            series are summarized by their per-frame min, max and mean.
+        max_frames (int): Maximum number of frames to keep (at least 2).
+        method (str): Frame selection method.
+
+    Returns:
+        ndarray: Sorted frame indices.
+    """
+
+    if method not in methods:
+        raise ValueError('decimation method must be one of: %s' % ', '.join(methods))
+    if n_frames <= max_frames:
+        return np.arange(n_frames)
+
+    if method == 'uniform':
+        return np.unique(np.linspace(0, n_frames - 1, max_frames).round().astype(int))
+
+    v = _signal_matrix(n_frames, signals)
+    # minmax keeps two frames per bucket - with fewer than four frames only the first and last frames are kept
+    n_buckets = max_frames - 2 if method == 'lttb' else (max_frames - 2) // 2
+    edges = np.linspace(1, n_frames - 1, n_buckets + 1).astype(int)
+
+    frames = [0]
+    if method == 'lttb':
+        # Frame positions are scaled to [0, 1] like the signals so time and value distances are comparable
+        t = np.linspace(0, 1, n_frames, dtype=v.dtype)[:, None]
+        points = np.hstack([t, v])
+        for i in range(n_buckets):
+            bucket = points[edges[i]:edges[i + 1]]
+            if len(bucket) == 0:
+                continue
+            next_bucket = points[edges[i + 1]:edges[i + 2]] if i + 2 <= n_buckets else points[-1:]
+            a = points[frames[-1]]
+            c = (next_bucket if len(next_bucket) else points[-1:]).mean(axis=0)
+            ab = bucket - a
+            ac = c - a
+            # Squared triangle area (up to a constant) in any number of dimensions
+            area = (ab * ab).sum(axis=1) * ac.dot(ac) - ab.dot(ac) ** 2
+            frames.append(edges[i] + int(np.argmax(area)))
+    else:
+        for i in range(n_buckets):
+            bucket = v[edges[i]:edges[i + 1]]
+            if len(bucket) == 0:
+                continue
+            deviation = bucket - bucket.mean(axis=0)
+            frames.append(edges[i] + int(np.argmax(deviation.max(axis=1))))
+            frames.append(edges[i] + int(np.argmax((-deviation).max(axis=1))))
+    frames.append(n_frames - 1)
+
+    return np.unique(frames)
+
+
+# Return 2-d array (frames x channels) of signals, each channel scaled to [0, 1]
+# Multi-dimensional signals are summarized in blocks of frames, so file-backed data is read a block at a time
+def _signal_matrix(n_frames, signals):
+    channels = [np.zeros(n_frames, dtype='float32')]
+    for signal in signals:
+        if signal.ndim == 1:
+            channels.append(np.asarray(signal, dtype='float32'))
+        else:
+            summary = np.empty((3, n_frames), dtype='float32')
+            for start, block in iter_blocks(signal):
+                block = np.asarray(block, dtype='float32').reshape(len(block), -1)
+                summary[:, start:start + len(block)] = [np.nanmin(block, axis=1), np.nanmax(block, axis=1),
+                                                        np.nanmean(block, axis=1)]
+            channels.extend(summary)
+
+    v = np.column_stack(channels)
+    v_min = np.nanmin(v, axis=0)
+    v_range = np.nanmax(v, axis=0) - v_min
+    v_range[~(v_range > 0)] = 1
+
+    return np.nan_to_num((v - v_min) / v_range)
+
+
+# Append numeric x-series indexed arrays in element data to signals
+def _collect_signals(value, n_frames, signals):
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if k in x_keys and k != 'x_series' and isinstance(v, np.ndarray) and v.ndim > 0 and \
+                    v.shape[0] == n_frames and v.dtype.kind in _numeric_kinds:
+                signals.append(v)
+            else:
+                _collect_signals(v, n_frames, signals)
+    elif isinstance(value, list):
+        for v in value:
+            _collect_signals(v, n_frames, signals)
+
+
+def take_frames(value, frames, n_frames):
+    """Function to return a copy of element data with the x-series indexed values sliced to frames.
+
+    Args:
+        value: Element data (dicts and lists of values, see Element.dump_attr).
+        frames (ndarray): Indices of the frames to keep.
+        n_frames (int): Length of the x-series - only values of this length are sliced.
+
+    Returns:
+        Copy of value with the selected frames.
+    """
+
+    if isinstance(value, dict):
+        return {k: _take(v, frames) if k in x_keys and frame_count(v) == n_frames else take_frames(v, frames, n_frames)
+                for k, v in value.items()}
+    elif isinstance(value, list):
+        return [take_frames(v, frames, n_frames) for v in value]
+
+    return value
+
+
+def _take(value, frames):
+    if isinstance(value, np.ndarray):
+        return value[frames]
+
+    return [value[i] for i in frames]
+
+
+def frame_count(value):
+    """Function to return the length of an x-series indexed value along its first axis.
+
+    Args:
+        value: Element data value (ndarray, list or tuple).
+
+    Returns:
+        int: Number of frames, None for scalars, 0-d arrays and other values.
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.shape[0] if value.ndim > 0 else None
+    elif isinstance(value, (list, tuple)):
+        return len(value)
+
+    return None
@@ -1,5 +1,6 @@
 from .conditions import Condition
 from .popovers import Popover
+from .registry import Registry
 from .type_check import type_check
 
 
@@ -25,6 +26,11 @@ class Element:
 
     _allowed_conditions = []
     _max_conditions = -1
+    _registry = Registry('element', 'ssv.elements')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Element._registry.register(cls)
 
     @type_check()
     def __init__(self, ids, description, x_series, report_id=''):
@@ -47,12 +53,7 @@ class Element:
                 Element subclass of type cls_name.
         """
 
-        for cls in Element.__subclasses__():
-            if cls_name.lower() == cls.__name__.lower():
-                return cls
-
-        # If we get to end of function raise error
-        raise ValueError('element type \'%s\' is not a supported type.' % cls_name)
+        return Element._registry.get(cls_name)
 
     def add_condition(self, condition_cls, *args, **kwargs):
         """Method to add visualization condition to internal class property.
@@ -89,10 +90,11 @@ class Element:
     def add_popover(self, cls_name, data, *args, **kwargs):
         self.popover = Popover.create(cls_name, self.x_series, data, *args, **kwargs)
 
+    # The x-series is rendered once per visualization, so it is not part of element data
     def dump_attr(self):
         return {k: ([c.dump_attr() for c in v] if k == 'conditions' else
                     v.dump_attr() if hasattr(v, "dump_attr") else v) for
-                    k, v in self.__dict__.items() if k[0] != '_'}
+                    k, v in self.__dict__.items() if k[0] != '_' and k != 'x_series'}
 
 
 # Wrapper for cell
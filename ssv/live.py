@@ -0,0 +1,190 @@
+import http.server
+import threading
+import urllib.parse
+
+from . import serializers
+from .decimation import frame_count, x_keys
+
+# Seconds between keep-alive comments on idle event streams (also the longest delay before frames appended with
+# Vis.append instead of LiveServer.append are pushed)
+_keepalive_interval = 15
+# Url of the event stream relative to the page
+_events_path = 'events'
+
+
+class LiveServer:
+    """Class representing a local server that pushes frames appended to a visualization to connected browsers.
+
+        The server serves the rendered visualization at its root url and streams frames appended with
+            LiveServer.append as Server-Sent Events.  Open pages extend their element data and x-series slider
+            with each event, so history is sent once (with the page) and pages never need to be reloaded.  The
+            server runs in a daemon thread on the standard library http.server.
+
+        Args:
+            vis (Vis): Visualization to serve.
+            host (str): Host name or address to listen on.
+            port (int): Port to listen on.  0 picks a free port (see url).
+            **kwargs: Keyword arguments for Vis.render_model (e.g., height, payload).  Options that transform
+                frames ('max_frames', 'chunk_size', 'compress', 'quantize_colors') and 'profile' are not supported.
+    """
+
+    def __init__(self, vis, host='127.0.0.1', port=0, **kwargs):
+        for key in ['max_frames', 'chunk_size', 'compress', 'quantize_colors', 'profile']:
+            if kwargs.get(key):
+                raise ValueError('\'%s\' is not supported by live visualizations' % key)
+        if kwargs.pop('mode', 'full') != 'full':
+            raise ValueError('live visualizations are rendered in \'full\' mode')
+
+        self.vis = vis
+        self._render_kwargs = kwargs
+        # Guards the visualization data - waiting event streams are notified of every append
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._httpd = http.server.ThreadingHTTPServer((host, port), _LiveRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.live = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return 'http://%s:%d/' % (host, port)
+
+    def start(self):
+        """Method to start serving in a daemon thread.
+
+        Returns:
+            LiveServer: The started server.
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name='ssv-live', daemon=True)
+            self._thread.start()
+
+        return self
+
+    def close(self):
+        """Method to stop serving and end all event streams."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, x_values, rows):
+        """Method to append frames to the visualization and push them to connected browsers.
+
+        See Vis.append for arguments.
+        """
+
+        with self._condition:
+            self.vis.append(x_values, rows)
+            self._condition.notify_all()
+
+    # Render the page with the frames appended so far
+    def render_page(self):
+        with self._condition:
+            live = {'url': _events_path, 'n_frames': len(self.vis._x_series)}
+            template, render_vars, _ = self.vis._prepare_render(live=live, **self._render_kwargs)
+
+            return template.render(render_vars)
+
+    # Yield the JSON text of new frames (and the frame count after them) as they are appended, starting at frame
+    # start - None is yielded when no frames were appended for a keep-alive interval
+    def iter_frames(self, start):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or len(self.vis._x_series) > start,
+                                         _keepalive_interval)
+                if self._closed:
+                    return
+
+                # Buffered data is never changed in place, so the snapshot is encoded outside of the lock
+                x_series = self.vis._x_series
+                element_data = [element.dump_attr() for element in self.vis._elements]
+            stop = len(x_series)
+
+            if stop > start:
+                yield serializers.strict_json(serializers.dumps(
+                    {'x_series': x_series[start:stop],
+                     'element_data': _tail(element_data, start, stop, len(x_series))})), stop
+                start = stop
+            else:
+                yield None
+
+
+class _LiveRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path in ('/', '/index.html'):
+            self._send_page()
+        elif url.path == '/' + _events_path:
+            self._send_events(urllib.parse.parse_qs(url.query))
+        else:
+            self.send_error(404)
+
+    def _send_page(self):
+        body = self.server.live.render_page().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Stream frames after the frame count of the page (or of the last event received before a reconnect)
+    def _send_events(self, query):
+        try:
+            start = int(self.headers.get('Last-Event-ID') or query.get('from', ['0'])[0])
+        except ValueError:
+            self.send_error(400)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        try:
+            for message in self.server.live.iter_frames(start):
+                if message is None:
+                    self.wfile.write(b': keep-alive\n\n')
+                else:
+                    text, n_frames = message
+                    self.wfile.write(('id: %d\ndata: %s\n\n' % (n_frames, text)).encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Return the frames from start to stop of the x-series indexed values of element data, keeping the nesting of
+# element and condition data (other values are left out)
+def _tail(value, start, stop, n_frames):
+    if isinstance(value, dict):
+        tail = {}
+        for k, v in value.items():
+            if k in x_keys and frame_count(v) == n_frames:
+                tail[k] = v[start:stop]
+            else:
+                v_tail = _tail(v, start, stop, n_frames)
+                if v_tail:
+                    tail[k] = v_tail
+        return tail
+    elif isinstance(value, list) and any(isinstance(v, dict) for v in value):
+        tails = [_tail(v, start, stop, n_frames) for v in value]
+        if any(tails):
+            return [t or {} for t in tails]
+
+    return None
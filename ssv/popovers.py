@@ -1,4 +1,5 @@
 from .data_validators import validate_array
+from .registry import Registry
 
 class Popover:
     """Class representing a popover for an element.
@@ -7,12 +8,19 @@ class Popover:
             **kwargs: arbitrary keyword arguments
     """
 
+    _registry = Registry('popover', 'ssv.popovers')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Popover._registry.register(cls)
+
     def __init__(self, **kwargs):
         self.type = type(self).__name__.lower()
         if "dims" in kwargs:
-            if not validate_array(kwargs["dims"], 1, 1, 2):
+            try:
+                self.dims = validate_array(kwargs["dims"], 'float', 1, 1, 2)
+            except (TypeError, ValueError):
                 raise ValueError("Input for popover dimensions must be a tuple with two floats")
-            self.dims = kwargs["dims"]
         else:
             self.dims = (150, 50)
 
@@ -34,15 +42,11 @@ class Popover:
                 Array of Condition subclass(es) of type cls_name.
         """
 
-        for cls in Popover.__subclasses__():
-            if cls_name.lower() == cls.__name__.lower():
-                return cls(*args, **kwargs)
-
-        # If we get to end of function raise error
-        raise ValueError('condition type \'%s\' is not a supported type.' % cls_name)
+        return Popover._registry.get(cls_name)(*args, **kwargs)
 
+    # The x-series is rendered once per visualization, so it is not part of popover data
     def dump_attr(self):
-        return {k: v for k, v in self.__dict__.items() if k[0] != '_'}
+        return {k: v for k, v in self.__dict__.items() if k[0] != '_' and k != 'x_series'}
 
 
 # Chart Subclasses
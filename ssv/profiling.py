@@ -0,0 +1,272 @@
+import contextlib
+import json
+import logging
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import serializers
+
+logger = logging.getLogger(__name__)
+
+
+class RenderStats:
+    """Class representing the wall time and allocations of each phase of a render.
+
+        Phases are timed exclusively, so the time spent in a lazily encoded payload is not counted again in the
+            template render that pulls it, and phase times add up to the profiled render time.  Allocations are the
+            peak of memory traced by tracemalloc above the memory held when the phase started.  Every element also
+            reports the time and allocations of its dump_attr call and the size of its serialized payload.
+
+        Attributes:
+            phases (dict): Phase name -> {'time_s', 'alloc_bytes'} in order of first use.
+            elements (list[dict]): Per element 'type', 'ids', 'conditions', 'time_s', 'alloc_bytes' and
+                'payload_bytes' (see iterencode).
+            page_bytes (Optional[int]): Size of the rendered page.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.elements = []
+        self.page_bytes = None
+
+        # Open phases as [phase metrics, element metrics, start time, start memory, peak memory]
+        self._stack = []
+
+    @property
+    def total_time_s(self):
+        return sum(phase['time_s'] for phase in self.phases.values())
+
+    def set_elements(self, elements):
+        """Method to add an entry for each rendered element.
+
+        Args:
+            elements (list[Element]): Elements in render order.
+        """
+
+        self.elements = [{'type': element.type, 'ids': list(element.ids),
+                          'conditions': [type(condition).__name__ for condition in element.conditions],
+                          'time_s': 0.0, 'alloc_bytes': 0, 'payload_bytes': None} for element in elements]
+
+    @contextlib.contextmanager
+    def phase(self, name, element=None):
+        """Method to measure a block of code as (part of) a phase.
+
+        Args:
+            name (str): Phase name.  Metrics of blocks with the same name are added up.
+            element (Optional[int]): Index of the element the block is measured for.
+        """
+
+        metrics = self.phases.setdefault(name, {'time_s': 0.0, 'alloc_bytes': 0})
+        element_metrics = self.elements[element] if element is not None else None
+        self._enter(metrics, element_metrics)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def iter_phase(self, name, iterable):
+        """Method to measure the iteration of a lazy iterable as a phase.
+
+        Args:
+            name (str): Phase name.
+            iterable (iterable): Iterable to measure.
+
+        Yields:
+            Items of iterable.
+        """
+
+        it = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def to_dict(self):
+        return {'total_time_s': self.total_time_s, 'page_bytes': self.page_bytes,
+                'phases': {name: dict(metrics) for name, metrics in self.phases.items()},
+                'elements': [dict(element) for element in self.elements]}
+
+    def report(self, n_elements=10):
+        """Method to format the stats as a text table.
+
+        Args:
+            n_elements (int): Number of elements with the largest payloads to list.
+
+        Returns:
+            str: Report of phase metrics and of the largest element payloads.
+        """
+
+        total = self.total_time_s
+        lines = ['Render profile: %.4f s%s' % (total, '' if self.page_bytes is None else
+                                                ', %.3f MB page' % (self.page_bytes / 1e6)),
+                 '  %-16s %10s %7s %12s' % ('phase', 'time s', 'time %', 'alloc MB')]
+        for name, metrics in self.phases.items():
+            lines.append('  %-16s %10.4f %6.1f%% %12.3f' % (name, metrics['time_s'],
+                                                          100 * metrics['time_s'] / total if total else 0,
+                                                          metrics['alloc_bytes'] / 1e6))
+
+        sized = [element for element in self.elements if element['payload_bytes'] is not None]
+        total_bytes = sum(element['payload_bytes'] for element in sized)
+        if sized:
+            lines.append('  %-40s %12s %7s %10s' % ('element', 'payload MB', 'size %', 'dump s'))
+            for element in sorted(sized, key=lambda e: e['payload_bytes'], reverse=True)[:n_elements]:
+                label = '%s %s (%s)' % (element['type'], '_'.join(element['ids']), ', '.join(element['conditions']))
+                lines.append('  %-40s %12.3f %6.1f%% %10.4f' % (label[:40], element['payload_bytes'] / 1e6,
+                                                               100 * element['payload_bytes'] / total_bytes
+                                                               if total_bytes else 0, element['time_s']))
+
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.report()
+
+    # Pause the open phase (its metrics are resumed on exit of the new phase) and start a new phase
+    def _enter(self, metrics, element_metrics):
+        now = time.perf_counter()
+        if self._stack:
+            self._pause(self._stack[-1], now)
+
+        self._stack.append([metrics, element_metrics, now, _traced_memory()[0], 0])
+        _reset_peak()
+
+    def _exit(self):
+        now = time.perf_counter()
+        entry = self._stack.pop()
+        self._pause(entry, now)
+        metrics, element_metrics, _, start_memory, peak = entry
+        for m in (metrics, element_metrics):
+            if m is not None:
+                m['alloc_bytes'] = max(m['alloc_bytes'], peak - start_memory)
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent[2] = now
+            parent[4] = max(parent[4], peak)
+        _reset_peak()
+
+    # Add the time since the phase was (re)started and record its peak memory
+    @staticmethod
+    def _pause(entry, now):
+        for metrics in entry[:2]:
+            if metrics is not None:
+                metrics['time_s'] += now - entry[2]
+        entry[4] = max(entry[4], _traced_memory()[1])
+
+
+def _traced_memory():
+    return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+
+def _reset_peak():
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+
+def phase(stats, name, element=None):
+    """Function to measure a block of code as a phase of stats (a no-op without stats).
+
+    Args:
+        stats (Optional[RenderStats]): Stats of the profiled render.
+        name (str): Phase name.
+        element (Optional[int]): Index of the element the block is measured for.
+    """
+
+    if stats is None:
+        return contextlib.nullcontext()
+
+    return stats.phase(name, element)
+
+
+def iter_phase(stats, name, iterable):
+    """Function to measure the iteration of a lazy iterable as a phase of stats (a no-op without stats)."""
+
+    if stats is None:
+        return iterable
+
+    return stats.iter_phase(name, iterable)
+
+
+@contextlib.contextmanager
+def tracing(stats):
+    """Context manager to trace allocations with tracemalloc while a render is profiled.
+
+    Tracing is only stopped on exit if it was started here.  Tracing slows down allocations, so profiled renders
+        take longer than unprofiled ones.
+    """
+
+    start = stats is not None and not tracemalloc.is_tracing()
+    if start:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if start:
+            tracemalloc.stop()
+
+
+def iterencode(stats, element_data):
+    """Function to serialize element data as JSON (see serializers.iterencode) and measure the payload of each element.
+
+    The size of each element is counted from the text as it is encoded, so element data is serialized only once,
+        and added to the element's 'payload_bytes' in stats (a no-op without stats).  The size is that of the UTF-8
+        JSON text of the element plus the base64 text of the 'binary' payload arrays it references.  Arrays stored
+        once for several elements (see serializers.dedupe_arrays) and compression are not counted.
+
+    Args:
+        stats (Optional[RenderStats]): Stats of the profiled render.
+        element_data: Element data (or a chunk of it) as embedded in the page, with one entry per element of stats.
+
+    Returns:
+        iterable: JSON text chunks.
+    """
+
+    if stats is None:
+        return serializers.iterencode(element_data)
+
+    return _iterencode_sized(stats, element_data)
+
+
+def _iterencode_sized(stats, element_data):
+    if isinstance(element_data, dict):
+        # Store of shared arrays and the elements referencing it
+        yield '{'
+        for i, (k, v) in enumerate(element_data.items()):
+            yield (', ' if i else '') + json.dumps(k) + ': '
+            yield from _iterencode_elements(stats, v) if k == 'elements' else serializers.iterencode(v)
+        yield '}'
+    elif isinstance(element_data, list):
+        yield from _iterencode_elements(stats, element_data)
+    else:
+        yield from serializers.iterencode(element_data)
+
+
+def _iterencode_elements(stats, elements):
+    yield '['
+    for i, element in enumerate(elements):
+        if i:
+            yield ', '
+        n_bytes = 4 * -(-_packed_bytes(element) // 3)
+        for text in serializers.iterencode(element):
+            n_bytes += len(text) if text.isascii() else len(text.encode('utf-8'))
+            yield text
+        if i < len(stats.elements):
+            stats.elements[i]['payload_bytes'] = (stats.elements[i]['payload_bytes'] or 0) + n_bytes
+    yield ']'
+
+
+# Return the number of bytes of the binary payload arrays referenced by packed element data
+def _packed_bytes(value):
+    if isinstance(value, dict):
+        ref = value.get(serializers.BUFFER_REF)
+        if isinstance(ref, dict):
+            return ref['length'] * np.dtype(serializers._packed_dtypes[ref['dtype']]).itemsize
+        return sum(_packed_bytes(v) for v in value.values())
+    elif isinstance(value, (list, tuple)):
+        return sum(_packed_bytes(v) for v in value)
+
+    return 0
@@ -0,0 +1,82 @@
+try:
+    from importlib import metadata
+except ImportError:
+    metadata = None
+
+
+class Registry:
+    """Class representing a registry of Element, Condition or Popover types keyed by lower case type name.
+
+        Subclasses register themselves when they are defined (see __init_subclass__ of the base classes).
+            Third-party types may also be provided by package entry points, which are only loaded when a
+            requested type name is not already registered.
+
+        Args:
+            kind (str): Kind of registered type used in error messages (e.g., 'element').
+            group (str): Entry point group of third-party types (e.g., 'ssv.elements').
+    """
+
+    def __init__(self, kind, group):
+        self.kind = kind
+        self.group = group
+        self._classes = {}
+        self._entry_points = None
+
+    def register(self, cls, name=None):
+        """Method to register a type under its class name (or under name if given)."""
+
+        self._classes[(name or cls.__name__).lower()] = cls
+
+        return cls
+
+    def get(self, name):
+        """Method to return the registered type for a type name (case insensitive).
+
+        Args:
+            name (str): Type name.
+
+        Returns:
+            Registered class.
+        """
+
+        try:
+            return self._classes[name.lower()]
+        except KeyError:
+            pass
+        except AttributeError:
+            raise TypeError('%s type must be of type str' % self.kind)
+
+        cls = self._load_entry_point(name.lower())
+        if cls is None:
+            raise ValueError('%s type \'%s\' is not a supported type.' % (self.kind, name))
+
+        return cls
+
+    def names(self):
+        """Method to return names of all registered types (including unloaded entry point types)."""
+
+        return sorted(set(self._classes) | set(self._get_entry_points()))
+
+    # Load entry point for type name and register it - returns None if there is no such entry point
+    def _load_entry_point(self, name):
+        entry_point = self._get_entry_points().get(name)
+        if entry_point is None:
+            return None
+
+        cls = entry_point.load()
+        # Entry point classes subclass a base class and register under their class name on import - also
+        # register them under the entry point name
+        return self.register(cls, name)
+
+    # Return dict of lower case entry point name -> entry point (listed once per registry)
+    def _get_entry_points(self):
+        if self._entry_points is None:
+            if metadata is None:
+                entry_points = []
+            elif hasattr(metadata.entry_points(), 'select'):
+                entry_points = metadata.entry_points().select(group=self.group)
+            else:
+                entry_points = metadata.entry_points().get(self.group, [])
+            self._entry_points = {entry_point.name.lower(): entry_point for entry_point in entry_points}
+
+        return self._entry_points
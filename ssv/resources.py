@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    from jinja2 import Environment, PackageLoader, FileSystemBytecodeCache
+except ImportError:
+    raise ImportError("Missing required package: jinja2.")
+
+_base_path = os.path.dirname(os.path.abspath(__file__))
+
+# Static files that are inlined (or linked, see write_static_assets) in 'full' mode renders,
+# keyed by template variable name
+_static_files = {
+    'ssv_css': os.path.join('static', 'css', 'ssv.css'),
+    'bootstrap_css': os.path.join('static', 'css', 'bootstrap.min.css'),
+    'ssv_js': os.path.join('static', 'js', 'ssv.min.js'),
+    'whammy_js': os.path.join('static', 'js', 'whammy.js'),
+}
+
+# Process-wide caches - populated on first use
+_cache = {}
+_bytecode_cache_dir = None
+
+
+def set_bytecode_cache(directory=None):
+    """Function to enable (or disable) an on-disk bytecode cache for compiled templates.
+
+    Compiled templates are always cached in memory for the life of the process.  The bytecode cache also
+        persists them across processes.
+
+    Args:
+        directory (Optional[str]): Directory for cached template bytecode.  None disables the disk cache.
+    """
+
+    global _bytecode_cache_dir
+
+    if directory is not None and not isinstance(directory, str):
+        raise TypeError('\'directory\' input must be a string.')
+    if directory is not None and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    _bytecode_cache_dir = directory
+    _cache.pop('environment', None)
+
+
+def clear_cache():
+    """Function to clear all cached templates, static assets and overlays."""
+
+    _cache.clear()
+
+
+def get_environment():
+    """Function to return the shared jinja2 environment for ssv templates."""
+
+    if 'environment' not in _cache:
+        bytecode_cache = FileSystemBytecodeCache(_bytecode_cache_dir) if _bytecode_cache_dir else None
+        _cache['environment'] = Environment(loader=PackageLoader('ssv', ''), bytecode_cache=bytecode_cache,
+                                            auto_reload=False)
+
+    return _cache['environment']
+
+
+def get_template(name):
+    """Function to return a compiled ssv template.
+
+    Args:
+        name (str): Template path relative to the ssv package (e.g., 'templates/ssv.html').
+    """
+
+    # Template names always use '/' separators (this also avoids the jinja2 Windows path bug)
+    return get_environment().get_template(name)
+
+
+def get_static_assets():
+    """Function to return the contents of the static files inlined in 'full' mode renders.
+
+    Returns:
+        dict: Template variable name -> file contents.
+    """
+
+    if 'static_assets' not in _cache:
+        static_assets = {}
+        for name, path in _static_files.items():
+            with open(os.path.join(_base_path, path), 'r', encoding='utf-8') as f:
+                static_assets[name] = f.read()
+        _cache['static_assets'] = static_assets
+
+    return _cache['static_assets']
+
+
+def get_static_asset_names():
+    """Function to return content-hashed file names for the static files used in 'full' mode renders.
+
+    The hash changes whenever the file contents change, so written assets can be cached indefinitely by browsers.
+
+    Returns:
+        dict: Template variable name -> file name (e.g., 'ssv.min.1a2b3c4d5e6f.js').
+    """
+
+    if 'static_asset_names' not in _cache:
+        static_asset_names = {}
+        for name, content in get_static_assets().items():
+            root, ext = os.path.splitext(os.path.basename(_static_files[name]))
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+            static_asset_names[name] = '%s.%s%s' % (root, digest, ext)
+        _cache['static_asset_names'] = static_asset_names
+
+    return _cache['static_asset_names']
+
+
+def write_static_assets(directory):
+    """Function to write the static files used in 'full' mode renders to a directory under content-hashed names.
+
+    Files that already exist are not rewritten, so repeated exports to the same directory only copy the
+        assets once.  Files are written to a temporary name and moved into place so concurrent exports never
+        see a partial file.
+
+    Args:
+        directory (str): Asset directory.  Created if it does not exist.
+
+    Returns:
+        dict: Template variable name -> file name written (or found) in directory.
+    """
+
+    if not isinstance(directory, str):
+        raise TypeError('\'directory\' input must be a string.')
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    static_assets = get_static_assets()
+    static_asset_names = get_static_asset_names()
+    for name, file_name in static_asset_names.items():
+        file_path = os.path.join(directory, file_name)
+        if os.path.isfile(file_path):
+            continue
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(static_assets[name])
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    return static_asset_names
+
+
+def get_svg_overlays():
+    """Function to return the svg pattern overlays (e.g., water) as a dict."""
+
+    if 'svg_overlays' not in _cache:
+        with open(os.path.join(_base_path, 'data', 'ssv-overlays.json'), 'r') as f:
+            _cache['svg_overlays'] = json.load(f)
+
+    return _cache['svg_overlays']
+
+
+def get_svg_overlays_json():
+    """Function to return the svg pattern overlays serialized as JSON."""
+
+    if 'svg_overlays_json' not in _cache:
+        _cache['svg_overlays_json'] = json.dumps(get_svg_overlays())
+
+    return _cache['svg_overlays_json']
@@ -0,0 +1,548 @@
+import base64
+import hashlib
+import json
+import re
+import zlib
+
+import numpy as np
+
+from .array_sources import is_file_backed, iter_blocks
+from .buffers import BufferView
+from .decimation import x_keys
+
+# Key used in serialized element data to mark a reference into the binary payload
+BUFFER_REF = '__ssv_buffer__'
+# Keys used in serialized element data to hold arrays shared by several conditions or elements (see dedupe_arrays)
+ARRAY_REF = '__ssv_array__'
+STORE_KEY = '__ssv_store__'
+
+_binary_dtypes = {'float32': '<f4', 'float64': '<f8'}
+# Integer arrays (e.g., color palette indices and delta indices) are packed with an exact integer dtype
+_packed_dtypes = dict(_binary_dtypes, uint8='u1', int32='<i4', uint32='<u4')
+# Keys of the x-series indexed arrays that are packed - small arrays (e.g., color_levels, shape or dims) stay JSON
+_packed_keys = frozenset(x_keys + ('keyframes', 'delta_counts', 'delta_indices', 'delta_values', STORE_KEY))
+# zlib window bits of each compression format ('deflate' is the zlib format read by DecompressionStream)
+_compress_wbits = {'gzip': 31, 'deflate': 15}
+_numeric_kinds = 'biuf'
+# Arrays smaller than this (in bytes) are cheaper to repeat than to reference
+_dedupe_min_bytes = 64
+_dedupe_kinds = 'biufU'
+# Palette index marking a missing (NaN) color value - palettes hold at most 255 colors
+_palette_nan_index = 255
+# Largest number of bytes of a 1-d array that is converted to a list for JSON encoding at once
+_encode_block_bytes = 2 ** 20
+# Non-finite number literals written by json.dumps (strings are matched as a whole so their contents are skipped)
+_nonfinite_re = re.compile(r'"(?:[^"\\]|\\.)*"|-?Infinity|NaN')
+# Strict JSON for non-finite numbers - 1e999 overflows to an infinity when parsed
+_nonfinite_json = {'NaN': 'null', 'Infinity': '1e999', '-Infinity': '-1e999'}
+
+
+class ArrayEncoder(json.JSONEncoder):
+    """JSON encoder for element data holding numpy arrays and scalars.
+
+        Validated condition data is kept as ndarrays and only converted to JSON at render time.
+    """
+
+    def default(self, o):
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        elif isinstance(o, np.generic):
+            return o.item()
+
+        return super(ArrayEncoder, self).default(o)
+
+
+def dumps(obj):
+    """Function to serialize element data (including numpy arrays) as a JSON string."""
+
+    return json.dumps(obj, cls=ArrayEncoder)
+
+
+def strict_json(text):
+    """Function to replace the NaN and Infinity literals of JSON text with strict JSON that JSON.parse accepts.
+
+        NaN is written as null (restored to NaN in arrays by ssv_compression.parse) and infinities as numbers that
+            overflow to infinities.  Chunks yielded by iterencode hold whole tokens, so each can be converted alone.
+
+        Args:
+            text (str): JSON text (as written by dumps or a chunk of iterencode).
+
+        Returns:
+            str: Text without non-finite literals.
+    """
+
+    if 'NaN' not in text and 'Infinity' not in text:
+        return text
+
+    return _nonfinite_re.sub(lambda m: _nonfinite_json.get(m.group(0), m.group(0)), text)
+
+
+def iterencode(obj):
+    """Function to serialize element data as JSON incrementally.
+
+        Yields the same text as dumps, but arrays are encoded one slice along their first axis (or one block of
+            a large 1-d array) at a time so the full JSON string is never held in memory, and file-backed arrays
+            (see array_sources) are read as they are encoded.
+
+        Args:
+            obj: Element data (dicts, lists, numpy arrays and JSON scalars).
+
+        Yields:
+            str: JSON text chunks.
+    """
+
+    if isinstance(obj, BufferView) and obj.buffer is not None and len(obj) >= obj.buffer.n_encoded:
+        yield from _iterencode_buffer(obj)
+    elif isinstance(obj, dict):
+        yield '{'
+        for i, (k, v) in enumerate(obj.items()):
+            yield (', ' if i else '') + json.dumps(k) + ': '
+            yield from iterencode(v)
+        yield '}'
+    elif isinstance(obj, np.ndarray) and obj.ndim > 1:
+        yield '['
+        for i in range(obj.shape[0]):
+            yield (', ' if i else '') + json.dumps(obj[i].tolist())
+        yield ']'
+    elif isinstance(obj, np.ndarray) and obj.ndim == 1 and obj.nbytes > _encode_block_bytes:
+        yield '['
+        for start, block in iter_blocks(obj, _encode_block_bytes):
+            yield (', ' if start else '') + json.dumps(block.tolist())[1:-1]
+        yield ']'
+    elif isinstance(obj, (list, tuple)) and any(isinstance(v, (dict, list, tuple, np.ndarray)) for v in obj):
+        yield '['
+        for i, v in enumerate(obj):
+            if i:
+                yield ', '
+            yield from iterencode(v)
+        yield ']'
+    else:
+        yield json.dumps(obj, cls=ArrayEncoder)
+
+
+# Encode a view of a growable buffer, caching the text of rows that were not encoded before on the buffer
+def _iterencode_buffer(view):
+    buffer = view.buffer
+    tail = np.asarray(view[buffer.n_encoded:])
+    if len(tail):
+        if tail.ndim > 1:
+            text = ', '.join(json.dumps(row.tolist()) for row in tail)
+        else:
+            text = json.dumps(tail.tolist())[1:-1]
+        buffer.json_segments.append(text)
+        buffer.n_encoded = len(view)
+
+    yield '['
+    for i, text in enumerate(buffer.json_segments):
+        yield (', ' if i else '') + text
+    yield ']'
+
+
+def iter_compress(chunks, method='gzip', level=6):
+    """Function to compress text or bytes chunks incrementally.
+
+        Args:
+            chunks (iterable): str (encoded as utf-8) or bytes chunks.
+            method (str): Compression format ('gzip' or 'deflate').
+            level (int): zlib compression level.
+
+        Yields:
+            bytes: Compressed data chunks.
+    """
+
+    if method not in _compress_wbits:
+        raise ValueError('compression method must be one of: %s' % ', '.join(sorted(_compress_wbits)))
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _compress_wbits[method])
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_base64(chunks):
+    """Function to encode bytes chunks as base64 text incrementally.
+
+        Yields:
+            str: base64 text chunks that concatenate to the base64 encoding of the joined input.
+    """
+
+    remainder = b''
+    for data in chunks:
+        data = remainder + data
+        n_bytes = len(data) - len(data) % 3
+        if n_bytes:
+            yield base64.b64encode(data[:n_bytes]).decode('ascii')
+        remainder = data[n_bytes:]
+
+    if remainder:
+        yield base64.b64encode(remainder).decode('ascii')
+
+
+def dedupe_arrays(element_data):
+    """Function to store arrays that appear more than once in element data a single time.
+
+        Arrays are identified by a hash of their dtype, shape and content, so equal arrays are shared even when
+            they are separate objects (e.g., the level data copied into the Info condition of a DynamicLevel, or
+            the same series bound to a Background and a Report).  Every repeated array is replaced by a reference
+            into a store of distinct arrays that is resolved by the browser on load.
+
+        Args:
+            element_data (list[dict]): Element data as returned by Element.dump_attr.
+
+        Returns:
+            Element data unchanged if no array is repeated, else a dict holding the store of distinct arrays
+                (STORE_KEY) and a copy of element data with repeated arrays replaced by references ('elements').
+    """
+
+    # id -> (array, content key) of every array visited - arrays are kept referenced so ids stay unique
+    keys = {}
+    counts = {}
+
+    def visit(value):
+        if isinstance(value, dict):
+            for v in value.values():
+                visit(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                visit(v)
+        elif _dedupe_candidate(value):
+            if id(value) not in keys:
+                keys[id(value)] = (value, _content_key(value))
+            key = keys[id(value)][1]
+            counts[key] = counts.get(key, 0) + 1
+
+    visit(element_data)
+    if not any(count > 1 for count in counts.values()):
+        return element_data
+
+    store = []
+    store_index = {}
+
+    def replace(value):
+        if isinstance(value, dict):
+            return {k: replace(v) for k, v in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [replace(v) for v in value]
+        elif _dedupe_candidate(value):
+            key = keys[id(value)][1]
+            if counts[key] < 2:
+                return value
+            if key not in store_index:
+                store_index[key] = len(store)
+                store.append(value)
+            return {ARRAY_REF: store_index[key]}
+
+        return value
+
+    elements = replace(element_data)
+
+    return {STORE_KEY: store, 'elements': elements}
+
+
+def _dedupe_candidate(value):
+    return isinstance(value, np.ndarray) and value.dtype.kind in _dedupe_kinds and value.nbytes >= _dedupe_min_bytes
+
+
+# Return hash of array dtype, shape and content
+# File-backed arrays are keyed by the memory they map instead, so their data is not read to be hashed
+def _content_key(arr):
+    if is_file_backed(arr):
+        return ('mapped', arr.__array_interface__['data'][0], arr.dtype.str, arr.shape, arr.strides)
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(('%s%s' % (arr.dtype.str, arr.shape)).encode('ascii'))
+    h.update(np.ascontiguousarray(arr).data)
+
+    return h.digest()
+
+
+def quantize_colors(element_data):
+    """Function to map the color data of conditions to palette indices of their color scale.
+
+        Indices are computed with the thresholds of the d3 quantile scale used by the browser (color levels
+            split into len(color_scale) equal bins), so each value maps to the same color as before.  The browser
+            then looks colors up directly instead of evaluating a scale per value and frame.  NaN values map to
+            index 255 (no color).  Frame encoded color data (see encode_frames) has its keyframes and delta values
+            mapped.  Condition dicts are modified in place.
+
+        Color data that is shown in an element report, and color scales of more than 255 colors, are not
+            quantized.
+
+        Args:
+            element_data (list[dict]): Element data as returned by Element.dump_attr.
+
+        Returns:
+            Element data with uint8 palette indices as color data (marked by 'color_indices').
+    """
+
+    for element in element_data:
+        reported = bool(element.get('report_id'))
+        for condition in element.get('conditions', []):
+            color_data = condition.get('color_data')
+            color_scale = condition.get('color_scale')
+            color_levels = condition.get('color_levels')
+            if color_data is None or color_scale is None or color_levels is None or \
+                    len(color_scale) > _palette_nan_index:
+                continue
+            # Reports show the color data itself unless the condition holds other data
+            if reported and condition.get('report') and 'data' not in condition and 'level_data' not in condition:
+                continue
+
+            n_colors = len(color_scale)
+            level_min, level_max = np.nanmin(color_levels), np.nanmax(color_levels)
+            thresholds = level_min + (level_max - level_min) * (np.arange(1, n_colors) / n_colors)
+
+            if isinstance(color_data, dict):
+                if not all(_is_numeric(color_data[k]) for k in ('keyframes', 'delta_values')):
+                    continue
+                color_data['keyframes'] = _palette_indices(color_data['keyframes'], thresholds)
+                color_data['delta_values'] = _palette_indices(color_data['delta_values'], thresholds)
+            elif _is_numeric(color_data):
+                condition['color_data'] = _palette_indices(color_data, thresholds)
+            else:
+                continue
+            condition['color_indices'] = True
+
+    return element_data
+
+
+def _is_numeric(value):
+    return isinstance(value, np.ndarray) and value.dtype.kind in _numeric_kinds
+
+
+# Return uint8 index of the quantile bin (given by its inner thresholds) of each value
+# Values are mapped in blocks, so file-backed color data is read a block at a time
+def _palette_indices(values, thresholds):
+    if values.ndim == 0:
+        return _palette_indices(values.reshape(1), thresholds).reshape(())
+
+    indices = np.empty(values.shape, dtype=np.uint8)
+    for start, block in iter_blocks(values):
+        block_indices = np.searchsorted(thresholds, block, side='right')
+        block_indices[np.isnan(block)] = _palette_nan_index
+        indices[start:start + len(block)] = block_indices
+
+    return indices
+
+
+def encode_frames(element_data):
+    """Function to apply the frame encoding requested by conditions (e.g., Rect encoding='delta') to element data.
+
+        Encoding is applied to rendered element data (after any x-series decimation).  Condition dicts are
+            modified in place.
+
+        Args:
+            element_data (list[dict]): Element data as returned by Element.dump_attr.
+
+        Returns:
+            Element data with encoded color data.
+    """
+
+    for element in element_data:
+        for condition in element.get('conditions', []):
+            if condition.get('encoding') == 'delta':
+                condition['color_data'] = delta_encode(condition['color_data'], condition.pop('keyframe_interval'),
+                                                       condition.pop('delta_tolerance'))
+
+    return element_data
+
+
+def delta_encode(frames, keyframe_interval=50, tolerance=0):
+    """Function to encode a series of frames (e.g., heatmap slices) as periodic keyframes plus sparse deltas.
+
+        Every keyframe_interval-th frame is kept in full.  Each other frame is stored as the flat indices and
+            values of the cells that changed by more than tolerance from the previous decoded frame, so decoded
+            frames never drift by more than tolerance.
+
+        Args:
+            frames (array): Frames along the first axis.
+            keyframe_interval (int): Number of frames between keyframes.
+            tolerance (int, float): Largest change in a cell that is not stored.  0 is lossless.
+
+        Returns:
+            dict: Encoded frames with keys 'encoding', 'shape', 'keyframe_interval', 'keyframes', 'delta_counts'
+                (number of changed cells in each frame), 'delta_indices' and 'delta_values'.
+    """
+
+    if not isinstance(frames, np.ndarray):
+        frames = np.asarray(frames, dtype='float64')
+    n_frames = frames.shape[0]
+    frame_size = int(np.prod(frames.shape[1:], dtype='int64'))
+
+    # Frames are read and compared a block at a time, so file-backed frames are never loaded in full
+    # previous holds the last frame (decoded frame with a tolerance) of the blocks before
+    keyframes = np.empty(((n_frames + keyframe_interval - 1) // keyframe_interval, frame_size))
+    counts = np.zeros(n_frames, dtype='int64')
+    indices = []
+    values = []
+    previous = None
+    for start, block in iter_blocks(frames):
+        flat = np.asarray(block, dtype='float64').reshape(len(block), frame_size)
+        is_keyframe = np.arange(start, start + len(block)) % keyframe_interval == 0
+        keyframes[(start + np.flatnonzero(is_keyframe)) // keyframe_interval] = flat[is_keyframe]
+
+        if tolerance == 0:
+            # Without a tolerance the previous decoded frame is the previous frame - compare the block at once
+            before = np.empty_like(flat)
+            before[1:] = flat[:-1]
+            before[0] = flat[0] if previous is None else previous
+            changed = (flat != before) & ~(np.isnan(flat) & np.isnan(before))
+            changed[is_keyframe] = False
+            frame_index, block_indices = np.nonzero(changed)
+            counts[start:start + len(block)] = changed.sum(axis=1)
+            indices.append(block_indices)
+            values.append(flat[frame_index, block_indices])
+            previous = flat[-1].copy()
+            continue
+
+        for i in range(len(block)):
+            if is_keyframe[i]:
+                previous = flat[i].copy()
+                continue
+            with np.errstate(invalid='ignore'):
+                changed = ~(np.abs(flat[i] - previous) <= tolerance)
+            changed &= ~(np.isnan(flat[i]) & np.isnan(previous))
+            frame_indices = np.flatnonzero(changed)
+            previous[frame_indices] = flat[i, frame_indices]
+            counts[start + i] = len(frame_indices)
+            indices.append(frame_indices)
+            values.append(flat[i, frame_indices])
+
+    indices = np.concatenate(indices) if indices else np.zeros(0, dtype='int64')
+    values = np.concatenate(values) if values else np.zeros(0)
+
+    return {'encoding': 'delta', 'shape': list(frames.shape), 'keyframe_interval': keyframe_interval,
+            'keyframes': keyframes.reshape((len(keyframes),) + frames.shape[1:]), 'delta_counts': counts,
+            'delta_indices': indices, 'delta_values': values}
+
+
+class BinaryPayload:
+    """Class representing a binary typed-array payload for rendered element data.
+
+        Numeric x-series indexed arrays (and the keyframes and deltas of delta encoded data) found in element data
+            are packed into a single little-endian buffer and replaced by references holding their byte offset,
+            dtype and shape.  Float arrays are packed with dtype and integer arrays with an exact integer dtype.
+            The buffer is embedded in the rendered page as base64 text and wrapped as JS typed arrays on load, so the
+            browser never parses the data as JSON.
+
+        Args:
+            dtype (Optional[str]): Float precision of the packed arrays ('float32' or 'float64').
+    """
+
+    # Alignment (in bytes) of every buffer so Float64Array views can be built on any offset
+    _alignment = 8
+
+    def __init__(self, dtype='float64'):
+        if dtype not in _binary_dtypes:
+            raise ValueError('binary payload dtype must be one of: %s' % ', '.join(sorted(_binary_dtypes)))
+
+        self.dtype = dtype
+        self._arrays = []
+        self._n_bytes = 0
+
+    def pack(self, element_data):
+        """Method to replace numeric arrays in element data with buffer references.
+
+        Args:
+            element_data (list[dict]): Element data as returned by Element.dump_attr.
+
+        Returns:
+            Copy of element data with numeric arrays replaced by buffer references.
+        """
+
+        return self._pack_value(element_data)
+
+    @property
+    def n_bytes(self):
+        return self._n_bytes
+
+    def dumps(self):
+        """Method to encode the packed buffer as base64 text.
+
+        Returns:
+            str: base64 representation of the packed buffer.
+        """
+
+        return base64.b64encode(b''.join(self.iter_bytes())).decode('ascii')
+
+    def iter_base64(self):
+        """Method to encode the packed buffer as base64 text incrementally.
+
+        Arrays are converted to bytes one block of rows at a time, so memory is bounded by the block size.
+
+        Yields:
+            str: base64 text chunks that concatenate to the output of dumps.
+        """
+
+        return iter_base64(self.iter_bytes())
+
+    def iter_bytes(self):
+        """Method to return the packed buffer incrementally, one block of array rows at a time.
+
+        Yields:
+            bytes: Buffer chunks (the bytes of each array are followed by padding to the buffer alignment).
+        """
+
+        for arr, dtype in self._arrays:
+            n_bytes = 0
+            for _, block in iter_blocks(arr):
+                data = np.ascontiguousarray(block, dtype=_packed_dtypes[dtype]).tobytes()
+                n_bytes += len(data)
+                yield data
+            if n_bytes % self._alignment:
+                yield b'\0' * (-n_bytes % self._alignment)
+
+    def _pack_value(self, value, packed=False):
+        if isinstance(value, dict):
+            return {k: self._pack_value(v, k in _packed_keys) for k, v in value.items()}
+
+        arr = _numeric_array(value) if packed else None
+        if arr is not None:
+            return self._add_array(arr)
+        elif isinstance(value, list):
+            return [self._pack_value(v, packed) for v in value]
+
+        return value
+
+    def _add_array(self, arr):
+        dtype = _integer_dtype(arr) if arr.dtype.kind in 'iu' else self.dtype
+        ref = {BUFFER_REF: {'offset': self._n_bytes, 'length': int(arr.size), 'dtype': dtype,
+                            'shape': list(arr.shape)}}
+
+        # Arrays are only converted to bytes when the payload is written
+        n_bytes = arr.size * np.dtype(_packed_dtypes[dtype]).itemsize
+        self._arrays.append((arr, dtype))
+        self._n_bytes += n_bytes + -n_bytes % self._alignment
+
+        return ref
+
+
+# Return the packed dtype of an integer array: uint8 as is, else int32 or uint32 if its values fit (float64 if not)
+def _integer_dtype(arr):
+    if arr.dtype == np.uint8:
+        return 'uint8'
+    for dtype in ('int32', 'uint32'):
+        if np.can_cast(arr.dtype, dtype) or np.iinfo(dtype).min <= arr.min() and arr.max() <= np.iinfo(dtype).max:
+            return dtype
+
+    return 'float64'
+
+
+# Helper function to return input as a numeric ndarray if it is a non-empty rectangular numeric array
+def _numeric_array(value):
+    if isinstance(value, np.ndarray):
+        arr = value
+    elif isinstance(value, list) and len(value) > 0:
+        try:
+            arr = np.asarray(value)
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if arr.ndim < 1 or arr.size < 1 or arr.dtype.kind not in _numeric_kinds:
+        return None
+
+    return arr
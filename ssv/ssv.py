@@ -1,15 +1,24 @@
-import json
+import re
 import xml.etree.ElementTree as ET
 import os
 import uuid
 
 try:
-    from jinja2 import Environment, PackageLoader
     import numpy as np
 except ImportError:
-    raise ImportError("Missing required packages: jinja2 and/or numpy.")
+    raise ImportError("Missing required package: numpy.")
 
+from . import batch
+from . import buffers
+from . import chunks
+from . import decimation as decimation_lib
 from . import elements
+from . import live as live_lib
+from . import profiling
+from . import resources
+from . import serializers
+from .array_sources import is_file_backed
+from .data_validators import validate_array, validate_array_slices
 
 
 class SSV:
@@ -47,6 +56,85 @@ class SSV:
 
         return ssv
 
+    @staticmethod
+    def render_many(specs, out_dir, workers=None, **kwargs):
+        """Method to build and save many visualizations in parallel using a process pool.
+
+        See batch.render_many for arguments and returned per-item results.
+        """
+
+        return batch.render_many(specs, out_dir, workers=workers, **kwargs)
+
+    @staticmethod
+    def render_dashboard(vis_list, layout=1, title='SSV Dashboard', assets='inline', asset_dir=None, asset_url=None,
+                         **kwargs):
+        """Method to render multiple visualizations as a single dashboard page.
+
+        The page holds a single copy of the static javascript and css files and the svg pattern overlays.
+            Panels with identical x-series share a single copy of the series.
+
+        Args:
+            vis_list (list[Vis]): Visualizations to render as dashboard panels.
+            layout (int, list[list[int]]): Dashboard layout
+            *int: Number of panel columns.  Panels are placed in rows in the order of vis_list.
+            *list[list[int]]: Rows of indices into vis_list.  Each visualization may be placed once.
+            title (Optional[str]): Title of dashboard page.
+            assets (str): Handling of static javascript and css files (see Vis.render_model).
+            asset_dir (str): Directory for 'external' assets.
+            asset_url (str): Url (or relative path) of 'asset_dir' as seen from the rendered page.
+            **kwargs: Keyword arguments for Vis.render_model applied to every panel (e.g., height, payload).  With
+                chunk_size, the chunks of each panel are written to a 'panel_<index>' subdirectory of 'chunk_dir'.
+
+        Returns:
+            str: Rendered dashboard page.
+        """
+
+        if not isinstance(vis_list, (list, tuple)) or len(vis_list) < 1 or \
+                not all(isinstance(vis, Vis) for vis in vis_list):
+            raise TypeError('\'vis_list\' input must be a non-empty list of Vis objects.')
+        if not isinstance(title, str):
+            raise TypeError('\'title\' input must be a string.')
+
+        if isinstance(layout, int) and not isinstance(layout, bool):
+            if layout < 1:
+                raise ValueError('\'layout\' column count must be greater than 0.')
+            layout = [list(range(i, min(i + layout, len(vis_list)))) for i in range(0, len(vis_list), layout)]
+        elif isinstance(layout, list) and all(isinstance(row, list) for row in layout):
+            indices = [i for row in layout for i in row]
+            if not all(isinstance(i, int) and 0 <= i < len(vis_list) for i in indices):
+                raise ValueError('\'layout\' indices must be valid indices of \'vis_list\'.')
+            if len(set(indices)) != len(indices):
+                raise ValueError('\'layout\' indices must be unique.')
+        else:
+            raise TypeError('\'layout\' input must be an int or a list of lists of ints.')
+
+        render_vars = {'title': title, 'shared_id': 'ssv_shared_' + uuid.uuid4().hex,
+                       'svg_overlays': resources.get_svg_overlays_json()}
+        render_vars.update(_asset_render_vars(assets, asset_dir, asset_url))
+
+        # Panels reference the shared overlays and x-series by name instead of embedding their own copy
+        x_series_index = {}
+        panels = {}
+        for i in set(i for row in layout for i in row):
+            panel_kwargs = dict(kwargs, mode='html')
+            if kwargs.get('chunk_size') is not None and isinstance(kwargs.get('chunk_dir'), str):
+                panel_kwargs['chunk_dir'] = os.path.join(kwargs['chunk_dir'], 'panel_%d' % i)
+                chunk_url = kwargs.get('chunk_url')
+                panel_kwargs['chunk_url'] = '%s/panel_%d' % (chunk_url.rstrip('/'), i) if chunk_url is not None \
+                    else None
+            template, panel_vars, _ = vis_list[i]._prepare_render(
+                svg_overlays=render_vars['shared_id'] + '.svg_overlays', **panel_kwargs)
+            x_series = str(panel_vars['x_series'])
+            if x_series not in x_series_index:
+                x_series_index[x_series] = len(x_series_index)
+            panel_vars['x_series'] = '%s.x_series[%d]' % (render_vars['shared_id'], x_series_index[x_series])
+            panels[i] = template.render(panel_vars)
+
+        render_vars['x_series'] = sorted(x_series_index, key=x_series_index.get)
+        render_vars['rows'] = [[panels[i] for i in row] for row in layout]
+
+        return resources.get_template('templates/ssv_dashboard.html').render(render_vars)
+
 
 class Vis:
     """Class representing SSV visualization.
@@ -76,11 +164,12 @@ class Vis:
             raise TypeError('\'title\' input must be a string.')
 
         try:
-            x_series = np.array(x_series).astype('float')
+            x_series = np.array(x_series, dtype='float64')
             if len(x_series.shape) > 1 or len(x_series.shape) < 0:
                 raise TypeError('\'x_series\' input must be 1 dimensional with at least one value.')
-            x_series = x_series.tolist()
-            self._x_series = ['%.4e' % i for i in x_series]
+            # A single read-only series is shared by reference with every element and formatted by the browser
+            x_series.flags.writeable = False
+            self._x_series = x_series
         except ValueError:
             raise ValueError('\'x_series\' input must be provided in an array-like numeric format')
 
@@ -118,9 +207,7 @@ class Vis:
         self._x_series_unit = x_series_unit
         self._elements = []
 
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        with open(os.path.join(base_path, 'data', 'ssv-overlays.json'), 'r') as f:
-            self._svg_overlays = json.load(f)
+        self._svg_overlays = resources.get_svg_overlays()
 
         self._svg_out = None
         self._font_size = font_size
@@ -174,28 +261,173 @@ class Vis:
         if not isinstance(element_id, str):
             raise TypeError('\'element_id\' input must be a string.')
 
-        for i in range(len(self._elements)):
-            element_ids = self._elements[i].ids
-            if element_id in element_ids:
-                element_ids.remove(element_id)
-            if len(element_ids) < 1:
-                del self._elements[i]
+        self._del_element_ids([element_id])
+
+    # Remove a batch of element ids in a single pass over elements
+    def _del_element_ids(self, element_ids):
+        element_ids = set(element_ids)
+
+        elements_kept = []
+        for element in self._elements:
+            if isinstance(element.ids, list) and element_ids.intersection(element.ids):
+                element.ids[:] = [i for i in element.ids if i not in element_ids]
+                if len(element.ids) < 1:
+                    continue
+            elements_kept.append(element)
+
+        self._elements = elements_kept
+
+    def append(self, x_values, rows):
+        """Method to append new x-series values and the matching rows of condition data to the visualization.
+
+        The x-series and all x-series indexed data (e.g., 'data', 'color_data' and 'level_data') are moved to
+            growable buffers on the first append, so repeated appends (e.g., progress snapshots of a running
+            simulation) copy each row a constant number of times on average.  Only the new rows are validated,
+            and the next render only encodes the JSON text of the new rows.  Buffered data is read-only.
+            File-backed data (e.g., a .npy path or np.memmap input) is not loaded into memory to grow it, so data
+            that is appended to must be passed as in-memory arrays.
+
+        Args:
+            x_values (array): New x-series values.  Must be castable as a 1 dimensional numeric array by numpy.
+            rows (dict): New rows along the first axis of condition data keyed by condition id (see
+                Condition.id).  Each value is an array for conditions with a single x-series indexed input, or
+                a dict of input name (e.g., 'level_data') to array.  Rows of the data of an element popover are
+                keyed by '<element ids joined by _>_popover'.  Inputs that share the same data (e.g., the info
+                condition added with 'color_data_description') do not need separate rows.
+        """
+
+        x_values = validate_array(x_values, 'float', 1, 1)
+        if not isinstance(rows, dict):
+            raise TypeError('\'rows\' input must be a dict of condition id to new rows.')
+        n_new = x_values.shape[0]
+        x_len = len(self._x_series)
+
+        # Find the x-series indexed inputs of every condition and popover
+        targets = []
+        for element in self._elements:
+            for condition in element.conditions:
+                targets += [(condition.id, container, key) for container, key in _x_indexed(condition, x_len)]
+            if element.popover is not None:
+                targets += [('%s_popover' % '_'.join(element.ids), container, key)
+                            for container, key in _x_indexed(element.popover, x_len)]
+
+        unknown_ids = set(rows) - set(target_id for target_id, _, _ in targets)
+        if unknown_ids:
+            raise ValueError('No x-series indexed data found for ids: %s' % ', '.join(sorted(map(str, unknown_ids))))
+
+        # Validate all new rows before any data is changed, then resolve inputs that share data with another input
+        new_rows = {}
+        unresolved = []
+        for target_id, container, key in targets:
+            value = container[key]
+            if isinstance(value, np.ndarray) and is_file_backed(value):
+                raise ValueError('\'%s\' of \'%s\' is read from a file and cannot be appended to, pass it as an '
+                                 'in-memory array instead.' % (key, target_id))
+            if target_id not in rows:
+                unresolved.append((target_id, container, key))
+                continue
+
+            target_rows = rows[target_id]
+            if isinstance(target_rows, dict):
+                if key not in target_rows:
+                    unresolved.append((target_id, container, key))
+                    continue
+                target_rows = target_rows[key]
+            elif sum(1 for target in targets if target[0] == target_id and target[1] is container) > 1:
+                raise TypeError('Rows for \'%s\' must be a dict of input name to rows.' % target_id)
+            new_rows[id(value)] = (value, _validate_rows(value, target_rows, n_new, target_id, key))
+
+        for target_id, container, key in unresolved:
+            if id(container[key]) not in new_rows:
+                raise ValueError('No rows provided for \'%s\' of \'%s\'.' % (key, target_id))
+
+        # Shared data is appended once and every input referencing it is pointed to the result
+        appended = {}
+        for target_id, container, key in targets:
+            value = container[key]
+            if id(value) not in appended:
+                appended[id(value)] = _append_rows(*new_rows[id(value)])
+            container[key] = appended[id(value)]
+
+        self._x_series = _append_rows(self._x_series, x_values)
+        for element in self._elements:
+            element.x_series = self._x_series
+            if element.popover is not None and hasattr(element.popover, 'x_series'):
+                element.popover.x_series = self._x_series
+
+    def serve(self, host='127.0.0.1', port=0, **kwargs):
+        """Method to serve visualization from a local server that pushes appended frames to open pages.
+
+        Frames appended with the append method of the returned server are sent to every open page, which grows
+            its x-series slider without reloading (see live.LiveServer).
+
+        Args:
+            host (str): Host name or address to listen on.
+            port (int): Port to listen on.  0 picks a free port.
+            **kwargs: Keyword arguments for render_model.
+
+        Returns:
+            LiveServer: Started server.  The page is served at its 'url'.
+        """
+
+        return live_lib.LiveServer(self, host, port, **kwargs).start()
 
     def save_visualization(self, file_path, **kwargs):
         """Method to save rendered visualization as html file.
 
+        The page is streamed to the file in chunks, so the full html string is never held in memory.
+
         Args:
             file_path (str): Intended file path for saving rendered visualization as single encompassing html file.
+            **kwargs: Keyword arguments for render_model.  With assets='external', 'asset_dir' defaults to an
+                'ssv_assets' directory next to the html file and 'asset_url' defaults to the path of 'asset_dir'
+                relative to the html file.  With chunk_size, 'chunk_dir' defaults to a '<file name>_data' directory
+                next to the html file and 'chunk_url' defaults to the path of 'chunk_dir' relative to the html file.
+
+        Returns:
+            Optional[RenderStats]: Stats of the render (and of the file write) if 'profile' is True, else None.
         """
         ext = '.html'
-        if len(file_path) < len(ext) or not ext == file_path[-len(ext)] and os.path.basename(file_path) != '':
+        if len(file_path) < len(ext) or not ext == file_path[-len(ext):] and os.path.basename(file_path) != '':
             file_path += ext
 
-        with open(file_path, 'w') as f:
-            f.write(self.render_model(**kwargs))
+        if kwargs.get('assets') == 'external':
+            html_dir = os.path.dirname(os.path.abspath(file_path))
+            if kwargs.get('asset_dir') is None:
+                kwargs['asset_dir'] = os.path.join(html_dir, 'ssv_assets')
+            if kwargs.get('asset_url') is None:
+                asset_url = os.path.relpath(os.path.abspath(kwargs['asset_dir']), html_dir)
+                kwargs['asset_url'] = asset_url.replace(os.sep, '/')
+
+        if kwargs.get('chunk_size') is not None:
+            html_dir = os.path.dirname(os.path.abspath(file_path))
+            if kwargs.get('chunk_dir') is None:
+                kwargs['chunk_dir'] = os.path.splitext(os.path.abspath(file_path))[0] + '_data'
+            if kwargs.get('chunk_url') is None:
+                chunk_url = os.path.relpath(os.path.abspath(kwargs['chunk_dir']), html_dir)
+                kwargs['chunk_url'] = chunk_url.replace(os.sep, '/')
+
+        profile = kwargs.pop('profile', False)
+        if not isinstance(profile, bool):
+            raise TypeError('\'profile\' input must be a bool.')
+        stats = profiling.RenderStats() if profile else None
+
+        with profiling.tracing(stats), open(file_path, 'w') as f:
+            for chunk in self._generate_model(stats=stats, **kwargs):
+                with profiling.phase(stats, 'write'):
+                    f.write(chunk)
+
+        if stats is not None:
+            stats.page_bytes = os.path.getsize(file_path)
+            profiling.logger.info('%s', stats.report())
+
+        return stats
 
     # Render ssv model using javascript, html, and css
-    def render_model(self, mode='full', height=400):
+    def render_model(self, mode='full', height=400, payload='json', payload_dtype='float64', assets='inline',
+                     asset_dir=None, asset_url=None, max_frames=None, decimation='lttb', chunk_size=None,
+                     chunk_dir=None, chunk_url=None, compress=None, quantize_colors=False, dedupe_arrays=False,
+                     perf_overlay=False, profile=False):
         """Method to render visualization.
 
         Args:
@@ -205,46 +437,296 @@ class Vis:
                 (i.e., javascript libraries) to be provided separately.  Use this option to support
                 a dashboard layout.
             height (float, int): Base pixel height for visualization div.
+            payload (str): Element data encoding
+            *'json' embeds all element data as a JSON literal.
+            *'binary' embeds numeric arrays as a base64 little-endian buffer that is wrapped as JS typed arrays
+                on load.  Use this option for large models.
+            payload_dtype (str): Float precision of 'binary' payload arrays ('float32' or 'float64').
+            assets (str): Handling of static javascript and css files in 'full' mode
+            *'inline' embeds the files in the page.
+            *'external' writes the files once to 'asset_dir' under content-hashed file names and links to them.
+                Files that already exist in 'asset_dir' are not copied again.
+            asset_dir (str): Directory for 'external' assets.
+            asset_url (str): Url (or relative path) of 'asset_dir' as seen from the rendered page.  Defaults to
+                'asset_dir'.
+            max_frames (Optional[int]): Maximum number of x-series frames to render.  All element data is sliced to
+                a shared subset of frames selected by 'decimation'.  None renders every frame.
+            decimation (str): Frame selection method used with max_frames
+            *'lttb' keeps the frames that best preserve the shape of all data series (largest triangle three
+                buckets).
+            *'minmax' keeps the largest positive and negative excursions of all data series in each frame bucket.
+            *'uniform' keeps evenly spaced frames.
+            chunk_size (Optional[int]): Number of x-series frames per sidecar file.  Element data is written to
+                'chunk_dir' as one script per chunk instead of being embedded in the page, and chunks are loaded on
+                demand (and prefetched during playback) as the x-series is scrubbed or played.  None embeds all
+                element data.
+            chunk_dir (str): Directory for chunk files.
+            chunk_url (str): Url (or relative path) of 'chunk_dir' as seen from the rendered page.  Defaults to
+                'chunk_dir'.
+            compress (Optional[str]): Compression of the embedded element data, overlays and binary payload
+            *'gzip' or 'deflate' embed them as compressed base64 blocks that are inflated in the browser (with
+                DecompressionStream where available).  Use this option to reduce the size of single file exports.
+            *None embeds them uncompressed.
+            quantize_colors (bool): Map color data to uint8 indices of each condition's color scale, so the page
+                looks colors up directly instead of evaluating color scales.  Color data shown in element reports is
+                not mapped.
+            dedupe_arrays (bool): Store arrays that appear more than once in element data a single time (see
+                serializers.dedupe_arrays).  Element data is then embedded as a store of shared arrays and a copy of
+                element data referencing it instead of a plain list of elements.
+            perf_overlay (bool): Show a heads-up display of page performance in the visualization panel: time spent
+                decoding element data and initializing elements, frames per second during playback, and the time
+                spent updating each element type per frame.
+            profile (bool): Record the wall time and allocations of each render phase and the payload size of each
+                element (see profiling.RenderStats).  The stats are also logged to the 'ssv.profiling' logger.
+
+        Returns:
+            str: Rendered visualization, or a tuple of the rendered visualization and its RenderStats if 'profile' is
+                True.
         """
 
+        if not isinstance(profile, bool):
+            raise TypeError('\'profile\' input must be a bool.')
+        stats = profiling.RenderStats() if profile else None
+
+        with profiling.tracing(stats):
+            template, render_vars, _ = self._prepare_render(mode=mode, height=height, payload=payload,
+                                                            payload_dtype=payload_dtype, assets=assets,
+                                                            asset_dir=asset_dir, asset_url=asset_url,
+                                                            max_frames=max_frames, decimation=decimation,
+                                                            chunk_size=chunk_size, chunk_dir=chunk_dir,
+                                                            chunk_url=chunk_url, compress=compress,
+                                                            quantize_colors=quantize_colors,
+                                                            dedupe_arrays=dedupe_arrays, perf_overlay=perf_overlay,
+                                                            stats=stats)
+            with profiling.phase(stats, 'template'):
+                html = template.render(render_vars)
+
+        if stats is None:
+            return html
+
+        stats.page_bytes = len(html.encode('utf-8'))
+        profiling.logger.info('%s', stats.report())
+        return html, stats
+
+    # Generate the rendered visualization in chunks (see render_model for arguments)
+    # Element data and binary payload are encoded incrementally in place of their marker strings
+    def _generate_model(self, stats=None, **kwargs):
+        template, render_vars, streams = self._prepare_render(stream=True, stats=stats, **kwargs)
+        marker_re = re.compile('|'.join(re.escape(marker) for marker in streams))
+
+        for chunk in profiling.iter_phase(stats, 'template', template.generate(render_vars)):
+            pos = 0
+            for match in marker_re.finditer(chunk):
+                yield chunk[pos:match.start()]
+                yield from streams[match.group()]
+                pos = match.end()
+            yield chunk[pos:]
+
+    # Validate render inputs and return template, template variables and a dict of marker -> chunk iterable
+    # for variables that are streamed (stream=True) instead of rendered as strings
+    # svg_overlays is a javascript expression of overlays defined elsewhere on the page (e.g., shared by dashboard
+    # panels) that are then neither embedded nor compressed with the element data
+    # Phases are recorded in stats (a RenderStats) if provided - lazily encoded variables are measured as they are
+    # iterated
+    def _prepare_render(self, mode='full', height=400, payload='json', payload_dtype='float64', assets='inline',
+                        asset_dir=None, asset_url=None, max_frames=None, decimation='lttb', chunk_size=None,
+                        chunk_dir=None, chunk_url=None, compress=None, quantize_colors=False, dedupe_arrays=False,
+                        perf_overlay=False, live=None, svg_overlays=None, stream=False, stats=None):
         if not isinstance(height, (int, float)) or height < 0:
             raise TypeError('Input for visualization height must be a number greater than 0')
+        if payload not in ('json', 'binary'):
+            raise ValueError('input for \'payload\' is not recognizable')
+        if mode not in ('full', 'html'):
+            raise ValueError('inout for \'mode\' is not recognizable')
+        if assets not in ('inline', 'external'):
+            raise ValueError('input for \'assets\' is not recognizable')
+        if assets == 'external' and not isinstance(asset_dir, str):
+            raise TypeError('\'asset_dir\' input must be a string when assets are external.')
+        if max_frames is not None and (not isinstance(max_frames, int) or isinstance(max_frames, bool) or
+                                       max_frames < 2):
+            raise ValueError('input for \'max_frames\' must be an int of at least 2')
+        if decimation not in decimation_lib.methods:
+            raise ValueError('input for \'decimation\' is not recognizable')
+        if chunk_size is not None and (not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or
+                                       chunk_size < 1):
+            raise ValueError('input for \'chunk_size\' must be an int greater than 0')
+        if chunk_size is not None and not isinstance(chunk_dir, str):
+            raise TypeError('\'chunk_dir\' input must be a string when chunk_size is provided.')
+
+        if compress is not None and compress not in ('gzip', 'deflate'):
+            raise ValueError('input for \'compress\' is not recognizable')
+        if compress is not None and chunk_size is not None:
+            raise ValueError('\'compress\' cannot be combined with \'chunk_size\'')
+        if not isinstance(quantize_colors, bool):
+            raise TypeError('\'quantize_colors\' input must be a bool.')
+        if not isinstance(dedupe_arrays, bool):
+            raise TypeError('\'dedupe_arrays\' input must be a bool.')
+        if not isinstance(perf_overlay, bool):
+            raise TypeError('\'perf_overlay\' input must be a bool.')
+
+        with profiling.phase(stats, 'prepare_svg'):
+            self._prepare_svg()
+            sim_visual = ET.tostring(self._svg_root, 'utf-8', method='xml').decode('utf-8')
+
+        if stats is None:
+            element_data = [element.dump_attr() for element in self._elements]
+        else:
+            stats.set_elements(self._elements)
+            element_data = []
+            for i, element in enumerate(self._elements):
+                with stats.phase('dump_attr', i):
+                    element_data.append(element.dump_attr())
 
-        env = Environment(loader=PackageLoader('ssv', ''))
-        element_data = [element.dump_attr() for element in self._elements]
-        self._prepare_svg()
+        x_series = self._x_series
+        if max_frames is not None:
+            with profiling.phase(stats, 'decimate'):
+                element_data, x_series = decimation_lib.decimate(element_data, x_series, max_frames, decimation)
 
         render_vars = {
-            'title': self._title, 'element_data': json.dumps(element_data),
-            'uuid': 's' + str(uuid.uuid4()), 'svg_overlays': json.dumps(self._svg_overlays),
-            'height': height, 'x_series': self._x_series,
-            'x_series_unit': self._x_series_unit, 'font_size': self._font_size,
-            'sim_visual': ET.tostring(self._svg_root, 'utf-8', method='xml').decode('utf-8')
+            'title': self._title, 'uuid': 's' + str(uuid.uuid4()),
+            'svg_overlays': resources.get_svg_overlays_json() if svg_overlays is None else svg_overlays,
+            'height': height, 'x_series_unit': self._x_series_unit, 'font_size': self._font_size,
+            'sim_visual': sim_visual, 'chunks': 'null', 'live': serializers.dumps(live),
+            'perf_overlay': perf_overlay
         }
+        with profiling.phase(stats, 'json_encode'):
+            render_vars['x_series'] = ''.join(serializers.iterencode(x_series))
+
+        # Element data is written to sidecar chunk files and loaded by the page on demand
+        if chunk_size is not None:
+            with profiling.phase(stats, 'write_chunks'):
+                chunk_info = chunks.write_chunks(element_data, len(x_series), chunk_size, chunk_dir, chunk_url,
+                                                 render_vars['uuid'], payload, payload_dtype, quantize_colors,
+                                                 dedupe_arrays, stats)
+            render_vars['chunks'] = serializers.dumps(chunk_info)
+            element_data = None
+        else:
+            with profiling.phase(stats, 'encode_frames'):
+                # Live pages extend condition data with pushed frames, so frame encodings are not applied
+                if live is None:
+                    element_data = serializers.encode_frames(element_data)
+                if quantize_colors:
+                    element_data = serializers.quantize_colors(element_data)
+            if dedupe_arrays:
+                with profiling.phase(stats, 'dedupe'):
+                    element_data = serializers.dedupe_arrays(element_data)
+
+        packer = None
+        if payload == 'binary' and element_data is not None:
+            with profiling.phase(stats, 'binary_pack'):
+                packer = serializers.BinaryPayload(payload_dtype)
+                element_data = packer.pack(element_data)
+
+        # Text chunk iterables of the payload variables (None for variables that are not rendered)
+        payload_vars = {'element_data': None, 'binary_payload': None, 'compressed_payload': None}
+        if compress is not None:
+            # Element data and overlays are embedded as a single compressed JSON document
+            render_vars['compression'] = compress
+            payload_json = profiling.iter_phase(stats, 'json_encode', _iter_payload_json(
+                element_data, render_vars['svg_overlays'] if svg_overlays is None else 'null', stats))
+            payload_vars['compressed_payload'] = profiling.iter_phase(stats, 'compress', serializers.iter_base64(
+                serializers.iter_compress(payload_json, compress)))
+            render_vars['element_data'] = 'null'
+            if svg_overlays is None:
+                render_vars['svg_overlays'] = 'null'
+            if packer is not None:
+                payload_vars['binary_payload'] = profiling.iter_phase(stats, 'compress', serializers.iter_base64(
+                    serializers.iter_compress(profiling.iter_phase(stats, 'binary_encode', packer.iter_bytes()),
+                                              compress)))
+        else:
+            render_vars['compression'] = None
+            payload_vars['element_data'] = profiling.iter_phase(stats, 'json_encode',
+                                                                profiling.iterencode(stats, element_data))
+            if packer is not None:
+                payload_vars['binary_payload'] = profiling.iter_phase(stats, 'binary_encode', packer.iter_base64())
+
+        streams = {}
+        for name, text in payload_vars.items():
+            if text is None:
+                render_vars.setdefault(name, None)
+            elif stream:
+                render_vars[name] = self._stream_marker(name)
+                streams[render_vars[name]] = text
+            else:
+                render_vars[name] = ''.join(text)
 
         # Render static web page for "full" mode
         if mode == 'full':
-            # Workaround for jinja2 Windows path bug
-            if os.name == 'nt':
-                template = env.get_template(os.path.join('templates/ssv.html'))
-            else:
-                template = env.get_template(os.path.join('templates', 'ssv.html'))
-
-            return template.render(render_vars)
+            template = resources.get_template('templates/ssv.html')
+            render_vars.update(_asset_render_vars(assets, asset_dir, asset_url))
 
         # Render html
-        elif mode == 'html':
-            template = env.get_template(os.path.join('templates', 'ssv_partial.html'))
-            return template.render(render_vars)
-
         else:
-            raise ValueError('inout for \'mode\' is not recognizable')
+            template = resources.get_template('templates/ssv_partial.html')
+
+        return template, render_vars, streams
+
+    # Return unique placeholder string for a streamed template variable
+    def _stream_marker(self, name):
+        return '\0ssv-stream-%s-%s\0' % (name, uuid.uuid4().hex)
 
     # Function to clean and ready svg for output
     # Cleans svg of troublesome attributes and searches for user-provided element ids to bind data to
     def _prepare_svg(self):
-        # Add info container element and zoom element to allow for zooming and panning
-        # Add id to svg to allow for identification on front end
+        if not self._rendered:
+            self._add_svg_layers()
+            self._rendered = True
+
+        # Build dict of element ids and include report ids
+        element_ids = [id for element in self._elements for id in element.ids]
+        element_ids += [element.report_id for element in self._elements if
+                        element.report_id]
+
+        # Index every svg node by id (and every node by parent) in a single traversal of the tree
+        id_index, parent_map = self._index_svg()
+        supported_tags = set('{%s}%s' % (self._svg_namespace, tag) for tag in self._supported_svg)
+        g_tag = '{%s}g' % self._svg_namespace
+        child_positions = {}
+
+        missing_ids = []
+        for element_id in element_ids:
+            # Drop stale entries for nodes whose id has since been removed or overwritten
+            nodes = [node for node in id_index.get(element_id, []) if node.attrib.get('id') == element_id]
+            elements_out = [node for node in nodes if node.tag in supported_tags]
+
+            # add g parent element if more than one child exists for easier manipulation in javascript
+            parents = []
+            for node in elements_out:
+                parent = parent_map[node]
+                if parent not in parents:
+                    parents.append(parent)
+            for parent in parents:
+                if len(parent) > 1:
+                    if parent not in child_positions:
+                        child_positions[parent] = {child: i for i, child in enumerate(parent)}
+                    positions = child_positions[parent]
+
+                    for sub_element in [node for node in nodes if parent_map[node] is parent]:
+                        g = ET.Element('g')
+                        i = positions.pop(sub_element)
+                        parent[i] = g
+                        g.append(sub_element)
+                        positions[g] = i
+                        parent_map[g] = parent
+                        parent_map[sub_element] = g
+
+            # Search for g elements with id
+            for g_element in [node for node in nodes if node.tag == g_tag]:
+                del g_element.attrib['id']
+                elements_out += self._find_all_id(g_element, element_id, id_index, parent_map)
+
+            # Warn user if input id is not found in svg and delete element_id
+            if len(elements_out) < 1:
+                print('Warning: SVG element with id \'%s\' not found for supported svg element types.'
+                      '  No data will be bound to this element.' % element_id)
+                missing_ids.append(element_id)
+
+        if missing_ids:
+            self._del_element_ids(missing_ids)
+
+    # Add info container element and zoom element to allow for zooming and panning
+    # Add id to svg to allow for identification on front end
+    def _add_svg_layers(self):
         info_layer = ET.Element('g')
         info_layer.attrib['id'] = 'info-layer'
 
@@ -263,45 +745,19 @@ class Vis:
         self._svg_root.insert(-1, zoom_layer)
         self._svg_root.insert(-1, info_layer)
 
-        # Build dict of element ids and include report ids
-        element_ids = [id for element in self._elements for id in element.ids]
-        element_ids += [element.report_id for element in self._elements if
-                        element.report_id]
+    # Traverse the svg tree once and return a dict of id -> nodes (in document order) and a dict of node -> parent
+    def _index_svg(self):
+        id_index = {}
+        parent_map = {}
 
-        # Loop through element ids and see what's in the xml tree under supported svg elements
-        for element_id in element_ids:
-            elements_out = []
-
-            for svg_element in self._supported_svg:
-                parents = self._svg_root.findall(".//{http://www.w3.org/2000/svg}%s[@id='%s'].."
-                                                            % (svg_element, element_id))
-                elements_out += (self._svg_root.findall(".//{http://www.w3.org/2000/svg}%s[@id='%s']"
-                                                            % (svg_element, element_id)))
-
-                # add g parent element if more than one child exists for easier manipulation in javascript
-                for parent in parents:
-                    if len(parent) > 1:
-                        for i, sub_element in enumerate(list(parent)):
-                            if 'id' in sub_element.attrib and sub_element.attrib['id'] == element_id:
-                                sub_element_copy = sub_element
-                                g = ET.Element('g')
-                                g.append(sub_element_copy)
-                                parent.insert(i, g)
-                                parent.remove(sub_element)
+        for parent in self._svg_root.iter():
+            for node in parent:
+                parent_map[node] = parent
+                node_id = node.attrib.get('id')
+                if node_id is not None:
+                    id_index.setdefault(node_id, []).append(node)
 
-            # Search for g elements with id
-            g_elements = self._svg_root.findall(".//{http://www.w3.org/2000/svg}g[@id='%s']" % element_id)
-            if g_elements:
-                for g_element in g_elements:
-                    del g_element.attrib['id']
-                    elements_out += self._find_all_id(g_element, element_id)
-
-            # Warn user if input id is not found in svg and delete element_id
-            if len(elements_out) < 1:
-                print('Warning: SVG element with id \'%s\' not found for supported svg element types.'
-                      '  No data will be bound to this element.' % element_id)
-
-                self.del_element(element_id)
+        return id_index, parent_map
 
     # Return svg tag without namespace
     def _namespace_strip(self, tag):
@@ -309,18 +765,85 @@ class Vis:
 
     # Recurse through an xml tree and search for specific id
     # Return list of all elements with specified id
-    def _find_all_id(self, element, name_id):
+    # If an id index is provided, it is updated with the newly assigned ids
+    def _find_all_id(self, element, name_id, id_index=None, parent_map=None):
         target_elements = []
 
         for sub_element in list(element):
             tag = self._namespace_strip(sub_element.tag)
 
             if tag == 'g':
-                target_elements += self._find_all_id(sub_element, name_id)
+                target_elements += self._find_all_id(sub_element, name_id, id_index, parent_map)
             elif tag in self._supported_svg:
                 sub_element.attrib['id'] = name_id
                 target_elements.append(sub_element)
+                if id_index is not None:
+                    id_index.setdefault(name_id, []).append(sub_element)
+                    parent_map[sub_element] = element
 
         return target_elements
 
 
+# Return template variables for the static javascript and css files of a 'full' page
+# Assets are either inlined or written to asset_dir under content-hashed names and linked
+def _asset_render_vars(assets, asset_dir, asset_url):
+    if assets not in ('inline', 'external'):
+        raise ValueError('input for \'assets\' is not recognizable')
+
+    if assets == 'inline':
+        return {'static_assets': resources.get_static_assets()}
+
+    if not isinstance(asset_dir, str):
+        raise TypeError('\'asset_dir\' input must be a string when assets are external.')
+
+    asset_names = resources.write_static_assets(asset_dir)
+    asset_url = (asset_dir if asset_url is None else asset_url).replace(os.sep, '/').rstrip('/')
+
+    return {'asset_urls': {name: '%s/%s' % (asset_url, file_name) if asset_url else file_name
+                           for name, file_name in asset_names.items()}}
+
+
+# Return text chunks of the JSON document embedded (compressed) in place of element data and overlays
+# The document is decoded with JSON.parse, so non-finite numbers are written as strict JSON (see
+# serializers.strict_json).  Element payload sizes are measured in stats (a RenderStats) if provided
+def _iter_payload_json(element_data, svg_overlays, stats=None):
+    yield '{"element_data": '
+    for text in profiling.iterencode(stats, element_data):
+        yield serializers.strict_json(text)
+    yield ', "svg_overlays": '
+    yield svg_overlays
+    yield '}'
+
+
+# Return (dict, key) pairs of the x-series indexed inputs of a condition or popover, including inputs of nested
+# dicts (e.g., 'additional_info')
+def _x_indexed(obj, x_len):
+    containers = [obj.__dict__] + [v for v in obj.__dict__.values() if isinstance(v, dict)]
+    return [(container, key) for container in containers for key in decimation_lib.x_keys
+            if key != 'x_series' and hasattr(container.get(key), '__len__') and len(container[key]) == x_len]
+
+
+# Validate new rows of an x-series indexed input against the shape of its current data
+def _validate_rows(value, rows, n_new, target_id, key):
+    if isinstance(value, list):
+        return validate_array_slices(rows, 'str', n_new)
+
+    rows = validate_array(rows, value.dtype, value.ndim, value.ndim, n_new)
+    if rows.shape[1:] != value.shape[1:]:
+        raise ValueError('Rows for \'%s\' of \'%s\' must have shape %s along all but the first axis' %
+                         (key, target_id, value.shape[1:]))
+
+    return rows
+
+
+# Append rows to an x-series indexed input, moving array data to a growable buffer on the first append
+def _append_rows(value, rows):
+    if isinstance(value, list):
+        value.extend(rows)
+        return value
+
+    buffer = value.buffer if isinstance(value, buffers.BufferView) else None
+    if buffer is None or len(buffer) != len(value):
+        buffer = buffers.GrowableArray(value)
+
+    return buffer.append(rows)
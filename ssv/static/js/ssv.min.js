@@ -4,5 +4,4 @@ var I=by(t.event.view).on("keydown.brush",u,!0).on("keyup.brush",s,!0).on("mouse
 df.data=ef,df.extent=rf,df.find=af,df.remove=uf,df.removeAll=O,df.root=lf,df.size=sf,df.visit=cf,df.visitAfter=ff,df.x=hf,df.y=pf;var _f=[].slice,vf={};Y.prototype=$.prototype={constructor:Y,defer:function(t){if("function"!=typeof t||this._call)throw new Error;if(null!=this._error)return this;var n=_f.call(arguments,1);return n.push(t),++this._waiting,this._tasks.push(n),H(this),this},abort:function(){return null==this._error&&W(this,new Error("abort")),this},await:function(t){if("function"!=typeof t||this._call)throw new Error;return this._call=function(n,e){t.apply(null,[n].concat(e))},G(this),this},awaitAll:function(t){if("function"!=typeof t||this._call)throw new Error;return this._call=t,G(this),this}};var yf=function(t){return function(){return t}},gf=1e-12,mf=Math.PI,xf=mf/2,bf=2*mf,wf=function(){function t(){var t,s,c=+n.apply(this,arguments),f=+e.apply(this,arguments),h=o.apply(this,arguments)-xf,p=a.apply(this,arguments)-xf,d=Math.abs(p-h),_=p>h;if(l||(l=t=L()),f<c&&(s=f,f=c,c=s),f>gf)if(d>bf-gf)l.moveTo(f*Math.cos(h),f*Math.sin(h)),l.arc(0,0,f,h,p,!_),c>gf&&(l.moveTo(c*Math.cos(p),c*Math.sin(p)),l.arc(0,0,c,p,h,_));else{var v,y,g=h,m=p,x=h,b=p,w=d,M=d,k=u.apply(this,arguments)/2,S=k>gf&&(i?+i.apply(this,arguments):Math.sqrt(c*c+f*f)),T=Math.min(Math.abs(f-c)/2,+r.apply(this,arguments)),N=T,E=T;if(S>gf){var A=nt(S/c*Math.sin(k)),z=nt(S/f*Math.sin(k));(w-=2*A)>gf?(A*=_?1:-1,x+=A,b-=A):(w=0,x=b=(h+p)/2),(M-=2*z)>gf?(z*=_?1:-1,g+=z,m-=z):(M=0,g=m=(h+p)/2)}var C=f*Math.cos(g),P=f*Math.sin(g),R=c*Math.cos(b),q=c*Math.sin(b);if(T>gf){var F=f*Math.cos(m),O=f*Math.sin(m),U=c*Math.cos(x),D=c*Math.sin(x);if(d<mf){var B=w>gf?et(C,P,U,D,F,O,R,q):[R,q],j=C-B[0],I=P-B[1],Y=F-B[0],H=O-B[1],X=1/Math.sin(Math.acos((j*Y+I*H)/(Math.sqrt(j*j+I*I)*Math.sqrt(Y*Y+H*H)))/2),V=Math.sqrt(B[0]*B[0]+B[1]*B[1]);N=Math.min(T,(c-V)/(X-1)),E=Math.min(T,(f-V)/(X+1))}}M>gf?E>gf?(v=rt(U,D,C,P,f,E,_),y=rt(F,O,R,q,f,E,_),l.moveTo(v.cx+v.x01,v.cy+v.y01),E<T?l.arc(v.cx,v.cy,E,Math.atan2(v.y01,v.x01),Math.atan2(y.y01,y.x01),!_):(l.arc(v.cx,v.cy,E,Math.atan2(v.y01,v.x01),Math.atan2(v.y11,v.x11),!_),l.arc(0,0,f,Math.atan2(v.cy+v.y11,v.cx+v.x11),Math.atan2(y.cy+y.y11,y.cx+y.x11),!_),l.arc(y.cx,y.cy,E,Math.atan2(y.y11,y.x11),Math.atan2(y.y01,y.x01),!_))):(l.moveTo(C,P),l.arc(0,0,f,g,m,!_)):l.moveTo(C,P),c>gf&&w>gf?N>gf?(v=rt(R,q,F,O,c,-N,_),y=rt(C,P,U,D,c,-N,_),l.lineTo(v.cx+v.x01,v.cy+v.y01),N<T?l.arc(v.cx,v.cy,N,Math.atan2(v.y01,v.x01),Math.atan2(y.y01,y.x01),!_):(l.arc(v.cx,v.cy,N,Math.atan2(v.y01,v.x01),Math.atan2(v.y11,v.x11),!_),l.arc(0,0,c,Math.atan2(v.cy+v.y11,v.cx+v.x11),Math.atan2(y.cy+y.y11,y.cx+y.x11),_),l.arc(y.cx,y.cy,N,Math.atan2(y.y11,y.x11),Math.atan2(y.y01,y.x01),!_))):l.arc(0,0,c,b,x,_):l.lineTo(R,q)}else l.moveTo(0,0);if(l.closePath(),t)return l=null,t+""||null}var n=Z,e=J,r=yf(0),i=null,o=Q,a=K,u=tt,l=null;return t.centroid=function(){var t=(+n.apply(this,arguments)+ +e.apply(this,arguments))/2,r=(+o.apply(this,arguments)+ +a.apply(this,arguments))/2-mf/2;return[Math.cos(r)*t,Math.sin(r)*t]},t.innerRadius=function(e){return arguments.length?(n="function"==typeof e?e:yf(+e),t):n},t.outerRadius=function(n){return arguments.length?(e="function"==typeof n?n:yf(+n),t):e},t.cornerRadius=function(n){return arguments.length?(r="function"==typeof n?n:yf(+n),t):r},t.padRadius=function(n){return arguments.length?(i=null==n?null:"function"==typeof n?n:yf(+n),t):i},t.startAngle=function(n){return arguments.length?(o="function"==typeof n?n:yf(+n),t):o},t.endAngle=function(n){return arguments.length?(a="function"==typeof n?n:yf(+n),t):a},t.padAngle=function(n){return arguments.length?(u="function"==typeof n?n:yf(+n),t):u},t.context=function(n){return arguments.length?(l=null==n?null:n,t):l},t};it.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2;default:this._context.lineTo(t,n)}}};var Mf=function(t){return new it(t)},kf=function(){function t(t){var u,l,s,c=t.length,f=!1;for(null==i&&(a=o(s=L())),u=0;u<=c;++u)!(u<c&&r(l=t[u],u,t))===f&&((f=!f)?a.lineStart():a.lineEnd()),f&&a.point(+n(l,u,t),+e(l,u,t));if(s)return a=null,s+""||null}var n=ot,e=at,r=yf(!0),i=null,o=Mf,a=null;return t.x=function(e){return arguments.length?(n="function"==typeof e?e:yf(+e),t):n},t.y=function(n){return arguments.length?(e="function"==typeof n?n:yf(+n),t):e},t.defined=function(n){return arguments.length?(r="function"==typeof n?n:yf(!!n),t):r},t.curve=function(n){return arguments.length?(o=n,null!=i&&(a=o(i)),t):o},t.context=function(n){return arguments.length?(null==n?i=a=null:a=o(i=n),t):i},t},Sf=function(){function t(t){var n,c,f,h,p,d=t.length,_=!1,v=new Array(d),y=new Array(d);for(null==u&&(s=l(p=L())),n=0;n<=d;++n){if(!(n<d&&a(h=t[n],n,t))===_)if(_=!_)c=n,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),f=n-1;f>=c;--f)s.point(v[f],y[f]);s.lineEnd(),s.areaEnd()}_&&(v[n]=+e(h,n,t),y[n]=+i(h,n,t),s.point(r?+r(h,n,t):v[n],o?+o(h,n,t):y[n]))}if(p)return s=null,p+""||null}function n(){return kf().defined(a).curve(l).context(u)}var e=ot,r=null,i=yf(0),o=at,a=yf(!0),u=null,l=Mf,s=null;return t.x=function(n){return arguments.length?(e="function"==typeof n?n:yf(+n),r=null,t):e},t.x0=function(n){return arguments.length?(e="function"==typeof n?n:yf(+n),t):e},t.x1=function(n){return arguments.length?(r=null==n?null:"function"==typeof n?n:yf(+n),t):r},t.y=function(n){return arguments.length?(i="function"==typeof n?n:yf(+n),o=null,t):i},t.y0=function(n){return arguments.length?(i="function"==typeof n?n:yf(+n),t):i},t.y1=function(n){return arguments.length?(o=null==n?null:"function"==typeof n?n:yf(+n),t):o},t.lineX0=t.lineY0=function(){return n().x(e).y(i)},t.lineY1=function(){return n().x(e).y(o)},t.lineX1=function(){return n().x(r).y(i)},t.defined=function(n){return arguments.length?(a="function"==typeof n?n:yf(!!n),t):a},t.curve=function(n){return arguments.length?(l=n,null!=u&&(s=l(u)),t):l},t.context=function(n){return arguments.length?(null==n?u=s=null:s=l(u=n),t):u},t},Tf=function(t,n){return n<t?-1:n>t?1:n>=t?0:NaN},Nf=function(t){return t},Ef=function(){function t(t){var u,l,s,c,f,h=t.length,p=0,d=new Array(h),_=new Array(h),v=+i.apply(this,arguments),y=Math.min(bf,Math.max(-bf,o.apply(this,arguments)-v)),g=Math.min(Math.abs(y)/h,a.apply(this,arguments)),m=g*(y<0?-1:1);for(u=0;u<h;++u)(f=_[d[u]=u]=+n(t[u],u,t))>0&&(p+=f);for(null!=e?d.sort(function(t,n){return e(_[t],_[n])}):null!=r&&d.sort(function(n,e){return r(t[n],t[e])}),u=0,s=p?(y-h*m)/p:0;u<h;++u,v=c)l=d[u],f=_[l],c=v+(f>0?f*s:0)+m,_[l]={data:t[l],index:u,value:f,startAngle:v,endAngle:c,padAngle:g};return _}var n=Nf,e=Tf,r=null,i=yf(0),o=yf(bf),a=yf(0);return t.value=function(e){return arguments.length?(n="function"==typeof e?e:yf(+e),t):n},t.sortValues=function(n){return arguments.length?(e=n,r=null,t):e},t.sort=function(n){return arguments.length?(r=n,e=null,t):r},t.startAngle=function(n){return arguments.length?(i="function"==typeof n?n:yf(+n),t):i},t.endAngle=function(n){return arguments.length?(o="function"==typeof n?n:yf(+n),t):o},t.padAngle=function(n){return arguments.length?(a="function"==typeof n?n:yf(+n),t):a},t},Af=lt(Mf);ut.prototype={areaStart:function(){this._curve.areaStart()},areaEnd:function(){this._curve.areaEnd()},lineStart:function(){this._curve.lineStart()},lineEnd:function(){this._curve.lineEnd()},point:function(t,n){this._curve.point(n*Math.sin(t),n*-Math.cos(t))}};var zf=function(){return st(kf().curve(Af))},Cf=function(){var t=Sf().curve(Af),n=t.curve,e=t.lineX0,r=t.lineX1,i=t.lineY0,o=t.lineY1;return t.angle=t.x,delete t.x,t.startAngle=t.x0,delete t.x0,t.endAngle=t.x1,delete t.x1,t.radius=t.y,delete t.y,t.innerRadius=t.y0,delete t.y0,t.outerRadius=t.y1,delete t.y1,t.lineStartAngle=function(){return st(e())},delete t.lineX0,t.lineEndAngle=function(){return st(r())},delete t.lineX1,t.lineInnerRadius=function(){return st(i())},delete t.lineY0,t.lineOuterRadius=function(){return st(o())},delete t.lineY1,t.curve=function(t){return arguments.length?n(lt(t)):n()._curve},t},Pf={draw:function(t,n){var e=Math.sqrt(n/mf);t.moveTo(e,0),t.arc(0,0,e,0,bf)}},Rf={draw:function(t,n){var e=Math.sqrt(n/5)/2;t.moveTo(-3*e,-e),t.lineTo(-e,-e),t.lineTo(-e,-3*e),t.lineTo(e,-3*e),t.lineTo(e,-e),t.lineTo(3*e,-e),t.lineTo(3*e,e),t.lineTo(e,e),t.lineTo(e,3*e),t.lineTo(-e,3*e),t.lineTo(-e,e),t.lineTo(-3*e,e),t.closePath()}},Lf=Math.sqrt(1/3),qf=2*Lf,Ff={draw:function(t,n){var e=Math.sqrt(n/qf),r=e*Lf;t.moveTo(0,-e),t.lineTo(r,0),t.lineTo(0,e),t.lineTo(-r,0),t.closePath()}},Of=.8908130915292852,Uf=Math.sin(mf/10)/Math.sin(7*mf/10),Df=Math.sin(bf/10)*Uf,Bf=-Math.cos(bf/10)*Uf,jf={draw:function(t,n){var e=Math.sqrt(n*Of),r=Df*e,i=Bf*e;t.moveTo(0,-e),t.lineTo(r,i);for(var o=1;o<5;++o){var a=bf*o/5,u=Math.cos(a),l=Math.sin(a);t.lineTo(l*e,-u*e),t.lineTo(u*r-l*i,l*r+u*i)}t.closePath()}},If={draw:function(t,n){var e=Math.sqrt(n),r=-e/2;t.rect(r,r,e,e)}},Yf=Math.sqrt(3),Hf={draw:function(t,n){var e=-Math.sqrt(n/(3*Yf));t.moveTo(0,2*e),t.lineTo(-Yf*e,-e),t.lineTo(Yf*e,-e),t.closePath()}},Xf=-.5,Vf=Math.sqrt(3)/2,Wf=1/Math.sqrt(12),Gf=3*(Wf/2+1),$f={draw:function(t,n){var e=Math.sqrt(n/Gf),r=e/2,i=e*Wf,o=r,a=e*Wf+e,u=-o,l=a;t.moveTo(r,i),t.lineTo(o,a),t.lineTo(u,l),t.lineTo(Xf*r-Vf*i,Vf*r+Xf*i),t.lineTo(Xf*o-Vf*a,Vf*o+Xf*a),t.lineTo(Xf*u-Vf*l,Vf*u+Xf*l),t.lineTo(Xf*r+Vf*i,Xf*i-Vf*r),t.lineTo(Xf*o+Vf*a,Xf*a-Vf*o),t.lineTo(Xf*u+Vf*l,Xf*l-Vf*u),t.closePath()}},Zf=[Pf,Rf,Ff,If,jf,Hf,$f],Jf=function(){function t(){var t;if(r||(r=t=L()),n.apply(this,arguments).draw(r,+e.apply(this,arguments)),t)return r=null,t+""||null}var n=yf(Pf),e=yf(64),r=null;return t.type=function(e){return arguments.length?(n="function"==typeof e?e:yf(e),t):n},t.size=function(n){return arguments.length?(e="function"==typeof n?n:yf(+n),t):e},t.context=function(n){return arguments.length?(r=null==n?null:n,t):r},t},Qf=function(){};ft.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:ct(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:ct(this,t,n)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=n}};var Kf=function(t){return new ft(t)};ht.prototype={areaStart:Qf,areaEnd:Qf,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._x2=t,this._y2=n;break;case 1:this._point=2,this._x3=t,this._y3=n;break;case 2:this._point=3,this._x4=t,this._y4=n,this._context.moveTo((this._x0+4*this._x1+t)/6,(this._y0+4*this._y1+n)/6);break;default:ct(this,t,n)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=n}};var th=function(t){return new ht(t)};pt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var e=(this._x0+4*this._x1+t)/6,r=(this._y0+4*this._y1+n)/6;this._line?this._context.lineTo(e,r):this._context.moveTo(e,r);break;case 3:this._point=4;default:ct(this,t,n)}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=n}};var nh=function(t){return new pt(t)};dt.prototype={lineStart:function(){this._x=[],this._y=[],this._basis.lineStart()},lineEnd:function(){var t=this._x,n=this._y,e=t.length-1;if(e>0)for(var r,i=t[0],o=n[0],a=t[e]-i,u=n[e]-o,l=-1;++l<=e;)r=l/e,this._basis.point(this._beta*t[l]+(1-this._beta)*(i+r*a),this._beta*n[l]+(1-this._beta)*(o+r*u));this._x=this._y=null,this._basis.lineEnd()},point:function(t,n){this._x.push(+t),this._y.push(+n)}};var eh=function qw(t){function n(n){return 1===t?new ft(n):new dt(n,t)}return n.beta=function(t){return qw(+t)},n}(.85);vt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:_t(this,this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2,this._x1=t,this._y1=n;break;case 2:this._point=3;default:_t(this,t,n)}this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var rh=function Fw(t){function n(n){return new vt(n,t)}return n.tension=function(t){return Fw(+t)},n}(0);yt.prototype={areaStart:Qf,areaEnd:Qf,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._x3=t,this._y3=n;break;case 1:this._point=2,this._context.moveTo(this._x4=t,this._y4=n);break;case 2:this._point=3,this._x5=t,this._y5=n;break;default:_t(this,t,n)}this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var ih=function Ow(t){function n(n){return new yt(n,t)}return n.tension=function(t){return Ow(+t)},n}(0);gt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:_t(this,t,n)}this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var oh=function Uw(t){function n(n){return new gt(n,t)}return n.tension=function(t){return Uw(+t)},n}(0);xt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:this.point(this._x2,this._y2)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){if(t=+t,n=+n,this._point){var e=this._x2-t,r=this._y2-n;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(e*e+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2;break;case 2:this._point=3;default:mt(this,t,n)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var ah=function Dw(t){function n(n){return t?new xt(n,t):new vt(n,0)}return n.alpha=function(t){return Dw(+t)},n}(.5);bt.prototype={areaStart:Qf,areaEnd:Qf,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(t,n){if(t=+t,n=+n,this._point){var e=this._x2-t,r=this._y2-n;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(e*e+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._x3=t,this._y3=n;break;case 1:this._point=2,this._context.moveTo(this._x4=t,this._y4=n);break;case 2:this._point=3,this._x5=t,this._y5=n;break;default:mt(this,t,n)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var uh=function Bw(t){function n(n){return t?new bt(n,t):new yt(n,0)}return n.alpha=function(t){return Bw(+t)},n}(.5);wt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){if(t=+t,n=+n,this._point){var e=this._x2-t,r=this._y2-n;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(e*e+r*r,this._alpha))}switch(this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:mt(this,t,n)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=t,this._y0=this._y1,this._y1=this._y2,this._y2=n}};var lh=function jw(t){function n(n){return t?new wt(n,t):new gt(n,0)}return n.alpha=function(t){return jw(+t)},n}(.5);Mt.prototype={areaStart:Qf,areaEnd:Qf,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(t,n){t=+t,n=+n,this._point?this._context.lineTo(t,n):(this._point=1,this._context.moveTo(t,n))}};var sh=function(t){return new Mt(t)};Et.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Nt(this,this._t0,Tt(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(t,n){var e=NaN;if(t=+t,n=+n,t!==this._x1||n!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2;break;case 2:this._point=3,Nt(this,Tt(this,e=St(this,t,n)),e);break;default:Nt(this,this._t0,e=St(this,t,n))}this._x0=this._x1,this._x1=t,this._y0=this._y1,this._y1=n,this._t0=e}}},(At.prototype=Object.create(Et.prototype)).point=function(t,n){Et.prototype.point.call(this,n,t)},zt.prototype={moveTo:function(t,n){this._context.moveTo(n,t)},closePath:function(){this._context.closePath()},lineTo:function(t,n){this._context.lineTo(n,t)},bezierCurveTo:function(t,n,e,r,i,o){this._context.bezierCurveTo(n,t,r,e,o,i)}},Rt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var t=this._x,n=this._y,e=t.length;if(e)if(this._line?this._context.lineTo(t[0],n[0]):this._context.moveTo(t[0],n[0]),2===e)this._context.lineTo(t[1],n[1]);else for(var r=Lt(t),i=Lt(n),o=0,a=1;a<e;++o,++a)this._context.bezierCurveTo(r[0][o],i[0][o],r[1][o],i[1][o],t[a],n[a]);(this._line||0!==this._line&&1===e)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(t,n){this._x.push(+t),this._y.push(+n)}};var ch=function(t){return new Rt(t)};qt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(t,n){switch(t=+t,n=+n,this._point){case 0:this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,n),this._context.lineTo(t,n);else{var e=this._x*(1-this._t)+t*this._t;this._context.lineTo(e,this._y),this._context.lineTo(e,n)}}this._x=t,this._y=n}};var fh=function(t){return new qt(t,.5)},hh=Array.prototype.slice,ph=function(t,n){if((r=t.length)>1)for(var e,r,i=1,o=t[n[0]],a=o.length;i<r;++i){e=o,o=t[n[i]];for(var u=0;u<a;++u)o[u][1]+=o[u][0]=isNaN(e[u][1])?e[u][0]:e[u][1]}},dh=function(t){for(var n=t.length,e=new Array(n);--n>=0;)e[n]=n;return e},_h=function(){function t(t){var o,a,u=n.apply(this,arguments),l=t.length,s=u.length,c=new Array(s);for(o=0;o<s;++o){for(var f,h=u[o],p=c[o]=new Array(l),d=0;d<l;++d)p[d]=f=[0,+i(t[d],h,d,t)],f.data=t[d];p.key=h}for(o=0,a=e(c);o<s;++o)c[a[o]].index=o;return r(c,a),c}var n=yf([]),e=dh,r=ph,i=Ut;return t.keys=function(e){return arguments.length?(n="function"==typeof e?e:yf(hh.call(e)),t):n},t.value=function(n){return arguments.length?(i="function"==typeof n?n:yf(+n),t):i},t.order=function(n){return arguments.length?(e=null==n?dh:"function"==typeof n?n:yf(hh.call(n)),t):e},t.offset=function(n){return arguments.length?(r=null==n?ph:n,t):r},t},vh=function(t,n){if((r=t.length)>0){for(var e,r,i,o=0,a=t[0].length;o<a;++o){for(i=e=0;e<r;++e)i+=t[e][o][1]||0;if(i)for(e=0;e<r;++e)t[e][o][1]/=i}ph(t,n)}},yh=function(t,n){if((e=t.length)>0){for(var e,r=0,i=t[n[0]],o=i.length;r<o;++r){for(var a=0,u=0;a<e;++a)u+=t[a][r][1]||0;i[r][1]+=i[r][0]=-u/2}ph(t,n)}},gh=function(t,n){if((i=t.length)>0&&(r=(e=t[n[0]]).length)>0){for(var e,r,i,o=0,a=1;a<r;++a){for(var u=0,l=0,s=0;u<i;++u){for(var c=t[n[u]],f=c[a][1]||0,h=c[a-1][1]||0,p=(f-h)/2,d=0;d<u;++d){var _=t[n[d]],v=_[a][1]||0,y=_[a-1][1]||0;p+=v-y}l+=f,s+=p*f}e[a-1][1]+=e[a-1][0]=o,l&&(o-=s/l)}e[a-1][1]+=e[a-1][0]=o,ph(t,n)}},mh=function(t){var n=t.map(Dt);return dh(t).sort(function(t,e){return n[t]-n[e]})},xh=function(t){return mh(t).reverse()},bh=function(t){var n,e,r=t.length,i=t.map(Dt),o=dh(t).sort(function(t,n){return i[n]-i[t]}),a=0,u=0,l=[],s=[];for(n=0;n<r;++n)e=o[n],a<u?(a+=i[e],l.push(e)):(u+=i[e],s.push(e));return s.reverse().concat(l)},wh=function(t){return dh(t).reverse()},Mh=function(t,n,e){t.prototype=n.prototype=e,e.constructor=t},kh=.7,Sh=1/kh,Th="\\s*([+-]?\\d+)\\s*",Nh="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)\\s*",Eh="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Ah=/^#([0-9a-f]{3})$/,zh=/^#([0-9a-f]{6})$/,Ch=new RegExp("^rgb\\("+[Th,Th,Th]+"\\)$"),Ph=new RegExp("^rgb\\("+[Eh,Eh,Eh]+"\\)$"),Rh=new RegExp("^rgba\\("+[Th,Th,Th,Nh]+"\\)$"),Lh=new RegExp("^rgba\\("+[Eh,Eh,Eh,Nh]+"\\)$"),qh=new RegExp("^hsl\\("+[Nh,Eh,Eh]+"\\)$"),Fh=new RegExp("^hsla\\("+[Nh,Eh,Eh,Nh]+"\\)$"),Oh={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};Mh(jt,It,{displayable:function(){return this.rgb().displayable()},toString:function(){return this.rgb()+""}}),Mh(Wt,Vt,Bt(jt,{brighter:function(t){return t=null==t?Sh:Math.pow(Sh,t),new Wt(this.r*t,this.g*t,this.b*t,this.opacity)},darker:function(t){return t=null==t?kh:Math.pow(kh,t),new Wt(this.r*t,this.g*t,this.b*t,this.opacity)},rgb:function(){return this},displayable:function(){return 0<=this.r&&this.r<=255&&0<=this.g&&this.g<=255&&0<=this.b&&this.b<=255&&0<=this.opacity&&this.opacity<=1},toString:function(){var t=this.opacity;return t=isNaN(t)?1:Math.max(0,Math.min(1,t)),(1===t?"rgb(":"rgba(")+Math.max(0,Math.min(255,Math.round(this.r)||0))+", "+Math.max(0,Math.min(255,Math.round(this.g)||0))+", "+Math.max(0,Math.min(255,Math.round(this.b)||0))+(1===t?")":", "+t+")")}})),Mh(Jt,Zt,Bt(jt,{brighter:function(t){return t=null==t?Sh:Math.pow(Sh,t),new Jt(this.h,this.s,this.l*t,this.opacity)},darker:function(t){return t=null==t?kh:Math.pow(kh,t),new Jt(this.h,this.s,this.l*t,this.opacity)},rgb:function(){var t=this.h%360+360*(this.h<0),n=isNaN(t)||isNaN(this.s)?0:this.s,e=this.l,r=e+(e<.5?e:1-e)*n,i=2*e-r;return new Wt(Qt(t>=240?t-240:t+120,i,r),Qt(t,i,r),Qt(t<120?t+240:t-120,i,r),this.opacity)},displayable:function(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1}}));var Uh=Math.PI/180,Dh=180/Math.PI,Bh=18,jh=.95047,Ih=1,Yh=1.08883,Hh=4/29,Xh=6/29,Vh=3*Xh*Xh,Wh=Xh*Xh*Xh;Mh(nn,tn,Bt(jt,{brighter:function(t){return new nn(this.l+Bh*(null==t?1:t),this.a,this.b,this.opacity)},darker:function(t){return new nn(this.l-Bh*(null==t?1:t),this.a,this.b,this.opacity)},rgb:function(){var t=(this.l+16)/116,n=isNaN(this.a)?t:t+this.a/500,e=isNaN(this.b)?t:t-this.b/200;return t=Ih*rn(t),n=jh*rn(n),e=Yh*rn(e),new Wt(on(3.2404542*n-1.5371385*t-.4985314*e),on(-.969266*n+1.8760108*t+.041556*e),on(.0556434*n-.2040259*t+1.0572252*e),this.opacity)}})),Mh(sn,ln,Bt(jt,{brighter:function(t){return new sn(this.h,this.c,this.l+Bh*(null==t?1:t),this.opacity)},darker:function(t){return new sn(this.h,this.c,this.l-Bh*(null==t?1:t),this.opacity)},rgb:function(){return Kt(this).rgb()}}));var Gh=-.14861,$h=1.78277,Zh=-.29227,Jh=-.90649,Qh=1.97294,Kh=Qh*Jh,tp=Qh*$h,np=$h*Zh-Jh*Gh;Mh(hn,fn,Bt(jt,{brighter:function(t){return t=null==t?Sh:Math.pow(Sh,t),new hn(this.h,this.s,this.l*t,this.opacity)},darker:function(t){return t=null==t?kh:Math.pow(kh,t),new hn(this.h,this.s,this.l*t,this.opacity)},rgb:function(){var t=isNaN(this.h)?0:(this.h+120)*Uh,n=+this.l,e=isNaN(this.s)?0:this.s*n*(1-n),r=Math.cos(t),i=Math.sin(t);return new Wt(255*(n+e*(Gh*r+$h*i)),255*(n+e*(Zh*r+Jh*i)),255*(n+e*(Qh*r)),this.opacity)}}));var ep,rp,ip,op,ap=function(t){var n=t.length-1;return function(e){var r=e<=0?e=0:e>=1?(e=1,n-1):Math.floor(e*n),i=t[r],o=t[r+1],a=r>0?t[r-1]:2*i-o,u=r<n-1?t[r+2]:2*o-i;return pn((e-r/n)*n,a,i,o,u)}},up=function(t){var n=t.length;return function(e){var r=Math.floor(((e%=1)<0?++e:e)*n),i=t[(r+n-1)%n],o=t[r%n],a=t[(r+1)%n],u=t[(r+2)%n];return pn((e-r/n)*n,i,o,a,u)}},lp=function(t){return function(){return t}},sp=function Iw(t){function n(t,n){var r=e((t=Vt(t)).r,(n=Vt(n)).r),i=e(t.g,n.g),o=e(t.b,n.b),a=e(t.opacity,n.opacity);return function(n){return t.r=r(n),t.g=i(n),t.b=o(n),t.opacity=a(n),t+""}}var e=yn(t);return n.gamma=Iw,n}(1),cp=mn(ap),fp=mn(up),hp=function(t,n){var e,r=n?n.length:0,i=t?Math.min(r,t.length):0,o=new Array(r),a=new Array(r);for(e=0;e<i;++e)o[e]=mp(t[e],n[e]);for(;e<r;++e)a[e]=n[e];return function(t){for(e=0;e<i;++e)a[e]=o[e](t);return a}},pp=function(t,n){var e=new Date;return t=+t,n-=t,function(r){return e.setTime(t+n*r),e}},dp=function(t,n){return t=+t,n-=t,function(e){return t+n*e}},_p=function(t,n){var e,r={},i={};null!==t&&"object"==typeof t||(t={}),null!==n&&"object"==typeof n||(n={});for(e in n)e in t?r[e]=mp(t[e],n[e]):i[e]=n[e];return function(t){for(e in r)i[e]=r[e](t);return i}},vp=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,yp=new RegExp(vp.source,"g"),gp=function(t,n){var e,r,i,o=vp.lastIndex=yp.lastIndex=0,a=-1,u=[],l=[];for(t+="",n+="";(e=vp.exec(t))&&(r=yp.exec(n));)(i=r.index)>o&&(i=n.slice(o,i),u[a]?u[a]+=i:u[++a]=i),(e=e[0])===(r=r[0])?u[a]?u[a]+=r:u[++a]=r:(u[++a]=null,l.push({i:a,x:dp(e,r)})),o=yp.lastIndex;return o<n.length&&(i=n.slice(o),u[a]?u[a]+=i:u[++a]=i),u.length<2?l[0]?bn(l[0].x):xn(n):(n=l.length,function(t){for(var e,r=0;r<n;++r)u[(e=l[r]).i]=e.x(t);return u.join("")})},mp=function(t,n){var e,r=typeof n;return null==n||"boolean"===r?lp(n):("number"===r?dp:"string"===r?(e=It(n))?(n=e,sp):gp:n instanceof It?sp:n instanceof Date?pp:Array.isArray(n)?hp:isNaN(n)?_p:dp)(t,n)},xp=function(t,n){return t=+t,n-=t,function(e){return Math.round(t+n*e)}},bp=180/Math.PI,wp={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1},Mp=function(t,n,e,r,i,o){var a,u,l;return(a=Math.sqrt(t*t+n*n))&&(t/=a,n/=a),(l=t*e+n*r)&&(e-=t*l,r-=n*l),(u=Math.sqrt(e*e+r*r))&&(e/=u,r/=u,l/=u),t*r<n*e&&(t=-t,n=-n,l=-l,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(n,t)*bp,skewX:Math.atan(l)*bp,scaleX:a,scaleY:u}},kp=kn(wn,"px, ","px)","deg)"),Sp=kn(Mn,", ",")",")"),Tp=Math.SQRT2,Np=2,Ep=4,Ap=1e-12,zp=function(t,n){
 var e,r,i=t[0],o=t[1],a=t[2],u=n[0],l=n[1],s=n[2],c=u-i,f=l-o,h=c*c+f*f;if(h<Ap)r=Math.log(s/a)/Tp,e=function(t){return[i+t*c,o+t*f,a*Math.exp(Tp*t*r)]};else{var p=Math.sqrt(h),d=(s*s-a*a+Ep*h)/(2*a*Np*p),_=(s*s-a*a-Ep*h)/(2*s*Np*p),v=Math.log(Math.sqrt(d*d+1)-d),y=Math.log(Math.sqrt(_*_+1)-_);r=(y-v)/Tp,e=function(t){var n=t*r,e=Sn(v),u=a/(Np*p)*(e*Nn(Tp*n+v)-Tn(v));return[i+u*c,o+u*f,a*e/Sn(Tp*n+v)]}}return e.duration=1e3*r,e},Cp=En(vn),Pp=En(gn),Rp=zn(vn),Lp=zn(gn),qp=Cn(vn),Fp=Cn(gn),Op=function(t,n){for(var e=new Array(n),r=0;r<n;++r)e[r]=t(r/(n-1));return e},Up={value:function(){}};Rn.prototype=Pn.prototype={constructor:Rn,on:function(t,n){var e,r=this._,i=Ln(t+"",r),o=-1,a=i.length;{if(!(arguments.length<2)){if(null!=n&&"function"!=typeof n)throw new Error("invalid callback: "+n);for(;++o<a;)if(e=(t=i[o]).type)r[e]=Fn(r[e],t.name,n);else if(null==n)for(e in r)r[e]=Fn(r[e],t.name,null);return this}for(;++o<a;)if((e=(t=i[o]).type)&&(e=qn(r[e],t.name)))return e}},copy:function(){var t={},n=this._;for(var e in n)t[e]=n[e].slice();return new Rn(t)},call:function(t,n){if((e=arguments.length-2)>0)for(var e,r,i=new Array(e),o=0;o<e;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(r=this._[t],o=0,e=r.length;o<e;++o)r[o].value.apply(n,i)},apply:function(t,n,e){if(!this._.hasOwnProperty(t))throw new Error("unknown type: "+t);for(var r=this._[t],i=0,o=r.length;i<o;++i)r[i].value.apply(n,e)}};var Dp,Bp,jp=function(t){function n(t,n){var r,i,o=e(t,function(t,e){return r?r(t,e-1):(i=t,void(r=n?Un(t,n):On(t)))});return o.columns=i,o}function e(t,n){function e(){if(c>=s)return a;if(i)return i=!1,o;var n,e=c;if(34===t.charCodeAt(e)){for(var r=e;r++<s;)if(34===t.charCodeAt(r)){if(34!==t.charCodeAt(r+1))break;++r}return c=r+2,n=t.charCodeAt(r+1),13===n?(i=!0,10===t.charCodeAt(r+2)&&++c):10===n&&(i=!0),t.slice(e+1,r).replace(/""/g,'"')}for(;c<s;){var u=1;if(n=t.charCodeAt(c++),10===n)i=!0;else if(13===n)i=!0,10===t.charCodeAt(c)&&(++c,++u);else if(n!==l)continue;return t.slice(e,c-u)}return t.slice(e)}for(var r,i,o={},a={},u=[],s=t.length,c=0,f=0;(r=e())!==a;){for(var h=[];r!==o&&r!==a;)h.push(r),r=e();n&&null==(h=n(h,f++))||u.push(h)}return u}function r(n,e){return null==e&&(e=Dn(n)),[e.map(a).join(t)].concat(n.map(function(n){return e.map(function(t){return a(n[t])}).join(t)})).join("\n")}function i(t){return t.map(o).join("\n")}function o(n){return n.map(a).join(t)}function a(t){return null==t?"":u.test(t+="")?'"'+t.replace(/\"/g,'""')+'"':t}var u=new RegExp('["'+t+"\n]"),l=t.charCodeAt(0);return{parse:n,parseRows:e,format:r,formatRows:i}},Ip=jp(","),Yp=Ip.parse,Hp=Ip.parseRows,Xp=Ip.format,Vp=Ip.formatRows,Wp=jp("\t"),Gp=Wp.parse,$p=Wp.parseRows,Zp=Wp.format,Jp=Wp.formatRows,Qp=function(t,n){function e(t){var n,e=c.status;if(!e&&jn(c)||e>=200&&e<300||304===e){if(a)try{n=a.call(r,c)}catch(i){return void l.call("error",r,i)}else n=c;l.call("load",r,n)}else l.call("error",r,t)}var r,i,a,u,l=Pn("beforesend","progress","load","error"),s=o(),c=new XMLHttpRequest,f=null,h=null,p=0;if("undefined"==typeof XDomainRequest||"withCredentials"in c||!/^(http(s)?:)?\/\//.test(t)||(c=new XDomainRequest),"onload"in c?c.onload=c.onerror=c.ontimeout=e:c.onreadystatechange=function(t){c.readyState>3&&e(t)},c.onprogress=function(t){l.call("progress",r,t)},r={header:function(t,n){return t=(t+"").toLowerCase(),arguments.length<2?s.get(t):(null==n?s.remove(t):s.set(t,n+""),r)},mimeType:function(t){return arguments.length?(i=null==t?null:t+"",r):i},responseType:function(t){return arguments.length?(u=t,r):u},timeout:function(t){return arguments.length?(p=+t,r):p},user:function(t){return arguments.length<1?f:(f=null==t?null:t+"",r)},password:function(t){return arguments.length<1?h:(h=null==t?null:t+"",r)},response:function(t){return a=t,r},get:function(t,n){return r.send("GET",t,n)},post:function(t,n){return r.send("POST",t,n)},send:function(n,e,o){return c.open(n,t,!0,f,h),null==i||s.has("accept")||s.set("accept",i+",*/*"),c.setRequestHeader&&s.each(function(t,n){c.setRequestHeader(n,t)}),null!=i&&c.overrideMimeType&&c.overrideMimeType(i),null!=u&&(c.responseType=u),p>0&&(c.timeout=p),null==o&&"function"==typeof e&&(o=e,e=null),null!=o&&1===o.length&&(o=Bn(o)),null!=o&&r.on("error",o).on("load",function(t){o(null,t)}),l.call("beforesend",r,c),c.send(null==e?null:e),r},abort:function(){return c.abort(),r},on:function(){var t=l.on.apply(l,arguments);return t===l?r:t}},null!=n){if("function"!=typeof n)throw new Error("invalid callback: "+n);return r.get(n)}return r},Kp=function(t,n){return function(e,r){var i=Qp(e).mimeType(t).response(n);if(null!=r){if("function"!=typeof r)throw new Error("invalid callback: "+r);return i.get(r)}return i}},td=Kp("text/html",function(t){return document.createRange().createContextualFragment(t.responseText)}),nd=Kp("application/json",function(t){return JSON.parse(t.responseText)}),ed=Kp("text/plain",function(t){return t.responseText}),rd=Kp("application/xml",function(t){var n=t.responseXML;if(!n)throw new Error("parse error");return n}),id=function(t,n){return function(e,r,i){arguments.length<3&&(i=r,r=null);var o=Qp(e).mimeType(t);return o.row=function(t){return arguments.length?o.response(In(n,r=t)):r},o.row(r),i?o.get(i):o}},od=id("text/csv",Yp),ad=id("text/tab-separated-values",Gp),ud=0,ld=0,sd=0,cd=1e3,fd=0,hd=0,pd=0,dd="object"==typeof performance&&performance.now?performance:Date,_d="function"==typeof requestAnimationFrame?requestAnimationFrame:function(t){setTimeout(t,17)};Xn.prototype=Vn.prototype={constructor:Xn,restart:function(t,n,e){if("function"!=typeof t)throw new TypeError("callback is not a function");e=(null==e?Yn():+e)+(null==n?0:+n),this._next||Bp===this||(Bp?Bp._next=this:Dp=this,Bp=this),this._call=t,this._time=e,Jn()},stop:function(){this._call&&(this._call=null,this._time=1/0,Jn())}};var vd=function(t,n,e){var r=new Xn;return n=null==n?0:+n,r.restart(function(e){r.stop(),t(e+n)},n,e),r},yd=function(t,n,e){var r=new Xn,i=n;return null==n?(r.restart(t,n,e),r):(n=+n,e=null==e?Yn():+e,r.restart(function o(a){a+=i,r.restart(o,i+=n,e),t(a)},n,e),r)},gd=new Date,md=new Date,xd=Qn(function(){},function(t,n){t.setTime(+t+n)},function(t,n){return n-t});xd.every=function(t){return t=Math.floor(t),isFinite(t)&&t>0?t>1?Qn(function(n){n.setTime(Math.floor(n/t)*t)},function(n,e){n.setTime(+n+e*t)},function(n,e){return(e-n)/t}):xd:null};var bd=xd.range,wd=1e3,Md=6e4,kd=36e5,Sd=864e5,Td=6048e5,Nd=Qn(function(t){t.setTime(Math.floor(t/wd)*wd)},function(t,n){t.setTime(+t+n*wd)},function(t,n){return(n-t)/wd},function(t){return t.getUTCSeconds()}),Ed=Nd.range,Ad=Qn(function(t){t.setTime(Math.floor(t/Md)*Md)},function(t,n){t.setTime(+t+n*Md)},function(t,n){return(n-t)/Md},function(t){return t.getMinutes()}),zd=Ad.range,Cd=Qn(function(t){var n=t.getTimezoneOffset()*Md%kd;n<0&&(n+=kd),t.setTime(Math.floor((+t-n)/kd)*kd+n)},function(t,n){t.setTime(+t+n*kd)},function(t,n){return(n-t)/kd},function(t){return t.getHours()}),Pd=Cd.range,Rd=Qn(function(t){t.setHours(0,0,0,0)},function(t,n){t.setDate(t.getDate()+n)},function(t,n){return(n-t-(n.getTimezoneOffset()-t.getTimezoneOffset())*Md)/Sd},function(t){return t.getDate()-1}),Ld=Rd.range,qd=Kn(0),Fd=Kn(1),Od=Kn(2),Ud=Kn(3),Dd=Kn(4),Bd=Kn(5),jd=Kn(6),Id=qd.range,Yd=Fd.range,Hd=Od.range,Xd=Ud.range,Vd=Dd.range,Wd=Bd.range,Gd=jd.range,$d=Qn(function(t){t.setDate(1),t.setHours(0,0,0,0)},function(t,n){t.setMonth(t.getMonth()+n)},function(t,n){return n.getMonth()-t.getMonth()+12*(n.getFullYear()-t.getFullYear())},function(t){return t.getMonth()}),Zd=$d.range,Jd=Qn(function(t){t.setMonth(0,1),t.setHours(0,0,0,0)},function(t,n){t.setFullYear(t.getFullYear()+n)},function(t,n){return n.getFullYear()-t.getFullYear()},function(t){return t.getFullYear()});Jd.every=function(t){return isFinite(t=Math.floor(t))&&t>0?Qn(function(n){n.setFullYear(Math.floor(n.getFullYear()/t)*t),n.setMonth(0,1),n.setHours(0,0,0,0)},function(n,e){n.setFullYear(n.getFullYear()+e*t)}):null};var Qd=Jd.range,Kd=Qn(function(t){t.setUTCSeconds(0,0)},function(t,n){t.setTime(+t+n*Md)},function(t,n){return(n-t)/Md},function(t){return t.getUTCMinutes()}),t_=Kd.range,n_=Qn(function(t){t.setUTCMinutes(0,0,0)},function(t,n){t.setTime(+t+n*kd)},function(t,n){return(n-t)/kd},function(t){return t.getUTCHours()}),e_=n_.range,r_=Qn(function(t){t.setUTCHours(0,0,0,0)},function(t,n){t.setUTCDate(t.getUTCDate()+n)},function(t,n){return(n-t)/Sd},function(t){return t.getUTCDate()-1}),i_=r_.range,o_=te(0),a_=te(1),u_=te(2),l_=te(3),s_=te(4),c_=te(5),f_=te(6),h_=o_.range,p_=a_.range,d_=u_.range,__=l_.range,v_=s_.range,y_=c_.range,g_=f_.range,m_=Qn(function(t){t.setUTCDate(1),t.setUTCHours(0,0,0,0)},function(t,n){t.setUTCMonth(t.getUTCMonth()+n)},function(t,n){return n.getUTCMonth()-t.getUTCMonth()+12*(n.getUTCFullYear()-t.getUTCFullYear())},function(t){return t.getUTCMonth()}),x_=m_.range,b_=Qn(function(t){t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)},function(t,n){t.setUTCFullYear(t.getUTCFullYear()+n)},function(t,n){return n.getUTCFullYear()-t.getUTCFullYear()},function(t){return t.getUTCFullYear()});b_.every=function(t){return isFinite(t=Math.floor(t))&&t>0?Qn(function(n){n.setUTCFullYear(Math.floor(n.getUTCFullYear()/t)*t),n.setUTCMonth(0,1),n.setUTCHours(0,0,0,0)},function(n,e){n.setUTCFullYear(n.getUTCFullYear()+e*t)}):null};var w_,M_=b_.range,k_=function(t,n){if((e=(t=n?t.toExponential(n-1):t.toExponential()).indexOf("e"))<0)return null;var e,r=t.slice(0,e);return[r.length>1?r[0]+r.slice(2):r,+t.slice(e+1)]},S_=function(t){return t=k_(Math.abs(t)),t?t[1]:NaN},T_=function(t,n){return function(e,r){for(var i=e.length,o=[],a=0,u=t[0],l=0;i>0&&u>0&&(l+u+1>r&&(u=Math.max(1,r-l)),o.push(e.substring(i-=u,i+u)),!((l+=u+1)>r));)u=t[a=(a+1)%t.length];return o.reverse().join(n)}},N_=function(t,n){t=t.toPrecision(n);t:for(var e,r=t.length,i=1,o=-1;i<r;++i)switch(t[i]){case".":o=e=i;break;case"0":0===o&&(o=i),e=i;break;case"e":break t;default:o>0&&(o=0)}return o>0?t.slice(0,o)+t.slice(e+1):t},E_=function(t,n){var e=k_(t,n);if(!e)return t+"";var r=e[0],i=e[1],o=i-(w_=3*Math.max(-8,Math.min(8,Math.floor(i/3))))+1,a=r.length;return o===a?r:o>a?r+new Array(o-a+1).join("0"):o>0?r.slice(0,o)+"."+r.slice(o):"0."+new Array(1-o).join("0")+k_(t,Math.max(0,n+o-1))[0]},A_=function(t,n){var e=k_(t,n);if(!e)return t+"";var r=e[0],i=e[1];return i<0?"0."+new Array((-i)).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")},z_={"":N_,"%":function(t,n){return(100*t).toFixed(n)},b:function(t){return Math.round(t).toString(2)},c:function(t){return t+""},d:function(t){return Math.round(t).toString(10)},e:function(t,n){return t.toExponential(n)},f:function(t,n){return t.toFixed(n)},g:function(t,n){return t.toPrecision(n)},o:function(t){return Math.round(t).toString(8)},p:function(t,n){return A_(100*t,n)},r:A_,s:E_,X:function(t){return Math.round(t).toString(16).toUpperCase()},x:function(t){return Math.round(t).toString(16)}},C_=/^(?:(.)?([<>=^]))?([+\-\( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?([a-z%])?$/i,P_=function(t){return new ne(t)};ne.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(null==this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(null==this.precision?"":"."+Math.max(0,0|this.precision))+this.type};var R_,L_=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"],q_=function(t){function n(t){function n(t){var n,i,l,g=d,m=_;if("c"===p)m=v(t)+m,t="";else{t=+t;var x=(t<0||1/t<0)&&(t*=-1,!0);if(t=v(t,h),x)for(n=-1,i=t.length,x=!1;++n<i;)if(l=t.charCodeAt(n),48<l&&l<58||"x"===p&&96<l&&l<103||"X"===p&&64<l&&l<71){x=!0;break}if(g=(x?"("===u?u:"-":"-"===u||"("===u?"":u)+g,m=m+("s"===p?L_[8+w_/3]:"")+(x&&"("===u?")":""),y)for(n=-1,i=t.length;++n<i;)if(l=t.charCodeAt(n),48>l||l>57){m=(46===l?o+t.slice(n+1):t.slice(n))+m,t=t.slice(0,n);break}}f&&!s&&(t=r(t,1/0));var b=g.length+t.length+m.length,w=b<c?new Array(c-b+1).join(e):"";switch(f&&s&&(t=r(w+t,w.length?c-m.length:1/0),w=""),a){case"<":return g+t+m+w;case"=":return g+w+t+m;case"^":return w.slice(0,b=w.length>>1)+g+t+m+w.slice(b)}return w+g+t+m}t=P_(t);var e=t.fill,a=t.align,u=t.sign,l=t.symbol,s=t.zero,c=t.width,f=t.comma,h=t.precision,p=t.type,d="$"===l?i[0]:"#"===l&&/[boxX]/.test(p)?"0"+p.toLowerCase():"",_="$"===l?i[1]:/[%p]/.test(p)?"%":"",v=z_[p],y=!p||/[defgprs%]/.test(p);return h=null==h?p?6:12:/[gprs]/.test(p)?Math.max(1,Math.min(21,h)):Math.max(0,Math.min(20,h)),n.toString=function(){return t+""},n}function e(t,e){var r=n((t=P_(t),t.type="f",t)),i=3*Math.max(-8,Math.min(8,Math.floor(S_(e)/3))),o=Math.pow(10,-i),a=L_[8+i/3];return function(t){return r(o*t)+a}}var r=t.grouping&&t.thousands?T_(t.grouping,t.thousands):ee,i=t.currency,o=t.decimal;return{format:n,formatPrefix:e}};re({decimal:".",thousands:",",grouping:[3],currency:["$",""]});var F_,O_=function(t){return Math.max(0,-S_(Math.abs(t)))},U_=function(t,n){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(S_(n)/3)))-S_(Math.abs(t)))},D_=function(t,n){return t=Math.abs(t),n=Math.abs(n)-t,Math.max(0,S_(n)-S_(t))+1},B_={"-":"",_:" ",0:"0"},j_=/^\s*\d+/,I_=/^%/,Y_=/[\\\^\$\*\+\?\|\[\]\(\)\.\{\}]/g;nr({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});var H_="%Y-%m-%dT%H:%M:%S.%LZ",X_=Date.prototype.toISOString?er:t.utcFormat(H_),V_=+new Date("2000-01-01T00:00:00.000Z")?rr:t.utcParse(H_),W_=Array.prototype,G_=W_.map,$_=W_.slice,Z_={name:"implicit"},J_=function(t){return function(){return t}},Q_=function(t){return+t},K_=[0,1],tv=function(n,r,i){var o,a=n[0],u=n[n.length-1],l=e(a,u,null==r?10:r);switch(i=P_(null==i?",f":i),i.type){case"s":var s=Math.max(Math.abs(a),Math.abs(u));return null!=i.precision||isNaN(o=U_(l,s))||(i.precision=o),t.formatPrefix(i,s);case"":case"e":case"g":case"p":case"r":null!=i.precision||isNaN(o=D_(l,Math.max(Math.abs(a),Math.abs(u))))||(i.precision=o-("e"===i.type));break;case"f":case"%":null!=i.precision||isNaN(o=O_(l))||(i.precision=o-2*("%"===i.type))}return t.format(i)},nv=function(t,n){t=t.slice();var e,r=0,i=t.length-1,o=t[r],a=t[i];return a<o&&(e=r,r=i,i=e,e=o,o=a,a=e),t[r]=n.floor(o),t[i]=n.ceil(a),t},ev=1e3,rv=60*ev,iv=60*rv,ov=24*iv,av=7*ov,uv=30*ov,lv=365*ov,sv=function(){return Rr(Jd,$d,qd,Rd,Cd,Ad,Nd,xd,t.timeFormat).domain([new Date(2e3,0,1),new Date(2e3,0,2)])},cv=function(){return Rr(b_,m_,o_,r_,n_,Kd,Nd,xd,t.utcFormat).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)])},fv=function(t){return t.match(/.{6}/g).map(function(t){return"#"+t})},hv=fv("1f77b4ff7f0e2ca02cd627289467bd8c564be377c27f7f7fbcbd2217becf"),pv=fv("393b795254a36b6ecf9c9ede6379398ca252b5cf6bcedb9c8c6d31bd9e39e7ba52e7cb94843c39ad494ad6616be7969c7b4173a55194ce6dbdde9ed6"),dv=fv("3182bd6baed69ecae1c6dbefe6550dfd8d3cfdae6bfdd0a231a35474c476a1d99bc7e9c0756bb19e9ac8bcbddcdadaeb636363969696bdbdbdd9d9d9"),_v=fv("1f77b4aec7e8ff7f0effbb782ca02c98df8ad62728ff98969467bdc5b0d58c564bc49c94e377c2f7b6d27f7f7fc7c7c7bcbd22dbdb8d17becf9edae5"),vv=Fp(fn(300,.5,0),fn(-240,.5,1)),yv=Fp(fn(-100,.75,.35),fn(80,1.5,.8)),gv=Fp(fn(260,.75,.35),fn(80,1.5,.8)),mv=fn(),xv=function(t){(t<0||t>1)&&(t-=Math.floor(t));var n=Math.abs(t-.5);return mv.h=360*t-100,mv.s=1.5-1.5*n,mv.l=.8-.9*n,mv+""},bv=Lr(fv("44015444025645045745055946075a46085c460a5d460b5e470d60470e6147106347116447136548146748166848176948186a481a6c481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a472d7b472e7c472f7d46307e46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f854240864241864142874144874045884046883f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b3b528b3a538b3a548c39558c39568c38588c38598c375a8c375b8d365c8d365d8d355e8d355f8d34608d34618d33628d33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e277e8e277f8e27808e26818e26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d218f8d21908d21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f881fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad8128ae8029af7f2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc743fbc7340bd7242be7144bf7046c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc8635ec96260ca6063cb5f65cb5e67cc5c69cd5b6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d84d44b86d54989d5488bd6468ed64590d74393d74195d84098d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021c8e020cae11fcde11dd0e11cd2e21bd5e21ad8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61ef6e620f8e621fbe723fde725")),wv=Lr(fv("00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e0907200a08220b09240c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c10441d11471e114920114b21114e22115024125325125527125829115a2a115c2c115f2d11612f116331116533106734106936106b38106c390f6e3b0f703d0f713f0f72400f74420f75440f764510774710784910784a10794c117a4e117b4f127b51127c52137c54137d56147d57157e59157e5a167e5c167f5d177f5f187f601880621980641a80651a80671b80681c816a1c816b1d816d1d816e1e81701f81721f817320817521817621817822817922827b23827c23827e24828025828125818326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80962c80982d80992d809b2e7f9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357bb3367ab5367ab73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064e75263e85362e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695cf56b5cf66c5cf66e5cf7705cf7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761fc8961fc8a62fc8c63fc8e64fc9065fd9266fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571fea772fea973feaa74feac76feae77feb078feb27afeb47bfeb67cfeb77efeb97ffebb81febd82febf84fec185fec287fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597fed799fed89afdda9cfddc9efddea0fde0a1fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8fcf7b9fcf9bbfcfbbdfcfdbf")),Mv=Lr(fv("00000401000501010601010802010a02020c02020e03021004031204031405041706041907051b08051d09061f0a07220b07240c08260d08290e092b10092d110a30120a32140b34150b37160b39180c3c190c3e1b0c411c0c431e0c451f0c48210c4a230c4c240c4f260c51280b53290b552b0b572d0b592f0a5b310a5c320a5e340a5f3609613809623909633b09643d09653e0966400a67420a68440a68450a69470b6a490b6a4a0c6b4c0c6b4d0d6c4f0d6c510e6c520e6d540f6d550f6d57106e59106e5a116e5c126e5d126e5f136e61136e62146e64156e65156e67166e69166e6a176e6c186e6d186e6f196e71196e721a6e741a6e751b6e771c6d781c6d7a1d6d7c1d6d7d1e6d7f1e6c801f6c82206c84206b85216b87216b88226a8a226a8c23698d23698f24699025689225689326679526679727669827669a28659b29649d29649f2a63a02a63a22b62a32c61a52c60a62d60a82e5fa92e5eab2f5ead305dae305cb0315bb1325ab3325ab43359b63458b73557b93556ba3655bc3754bd3853bf3952c03a51c13a50c33b4fc43c4ec63d4dc73e4cc83f4bca404acb4149cc4248ce4347cf4446d04545d24644d34743d44842d54a41d74b3fd84c3ed94d3dda4e3cdb503bdd513ade5238df5337e05536e15635e25734e35933e45a31e55c30e65d2fe75e2ee8602de9612bea632aeb6429eb6628ec6726ed6925ee6a24ef6c23ef6e21f06f20f1711ff1731df2741cf3761bf37819f47918f57b17f57d15f67e14f68013f78212f78410f8850ff8870ef8890cf98b0bf98c0af98e09fa9008fa9207fa9407fb9606fb9706fb9906fb9b06fb9d07fc9f07fca108fca309fca50afca60cfca80dfcaa0ffcac11fcae12fcb014fcb216fcb418fbb61afbb81dfbba1ffbbc21fbbe23fac026fac228fac42afac62df9c72ff9c932f9cb35f8cd37f8cf3af7d13df7d340f6d543f6d746f5d949f5db4cf4dd4ff4df53f4e156f3e35af3e55df2e661f2e865f2ea69f1ec6df1ed71f1ef75f1f179f2f27df2f482f3f586f3f68af4f88ef5f992f6fa96f8fb9af9fc9dfafda1fcffa4")),kv=Lr(fv("0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f059631059733059735049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a14c02a14e02a25002a25102a35302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a76600a76700a86900a86a00a86c00a86e00a86f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a87e03a88004a88104a78305a78405a78606a68707a68808a68a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a29511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9ba21d9aa31e9aa51f99a62098a72197a82296aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308bb7318ab83289ba3388bb3488bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447aca457acb4679cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586ada5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5de66c5ce76e5be76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b51ef7c51ef7e50f07f4ff0804ef1814df1834cf2844bf3854bf3874af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441f89540f9973ff9983ef99a3efa9b3dfa9c3cfa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72dfeb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324fbd524fbd724fad824fada24f9dc24f9dd25f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227f1f426f1f525f0f724f0f921")),Sv="http://www.w3.org/1999/xhtml",Tv={svg:"http://www.w3.org/2000/svg",xhtml:Sv,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"},Nv=function(t){var n=t+="",e=n.indexOf(":");return e>=0&&"xmlns"!==(n=t.slice(0,e))&&(t=t.slice(e+1)),Tv.hasOwnProperty(n)?{space:Tv[n],local:t}:t},Ev=function(t){var n=Nv(t);return(n.local?Or:Fr)(n)},Av=0;Dr.prototype=Ur.prototype={constructor:Dr,get:function(t){for(var n=this._;!(n in t);)if(!(t=t.parentNode))return;return t[n]},set:function(t,n){return t[this._]=n},remove:function(t){return this._ in t&&delete t[this._]},toString:function(){return this._}};var zv=function(t){return function(){return this.matches(t)}};if("undefined"!=typeof document){var Cv=document.documentElement;if(!Cv.matches){var Pv=Cv.webkitMatchesSelector||Cv.msMatchesSelector||Cv.mozMatchesSelector||Cv.oMatchesSelector;zv=function(t){return function(){return Pv.call(this,t)}}}}var Rv=zv,Lv={};if(t.event=null,"undefined"!=typeof document){var qv=document.documentElement;"onmouseenter"in qv||(Lv={mouseenter:"mouseover",mouseleave:"mouseout"})}var Fv=function(t,n,e){var r,i,o=Ir(t+""),a=o.length;{if(!(arguments.length<2)){for(u=n?Hr:Yr,null==e&&(e=!1),r=0;r<a;++r)this.each(u(o[r],n,e));return this}var u=this.node().__on;if(u)for(var l,s=0,c=u.length;s<c;++s)for(r=0,l=u[s];r<a;++r)if((i=o[r]).type===l.type&&i.name===l.name)return l.value}},Ov=function(){for(var n,e=t.event;n=e.sourceEvent;)e=n;return e},Uv=function(t,n){var e=t.ownerSVGElement||t;if(e.createSVGPoint){var r=e.createSVGPoint();return r.x=n.clientX,r.y=n.clientY,r=r.matrixTransform(t.getScreenCTM().inverse()),[r.x,r.y]}var i=t.getBoundingClientRect();return[n.clientX-i.left-t.clientLeft,n.clientY-i.top-t.clientTop]},Dv=function(t){var n=Ov();return n.changedTouches&&(n=n.changedTouches[0]),Uv(t,n)},Bv=function(t){return null==t?Vr:function(){return this.querySelector(t)}},jv=function(t){"function"!=typeof t&&(t=Bv(t));for(var n=this._groups,e=n.length,r=new Array(e),i=0;i<e;++i)for(var o,a,u=n[i],l=u.length,s=r[i]=new Array(l),c=0;c<l;++c)(o=u[c])&&(a=t.call(o,o.__data__,c,u))&&("__data__"in o&&(a.__data__=o.__data__),s[c]=a);return new Ci(r,this._parents)},Iv=function(t){return null==t?Wr:function(){return this.querySelectorAll(t)}},Yv=function(t){"function"!=typeof t&&(t=Iv(t));for(var n=this._groups,e=n.length,r=[],i=[],o=0;o<e;++o)for(var a,u=n[o],l=u.length,s=0;s<l;++s)(a=u[s])&&(r.push(t.call(a,a.__data__,s,u)),i.push(a));return new Ci(r,i)},Hv=function(t){"function"!=typeof t&&(t=Rv(t));for(var n=this._groups,e=n.length,r=new Array(e),i=0;i<e;++i)for(var o,a=n[i],u=a.length,l=r[i]=[],s=0;s<u;++s)(o=a[s])&&t.call(o,o.__data__,s,a)&&l.push(o);return new Ci(r,this._parents)},Xv=function(t){return new Array(t.length)},Vv=function(){return new Ci(this._enter||this._groups.map(Xv),this._parents)};Gr.prototype={constructor:Gr,appendChild:function(t){return this._parent.insertBefore(t,this._next)},insertBefore:function(t,n){return this._parent.insertBefore(t,n)},querySelector:function(t){return this._parent.querySelector(t)},querySelectorAll:function(t){return this._parent.querySelectorAll(t)}};var Wv=function(t){return function(){return t}},Gv="$",$v=function(t,n){if(!t)return p=new Array(this.size()),s=-1,this.each(function(t){p[++s]=t}),p;var e=n?Zr:$r,r=this._parents,i=this._groups;"function"!=typeof t&&(t=Wv(t));for(var o=i.length,a=new Array(o),u=new Array(o),l=new Array(o),s=0;s<o;++s){var c=r[s],f=i[s],h=f.length,p=t.call(c,c&&c.__data__,s,r),d=p.length,_=u[s]=new Array(d),v=a[s]=new Array(d),y=l[s]=new Array(h);e(c,f,_,v,y,p,n);for(var g,m,x=0,b=0;x<d;++x)if(g=_[x]){for(x>=b&&(b=x+1);!(m=v[b])&&++b<d;);g._next=m||null}}return a=new Ci(a,r),a._enter=u,a._exit=l,a},Zv=function(){return new Ci(this._exit||this._groups.map(Xv),this._parents)},Jv=function(t){for(var n=this._groups,e=t._groups,r=n.length,i=e.length,o=Math.min(r,i),a=new Array(r),u=0;u<o;++u)for(var l,s=n[u],c=e[u],f=s.length,h=a[u]=new Array(f),p=0;p<f;++p)(l=s[p]||c[p])&&(h[p]=l);for(;u<r;++u)a[u]=n[u];return new Ci(a,this._parents)},Qv=function(){for(var t=this._groups,n=-1,e=t.length;++n<e;)for(var r,i=t[n],o=i.length-1,a=i[o];--o>=0;)(r=i[o])&&(a&&a!==r.nextSibling&&a.parentNode.insertBefore(r,a),a=r);return this},Kv=function(t){function n(n,e){return n&&e?t(n.__data__,e.__data__):!n-!e}t||(t=Jr);for(var e=this._groups,r=e.length,i=new Array(r),o=0;o<r;++o){for(var a,u=e[o],l=u.length,s=i[o]=new Array(l),c=0;c<l;++c)(a=u[c])&&(s[c]=a);s.sort(n)}return new Ci(i,this._parents).order()},ty=function(){var t=arguments[0];return arguments[0]=this,t.apply(null,arguments),this},ny=function(){var t=new Array(this.size()),n=-1;return this.each(function(){t[++n]=this}),t},ey=function(){for(var t=this._groups,n=0,e=t.length;n<e;++n)for(var r=t[n],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null},ry=function(){var t=0;return this.each(function(){++t}),t},iy=function(){return!this.node()},oy=function(t){for(var n=this._groups,e=0,r=n.length;e<r;++e)for(var i,o=n[e],a=0,u=o.length;a<u;++a)(i=o[a])&&t.call(i,i.__data__,a,o);return this},ay=function(t,n){var e=Nv(t);if(arguments.length<2){var r=this.node();return e.local?r.getAttributeNS(e.space,e.local):r.getAttribute(e)}return this.each((null==n?e.local?Kr:Qr:"function"==typeof n?e.local?ri:ei:e.local?ni:ti)(e,n))},uy=function(t){return t.ownerDocument&&t.ownerDocument.defaultView||t.document&&t||t.defaultView},ly=function(t,n,e){var r;return arguments.length>1?this.each((null==n?ii:"function"==typeof n?ai:oi)(t,n,null==e?"":e)):uy(r=this.node()).getComputedStyle(r,null).getPropertyValue(t)},sy=function(t,n){return arguments.length>1?this.each((null==n?ui:"function"==typeof n?si:li)(t,n)):this.node()[t]};hi.prototype={add:function(t){var n=this._names.indexOf(t);n<0&&(this._names.push(t),this._node.setAttribute("class",this._names.join(" ")))},remove:function(t){var n=this._names.indexOf(t);n>=0&&(this._names.splice(n,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(t){return this._names.indexOf(t)>=0}};var cy=function(t,n){var e=ci(t+"");if(arguments.length<2){for(var r=fi(this.node()),i=-1,o=e.length;++i<o;)if(!r.contains(e[i]))return!1;return!0}return this.each(("function"==typeof n?yi:n?_i:vi)(e,n))},fy=function(t){return arguments.length?this.each(null==t?gi:("function"==typeof t?xi:mi)(t)):this.node().textContent},hy=function(t){return arguments.length?this.each(null==t?bi:("function"==typeof t?Mi:wi)(t)):this.node().innerHTML},py=function(){return this.each(ki)},dy=function(){return this.each(Si)},_y=function(t){var n="function"==typeof t?t:Ev(t);return this.select(function(){return this.appendChild(n.apply(this,arguments))})},vy=function(t,n){var e="function"==typeof t?t:Ev(t),r=null==n?Ti:"function"==typeof n?n:Bv(n);return this.select(function(){return this.insertBefore(e.apply(this,arguments),r.apply(this,arguments)||null)})},yy=function(){return this.each(Ni)},gy=function(t){return arguments.length?this.property("__data__",t):this.node().__data__},my=function(t,n){return this.each(("function"==typeof n?zi:Ai)(t,n))},xy=[null];Ci.prototype=Pi.prototype={constructor:Ci,select:jv,selectAll:Yv,filter:Hv,data:$v,enter:Vv,exit:Zv,merge:Jv,order:Qv,sort:Kv,call:ty,nodes:ny,node:ey,size:ry,empty:iy,each:oy,attr:ay,style:ly,property:sy,classed:cy,text:fy,html:hy,raise:py,lower:dy,append:_y,insert:vy,remove:yy,datum:gy,on:Fv,dispatch:my};var by=function(t){return"string"==typeof t?new Ci([[document.querySelector(t)]],[document.documentElement]):new Ci([[t]],xy)},wy=function(t){return"string"==typeof t?new Ci([document.querySelectorAll(t)],[document.documentElement]):new Ci([null==t?[]:t],xy)},My=function(t,n,e){arguments.length<3&&(e=n,n=Ov().changedTouches);for(var r,i=0,o=n?n.length:0;i<o;++i)if((r=n[i]).identifier===e)return Uv(t,r);return null},ky=function(t,n){null==n&&(n=Ov().touches);for(var e=0,r=n?n.length:0,i=new Array(r);e<r;++e)i[e]=Uv(t,n[e]);return i},Sy=Pn("start","end","interrupt"),Ty=[],Ny=0,Ey=1,Ay=2,zy=3,Cy=4,Py=5,Ry=6,Ly=function(t,n,e,r,i,o){var a=t.__transition;if(a){if(e in a)return}else t.__transition={};Fi(t,e,{name:n,index:r,group:i,on:Sy,tween:Ty,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:Ny})},qy=function(t,n){var e,r,i,o=t.__transition,a=!0;if(o){n=null==n?null:n+"";for(i in o)(e=o[i]).name===n?(r=e.state>Ay&&e.state<Py,e.state=Ry,e.timer.stop(),r&&e.on.call("interrupt",t,t.__data__,e.index,e.group),delete o[i]):a=!1;a&&delete t.__transition}},Fy=function(t){return this.each(function(){qy(this,t)})},Oy=function(t,n){var e=this._id;if(t+="",arguments.length<2){for(var r,i=qi(this.node(),e).tween,o=0,a=i.length;o<a;++o)if((r=i[o]).name===t)return r.value;return null}return this.each((null==n?Oi:Ui)(e,t,n))},Uy=function(t,n){var e;return("number"==typeof n?dp:n instanceof It?sp:(e=It(n))?(n=e,sp):gp)(t,n)},Dy=function(t,n){var e=Nv(t),r="transform"===e?Sp:Uy;return this.attrTween(t,"function"==typeof n?(e.local?Xi:Hi)(e,r,Di(this,"attr."+t,n)):null==n?(e.local?ji:Bi)(e):(e.local?Yi:Ii)(e,r,n))},By=function(t,n){var e="attr."+t;if(arguments.length<2)return(e=this.tween(e))&&e._value;if(null==n)return this.tween(e,null);if("function"!=typeof n)throw new Error;var r=Nv(t);return this.tween(e,(r.local?Vi:Wi)(r,n))},jy=function(t){var n=this._id;return arguments.length?this.each(("function"==typeof t?Gi:$i)(n,t)):qi(this.node(),n).delay},Iy=function(t){var n=this._id;return arguments.length?this.each(("function"==typeof t?Zi:Ji)(n,t)):qi(this.node(),n).duration},Yy=function(t){var n=this._id;return arguments.length?this.each(Qi(n,t)):qi(this.node(),n).ease},Hy=function(t){"function"!=typeof t&&(t=Rv(t));for(var n=this._groups,e=n.length,r=new Array(e),i=0;i<e;++i)for(var o,a=n[i],u=a.length,l=r[i]=[],s=0;s<u;++s)(o=a[s])&&t.call(o,o.__data__,s,a)&&l.push(o);return new so(r,this._parents,this._name,this._id)},Xy=function(t){if(t._id!==this._id)throw new Error;for(var n=this._groups,e=t._groups,r=n.length,i=e.length,o=Math.min(r,i),a=new Array(r),u=0;u<o;++u)for(var l,s=n[u],c=e[u],f=s.length,h=a[u]=new Array(f),p=0;p<f;++p)(l=s[p]||c[p])&&(h[p]=l);for(;u<r;++u)a[u]=n[u];return new so(a,this._parents,this._name,this._id)},Vy=function(t,n){
 var e=this._id;return arguments.length<2?qi(this.node(),e).on.on(t):this.each(to(e,t,n))},Wy=function(){return this.on("end.remove",no(this._id))},Gy=function(t){var n=this._name,e=this._id;"function"!=typeof t&&(t=Bv(t));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var u,l,s=r[a],c=s.length,f=o[a]=new Array(c),h=0;h<c;++h)(u=s[h])&&(l=t.call(u,u.__data__,h,s))&&("__data__"in u&&(l.__data__=u.__data__),f[h]=l,Ly(f[h],n,e,h,f,qi(u,e)));return new so(o,this._parents,n,e)},$y=function(t){var n=this._name,e=this._id;"function"!=typeof t&&(t=Iv(t));for(var r=this._groups,i=r.length,o=[],a=[],u=0;u<i;++u)for(var l,s=r[u],c=s.length,f=0;f<c;++f)if(l=s[f]){for(var h,p=t.call(l,l.__data__,f,s),d=qi(l,e),_=0,v=p.length;_<v;++_)(h=p[_])&&Ly(h,n,e,_,p,d);o.push(p),a.push(l)}return new so(o,a,n,e)},Zy=Pi.prototype.constructor,Jy=function(){return new Zy(this._groups,this._parents)},Qy=function(t,n,e){var r="transform"==(t+="")?kp:Uy;return null==n?this.styleTween(t,eo(t,r)).on("end.style."+t,ro(t)):this.styleTween(t,"function"==typeof n?oo(t,r,Di(this,"style."+t,n)):io(t,r,n),e)},Ky=function(t,n,e){var r="style."+(t+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==n)return this.tween(r,null);if("function"!=typeof n)throw new Error;return this.tween(r,ao(t,n,null==e?"":e))},tg=function(t){return this.tween("text","function"==typeof t?lo(Di(this,"text",t)):uo(null==t?"":t+""))},ng=function(){for(var t=this._name,n=this._id,e=fo(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a,u=r[o],l=u.length,s=0;s<l;++s)if(a=u[s]){var c=qi(a,n);Ly(a,t,e,s,u,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new so(r,this._parents,t,e)},eg=0,rg=Pi.prototype;so.prototype=co.prototype={constructor:so,select:Gy,selectAll:$y,filter:Hy,merge:Xy,selection:Jy,transition:ng,call:rg.call,nodes:rg.nodes,node:rg.node,size:rg.size,empty:rg.empty,each:rg.each,on:Vy,attr:Dy,attrTween:By,style:Qy,styleTween:Ky,text:tg,remove:Wy,tween:Oy,delay:jy,duration:Iy,ease:Yy};var ig={time:null,delay:0,duration:250,ease:g},og=function(t){var n,e;t instanceof so?(n=t._id,t=t._name):(n=fo(),(e=ig).time=Yn(),t=null==t?null:t+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a,u=r[o],l=u.length,s=0;s<l;++s)(a=u[s])&&Ly(a,t,n,s,u,e||ho(a,n));return new so(r,this._parents,t,n)};Pi.prototype.interrupt=Fy,Pi.prototype.transition=og;var ag=[null],ug=function(t,n){var e,r,i=t.__transition;if(i){n=null==n?null:n+"";for(r in i)if((e=i[r]).state>Ey&&e.name===n)return new so([[t]],ag,n,(+r))}return null},lg=Array.prototype.slice,sg=function(t){return t},cg=1,fg=2,hg=3,pg=4,dg=1e-6,_g=function(){function t(t){var o,a=0;t.eachAfter(function(t){var e=t.children;e?(t.x=ko(e),t.y=To(e)):(t.x=o?a+=n(t,o):0,t.y=0,o=t)});var u=Eo(t),l=Ao(t),s=u.x-n(u,l)/2,c=l.x+n(l,u)/2;return t.eachAfter(i?function(n){n.x=(n.x-t.x)*e,n.y=(t.y-n.y)*r}:function(n){n.x=(n.x-s)/(c-s)*e,n.y=(1-(t.y?n.y/t.y:1))*r})}var n=Mo,e=1,r=1,i=!1;return t.separation=function(e){return arguments.length?(n=e,t):n},t.size=function(n){return arguments.length?(i=!1,e=+n[0],r=+n[1],t):i?null:[e,r]},t.nodeSize=function(n){return arguments.length?(i=!0,e=+n[0],r=+n[1],t):i?[e,r]:null},t},vg=function(t){var n,e,r,i,o=this,a=[o];do for(n=a.reverse(),a=[];o=n.pop();)if(t(o),e=o.children)for(r=0,i=e.length;r<i;++r)a.push(e[r]);while(a.length);return this},yg=function(t){for(var n,e,r=this,i=[r];r=i.pop();)if(t(r),n=r.children)for(e=n.length-1;e>=0;--e)i.push(n[e]);return this},gg=function(t){for(var n,e,r,i=this,o=[i],a=[];i=o.pop();)if(a.push(i),n=i.children)for(e=0,r=n.length;e<r;++e)o.push(n[e]);for(;i=a.pop();)t(i);return this},mg=function(t){return this.eachAfter(function(n){for(var e=+t(n.data)||0,r=n.children,i=r&&r.length;--i>=0;)e+=r[i].value;n.value=e})},xg=function(t){return this.eachBefore(function(n){n.children&&n.children.sort(t)})},bg=function(t){for(var n=this,e=zo(n,t),r=[n];n!==e;)n=n.parent,r.push(n);for(var i=r.length;t!==e;)r.splice(i,0,t),t=t.parent;return r},wg=function(){for(var t=this,n=[t];t=t.parent;)n.push(t);return n},Mg=function(){var t=[];return this.each(function(n){t.push(n)}),t},kg=function(){var t=[];return this.eachBefore(function(n){n.children||t.push(n)}),t},Sg=function(){var t=this,n=[];return t.each(function(e){e!==t&&n.push({source:e.parent,target:e})}),n};Fo.prototype=Co.prototype={constructor:Fo,each:vg,eachAfter:gg,eachBefore:yg,sum:mg,sort:xg,path:bg,ancestors:wg,descendants:Mg,leaves:kg,links:Sg,copy:Po};var Tg=function(t){for(var n,e=(t=t.slice()).length,r=null,i=r;e;){var o=new Oo(t[e-1]);i=i?i.next=o:r=o,t[n]=t[--e]}return{head:r,tail:i}},Ng=function(t){return Do(Tg(t),[])},Eg=function(t){return Wo(t),t},Ag=function(t){return function(){return t}},zg=function(){function t(t){return t.x=e/2,t.y=r/2,n?t.eachBefore(Qo(n)).eachAfter(Ko(i,.5)).eachBefore(ta(1)):t.eachBefore(Qo(Jo)).eachAfter(Ko(Zo,1)).eachAfter(Ko(i,t.r/Math.min(e,r))).eachBefore(ta(Math.min(e,r)/(2*t.r))),t}var n=null,e=1,r=1,i=Zo;return t.radius=function(e){return arguments.length?(n=Go(e),t):n},t.size=function(n){return arguments.length?(e=+n[0],r=+n[1],t):[e,r]},t.padding=function(n){return arguments.length?(i="function"==typeof n?n:Ag(+n),t):i},t},Cg=function(t){t.x0=Math.round(t.x0),t.y0=Math.round(t.y0),t.x1=Math.round(t.x1),t.y1=Math.round(t.y1)},Pg=function(t,n,e,r,i){for(var o,a=t.children,u=-1,l=a.length,s=t.value&&(r-n)/t.value;++u<l;)o=a[u],o.y0=e,o.y1=i,o.x0=n,o.x1=n+=o.value*s},Rg=function(){function t(t){var a=t.height+1;return t.x0=t.y0=i,t.x1=e,t.y1=r/a,t.eachBefore(n(r,a)),o&&t.eachBefore(Cg),t}function n(t,n){return function(e){e.children&&Pg(e,e.x0,t*(e.depth+1)/n,e.x1,t*(e.depth+2)/n);var r=e.x0,o=e.y0,a=e.x1-i,u=e.y1-i;a<r&&(r=a=(r+a)/2),u<o&&(o=u=(o+u)/2),e.x0=r,e.y0=o,e.x1=a,e.y1=u}}var e=1,r=1,i=0,o=!1;return t.round=function(n){return arguments.length?(o=!!n,t):o},t.size=function(n){return arguments.length?(e=+n[0],r=+n[1],t):[e,r]},t.padding=function(n){return arguments.length?(i=+n,t):i},t},Lg="$",qg={depth:-1},Fg={},Og=function(){function t(t){var r,i,o,a,u,l,s,c=t.length,f=new Array(c),h={};for(i=0;i<c;++i)r=t[i],u=f[i]=new Fo(r),null!=(l=n(r,i,t))&&(l+="")&&(s=Lg+(u.id=l),h[s]=s in h?Fg:u);for(i=0;i<c;++i)if(u=f[i],l=e(t[i],i,t),null!=l&&(l+="")){if(a=h[Lg+l],!a)throw new Error("missing: "+l);if(a===Fg)throw new Error("ambiguous: "+l);a.children?a.children.push(u):a.children=[u],u.parent=a}else{if(o)throw new Error("multiple roots");o=u}if(!o)throw new Error("no root");if(o.parent=qg,o.eachBefore(function(t){t.depth=t.parent.depth+1,--c}).eachBefore(qo),o.parent=null,c>0)throw new Error("cycle");return o}var n=na,e=ea;return t.id=function(e){return arguments.length?(n=$o(e),t):n},t.parentId=function(n){return arguments.length?(e=$o(n),t):e},t};sa.prototype=Object.create(Fo.prototype);var Ug=function(){function t(t){var r=ca(t);if(r.eachAfter(n),r.parent.m=-r.z,r.eachBefore(e),l)t.eachBefore(i);else{var s=t,c=t,f=t;t.eachBefore(function(t){t.x<s.x&&(s=t),t.x>c.x&&(c=t),t.depth>f.depth&&(f=t)});var h=s===c?1:o(s,c)/2,p=h-s.x,d=a/(c.x+h+p),_=u/(f.depth||1);t.eachBefore(function(t){t.x=(t.x+p)*d,t.y=t.depth*_})}return t}function n(t){var n=t.children,e=t.parent.children,i=t.i?e[t.i-1]:null;if(n){ua(t);var a=(n[0].z+n[n.length-1].z)/2;i?(t.z=i.z+o(t._,i._),t.m=t.z-a):t.z=a}else i&&(t.z=i.z+o(t._,i._));t.parent.A=r(t,i,t.parent.A||e[0])}function e(t){t._.x=t.z+t.parent.m,t.m+=t.parent.m}function r(t,n,e){if(n){for(var r,i=t,a=t,u=n,l=i.parent.children[0],s=i.m,c=a.m,f=u.m,h=l.m;u=oa(u),i=ia(i),u&&i;)l=ia(l),a=oa(a),a.a=t,r=u.z+f-i.z-s+o(u._,i._),r>0&&(aa(la(u,t,e),t,r),s+=r,c+=r),f+=u.m,s+=i.m,h+=l.m,c+=a.m;u&&!oa(a)&&(a.t=u,a.m+=f-c),i&&!ia(l)&&(l.t=i,l.m+=s-h,e=t)}return e}function i(t){t.x*=a,t.y=t.depth*u}var o=ra,a=1,u=1,l=null;return t.separation=function(n){return arguments.length?(o=n,t):o},t.size=function(n){return arguments.length?(l=!1,a=+n[0],u=+n[1],t):l?null:[a,u]},t.nodeSize=function(n){return arguments.length?(l=!0,a=+n[0],u=+n[1],t):l?[a,u]:null},t},Dg=function(t,n,e,r,i){for(var o,a=t.children,u=-1,l=a.length,s=t.value&&(i-e)/t.value;++u<l;)o=a[u],o.x0=n,o.x1=r,o.y0=e,o.y1=e+=o.value*s},Bg=(1+Math.sqrt(5))/2,jg=function Yw(t){function n(n,e,r,i,o){fa(t,n,e,r,i,o)}return n.ratio=function(t){return Yw((t=+t)>1?t:1)},n}(Bg),Ig=function(){function t(t){return t.x0=t.y0=0,t.x1=i,t.y1=o,t.eachBefore(n),a=[0],r&&t.eachBefore(Cg),t}function n(t){var n=a[t.depth],r=t.x0+n,i=t.y0+n,o=t.x1-n,h=t.y1-n;o<r&&(r=o=(r+o)/2),h<i&&(i=h=(i+h)/2),t.x0=r,t.y0=i,t.x1=o,t.y1=h,t.children&&(n=a[t.depth+1]=u(t)/2,r+=f(t)-n,i+=l(t)-n,o-=s(t)-n,h-=c(t)-n,o<r&&(r=o=(r+o)/2),h<i&&(i=h=(i+h)/2),e(t,r,i,o,h))}var e=jg,r=!1,i=1,o=1,a=[0],u=Zo,l=Zo,s=Zo,c=Zo,f=Zo;return t.round=function(n){return arguments.length?(r=!!n,t):r},t.size=function(n){return arguments.length?(i=+n[0],o=+n[1],t):[i,o]},t.tile=function(n){return arguments.length?(e=$o(n),t):e},t.padding=function(n){return arguments.length?t.paddingInner(n).paddingOuter(n):t.paddingInner()},t.paddingInner=function(n){return arguments.length?(u="function"==typeof n?n:Ag(+n),t):u},t.paddingOuter=function(n){return arguments.length?t.paddingTop(n).paddingRight(n).paddingBottom(n).paddingLeft(n):t.paddingTop()},t.paddingTop=function(n){return arguments.length?(l="function"==typeof n?n:Ag(+n),t):l},t.paddingRight=function(n){return arguments.length?(s="function"==typeof n?n:Ag(+n),t):s},t.paddingBottom=function(n){return arguments.length?(c="function"==typeof n?n:Ag(+n),t):c},t.paddingLeft=function(n){return arguments.length?(f="function"==typeof n?n:Ag(+n),t):f},t},Yg=function(t,n,e,r,i){function o(t,n,e,r,i,a,u){if(t>=n-1){var s=l[t];return s.x0=r,s.y0=i,s.x1=a,s.y1=u,void 0}for(var f=c[t],h=e/2+f,p=t+1,d=n-1;p<d;){var _=p+d>>>1;c[_]<h?p=_+1:d=_}var v=c[p]-f,y=e-v;if(u-i>a-r){var g=(i*y+u*v)/e;o(t,p,v,r,i,a,g),o(p,n,y,r,g,a,u)}else{var m=(r*y+a*v)/e;o(t,p,v,r,i,m,u),o(p,n,y,m,i,a,u)}}var a,u,l=t.children,s=l.length,c=new Array(s+1);for(c[0]=u=a=0;a<s;++a)c[a+1]=u+=l[a].value;o(0,s,t.value,n,e,r,i)},Hg=function(t,n,e,r,i){(1&t.depth?Dg:Pg)(t,n,e,r,i)},Xg=function Hw(t){function n(n,e,r,i,o){if((a=n._squarify)&&a.ratio===t)for(var a,u,l,s,c,f=-1,h=a.length,p=n.value;++f<h;){for(u=a[f],l=u.children,s=u.value=0,c=l.length;s<c;++s)u.value+=l[s].value;u.dice?Pg(u,e,r,i,r+=(o-r)*u.value/p):Dg(u,e,r,e+=(i-e)*u.value/p,o),p-=u.value}else n._squarify=a=fa(t,n,e,r,i,o),a.ratio=t}return n.ratio=function(t){return Hw((t=+t)>1?t:1)},n}(Bg),Vg=function(t,n){function e(){var e,i,o=r.length,a=0,u=0;for(e=0;e<o;++e)i=r[e],a+=i.x,u+=i.y;for(a=a/o-t,u=u/o-n,e=0;e<o;++e)i=r[e],i.x-=a,i.y-=u}var r;return null==t&&(t=0),null==n&&(n=0),e.initialize=function(t){r=t},e.x=function(n){return arguments.length?(t=+n,e):t},e.y=function(t){return arguments.length?(n=+t,e):n},e},Wg=function(t){return function(){return t}},Gg=function(){return 1e-6*(Math.random()-.5)},$g=function(t){function n(){function t(t,n,e,r,i){var o=t.data,u=t.r,p=f+u;{if(!o)return n>s+p||r<s-p||e>c+p||i<c-p;if(o.index>l.index){var d=s-o.x-o.vx,_=c-o.y-o.vy,v=d*d+_*_;v<p*p&&(0===d&&(d=Gg(),v+=d*d),0===_&&(_=Gg(),v+=_*_),v=(p-(v=Math.sqrt(v)))/v*a,l.vx+=(d*=v)*(p=(u*=u)/(h+u)),l.vy+=(_*=v)*p,o.vx-=d*(p=1-p),o.vy-=_*p)}}}for(var n,r,l,s,c,f,h,p=i.length,d=0;d<u;++d)for(r=B(i,ha,pa).visitAfter(e),n=0;n<p;++n)l=i[n],f=o[l.index],h=f*f,s=l.x+l.vx,c=l.y+l.vy,r.visit(t)}function e(t){if(t.data)return t.r=o[t.data.index];for(var n=t.r=0;n<4;++n)t[n]&&t[n].r>t.r&&(t.r=t[n].r)}function r(){if(i){var n,e,r=i.length;for(o=new Array(r),n=0;n<r;++n)e=i[n],o[e.index]=+t(e,n,i)}}var i,o,a=1,u=1;return"function"!=typeof t&&(t=Wg(null==t?1:+t)),n.initialize=function(t){i=t,r()},n.iterations=function(t){return arguments.length?(u=+t,n):u},n.strength=function(t){return arguments.length?(a=+t,n):a},n.radius=function(e){return arguments.length?(t="function"==typeof e?e:Wg(+e),r(),n):t},n},Zg=function(t){function n(t){return 1/Math.min(c[t.source.index],c[t.target.index])}function e(n){for(var e=0,r=t.length;e<_;++e)for(var i,o,a,s,c,h,p,d=0;d<r;++d)i=t[d],o=i.source,a=i.target,s=a.x+a.vx-o.x-o.vx||Gg(),c=a.y+a.vy-o.y-o.vy||Gg(),h=Math.sqrt(s*s+c*c),h=(h-l[d])/h*n*u[d],s*=h,c*=h,a.vx-=s*(p=f[d]),a.vy-=c*p,o.vx+=s*(p=1-p),o.vy+=c*p}function r(){if(s){var n,e,r=s.length,p=t.length,d=o(s,h);for(n=0,c=new Array(r);n<p;++n)e=t[n],e.index=n,"object"!=typeof e.source&&(e.source=_a(d,e.source)),"object"!=typeof e.target&&(e.target=_a(d,e.target)),c[e.source.index]=(c[e.source.index]||0)+1,c[e.target.index]=(c[e.target.index]||0)+1;for(n=0,f=new Array(p);n<p;++n)e=t[n],f[n]=c[e.source.index]/(c[e.source.index]+c[e.target.index]);u=new Array(p),i(),l=new Array(p),a()}}function i(){if(s)for(var n=0,e=t.length;n<e;++n)u[n]=+p(t[n],n,t)}function a(){if(s)for(var n=0,e=t.length;n<e;++n)l[n]=+d(t[n],n,t)}var u,l,s,c,f,h=da,p=n,d=Wg(30),_=1;return null==t&&(t=[]),e.initialize=function(t){s=t,r()},e.links=function(n){return arguments.length?(t=n,r(),e):t},e.id=function(t){return arguments.length?(h=t,e):h},e.iterations=function(t){return arguments.length?(_=+t,e):_},e.strength=function(t){return arguments.length?(p="function"==typeof t?t:Wg(+t),i(),e):p},e.distance=function(t){return arguments.length?(d="function"==typeof t?t:Wg(+t),a(),e):d},e},Jg=10,Qg=Math.PI*(3-Math.sqrt(5)),Kg=function(t){function n(){e(),d.call("tick",a),u<l&&(p.stop(),d.call("end",a))}function e(){var n,e,r=t.length;for(u+=(c-u)*s,h.each(function(t){t(u)}),n=0;n<r;++n)e=t[n],null==e.fx?e.x+=e.vx*=f:(e.x=e.fx,e.vx=0),null==e.fy?e.y+=e.vy*=f:(e.y=e.fy,e.vy=0)}function r(){for(var n,e=0,r=t.length;e<r;++e){if(n=t[e],n.index=e,isNaN(n.x)||isNaN(n.y)){var i=Jg*Math.sqrt(e),o=e*Qg;n.x=i*Math.cos(o),n.y=i*Math.sin(o)}(isNaN(n.vx)||isNaN(n.vy))&&(n.vx=n.vy=0)}}function i(n){return n.initialize&&n.initialize(t),n}var a,u=1,l=.001,s=1-Math.pow(l,1/300),c=0,f=.6,h=o(),p=Vn(n),d=Pn("tick","end");return null==t&&(t=[]),r(),a={tick:e,restart:function(){return p.restart(n),a},stop:function(){return p.stop(),a},nodes:function(n){return arguments.length?(t=n,r(),h.each(i),a):t},alpha:function(t){return arguments.length?(u=+t,a):u},alphaMin:function(t){return arguments.length?(l=+t,a):l},alphaDecay:function(t){return arguments.length?(s=+t,a):+s},alphaTarget:function(t){return arguments.length?(c=+t,a):c},velocityDecay:function(t){return arguments.length?(f=1-t,a):1-f},force:function(t,n){return arguments.length>1?(null==n?h.remove(t):h.set(t,i(n)),a):h.get(t)},find:function(n,e,r){var i,o,a,u,l,s=0,c=t.length;for(null==r?r=1/0:r*=r,s=0;s<c;++s)u=t[s],i=n-u.x,o=e-u.y,a=i*i+o*o,a<r&&(l=u,r=a);return l},on:function(t,n){return arguments.length>1?(d.on(t,n),a):d.on(t)}}},tm=function(){function t(t){var n,u=i.length,l=B(i,va,ya).visitAfter(e);for(a=t,n=0;n<u;++n)o=i[n],l.visit(r)}function n(){if(i){var t,n,e=i.length;for(u=new Array(e),t=0;t<e;++t)n=i[t],u[n.index]=+l(n,t,i)}}function e(t){var n,e,r,i,o,a=0;if(t.length){for(r=i=o=0;o<4;++o)(n=t[o])&&(e=n.value)&&(a+=e,r+=e*n.x,i+=e*n.y);t.x=r/a,t.y=i/a}else{n=t,n.x=n.data.x,n.y=n.data.y;do a+=u[n.data.index];while(n=n.next)}t.value=a}function r(t,n,e,r){if(!t.value)return!0;var i=t.x-o.x,l=t.y-o.y,h=r-n,p=i*i+l*l;if(h*h/f<p)return p<c&&(0===i&&(i=Gg(),p+=i*i),0===l&&(l=Gg(),p+=l*l),p<s&&(p=Math.sqrt(s*p)),o.vx+=i*t.value*a/p,o.vy+=l*t.value*a/p),!0;if(!(t.length||p>=c)){(t.data!==o||t.next)&&(0===i&&(i=Gg(),p+=i*i),0===l&&(l=Gg(),p+=l*l),p<s&&(p=Math.sqrt(s*p)));do t.data!==o&&(h=u[t.data.index]*a/p,o.vx+=i*h,o.vy+=l*h);while(t=t.next)}}var i,o,a,u,l=Wg(-30),s=1,c=1/0,f=.81;return t.initialize=function(t){i=t,n()},t.strength=function(e){return arguments.length?(l="function"==typeof e?e:Wg(+e),n(),t):l},t.distanceMin=function(n){return arguments.length?(s=n*n,t):Math.sqrt(s)},t.distanceMax=function(n){return arguments.length?(c=n*n,t):Math.sqrt(c)},t.theta=function(n){return arguments.length?(f=n*n,t):Math.sqrt(f)},t},nm=function(t){function n(t){for(var n,e=0,a=r.length;e<a;++e)n=r[e],n.vx+=(o[e]-n.x)*i[e]*t}function e(){if(r){var n,e=r.length;for(i=new Array(e),o=new Array(e),n=0;n<e;++n)i[n]=isNaN(o[n]=+t(r[n],n,r))?0:+a(r[n],n,r)}}var r,i,o,a=Wg(.1);return"function"!=typeof t&&(t=Wg(null==t?0:+t)),n.initialize=function(t){r=t,e()},n.strength=function(t){return arguments.length?(a="function"==typeof t?t:Wg(+t),e(),n):a},n.x=function(r){return arguments.length?(t="function"==typeof r?r:Wg(+r),e(),n):t},n},em=function(t){function n(t){for(var n,e=0,a=r.length;e<a;++e)n=r[e],n.vy+=(o[e]-n.y)*i[e]*t}function e(){if(r){var n,e=r.length;for(i=new Array(e),o=new Array(e),n=0;n<e;++n)i[n]=isNaN(o[n]=+t(r[n],n,r))?0:+a(r[n],n,r)}}var r,i,o,a=Wg(.1);return"function"!=typeof t&&(t=Wg(null==t?0:+t)),n.initialize=function(t){r=t,e()},n.strength=function(t){return arguments.length?(a="function"==typeof t?t:Wg(+t),e(),n):a},n.y=function(r){return arguments.length?(t="function"==typeof r?r:Wg(+r),e(),n):t},n},rm=function(){t.event.preventDefault(),t.event.stopImmediatePropagation()},im=function(t){var n=t.document.documentElement,e=by(t).on("dragstart.drag",rm,!0);"onselectstart"in n?e.on("selectstart.drag",rm,!0):(n.__noselect=n.style.MozUserSelect,n.style.MozUserSelect="none")},om=function(t){return function(){return t}};xa.prototype.on=function(){var t=this._.on.apply(this._,arguments);return t===this._?this:t};var am=function(){function n(t){t.on("mousedown.drag",e).on("touchstart.drag",o).on("touchmove.drag",a).on("touchend.drag touchcancel.drag",u).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function e(){if(!c&&f.apply(this,arguments)){var n=l("mouse",h.apply(this,arguments),Dv,this,arguments);n&&(by(t.event.view).on("mousemove.drag",r,!0).on("mouseup.drag",i,!0),im(t.event.view),ga(),s=!1,n("start"))}}function r(){rm(),s=!0,d.mouse("drag")}function i(){by(t.event.view).on("mousemove.drag mouseup.drag",null),ma(t.event.view,s),rm(),d.mouse("end")}function o(){if(f.apply(this,arguments)){var n,e,r=t.event.changedTouches,i=h.apply(this,arguments),o=r.length;for(n=0;n<o;++n)(e=l(r[n].identifier,i,My,this,arguments))&&(ga(),e("start"))}}function a(){var n,e,r=t.event.changedTouches,i=r.length;for(n=0;n<i;++n)(e=d[r[n].identifier])&&(rm(),e("drag"))}function u(){var n,e,r=t.event.changedTouches,i=r.length;for(c&&clearTimeout(c),c=setTimeout(function(){c=null},500),n=0;n<i;++n)(e=d[r[n].identifier])&&(ga(),e("end"))}function l(e,r,i,o,a){var u,l,s,c=i(r,e),f=_.copy();if(Xr(new xa(n,"beforestart",u,e,v,c[0],c[1],0,0,f),function(){return null!=(t.event.subject=u=p.apply(o,a))&&(l=u.x-c[0]||0,s=u.y-c[1]||0,!0)}))return function h(t){var p,_=c;switch(t){case"start":d[e]=h,p=v++;break;case"end":delete d[e],--v;case"drag":c=i(r,e),p=v}Xr(new xa(n,t,u,e,p,c[0]+l,c[1]+s,c[0]-_[0],c[1]-_[1],f),f.apply,f,[t,o,a])}}var s,c,f=ba,h=wa,p=Ma,d={},_=Pn("start","drag","end"),v=0;return n.filter=function(t){return arguments.length?(f="function"==typeof t?t:om(!!t),n):f},n.container=function(t){return arguments.length?(h="function"==typeof t?t:om(t),n):h},n.subject=function(t){return arguments.length?(p="function"==typeof t?t:om(t),n):p},n.on=function(){var t=_.on.apply(_,arguments);return t===_?n:t},n},um=function(t){return function(){return t}};Ta.prototype={constructor:Ta,insert:function(t,n){var e,r,i;if(t){if(n.P=t,n.N=t.N,t.N&&(t.N.P=n),t.N=n,t.R){for(t=t.R;t.L;)t=t.L;t.L=n}else t.R=n;e=t}else this._?(t=za(this._),n.P=null,n.N=t,t.P=t.L=n,e=t):(n.P=n.N=null,this._=n,e=null);for(n.L=n.R=null,n.U=e,n.C=!0,t=n;e&&e.C;)r=e.U,e===r.L?(i=r.R,i&&i.C?(e.C=i.C=!1,r.C=!0,t=r):(t===e.R&&(Ea(this,e),t=e,e=t.U),e.C=!1,r.C=!0,Aa(this,r))):(i=r.L,i&&i.C?(e.C=i.C=!1,r.C=!0,t=r):(t===e.L&&(Aa(this,e),t=e,e=t.U),e.C=!1,r.C=!0,Ea(this,r))),e=t.U;this._.C=!1},remove:function(t){t.N&&(t.N.P=t.P),t.P&&(t.P.N=t.N),t.N=t.P=null;var n,e,r,i=t.U,o=t.L,a=t.R;if(e=o?a?za(a):o:a,i?i.L===t?i.L=e:i.R=e:this._=e,o&&a?(r=e.C,e.C=t.C,e.L=o,o.U=e,e!==a?(i=e.U,e.U=t.U,t=e.R,i.L=t,e.R=a,a.U=e):(e.U=i,i=e,t=e.R)):(r=t.C,t=e),t&&(t.U=i),!r){if(t&&t.C)return void(t.C=!1);do{if(t===this._)break;if(t===i.L){if(n=i.R,n.C&&(n.C=!1,i.C=!0,Ea(this,i),n=i.R),n.L&&n.L.C||n.R&&n.R.C){n.R&&n.R.C||(n.L.C=!1,n.C=!0,Aa(this,n),n=i.R),n.C=i.C,i.C=n.R.C=!1,Ea(this,i),t=this._;break}}else if(n=i.L,n.C&&(n.C=!1,i.C=!0,Aa(this,i),n=i.L),n.L&&n.L.C||n.R&&n.R.C){n.L&&n.L.C||(n.R.C=!1,n.C=!0,Ea(this,n),n=i.L),n.C=i.C,i.C=n.L.C=!1,Aa(this,i),t=this._;break}n.C=!0,t=i,i=i.U}while(!t.C);t&&(t.C=!1)}}};var lm,sm,cm,fm,hm,pm=[],dm=[],_m=1e-6,vm=1e-12;nu.prototype={constructor:nu,polygons:function(){var t=this.edges;return this.cells.map(function(n){var e=n.halfedges.map(function(e){return Da(n,t[e])});return e.data=n.site.data,e})},triangles:function(){var t=[],n=this.edges;return this.cells.forEach(function(e,r){for(var i,o=e.site,a=e.halfedges,u=-1,l=a.length,s=n[a[l-1]],c=s.left===o?s.right:s.left;++u<l;)i=c,s=n[a[u]],c=s.left===o?s.right:s.left,i&&c&&r<i.index&&r<c.index&&Ka(o,i,c)<0&&t.push([o.data,i.data,c.data])}),t},links:function(){return this.edges.filter(function(t){return t.right}).map(function(t){return{source:t.left.data,target:t.right.data}})},find:function(t,n,e){var r,i=this,o=i._found||0,a=i.cells[o]||i.cells[o=0],u=t-a.site[0],l=n-a.site[1],s=u*u+l*l;do a=i.cells[r=o],o=null,a.halfedges.forEach(function(e){var r=i.edges[e],u=r.left;if(u!==a.site&&u||(u=r.right)){var l=t-u[0],c=n-u[1],f=l*l+c*c;f<s&&(s=f,o=u.index)}});while(null!==o);return i._found=r,null==e||s<=e*e?a.site:null}};var ym=function(){function t(t){return new nu(t.map(function(r,i){var o=[Math.round(n(r,i,t)/_m)*_m,Math.round(e(r,i,t)/_m)*_m];return o.index=i,o.data=r,o}),r)}var n=ka,e=Sa,r=null;return t.polygons=function(n){return t(n).polygons()},t.links=function(n){return t(n).links()},t.triangles=function(n){return t(n).triangles()},t.x=function(e){return arguments.length?(n="function"==typeof e?e:um(+e),t):n},t.y=function(n){return arguments.length?(e="function"==typeof n?n:um(+n),t):e},t.extent=function(n){return arguments.length?(r=null==n?null:[[+n[0][0],+n[0][1]],[+n[1][0],+n[1][1]]],t):r&&[[r[0][0],r[0][1]],[r[1][0],r[1][1]]]},t.size=function(n){return arguments.length?(r=null==n?null:[[0,0],[+n[0],+n[1]]],t):r&&[r[1][0]-r[0][0],r[1][1]-r[0][1]]},t},gm=function(t){return function(){return t}};ru.prototype={constructor:ru,scale:function(t){return 1===t?this:new ru(this.k*t,this.x,this.y)},translate:function(t,n){return 0===t&0===n?this:new ru(this.k,this.x+this.k*t,this.y+this.k*n)},apply:function(t){return[t[0]*this.k+this.x,t[1]*this.k+this.y]},applyX:function(t){return t*this.k+this.x},applyY:function(t){return t*this.k+this.y},invert:function(t){return[(t[0]-this.x)/this.k,(t[1]-this.y)/this.k]},invertX:function(t){return(t-this.x)/this.k},invertY:function(t){return(t-this.y)/this.k},rescaleX:function(t){return t.copy().domain(t.range().map(this.invertX,this).map(t.invert,t))},rescaleY:function(t){return t.copy().domain(t.range().map(this.invertY,this).map(t.invert,t))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var mm=new ru(1,0,0);iu.prototype=ru.prototype;var xm=function(){t.event.preventDefault(),t.event.stopImmediatePropagation()},bm=function(){function n(t){t.on("wheel.zoom",s).on("mousedown.zoom",c).on("dblclick.zoom",f).on("touchstart.zoom",h).on("touchmove.zoom",p).on("touchend.zoom touchcancel.zoom",d).style("-webkit-tap-highlight-color","rgba(0,0,0,0)").property("__zoom",lu)}function e(t,n){return n=Math.max(m,Math.min(x,n)),n===t.k?t:new ru(n,t.x,t.y)}function r(t,n,e){var r=n[0]-e[0]*t.k,i=n[1]-e[1]*t.k;return r===t.x&&i===t.y?t:new ru(t.k,r,i)}function i(t,n){var e=t.invertX(n[0][0])-b,r=t.invertX(n[1][0])-w,i=t.invertY(n[0][1])-M,o=t.invertY(n[1][1])-k;return t.translate(r>e?(e+r)/2:Math.min(0,e)||Math.max(0,r),o>i?(i+o)/2:Math.min(0,i)||Math.max(0,o))}function o(t){return[(+t[0][0]+ +t[1][0])/2,(+t[0][1]+ +t[1][1])/2]}function a(t,n,e){t.on("start.zoom",function(){u(this,arguments).start()}).on("interrupt.zoom end.zoom",function(){u(this,arguments).end()}).tween("zoom",function(){var t=this,r=arguments,i=u(t,r),a=g.apply(t,r),l=e||o(a),s=Math.max(a[1][0]-a[0][0],a[1][1]-a[0][1]),c=t.__zoom,f="function"==typeof n?n.apply(t,r):n,h=T(c.invert(l).concat(s/c.k),f.invert(l).concat(s/f.k));return function(t){if(1===t)t=f;else{var n=h(t),e=s/n[2];t=new ru(e,l[0]-n[0]*e,l[1]-n[1]*e)}i.zoom(null,t)}})}function u(t,n){for(var e,r=0,i=N.length;r<i;++r)if((e=N[r]).that===t)return e;return new l(t,n)}function l(t,n){this.that=t,this.args=n,this.index=-1,this.active=0,this.extent=g.apply(t,n)}function s(){function n(){o.wheel=null,o.end()}if(y.apply(this,arguments)){var o=u(this,arguments),a=this.__zoom,l=Math.max(m,Math.min(x,a.k*Math.pow(2,-t.event.deltaY*(t.event.deltaMode?120:1)/500))),s=Dv(this);if(o.wheel)o.mouse[0][0]===s[0]&&o.mouse[0][1]===s[1]||(o.mouse[1]=a.invert(o.mouse[0]=s)),clearTimeout(o.wheel);else{if(a.k===l)return;o.mouse=[s,a.invert(s)],qy(this),o.start()}xm(),o.wheel=setTimeout(n,z),o.zoom("mouse",i(r(e(a,l),o.mouse[0],o.mouse[1]),o.extent))}}function c(){function n(){xm(),o.moved=!0,o.zoom("mouse",i(r(o.that.__zoom,o.mouse[0]=Dv(o.that),o.mouse[1]),o.extent))}function e(){a.on("mousemove.zoom mouseup.zoom",null),ma(t.event.view,o.moved),xm(),o.end()}if(!v&&y.apply(this,arguments)){var o=u(this,arguments),a=by(t.event.view).on("mousemove.zoom",n,!0).on("mouseup.zoom",e,!0),l=Dv(this);im(t.event.view),ou(),o.mouse=[l,this.__zoom.invert(l)],qy(this),o.start()}}function f(){if(y.apply(this,arguments)){var o=this.__zoom,u=Dv(this),l=o.invert(u),s=o.k*(t.event.shiftKey?.5:2),c=i(r(e(o,s),u,l),g.apply(this,arguments));xm(),S>0?by(this).transition().duration(S).call(a,c,u):by(this).call(n.transform,c)}}function h(){if(y.apply(this,arguments)){var n,e,r,i=u(this,arguments),o=t.event.changedTouches,a=o.length;for(ou(),n=0;n<a;++n)e=o[n],r=My(this,o,e.identifier),r=[r,this.__zoom.invert(r),e.identifier],i.touch0?i.touch1||(i.touch1=r):i.touch0=r;return _&&(_=clearTimeout(_),!i.touch1)?(i.end(),r=by(this).on("dblclick.zoom"),void(r&&r.apply(this,arguments))):void(t.event.touches.length===a&&(_=setTimeout(function(){_=null},A),qy(this),i.start()))}}function p(){var n,o,a,l,s=u(this,arguments),c=t.event.changedTouches,f=c.length;for(xm(),_&&(_=clearTimeout(_)),n=0;n<f;++n)o=c[n],a=My(this,c,o.identifier),s.touch0&&s.touch0[2]===o.identifier?s.touch0[0]=a:s.touch1&&s.touch1[2]===o.identifier&&(s.touch1[0]=a);if(o=s.that.__zoom,s.touch1){var h=s.touch0[0],p=s.touch0[1],d=s.touch1[0],v=s.touch1[1],y=(y=d[0]-h[0])*y+(y=d[1]-h[1])*y,g=(g=v[0]-p[0])*g+(g=v[1]-p[1])*g;o=e(o,Math.sqrt(y/g)),a=[(h[0]+d[0])/2,(h[1]+d[1])/2],l=[(p[0]+v[0])/2,(p[1]+v[1])/2]}else{if(!s.touch0)return;a=s.touch0[0],l=s.touch0[1]}s.zoom("touch",i(r(o,a,l),s.extent))}function d(){var n,e,r=u(this,arguments),i=t.event.changedTouches,o=i.length;for(ou(),v&&clearTimeout(v),v=setTimeout(function(){v=null},A),n=0;n<o;++n)e=i[n],r.touch0&&r.touch0[2]===e.identifier?delete r.touch0:r.touch1&&r.touch1[2]===e.identifier&&delete r.touch1;r.touch1&&!r.touch0&&(r.touch0=r.touch1,delete r.touch1),r.touch0||r.end()}var _,v,y=au,g=uu,m=0,x=1/0,b=-x,w=x,M=b,k=w,S=250,T=zp,N=[],E=Pn("start","zoom","end"),A=500,z=150;return n.transform=function(t,n){var e=t.selection?t.selection():t;e.property("__zoom",lu),t!==e?a(t,n):e.interrupt().each(function(){u(this,arguments).start().zoom(null,"function"==typeof n?n.apply(this,arguments):n).end()})},n.scaleBy=function(t,e){n.scaleTo(t,function(){var t=this.__zoom.k,n="function"==typeof e?e.apply(this,arguments):e;return t*n})},n.scaleTo=function(t,a){n.transform(t,function(){var t=g.apply(this,arguments),n=this.__zoom,u=o(t),l=n.invert(u),s="function"==typeof a?a.apply(this,arguments):a;return i(r(e(n,s),u,l),t)})},n.translateBy=function(t,e,r){n.transform(t,function(){return i(this.__zoom.translate("function"==typeof e?e.apply(this,arguments):e,"function"==typeof r?r.apply(this,arguments):r),g.apply(this,arguments))})},l.prototype={start:function(){return 1===++this.active&&(this.index=N.push(this)-1,this.emit("start")),this},zoom:function(t,n){return this.mouse&&"mouse"!==t&&(this.mouse[1]=n.invert(this.mouse[0])),this.touch0&&"touch"!==t&&(this.touch0[1]=n.invert(this.touch0[0])),this.touch1&&"touch"!==t&&(this.touch1[1]=n.invert(this.touch1[0])),this.that.__zoom=n,this.emit("zoom"),this},end:function(){return 0===--this.active&&(N.splice(this.index,1),this.index=-1,this.emit("end")),this},emit:function(t){Xr(new eu(n,t,this.that.__zoom),E.apply,E,[t,this.that,this.args])}},n.filter=function(t){return arguments.length?(y="function"==typeof t?t:gm(!!t),n):y},n.extent=function(t){return arguments.length?(g="function"==typeof t?t:gm([[+t[0][0],+t[0][1]],[+t[1][0],+t[1][1]]]),n):g},n.scaleExtent=function(t){return arguments.length?(m=+t[0],x=+t[1],n):[m,x]},n.translateExtent=function(t){return arguments.length?(b=+t[0][0],w=+t[1][0],M=+t[0][1],k=+t[1][1],n):[[b,M],[w,k]]},n.duration=function(t){return arguments.length?(S=+t,n):S},n.interpolate=function(t){return arguments.length?(T=t,n):T},n.on=function(){var t=E.on.apply(E,arguments);return t===E?n:t},n},wm=function(t){return function(){return t}},Mm=function(t,n,e){this.target=t,this.type=n,this.selection=e},km=function(){t.event.preventDefault(),t.event.stopImmediatePropagation()},Sm={name:"drag"},Tm={name:"space"},Nm={name:"handle"},Em={name:"center"},Am={name:"x",handles:["e","w"].map(cu),input:function(t,n){return t&&[[t[0],n[0][1]],[t[1],n[1][1]]]},output:function(t){return t&&[t[0][0],t[1][0]]}},zm={name:"y",handles:["n","s"].map(cu),input:function(t,n){return t&&[[n[0][0],t[0]],[n[1][0],t[1]]]},output:function(t){return t&&[t[0][1],t[1][1]]}},Cm={name:"xy",handles:["n","e","s","w","nw","ne","se","sw"].map(cu),input:function(t){return t},output:function(t){return t}},Pm={overlay:"crosshair",selection:"move",n:"ns-resize",e:"ew-resize",s:"ns-resize",w:"ew-resize",nw:"nwse-resize",ne:"nesw-resize",se:"nwse-resize",sw:"nesw-resize"},Rm={e:"w",w:"e",nw:"ne",ne:"nw",se:"sw",sw:"se"},Lm={n:"s",s:"n",nw:"sw",ne:"se",se:"ne",sw:"nw"},qm={overlay:1,selection:1,n:null,e:1,s:null,w:-1,nw:-1,ne:1,se:1,sw:-1},Fm={overlay:1,selection:1,n:-1,e:null,s:1,w:null,nw:-1,ne:-1,se:1,sw:1},Om=function(){return gu(Cm)},Um=Math.cos,Dm=Math.sin,Bm=Math.PI,jm=Bm/2,Im=2*Bm,Ym=Math.max,Hm=function(){function t(t){var o,a,u,l,s,c,f=t.length,h=[],p=Us(f),d=[],_=[],v=_.groups=new Array(f),y=new Array(f*f);for(o=0,s=-1;++s<f;){for(a=0,c=-1;++c<f;)a+=t[s][c];h.push(a),d.push(Us(f)),o+=a}for(e&&p.sort(function(t,n){return e(h[t],h[n])}),r&&d.forEach(function(n,e){n.sort(function(n,i){return r(t[e][n],t[e][i])})}),o=Ym(0,Im-n*f)/o,l=o?n:Im/f,a=0,s=-1;++s<f;){for(u=a,c=-1;++c<f;){var g=p[s],m=d[g][c],x=t[g][m],b=a,w=a+=x*o;y[m*f+g]={index:g,subindex:m,startAngle:b,endAngle:w,value:x}}v[g]={index:g,startAngle:u,endAngle:a,value:h[g]},a+=l}for(s=-1;++s<f;)for(c=s-1;++c<f;){var M=y[c*f+s],k=y[s*f+c];(M.value||k.value)&&_.push(M.value<k.value?{source:k,target:M}:{source:M,target:k})}return i?_.sort(i):_}var n=0,e=null,r=null,i=null;return t.padAngle=function(e){return arguments.length?(n=Ym(0,e),t):n},t.sortGroups=function(n){return arguments.length?(e=n,t):e},t.sortSubgroups=function(n){return arguments.length?(r=n,t):r},t.sortChords=function(n){return arguments.length?(null==n?i=null:(i=mu(n))._=n,t):i&&i._},t},Xm=Array.prototype.slice,Vm=function(t){return function(){return t}},Wm=function(){function t(){var t,u=Xm.call(arguments),l=n.apply(this,u),s=e.apply(this,u),c=+r.apply(this,(u[0]=l,u)),f=i.apply(this,u)-jm,h=o.apply(this,u)-jm,p=c*Um(f),d=c*Dm(f),_=+r.apply(this,(u[0]=s,u)),v=i.apply(this,u)-jm,y=o.apply(this,u)-jm;if(a||(a=t=L()),a.moveTo(p,d),a.arc(0,0,c,f,h),f===v&&h===y||(a.quadraticCurveTo(0,0,_*Um(v),_*Dm(v)),a.arc(0,0,_,v,y)),a.quadraticCurveTo(0,0,p,d),a.closePath(),t)return a=null,t+""||null}var n=xu,e=bu,r=wu,i=Mu,o=ku,a=null;return t.radius=function(n){return arguments.length?(r="function"==typeof n?n:Vm(+n),t):r},t.startAngle=function(n){return arguments.length?(i="function"==typeof n?n:Vm(+n),t):i},t.endAngle=function(n){return arguments.length?(o="function"==typeof n?n:Vm(+n),
-t):o},t.source=function(e){return arguments.length?(n=e,t):n},t.target=function(n){return arguments.length?(e=n,t):e},t.context=function(n){return arguments.length?(a=null==n?null:n,t):a},t},Gm=function(){return new Su};Su.prototype={constructor:Su,reset:function(){this.s=this.t=0},add:function(t){Tu(Tx,t,this.t),Tu(this,Tx.s,this.s),this.s?this.t+=Tx.t:this.s=Tx.t},valueOf:function(){return this.s}};var $m,Zm,Jm,Qm,Km,tx,nx,ex,rx,ix,ox,ax,ux,lx,sx,cx,fx,hx,px,dx,_x,vx,yx,gx,mx,xx,bx,wx,Mx,kx,Sx,Tx=new Su,Nx=1e-6,Ex=1e-12,Ax=Math.PI,zx=Ax/2,Cx=Ax/4,Px=2*Ax,Rx=180/Ax,Lx=Ax/180,qx=Math.abs,Fx=Math.atan,Ox=Math.atan2,Ux=Math.cos,Dx=Math.ceil,Bx=Math.exp,jx=Math.log,Ix=Math.pow,Yx=Math.sin,Hx=Math.sign||function(t){return t>0?1:t<0?-1:0},Xx=Math.sqrt,Vx=Math.tan,Wx={Feature:function(t,n){Cu(t.geometry,n)},FeatureCollection:function(t,n){for(var e=t.features,r=-1,i=e.length;++r<i;)Cu(e[r].geometry,n)}},Gx={Sphere:function(t,n){n.sphere()},Point:function(t,n){t=t.coordinates,n.point(t[0],t[1],t[2])},MultiPoint:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)t=e[r],n.point(t[0],t[1],t[2])},LineString:function(t,n){Pu(t.coordinates,n,0)},MultiLineString:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)Pu(e[r],n,0)},Polygon:function(t,n){Ru(t.coordinates,n)},MultiPolygon:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)Ru(e[r],n)},GeometryCollection:function(t,n){for(var e=t.geometries,r=-1,i=e.length;++r<i;)Cu(e[r],n)}},$x=function(t,n){t&&Wx.hasOwnProperty(t.type)?Wx[t.type](t,n):Cu(t,n)},Zx=Gm(),Jx=Gm(),Qx={point:zu,lineStart:zu,lineEnd:zu,polygonStart:function(){Zx.reset(),Qx.lineStart=Lu,Qx.lineEnd=qu},polygonEnd:function(){var t=+Zx;Jx.add(t<0?Px+t:t),this.lineStart=this.lineEnd=this.point=zu},sphere:function(){Jx.add(Px)}},Kx=function(t){return Jx.reset(),$x(t,Qx),2*Jx},tb=Gm(),nb={point:Xu,lineStart:Wu,lineEnd:Gu,polygonStart:function(){nb.point=$u,nb.lineStart=Zu,nb.lineEnd=Ju,tb.reset(),Qx.polygonStart()},polygonEnd:function(){Qx.polygonEnd(),nb.point=Xu,nb.lineStart=Wu,nb.lineEnd=Gu,Zx<0?(tx=-(ex=180),nx=-(rx=90)):tb>Nx?rx=90:tb<-Nx&&(nx=-90),sx[0]=tx,sx[1]=ex}},eb=function(t){var n,e,r,i,o,a,u;if(rx=ex=-(tx=nx=1/0),lx=[],$x(t,nb),e=lx.length){for(lx.sort(Ku),n=1,r=lx[0],o=[r];n<e;++n)i=lx[n],tl(r,i[0])||tl(r,i[1])?(Qu(r[0],i[1])>Qu(r[0],r[1])&&(r[1]=i[1]),Qu(i[0],r[1])>Qu(r[0],r[1])&&(r[0]=i[0])):o.push(r=i);for(a=-(1/0),e=o.length-1,n=0,r=o[e];n<=e;r=i,++n)i=o[n],(u=Qu(r[1],i[0]))>a&&(a=u,tx=i[0],ex=r[1])}return lx=sx=null,tx===1/0||nx===1/0?[[NaN,NaN],[NaN,NaN]]:[[tx,nx],[ex,rx]]},rb={sphere:zu,point:nl,lineStart:rl,lineEnd:al,polygonStart:function(){rb.lineStart=ul,rb.lineEnd=ll},polygonEnd:function(){rb.lineStart=rl,rb.lineEnd=al}},ib=function(t){cx=fx=hx=px=dx=_x=vx=yx=gx=mx=xx=0,$x(t,rb);var n=gx,e=mx,r=xx,i=n*n+e*e+r*r;return i<Ex&&(n=_x,e=vx,r=yx,fx<Nx&&(n=hx,e=px,r=dx),i=n*n+e*e+r*r,i<Ex)?[NaN,NaN]:[Ox(e,n)*Rx,Eu(r/Xx(i))*Rx]},ob=function(t){return function(){return t}},ab=function(t,n){function e(e,r){return e=t(e,r),n(e[0],e[1])}return t.invert&&n.invert&&(e.invert=function(e,r){return e=n.invert(e,r),e&&t.invert(e[0],e[1])}),e};fl.invert=fl;var ub,lb,sb,cb,fb,hb,pb,db,_b,vb,yb,gb=function(t){function n(n){return n=t(n[0]*Lx,n[1]*Lx),n[0]*=Rx,n[1]*=Rx,n}return t=hl(t[0]*Lx,t[1]*Lx,t.length>2?t[2]*Lx:0),n.invert=function(n){return n=t.invert(n[0]*Lx,n[1]*Lx),n[0]*=Rx,n[1]*=Rx,n},n},mb=function(){function t(t,n){e.push(t=r(t,n)),t[0]*=Rx,t[1]*=Rx}function n(){var t=i.apply(this,arguments),n=o.apply(this,arguments)*Lx,l=a.apply(this,arguments)*Lx;return e=[],r=hl(-t[0]*Lx,-t[1]*Lx,0).invert,vl(u,n,l,1),t={type:"Polygon",coordinates:[e]},e=r=null,t}var e,r,i=ob([0,0]),o=ob(90),a=ob(6),u={point:t};return n.center=function(t){return arguments.length?(i="function"==typeof t?t:ob([+t[0],+t[1]]),n):i},n.radius=function(t){return arguments.length?(o="function"==typeof t?t:ob(+t),n):o},n.precision=function(t){return arguments.length?(a="function"==typeof t?t:ob(+t),n):a},n},xb=function(){var t,n=[];return{point:function(n,e){t.push([n,e])},lineStart:function(){n.push(t=[])},lineEnd:zu,rejoin:function(){n.length>1&&n.push(n.pop().concat(n.shift()))},result:function(){var e=n;return n=[],t=null,e}}},bb=function(t,n,e,r,i,o){var a,u=t[0],l=t[1],s=n[0],c=n[1],f=0,h=1,p=s-u,d=c-l;if(a=e-u,p||!(a>0)){if(a/=p,p<0){if(a<f)return;a<h&&(h=a)}else if(p>0){if(a>h)return;a>f&&(f=a)}if(a=i-u,p||!(a<0)){if(a/=p,p<0){if(a>h)return;a>f&&(f=a)}else if(p>0){if(a<f)return;a<h&&(h=a)}if(a=r-l,d||!(a>0)){if(a/=d,d<0){if(a<f)return;a<h&&(h=a)}else if(d>0){if(a>h)return;a>f&&(f=a)}if(a=o-l,d||!(a<0)){if(a/=d,d<0){if(a>h)return;a>f&&(f=a)}else if(d>0){if(a<f)return;a<h&&(h=a)}return f>0&&(t[0]=u+f*p,t[1]=l+f*d),h<1&&(n[0]=u+h*p,n[1]=l+h*d),!0}}}}},wb=function(t,n){return qx(t[0]-n[0])<Nx&&qx(t[1]-n[1])<Nx},Mb=function(t,n,e,r,i){var o,a,u=[],l=[];if(t.forEach(function(t){if(!((n=t.length-1)<=0)){var n,e,r=t[0],a=t[n];if(wb(r,a)){for(i.lineStart(),o=0;o<n;++o)i.point((r=t[o])[0],r[1]);return void i.lineEnd()}u.push(e=new gl(r,t,null,(!0))),l.push(e.o=new gl(r,null,e,(!1))),u.push(e=new gl(a,t,null,(!1))),l.push(e.o=new gl(a,null,e,(!0)))}}),u.length){for(l.sort(n),ml(u),ml(l),o=0,a=l.length;o<a;++o)l[o].e=e=!e;for(var s,c,f=u[0];;){for(var h=f,p=!0;h.v;)if((h=h.n)===f)return;s=h.z,i.lineStart();do{if(h.v=h.o.v=!0,h.e){if(p)for(o=0,a=s.length;o<a;++o)i.point((c=s[o])[0],c[1]);else r(h.x,h.n.x,1,i);h=h.n}else{if(p)for(s=h.p.z,o=s.length-1;o>=0;--o)i.point((c=s[o])[0],c[1]);else r(h.x,h.p.x,-1,i);h=h.p}h=h.o,s=h.z,p=!p}while(!h.v);i.lineEnd()}}},kb=1e9,Sb=-kb,Tb=function(){var t,n,e,r=0,i=0,o=960,a=500;return e={stream:function(e){return t&&n===e?t:t=xl(r,i,o,a)(n=e)},extent:function(u){return arguments.length?(r=+u[0][0],i=+u[0][1],o=+u[1][0],a=+u[1][1],t=n=null,e):[[r,i],[o,a]]}}},Nb=Gm(),Eb={sphere:zu,point:zu,lineStart:bl,lineEnd:zu,polygonStart:zu,polygonEnd:zu},Ab=function(t){return Nb.reset(),$x(t,Eb),+Nb},zb=[null,null],Cb={type:"LineString",coordinates:zb},Pb=function(t,n){return zb[0]=t,zb[1]=n,Ab(Cb)},Rb=function(t,n){var e=t[0]*Lx,r=t[1]*Lx,i=n[0]*Lx,o=n[1]*Lx,a=Ux(r),u=Yx(r),l=Ux(o),s=Yx(o),c=a*Ux(e),f=a*Yx(e),h=l*Ux(i),p=l*Yx(i),d=2*Eu(Xx(Au(o-r)+a*l*Au(i-e))),_=Yx(d),v=d?function(t){var n=Yx(t*=d)/_,e=Yx(d-t)/_,r=e*c+n*h,i=e*f+n*p,o=e*u+n*s;return[Ox(i,r)*Rx,Ox(o,Xx(r*r+i*i))*Rx]}:function(){return[e*Rx,r*Rx]};return v.distance=d,v},Lb=function(t){return t},qb=Gm(),Fb=Gm(),Ob={point:zu,lineStart:zu,lineEnd:zu,polygonStart:function(){Ob.lineStart=Al,Ob.lineEnd=Pl},polygonEnd:function(){Ob.lineStart=Ob.lineEnd=Ob.point=zu,qb.add(qx(Fb)),Fb.reset()},result:function(){var t=qb/2;return qb.reset(),t}},Ub=1/0,Db=Ub,Bb=-Ub,jb=Bb,Ib={point:Rl,lineStart:zu,lineEnd:zu,polygonStart:zu,polygonEnd:zu,result:function(){var t=[[Ub,Db],[Bb,jb]];return Bb=jb=-(Db=Ub=1/0),t}},Yb=0,Hb=0,Xb=0,Vb=0,Wb=0,Gb=0,$b=0,Zb=0,Jb=0,Qb={point:Ll,lineStart:ql,lineEnd:Ul,polygonStart:function(){Qb.lineStart=Dl,Qb.lineEnd=Bl},polygonEnd:function(){Qb.point=Ll,Qb.lineStart=ql,Qb.lineEnd=Ul},result:function(){var t=Jb?[$b/Jb,Zb/Jb]:Gb?[Vb/Gb,Wb/Gb]:Xb?[Yb/Xb,Hb/Xb]:[NaN,NaN];return Yb=Hb=Xb=Vb=Wb=Gb=$b=Zb=Jb=0,t}};Yl.prototype={_radius:4.5,pointRadius:function(t){return this._radius=t,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._context.closePath(),this._point=NaN},point:function(t,n){switch(this._point){case 0:this._context.moveTo(t,n),this._point=1;break;case 1:this._context.lineTo(t,n);break;default:this._context.moveTo(t+this._radius,n),this._context.arc(t,n,this._radius,0,Px)}},result:zu},Hl.prototype={_circle:Xl(4.5),pointRadius:function(t){return this._circle=Xl(t),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._string.push("Z"),this._point=NaN},point:function(t,n){switch(this._point){case 0:this._string.push("M",t,",",n),this._point=1;break;case 1:this._string.push("L",t,",",n);break;default:this._string.push("M",t,",",n,this._circle)}},result:function(){if(this._string.length){var t=this._string.join("");return this._string=[],t}}};var Kb=function(t,n){function e(t){return t&&("function"==typeof o&&i.pointRadius(+o.apply(this,arguments)),$x(t,r(i))),i.result()}var r,i,o=4.5;return e.area=function(t){return $x(t,r(Ob)),Ob.result()},e.bounds=function(t){return $x(t,r(Ib)),Ib.result()},e.centroid=function(t){return $x(t,r(Qb)),Qb.result()},e.projection=function(n){return arguments.length?(r=null==n?(t=null,Lb):(t=n).stream,e):t},e.context=function(t){return arguments.length?(i=null==t?(n=null,new Hl):new Yl(n=t),"function"!=typeof o&&i.pointRadius(o),e):n},e.pointRadius=function(t){return arguments.length?(o="function"==typeof t?t:(i.pointRadius(+t),+t),e):o},e.projection(t).context(n)},tw=Gm(),nw=function(t,n){var e=n[0],r=n[1],i=[Yx(e),-Ux(e),0],o=0,a=0;tw.reset();for(var u=0,l=t.length;u<l;++u)if(c=(s=t[u]).length)for(var s,c,f=s[c-1],h=f[0],p=f[1]/2+Cx,d=Yx(p),_=Ux(p),v=0;v<c;++v,h=g,d=x,_=b,f=y){var y=s[v],g=y[0],m=y[1]/2+Cx,x=Yx(m),b=Ux(m),w=g-h,M=w>=0?1:-1,k=M*w,S=k>Ax,T=d*x;if(tw.add(Ox(T*M*Yx(k),_*b+T*Ux(k))),o+=S?w+M*Px:w,S^h>=e^g>=e){var N=ju(Du(f),Du(y));Hu(N);var E=ju(i,N);Hu(E);var A=(S^w>=0?-1:1)*Eu(E[2]);(r>A||r===A&&(N[0]||N[1]))&&(a+=S^w>=0?1:-1)}}return(o<-Nx||o<Nx&&tw<-Nx)^1&a},ew=function(t,n,e,r){return function(i,o){function a(n,e){var r=i(n,e);t(n=r[0],e=r[1])&&o.point(n,e)}function u(t,n){var e=i(t,n);v.point(e[0],e[1])}function l(){b.point=u,v.lineStart()}function s(){b.point=a,v.lineEnd()}function c(t,n){_.push([t,n]);var e=i(t,n);m.point(e[0],e[1])}function f(){m.lineStart(),_=[]}function h(){c(_[0][0],_[0][1]),m.lineEnd();var t,n,e,r,i=m.clean(),a=g.result(),u=a.length;if(_.pop(),p.push(_),_=null,u)if(1&i){if(e=a[0],(n=e.length-1)>0){for(x||(o.polygonStart(),x=!0),o.lineStart(),t=0;t<n;++t)o.point((r=e[t])[0],r[1]);o.lineEnd()}}else u>1&&2&i&&a.push(a.pop().concat(a.shift())),d.push(a.filter(Vl))}var p,d,_,v=n(o),y=i.invert(r[0],r[1]),g=xb(),m=n(g),x=!1,b={point:a,lineStart:l,lineEnd:s,polygonStart:function(){b.point=c,b.lineStart=f,b.lineEnd=h,d=[],p=[]},polygonEnd:function(){b.point=a,b.lineStart=l,b.lineEnd=s,d=Js(d);var t=nw(p,y);d.length?(x||(o.polygonStart(),x=!0),Mb(d,Wl,t,e,o)):t&&(x||(o.polygonStart(),x=!0),o.lineStart(),e(null,null,1,o),o.lineEnd()),x&&(o.polygonEnd(),x=!1),d=p=null},sphere:function(){o.polygonStart(),o.lineStart(),e(null,null,1,o),o.lineEnd(),o.polygonEnd()}};return b}},rw=ew(function(){return!0},Gl,Zl,[-Ax,-zx]),iw=function(t,n){function e(e,r,i,o){vl(o,t,n,i,e,r)}function r(t,n){return Ux(t)*Ux(n)>u}function i(t){var n,e,i,u,c;return{lineStart:function(){u=i=!1,c=1},point:function(f,h){var p,d=[f,h],_=r(f,h),v=l?_?0:a(f,h):_?a(f+(f<0?Ax:-Ax),h):0;if(!n&&(u=i=_)&&t.lineStart(),_!==i&&(p=o(n,d),(wb(n,p)||wb(d,p))&&(d[0]+=Nx,d[1]+=Nx,_=r(d[0],d[1]))),_!==i)c=0,_?(t.lineStart(),p=o(d,n),t.point(p[0],p[1])):(p=o(n,d),t.point(p[0],p[1]),t.lineEnd()),n=p;else if(s&&n&&l^_){var y;v&e||!(y=o(d,n,!0))||(c=0,l?(t.lineStart(),t.point(y[0][0],y[0][1]),t.point(y[1][0],y[1][1]),t.lineEnd()):(t.point(y[1][0],y[1][1]),t.lineEnd(),t.lineStart(),t.point(y[0][0],y[0][1])))}!_||n&&wb(n,d)||t.point(d[0],d[1]),n=d,i=_,e=v},lineEnd:function(){i&&t.lineEnd(),n=null},clean:function(){return c|(u&&i)<<1}}}function o(t,n,e){var r=Du(t),i=Du(n),o=[1,0,0],a=ju(r,i),l=Bu(a,a),s=a[0],c=l-s*s;if(!c)return!e&&t;var f=u*l/c,h=-u*s/c,p=ju(o,a),d=Yu(o,f),_=Yu(a,h);Iu(d,_);var v=p,y=Bu(d,v),g=Bu(v,v),m=y*y-g*(Bu(d,d)-1);if(!(m<0)){var x=Xx(m),b=Yu(v,(-y-x)/g);if(Iu(b,d),b=Uu(b),!e)return b;var w,M=t[0],k=n[0],S=t[1],T=n[1];k<M&&(w=M,M=k,k=w);var N=k-M,E=qx(N-Ax)<Nx,A=E||N<Nx;if(!E&&T<S&&(w=S,S=T,T=w),A?E?S+T>0^b[1]<(qx(b[0]-M)<Nx?S:T):S<=b[1]&&b[1]<=T:N>Ax^(M<=b[0]&&b[0]<=k)){var z=Yu(v,(-y+x)/g);return Iu(z,d),[b,Uu(z)]}}}function a(n,e){var r=l?t:Ax-t,i=0;return n<-r?i|=1:n>r&&(i|=2),e<-r?i|=4:e>r&&(i|=8),i}var u=Ux(t),l=u>0,s=qx(u)>Nx;return ew(r,i,e,l?[0,-t]:[-Ax,t-Ax])},ow=function(t){return{stream:Jl(t)}};Ql.prototype={constructor:Ql,point:function(t,n){this.stream.point(t,n)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};var aw=16,uw=Ux(30*Lx),lw=function(t,n){return+n?es(t,n):ns(t)},sw=Jl({point:function(t,n){this.stream.point(t*Lx,n*Lx)}}),cw=function(){return os(us).scale(155.424).center([0,33.6442])},fw=function(){return cw().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])},hw=function(){function t(t){var n=t[0],e=t[1];return u=null,i.point(n,e),u||(o.point(n,e),u)||(a.point(n,e),u)}function n(){return e=r=null,t}var e,r,i,o,a,u,l=fw(),s=cw().rotate([154,0]).center([-2,58.5]).parallels([55,65]),c=cw().rotate([157,0]).center([-3,19.9]).parallels([8,18]),f={point:function(t,n){u=[t,n]}};return t.invert=function(t){var n=l.scale(),e=l.translate(),r=(t[0]-e[0])/n,i=(t[1]-e[1])/n;return(i>=.12&&i<.234&&r>=-.425&&r<-.214?s:i>=.166&&i<.234&&r>=-.214&&r<-.115?c:l).invert(t)},t.stream=function(t){return e&&r===t?e:e=ls([l.stream(r=t),s.stream(t),c.stream(t)])},t.precision=function(t){return arguments.length?(l.precision(t),s.precision(t),c.precision(t),n()):l.precision()},t.scale=function(n){return arguments.length?(l.scale(n),s.scale(.35*n),c.scale(n),t.translate(l.translate())):l.scale()},t.translate=function(t){if(!arguments.length)return l.translate();var e=l.scale(),r=+t[0],u=+t[1];return i=l.translate(t).clipExtent([[r-.455*e,u-.238*e],[r+.455*e,u+.238*e]]).stream(f),o=s.translate([r-.307*e,u+.201*e]).clipExtent([[r-.425*e+Nx,u+.12*e+Nx],[r-.214*e-Nx,u+.234*e-Nx]]).stream(f),a=c.translate([r-.205*e,u+.212*e]).clipExtent([[r-.214*e+Nx,u+.166*e+Nx],[r-.115*e-Nx,u+.234*e-Nx]]).stream(f),n()},t.fitExtent=function(n,e){return Kl(t,n,e)},t.fitSize=function(n,e){return ts(t,n,e)},t.scale(1070)},pw=ss(function(t){return Xx(2/(1+t))});pw.invert=cs(function(t){return 2*Eu(t/2)});var dw=function(){return rs(pw).scale(124.75).clipAngle(179.999)},_w=ss(function(t){return(t=Nu(t))&&t/Yx(t)});_w.invert=cs(function(t){return t});var vw=function(){return rs(_w).scale(79.4188).clipAngle(179.999)};fs.invert=function(t,n){return[t,2*Fx(Bx(n))-zx]};var yw=function(){return hs(fs).scale(961/Px)},gw=function(){return os(ds).scale(109.5).parallels([30,30])};_s.invert=_s;var mw=function(){return rs(_s).scale(152.63)},xw=function(){return os(vs).scale(131.154).center([0,13.9389])};ys.invert=cs(Fx);var bw=function(){return rs(ys).scale(144.049).clipAngle(60)},ww=function(){function t(){return i=o=null,a}var n,e,r,i,o,a,u=1,l=0,s=0,c=1,f=1,h=Lb,p=null,d=Lb;return a={stream:function(t){return i&&o===t?i:i=h(d(o=t))},clipExtent:function(i){return arguments.length?(d=null==i?(p=n=e=r=null,Lb):xl(p=+i[0][0],n=+i[0][1],e=+i[1][0],r=+i[1][1]),t()):null==p?null:[[p,n],[e,r]]},scale:function(n){return arguments.length?(h=gs((u=+n)*c,u*f,l,s),t()):u},translate:function(n){return arguments.length?(h=gs(u*c,u*f,l=+n[0],s=+n[1]),t()):[l,s]},reflectX:function(n){return arguments.length?(h=gs(u*(c=n?-1:1),u*f,l,s),t()):c<0},reflectY:function(n){return arguments.length?(h=gs(u*c,u*(f=n?-1:1),l,s),t()):f<0},fitExtent:function(t,n){return Kl(a,t,n)},fitSize:function(t,n){return ts(a,t,n)}}};ms.invert=cs(Eu);var Mw=function(){return rs(ms).scale(249.5).clipAngle(90+Nx)};xs.invert=cs(function(t){return 2*Fx(t)});var kw=function(){return rs(xs).scale(250).clipAngle(142)};bs.invert=function(t,n){return[-n,2*Fx(Bx(t))-zx]};var Sw=function(){var t=hs(bs),n=t.center,e=t.rotate;return t.center=function(t){return arguments.length?n([-t[1],t[0]]):(t=n(),[t[1],-t[0]])},t.rotate=function(t){return arguments.length?e([t[0],t[1],t.length>2?t[2]+90:90]):(t=e(),[t[0],t[1],t[2]-90])},e([0,0,90]).scale(159.155)};t.version=ws,t.bisect=Ts,t.bisectRight=Ts,t.bisectLeft=Ns,t.ascending=Ms,t.bisector=ks,t.descending=Es,t.deviation=Cs,t.extent=Ps,t.histogram=Hs,t.thresholdFreedmanDiaconis=Vs,t.thresholdScott=Ws,t.thresholdSturges=Ys,t.max=Gs,t.mean=$s,t.median=Zs,t.merge=Js,t.min=Qs,t.pairs=Ks,t.permute=tc,t.quantile=Xs,t.range=Us,t.scan=nc,t.shuffle=ec,t.sum=rc,t.ticks=Is,t.tickStep=e,t.transpose=ic,t.variance=zs,t.zip=oc,t.entries=fc,t.keys=sc,t.values=cc,t.map=o,t.set=f,t.nest=uc,t.randomUniform=hc,t.randomNormal=pc,t.randomLogNormal=dc,t.randomBates=vc,t.randomIrwinHall=_c,t.randomExponential=yc,t.easeLinear=h,t.easeQuad=_,t.easeQuadIn=p,t.easeQuadOut=d,t.easeQuadInOut=_,t.easeCubic=g,t.easeCubicIn=v,t.easeCubicOut=y,t.easeCubicInOut=g,t.easePoly=bc,t.easePolyIn=mc,t.easePolyOut=xc,t.easePolyInOut=bc,t.easeSin=b,t.easeSinIn=m,t.easeSinOut=x,t.easeSinInOut=b,t.easeExp=k,t.easeExpIn=w,t.easeExpOut=M,t.easeExpInOut=k,t.easeCircle=N,t.easeCircleIn=S,t.easeCircleOut=T,t.easeCircleInOut=N,t.easeBounce=A,t.easeBounceIn=E,t.easeBounceOut=A,t.easeBounceInOut=z,t.easeBack=Oc,t.easeBackIn=qc,t.easeBackOut=Fc,t.easeBackInOut=Oc,t.easeElastic=Ic,t.easeElasticIn=jc,t.easeElasticOut=Ic,t.easeElasticInOut=Yc,t.polygonArea=Hc,t.polygonCentroid=Xc,t.polygonHull=Wc,t.polygonContains=Gc,t.polygonLength=$c,t.path=L,t.quadtree=B,t.queue=$,t.arc=wf,t.area=Sf,t.line=kf,t.pie=Ef,t.radialArea=Cf,t.radialLine=zf,t.symbol=Jf,t.symbols=Zf,t.symbolCircle=Pf,t.symbolCross=Rf,t.symbolDiamond=Ff,t.symbolSquare=If,t.symbolStar=jf,t.symbolTriangle=Hf,t.symbolWye=$f,t.curveBasisClosed=th,t.curveBasisOpen=nh,t.curveBasis=Kf,t.curveBundle=eh,t.curveCardinalClosed=ih,t.curveCardinalOpen=oh,t.curveCardinal=rh,t.curveCatmullRomClosed=uh,t.curveCatmullRomOpen=lh,t.curveCatmullRom=ah,t.curveLinearClosed=sh,t.curveLinear=Mf,t.curveMonotoneX=Ct,t.curveMonotoneY=Pt,t.curveNatural=ch,t.curveStep=fh,t.curveStepAfter=Ot,t.curveStepBefore=Ft,t.stack=_h,t.stackOffsetExpand=vh,t.stackOffsetNone=ph,t.stackOffsetSilhouette=yh,t.stackOffsetWiggle=gh,t.stackOrderAscending=mh,t.stackOrderDescending=xh,t.stackOrderInsideOut=bh,t.stackOrderNone=dh,t.stackOrderReverse=wh,t.color=It,t.rgb=Vt,t.hsl=Zt,t.lab=tn,t.hcl=ln,t.cubehelix=fn,t.interpolate=mp,t.interpolateArray=hp,t.interpolateDate=pp,t.interpolateNumber=dp,t.interpolateObject=_p,t.interpolateRound=xp,t.interpolateString=gp,t.interpolateTransformCss=kp,t.interpolateTransformSvg=Sp,t.interpolateZoom=zp,t.interpolateRgb=sp,t.interpolateRgbBasis=cp,t.interpolateRgbBasisClosed=fp,t.interpolateHsl=Cp,t.interpolateHslLong=Pp,t.interpolateLab=An,t.interpolateHcl=Rp,t.interpolateHclLong=Lp,t.interpolateCubehelix=qp,t.interpolateCubehelixLong=Fp,t.interpolateBasis=ap,t.interpolateBasisClosed=up,t.quantize=Op,t.dispatch=Pn,t.dsvFormat=jp,t.csvParse=Yp,t.csvParseRows=Hp,t.csvFormat=Xp,t.csvFormatRows=Vp,t.tsvParse=Gp,t.tsvParseRows=$p,t.tsvFormat=Zp,t.tsvFormatRows=Jp,t.request=Qp,t.html=td,t.json=nd,t.text=ed,t.xml=rd,t.csv=od,t.tsv=ad,t.now=Yn,t.timer=Vn,t.timerFlush=Wn,t.timeout=vd,t.interval=yd,t.timeInterval=Qn,t.timeMillisecond=xd,t.timeMilliseconds=bd,t.timeSecond=Nd,t.timeSeconds=Ed,t.timeMinute=Ad,t.timeMinutes=zd,t.timeHour=Cd,t.timeHours=Pd,t.timeDay=Rd,t.timeDays=Ld,t.timeWeek=qd,t.timeWeeks=Id,t.timeSunday=qd,t.timeSundays=Id,t.timeMonday=Fd,t.timeMondays=Yd,t.timeTuesday=Od,t.timeTuesdays=Hd,t.timeWednesday=Ud,t.timeWednesdays=Xd,t.timeThursday=Dd,t.timeThursdays=Vd,t.timeFriday=Bd,t.timeFridays=Wd,t.timeSaturday=jd,t.timeSaturdays=Gd,t.timeMonth=$d,t.timeMonths=Zd,t.timeYear=Jd,t.timeYears=Qd,t.utcMillisecond=xd,t.utcMilliseconds=bd,t.utcSecond=Nd,t.utcSeconds=Ed,t.utcMinute=Kd,t.utcMinutes=t_,t.utcHour=n_,t.utcHours=e_,t.utcDay=r_,t.utcDays=i_,t.utcWeek=o_,t.utcWeeks=h_,t.utcSunday=o_,t.utcSundays=h_,t.utcMonday=a_,t.utcMondays=p_,t.utcTuesday=u_,t.utcTuesdays=d_,t.utcWednesday=l_,t.utcWednesdays=__,t.utcThursday=s_,t.utcThursdays=v_,t.utcFriday=c_,t.utcFridays=y_,t.utcSaturday=f_,t.utcSaturdays=g_,t.utcMonth=m_,t.utcMonths=x_,t.utcYear=b_,t.utcYears=M_,t.formatLocale=q_,t.formatDefaultLocale=re,t.formatSpecifier=P_,t.precisionFixed=O_,t.precisionPrefix=U_,t.precisionRound=D_,t.isoFormat=X_,t.isoParse=V_,t.timeFormatLocale=ue,t.timeFormatDefaultLocale=nr,t.scaleBand=or,t.scalePoint=ur,t.scaleIdentity=yr,t.scaleLinear=vr,t.scaleLog=kr,t.scaleOrdinal=ir,t.scaleImplicit=Z_,t.scalePow=Tr,t.scaleSqrt=Nr,t.scaleQuantile=Er,t.scaleQuantize=Ar,t.scaleThreshold=zr,t.scaleTime=sv,t.scaleUtc=cv,t.schemeCategory10=hv,t.schemeCategory20b=pv,t.schemeCategory20c=dv,t.schemeCategory20=_v,t.scaleSequential=qr,t.interpolateCubehelixDefault=vv,t.interpolateRainbow=xv,t.interpolateWarm=yv,t.interpolateCool=gv,t.interpolateViridis=bv,t.interpolateMagma=wv,t.interpolateInferno=Mv,t.interpolatePlasma=kv,t.creator=Ev,t.customEvent=Xr,t.local=Ur,t.matcher=Rv,t.mouse=Dv,t.namespace=Nv,t.namespaces=Tv,t.select=by,t.selectAll=wy,t.selection=Pi,t.selector=Bv,t.selectorAll=Iv,t.touch=My,t.touches=ky,t.window=uy,t.active=ug,t.interrupt=qy,t.transition=co,t.axisTop=mo,t.axisRight=xo,t.axisBottom=bo,t.axisLeft=wo,t.cluster=_g,t.hierarchy=Co,t.pack=zg,t.packSiblings=Eg,t.packEnclose=Ng,t.partition=Rg,t.stratify=Og,t.tree=Ug,t.treemap=Ig,t.treemapBinary=Yg,t.treemapDice=Pg,t.treemapSlice=Dg,t.treemapSliceDice=Hg,t.treemapSquarify=jg,t.treemapResquarify=Xg,t.forceCenter=Vg,t.forceCollide=$g,t.forceLink=Zg,t.forceManyBody=tm,t.forceSimulation=Kg,t.forceX=nm,t.forceY=em,t.drag=am,t.dragDisable=im,t.dragEnable=ma,t.voronoi=ym,t.zoom=bm,t.zoomIdentity=mm,t.zoomTransform=iu,t.brush=Om,t.brushX=vu,t.brushY=yu,t.brushSelection=_u,t.chord=Hm,t.ribbon=Wm,t.geoAlbers=fw,t.geoAlbersUsa=hw,t.geoArea=Kx,t.geoAzimuthalEqualArea=dw,t.geoAzimuthalEqualAreaRaw=pw,t.geoAzimuthalEquidistant=vw,t.geoAzimuthalEquidistantRaw=_w,t.geoBounds=eb,t.geoCentroid=ib,t.geoCircle=mb,t.geoClipExtent=Tb,t.geoConicConformal=gw,t.geoConicConformalRaw=ds,t.geoConicEqualArea=cw,t.geoConicEqualAreaRaw=us,t.geoConicEquidistant=xw,t.geoConicEquidistantRaw=vs,t.geoDistance=Pb,t.geoEquirectangular=mw,t.geoEquirectangularRaw=_s,t.geoGnomonic=bw,t.geoGnomonicRaw=ys,t.geoGraticule=Nl,t.geoGraticule10=El,t.geoIdentity=ww,t.geoInterpolate=Rb,t.geoLength=Ab,t.geoMercator=yw,t.geoMercatorRaw=fs,t.geoOrthographic=Mw,t.geoOrthographicRaw=ms,t.geoPath=Kb,t.geoProjection=rs,t.geoProjectionMutator=is,t.geoRotation=gb,t.geoStereographic=kw,t.geoStereographicRaw=xs,t.geoStream=$x,t.geoTransform=ow,t.geoTransverseMercator=Sw,t.geoTransverseMercatorRaw=bs,Object.defineProperty(t,"__esModule",{value:!0})})},{}],2:[function(t,n,e){"use strict";function r(t,n){if(!(t instanceof n))throw new TypeError("Cannot call a class as a function")}var i=function(){function t(t,n){for(var e=0;e<n.length;e++){var r=n[e];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,r.key,r)}}return function(n,e,r){return e&&t(n.prototype,e),r&&t(n,r),n}}(),o=t("./ssv_utilities.js"),a=t("d3"),u=function(){function t(n,e,i,o,a){r(this,t),this.uuid=uuid,this.title=n,this.x_series=e,this.x_series_unit=i,this.update_callback=o,this.context=a,this.sels=a.sels,this.play_enabled=!1,this.pan_zoom_enabled=!1,this.slider_moving=!1,this.current_x=0,this.target_x=0,this.play_speed=1,this.max_speed=8,this.min_speed=1,this.speed_mult=2,this.bbox_zoom=null,this.initialize()}return i(t,[{key:"render_slider",value:function(){var t=this.sels.controls.modebar.node().getBoundingClientRect(),n=t.height,e=2,r=8,i=t.width-this.sels.controls.modebar_group.node().getBoundingClientRect().width,o=a.scaleLinear().domain([0,this.x_series.length-1]).range([0,i-2*(e+r)]).clamp(!0);this.sels.controls.modebar_slider.selectAll("svg").remove();var u=this.sels.controls.modebar_slider.append("svg").attr("width",i).append("g").attr("transform","translate("+(r+e).toString()+","+(n/2+e).toString()+")"),l=this;u.append("line").attr("class","slider-track").attr("x1",o.range()[0]).attr("x2",o.range()[1]).select(function(){return this.parentNode.appendChild(this.cloneNode(!0))}).attr("class","slider-inset").select(function(){return this.parentNode.appendChild(this.cloneNode(!0))}).attr("class","slider-overlay").call(a.drag().on("start.interrupt",function(){u.interrupt()}).on("start drag",function(){l.target_x=Math.round(o.invert(a.event.x)),l.move(250)}));var s=u.append("circle").attr("class","slider-handle").attr("r",r);this.slider_dispatch=a.dispatch("change"),this.slider_dispatch.on("change",function(){s.attr("cx",o(l.target_x))})}},{key:"play",value:function(){this.play_enabled?(this.play_enabled=!1,this.sels.controls.pause_icon.attr("style","display:none"),this.sels.controls.play_icon.attr("style","")):(this.play_enabled=!0,this.sels.controls.pause_icon.attr("style",""),this.sels.controls.play_icon.attr("style","display:none"),this.current_x>=this.x_series.length-1&&(this.current_x=0),this.x_series_forward())}},{key:"toggle_pan_zoom",value:function(){this.pan_zoom_enabled?(this.pan_zoom_enabled=!1,this.sels.controls.pan_zoom_disabled_icon.attr("style",""),this.sels.controls.pan_zoom_enabled_icon.attr("style","display:none")):(this.pan_zoom_enabled=!0,this.sels.controls.pan_zoom_disabled_icon.attr("style","display:none"),this.sels.controls.pan_zoom_enabled_icon.attr("style",""))}},{key:"move",value:function(t){if(this.slider_dispatch.call("change"),this.current_x=this.target_x,!this.slider_moving){this.slider_moving=!0,this.update_callback.call(this.context,this.current_x,t),this.set_x_series_display(this.current_x);var n=this;a.timer(function(){n.slider_moving=!1},100)}}},{key:"x_series_forward",value:function(){var t=this;window.setTimeout(function(){t.play_enabled&&t.current_x<t.x_series.length-1&&(t.target_x=t.current_x+1,t.move(250),t.current_x<t.x_series.length-1?t.x_series_forward():t.play())},1e3/this.play_speed)}},{key:"set_x_series_display",value:function(t){this.sels.title.x_val.html(o.num_format(this.x_series[t]))}},{key:"initialize",value:function(){this.render_slider(),this.update_viewbox(),this.sels.title.title.html(this.title),this.set_x_series_display(0),this.sels.title.x_val_unit.html(this.x_series_unit);var t=this;a.select(window).on("resize",function(){t.render_slider(),t.update_viewbox()}),this.sels.controls.play_btn.attr("ssv-id",this.uuid).on("click",function(){t.play()}),this.sels.controls.pan_zoom_btn.attr("ssv-id",this.uuid).on("click",function(){t.toggle_pan_zoom()}),this.sels.controls.speed_btn.attr("ssv-id",this.uuid).on("click",function(){t.play_speed==t.max_speed?t.play_speed=t.min_speed:t.play_speed*=t.speed_mult;var n=t.play_speed.toString();t.sels.controls.speed_btn.select("span").html("<b>"+n+"x</b>")}),this.initialize_pan_zoom(),this.sels.controls.save_btn.attr("ssv-id",this.uuid).on("click",function(){t.to_image()}),this.sels.controls.vid_btn.attr("ssv-id",this.uuid).on("click",function(){t.to_video()})}},{key:"initialize_pan_zoom",value:function(){var t=this.sels.containers.info_layer.node().getBBox(),n=[t.x,t.y],e=this,r=a.zoom().scaleExtent([1,8]).on("zoom",function(){var r=a.event.transform.k,i=0,o=0;t.width*r<=e.bbox_zoom.width?(i=Math.max(a.event.transform.x,e.bbox_zoom.x-t.x-n[0]*(r-1)),i=Math.min(i,e.bbox_zoom.width-(t.x-e.bbox_zoom.x+n[0]*(r-1))-t.width*r)):(i=Math.max(a.event.transform.x,e.bbox_zoom.x-t.x-(t.width*r-e.bbox_zoom.width)-n[0]*(r-1)),i=Math.min(i,t.x-n[0]*(r-1)-e.bbox_zoom.x)),t.height*r<=e.bbox_zoom.height?(o=Math.max(a.event.transform.y,e.bbox_zoom.y-t.y-n[1]*(r-1)),o=Math.min(o,e.bbox_zoom.height-(t.y-e.bbox_zoom.y+n[1]*(r-1))-t.height*r)):(o=Math.max(a.event.transform.y,e.bbox_zoom.y-t.y-(t.height*r-e.bbox_zoom.height)-n[1]*(r-1)),o=Math.min(o,t.y-n[1]*(r-1)-e.bbox_zoom.y)),a.event.transform.x=i,a.event.transform.y=o,this.pan_zoom_enabled&&e.sels.containers.info_layer.attr("transform","translate("+[i,o]+")scale("+r+")")});this.sels.containers.svg.call(r),this.sels.controls.center_btn.attr("ssv-id",this.uuid).on("click",function(){e.sels.containers.info_layer.attr("transform","translate("+[t.x,t.y]+")scale(1)"),r.transform(e.sels.containers.svg,a.zoomIdentity)})}},{key:"update_viewbox",value:function(){var t=this.sels.containers.svg_container.node().getBoundingClientRect(),n=this.sels.containers.svg.attr("viewBox").split(" ").map(function(t){return parseFloat(t)}),e=.05*n[3],r=n[3]/t.height,i=t.width*r-n[2];n[2]=n[2]+i,n[0]=n[0]-i/2,this.sels.containers.svg.attr("viewBox",n.join(" ")),this.sels.containers.zoom_layer.attr("x",n[0]+e).attr("width",n[2]-2*e).attr("y",n[1]+e).attr("height",n[3]-2*e).style("fill","none"),this.bbox_zoom=this.sels.containers.zoom_layer.node().getBBox()}},{key:"render_slice",value:function(t,n){var e='<?xml version="1.0" standalone="no"?><!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">',r=(new XMLSerializer).serializeToString(this.sels.containers.svg.node()),i=new Blob([e+r],{type:"image/svg+xml;charset=utf-8"}),o=window.URL.createObjectURL(i),a=this.sels.containers.svg.node().getBoundingClientRect(),u=this.sels.containers.img.attr("width",a.width).attr("height",a.height).node(),l=4,s=this.sels.containers.render.node();s.width=a.width*l,s.height=a.height*l;var c=s.getContext("2d");c.fillStyle="white",c.fillRect(0,0,a.width*l,a.height*l),u.onload=function(){c.drawImage(u,0,0),"image"==t?n(s.toDataURL()):"video"==t&&n(s.toDataURL("image/webp"))},u.src=o}},{key:"to_image",value:function(){var t=this,n=function(n){var e=document.createElement("a"),r=o.num_format(t.x_series[t.current_x])+"_"+t.x_series_unit;e.download=t.title.replace(" ","_")+"_"+r+".jpeg",e.href=n,e.click()};this.render_slice("image",n)}},{key:"to_video",value:function(){function t(){i=e>n.frames.length,i||(n.target_x=e,n.move(0),n.set_x_series_display(e),n.render_slice("video",r),i=!0,e+=1)}var n=this;n.frames=[];var e=0;n.sels.containers.progress.style("display","table"),n.sels.containers.progress.select(".progress-bar").html("Generating Video");var r=function(t){n.frames.push(t)},i=!1,o=setInterval(function(){if(e<n.x_series.length){t();var r=Math.ceil(e/n.x_series.length*100).toString()+"%";n.sels.containers.progress.select(".progress-bar").style("width",r)}else{var i=Whammy.fromImageArray(n.frames,15),a=window.URL.createObjectURL(i),u=document.createElement("a");u.download=n.title.replace(" ","_")+".webm",u.href=a,u.click(),clearInterval(o),n.sels.containers.progress.select(".progress-bar").style("width",0),n.sels.containers.progress.style("display","none")}},100)}}]),t}();n.exports=function(){for(var t=arguments.length,n=Array(t),e=0;e<t;e++)n[e]=arguments[e];return new(Function.prototype.bind.apply(u,[null].concat(n)))}},{"./ssv_utilities.js":7,d3:1}],3:[function(t,n,e){"use strict";function r(t,n){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!n||"object"!=typeof n&&"function"!=typeof n?t:n}function i(t,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function, not "+typeof n);t.prototype=Object.create(n&&n.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),n&&(Object.setPrototypeOf?Object.setPrototypeOf(t,n):t.__proto__=n)}function o(t,n){if(!(t instanceof n))throw new TypeError("Cannot call a class as a function")}function a(t,n,e){return new m[n.type](t,n.ids,n.description,n.conditions,n.report_id,n.popover,e)}function u(t){c.selectAll("#"+t+" #element").attr("style",null),c.selectAll("#"+t+" defs").remove()}var l=function(){function t(t,n){for(var e=0;e<n.length;e++){var r=n[e];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,r.key,r)}}return function(n,e,r){return e&&t(n.prototype,e),r&&t(n,r),n}}(),s=t("./ssv_renderers.js"),c=t("d3"),f=function(){function t(n,e,r,i,a,u,l){o(this,t),this.uuid=n,this.selectors=[],e&&(this.ids=e,this.selectors=e.map(function(t){return c.select("#"+n+" #"+t)})),this.update_functions=[],""==a?this.report_sel=!1:this.report_sel=c.select("#"+n+" #"+a),this.popover_div_sel=c.select("#"+n+" .popover-spacer"),this.description=r,this.conditions=i,this.popover=u,this.font_scale=l,
-this.patterns_initialized=!1,this.gen_color_scales(),this.initialize()}return l(t,[{key:"gen_color_scales",value:function(){this.conditions.map(function(t){if("color_scale"in t&&"color_levels"in t){var n=t.color_scale,e=t.color_levels;t.color_scale=c.scaleQuantile().domain([c.min(e),c.max(e)]).range(n)}})}},{key:"initialize",value:function(){this.report_sel&&!this.report_sel.empty()&&(console.log(this.report_sel.node(),this.font_scale,this.conditions,this.description),this.update_functions.push(s.render_report(this.report_sel.node(),this.font_scale,this.conditions,this.description))),this.popover&&this.update_functions.push(s.render_popover(this.popover_div_sel,this.selectors,this.popover,this.font_scale)),this.initialize_hook(),delete this.conditions}},{key:"initialize_hook",value:function(){}},{key:"update",value:function(t,n){this.update_functions&&this.update_functions.map(function(e){"function"==typeof e&&e(t,n)})}}]),t}(),h=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize_hook",value:function(){var t=this;t.selectors.map(function(n,e){var r="pattern_"+t.ids[e];if(!t.patterns_initialized){var i=[];t.conditions.map(function(t){var n,e=1.01;if(n="overlay"in t&&t.overlay?t.overlay:null,"background"==t.type)i.push(t.color_data.map(function(r){return[e,t.color_scale(r),t.opacity,n]}));else if("levelstatic"==t.type)i.push(t.level_data.map(function(e){var r=(Math.min((e-t.min_height)/(t.max_height-t.min_height)),1);return[r,t.color,t.opacity,n]}));else if("dynamiclevel"==t.type)i.push(t.level_data.map(function(e,r){var i=Math.min((e-t.min_height)/(t.max_height-t.min_height),1),o=t.color_scale(t.color_data[r]);return[i,o,t.opacity,n]}));else if("logical"==t.type)i.push(t.data.map(function(r){var i;return i=r?t.true_color:t.false_color,[e,i,t.opacity,n]}));else if("zonaly"==t.type){var r=[];r=r.concat(t.level_data.map(function(e,r){return e.map(function(e,i){var o=Math.min((e-t.min_height)/(t.max_height-t.min_height),1),a=t.color_scale(t.color_data[r][i]);return[o,a,t.opacity,n]})})),i=i.concat(c.zip.apply(this,r))}}),i=c.zip.apply(this,i),n.each(function(){t.update_functions.push(s.render_pattern(this,r,i,"fill"))})}})}}]),n}(f),p=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize_hook",value:function(){var t=this;t.selectors.map(function(n,e){var r="pattern_"+t.ids[e],i=[];t.patterns_initialized||(t.conditions.map(function(t){var n,n=(t.opacity,null);if("equaly"==t.type){var e=[],e=e.concat(t.color_data.map(function(e){return e.map(function(r,i){var o=i/e.length,a=t.color_scale(r);return[o,a,t.opacity,n]})}));i=i.concat(c.zip.apply(this,e))}}),i=c.zip.apply(this,i),n.each(function(){t.update_functions.push(s.render_pattern(this,r,i,"stroke"))}))})}}]),n}(f),d=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize_hook",value:function(){var t=this.conditions[0].color_data,n=this.conditions[0].color_scale,e=this.opacity,r=this;r.selectors.map(function(i){i.each(function(){r.update_functions.push(s.render_rect_heatmap(this,t,n,e))})})}}]),n}(f),_=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize_hook",value:function(){var t=this;t.selectors.map(function(n){if("showhide"==t.conditions[0].type){var e=t.conditions[0].data;n.datum(e);var r=function(t){e[t]||e[t]>0?n.transition().attr("opacity",1):n.transition().attr("opacity",0)};t.update_functions.push(r)}})}}]),n}(f),v=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),n}(f),y=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize",value:function(){var t=this.report_sel.node(),n="table_"+this.report_id,e=this.conditions[0].tabular_data,r=this.conditions[0].headers;this.update_functions.push(s.render_table(t,n,e,r,this.font_scale))}}]),n}(f),g=function(t){function n(){return o(this,n),r(this,(n.__proto__||Object.getPrototypeOf(n)).apply(this,arguments))}return i(n,t),l(n,[{key:"initialize",value:function(){var t=this.conditions[0].color_scale,n=this.report_sel.node(),e=this.conditions[0].opacity;s.render_color_scale(n,t,this.description,e,this.font_scale)}}]),n}(f),m={cell:h,line:p,heatmap:d,toggle:_,report:v,table:y,legend:g};n.exports={create_element:a,remove_element:u}},{"./ssv_renderers.js":5,d3:1}],4:[function(t,n,e){"use strict";function r(t,n){if(!(t instanceof n))throw new TypeError("Cannot call a class as a function")}var i=function(){function t(t,n){for(var e=0;e<n.length;e++){var r=n[e];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,r.key,r)}}return function(n,e,r){return e&&t(n.prototype,e),r&&t(n,r),n}}(),o=t("./ssv_controls.js"),a=t("./ssv_elements.js"),u=t("./ssv_selectors.js"),l=function(){function t(n,e,i,a,l,s,c){r(this,t),this.uuid=n,this.sels=u(n),this.sels.containers.svg_container.style("font-size",c.toString()+"px"),this.sels.containers.svg.style("font-size",c.toString()+"px"),this.elements=[],this.svg_overlays=s,this.initialize_overlays(),this.set_font_scale(),o(e,i,a,this.update_elements,this),this.initialize_elements(l)}return i(t,[{key:"initialize_overlays",value:function(){this.sels.containers.svg.select("defs").empty()&&this.sels.containers.svg.append("defs");for(var t in this.svg_overlays)this.sels.containers.svg.select("defs").html(this.sels.containers.svg.select("defs").html()+this.svg_overlays[t])}},{key:"set_font_scale",value:function(){var t=parseFloat(this.sels.containers.svg.attr("viewBox").split(" ")[3])/this.sels.containers.svg_container.node().getBoundingClientRect().height;this.font_scale=t,this.sels.containers.svg.attr("font-scale",t)}},{key:"initialize_elements",value:function(t){var n=this.uuid,e=this.font_scale;this.elements=[];var r=t.length,i=this;t.forEach(function(t){setTimeout(function(){i.elements.push(a.create_element(n,t,e)),i.update_loading_progress(r)},0)})}},{key:"update_loading_progress",value:function(t){if(this.elements.length==t)this.sels.containers.progress.select(".progress-bar").style("width",0),this.sels.containers.progress.style("display","none"),this.update_elements(0);else{var n=Math.ceil(this.elements.length/t*100).toString()+"%";this.sels.containers.progress.select(".progress-bar").style("width",n)}}},{key:"update_elements",value:function(t,n){this.elements.map(function(e){e.update(t,n)})}}]),t}();window.onerror=function(t){document.body.setAttribute("JSError",t)};var s={};n.exports={add_element_context:function(t){for(var n=arguments.length,e=Array(n>1?n-1:0),r=1;r<n;r++)e[r-1]=arguments[r];s[t]=new(Function.prototype.bind.apply(l,[null].concat([t],e)))},create_demo_element:function(t,n,e){return a.create_element(t,n,1)},remove_demo_element:function(t){a.remove_element(t)},get_type_requirements:function(){return{table:{args:{description:"str",id:"str",x_series:null},conditions:{tabularinfo:{args:{id:{"default":null,input_type:"str"},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},x_len:{"default":null,input_type:"int"},tabular_data:{"default":null,input_type:null},headers:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"headers.str.1.1":"validate_array","tabular_data.str&x_len":"validate_array_slices"},max_conditions:1}}},cell:{args:{description:"str",id:"str",x_series:null},conditions:{background:{args:{id:{"default":null,input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},color_data:{"default":null,input_type:null},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit_description_prepend:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"color_data.float.1.1&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},max_conditions:-1},zonaly:{args:{level_data:{"default":null,input_type:null},id:{"default":null,input_type:"str"},color_data_description:{"default":null,input_type:"str"},color_data:{"default":null,input_type:null},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit_description_prepend:{"default":null,input_type:"str"},min_height:{"default":null,input_type:["int","float"]},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},opacity:{"default":1,input_type:["int","float"]},max_height:{"default":null,input_type:["int","float"]},description:{"default":null,input_type:"str"},color_data_unit:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"min_height&max_height":"validate_heights","level_data.float.2.2&x_len":"validate_array","color_data.float.2.2&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},max_conditions:-1},dynamiclevel:{args:{level_data:{"default":null,input_type:null},id:{"default":null,input_type:"str"},color_data_description:{"default":null,input_type:"str"},color_data:{"default":null,input_type:null},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit_description_prepend:{"default":null,input_type:"str"},min_height:{"default":null,input_type:["int","float"]},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},opacity:{"default":1,input_type:["int","float"]},max_height:{"default":null,input_type:["int","float"]},description:{"default":null,input_type:"str"},color_data_unit:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"min_height&max_height":"validate_heights","color_scale&color_levels":"validate_color_scale","color_data.float.1.1&x_len":"validate_array","level_data.float.1.1&x_len":"validate_array"},max_conditions:-1},staticlevel:{args:{level_data:{"default":null,input_type:null},min_height:{"default":null,input_type:["int","float"]},id:{"default":null,input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},max_height:{"default":null,input_type:["int","float"]},unit_description_prepend:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"color_scale&color_levels":"validate_color_scale","min_height&max_height":"validate_heights","level_data.float.1.1&x_len":"validate_array"},max_conditions:-1}}},line:{args:{line_description:null,line_id:null,x_series:null},conditions:{equaly:{args:{id:{"default":null,input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},color_data:{"default":null,input_type:null},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit_description_prepend:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"color_data.float.2.2&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},max_conditions:1}}},report:{args:{description:"str",id:"str",x_series:null},conditions:{info:{args:{id:{"default":null,input_type:"str"},opacity:{"default":1,input_type:["int","float"]},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},data:{"default":null,input_type:null},report:{"default":!0,input_type:"bool"},section_label:{"default":"zone",input_type:"str"},description:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"data.float.1.2&x_len":"validate_array"},max_conditions:-1}}},toggle:{args:{description:"str",id:"str",x_series:null},conditions:{logical:{args:{true_color:{"default":null,input_type:"validate_color"},id:{"default":null,input_type:"str"},opacity:{"default":1,input_type:["int","float"]},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},data:{"default":null,input_type:null},report:{"default":!0,input_type:"bool"},section_label:{"default":"zone",input_type:"str"},description:{"default":null,input_type:"str"},false_color:{"default":null,input_type:"validate_color"},unit:{"default":null,input_type:"str"}},validators:{"data.float.1.1&x_len":"validate_array"},max_conditions:1},showhide:{args:{id:{"default":null,input_type:"str"},opacity:{"default":1,input_type:["int","float"]},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},data:{"default":null,input_type:null},report:{"default":!0,input_type:"bool"},section_label:{"default":"zone",input_type:"str"},description:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"data.float.1.1&x_len":"validate_array"},max_conditions:1}}},heatmap:{args:{description:"str",id:"str",x_series:null},conditions:{rect:{args:{id:{"default":null,input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},color_data:{"default":null,input_type:null},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit_description_prepend:{"default":null,input_type:"str"},unit:{"default":null,input_type:"str"}},validators:{"color_data.float.3.3&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},max_conditions:1}}},legend:{args:{desc:null,id:"str",x_series:null},conditions:{colorscale:{args:{id:{"default":null,input_type:"str"},description:{"default":null,input_type:"str"},overlay:{"default":null,input_type:"str"},x_len:{"default":null,input_type:"int"},opacity:{"default":1,input_type:["int","float"]},report:{"default":!0,input_type:"bool"},color_scale:{"default":null,input_type:null},section_label:{"default":"zone",input_type:"str"},color_levels:{"default":null,input_type:"validate_color_levels"},unit:{"default":null,input_type:"str"}},validators:{"color_scale&color_levels":"validate_color_scale"},max_conditions:1}}}}}}},{"./ssv_controls.js":2,"./ssv_elements.js":3,"./ssv_selectors.js":6}],5:[function(t,n,e){"use strict";function r(t,n,e,r){if(t){var i=f.select(t.parentNode),o=t.getBBox(),a=o.width,u=o.x,l=o.y,s=1.2,h=1,p=.1,d="#FFC107",_="#00BFA5",v="#FFFFFF",y="#FFFFFF",g="#FFEB3B",m="#616161",x="Sizing...";f.select(t).style("visibility","hidden");var b=i.append("g").attr("transform","translate("+u+","+l+")").append("g").attr("id","ssv-report").attr("font-size",n.toString()+"em"),w=b.append("rect").attr("width",a).attr("fill",m).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge"),M=b.append("text").attr("width",a).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","baseline").attr("x",a/2).attr("fill",d).style("font-size",s.toString()+"em").text(x),k=M.node().getBBox().height;M.attr("y",k*(1+p));var S=k*h/s,T=k*(1+2*p);w.attr("height",T);var N=S*(1+1*p),E=N+S*p;M.text(r);for(var A=0;A<e.length;A++){var z=e[A];if("report"in z&&z.report){var C=z.data?z.data:z.level_data?z.level_data:z.color_data,P=1;C[0].constructor===Array&&(P=C[0].length),b.append("rect").attr("width",a).attr("fill",m).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge").attr("y",T).attr("height",(P+1)*E),b.append("text").attr("width",a).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge").attr("x",a/2).attr("y",T+N).attr("fill",_).style("font-size",h.toString()+"em").attr("font-style","oblique").text(z.description);var R;R="section_label"in z&&""!=z.section_label?z.section_label:"Section",T+=E;for(var L=0;L<P;L++){var q;q=P>1?3:2,P>1&&b.append("text").attr("width",a).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge").attr("x",a/(2*q)).attr("y",T+N).attr("fill",v).style("font-size",h.toString()+"em").text(R+" #"+(L+1).toString());var F;F=P>1?C.map(function(t){return c(t[L])}):C.map(function(t){return c(t)}),b.append("text").attr("width",a).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge").attr("class","value-text").datum(F).attr("x",a/(2*(4-q))).attr("y",T+N).attr("fill",g).style("font-size",h.toString()+"em"),b.append("text").attr("width",a).attr("fill-opacity","1").attr("text-anchor","middle").attr("alignment-baseline","after-edge").attr("x",(2*q-1)*a/(2*q)).attr("y",T+N).attr("fill",y).style("font-size",h.toString()+"em").text(z.unit),T+=E}}}}var O=function(t){i.selectAll(".value-text").text(function(n){return n[t]})};return O}function i(t,n,e,r){var i=f.select(t.parentNode);i.select("defs").empty()&&i.append("defs");var o=t.getBBox().height;e[0].length>1&&(e=e.map(function(t){return t.sort(function(t,n){return-(t[0]-n[0])})}));var e=e.map(function(t){return t.map(function(t){var n=Math.max(0,1-t[0])*o;return[n].concat(t.slice(1,t.length))})}),a=i.select("defs"),u=a.append("pattern").attr("id",n).attr("x",0).attr("y",0).attr("width","100%").attr("height","100%").attr("patternContentUnits","userSpaceOnUse").datum(e),l=u.selectAll().data(function(t){return t[0]}).enter();l.each(function(){u.append("rect").attr("id","base").attr("x","0").attr("width","100%").attr("height","100%"),u.append("rect").attr("id","transition").attr("x","0").attr("width","100%").attr("height","1px").attr("fill","#FFFFFF"),u.append("rect").attr("id","overlay").attr("x","0").attr("width","100%").attr("height","100%")});var s=f.select(t);"fill"==r?s.style("fill","url(#"+n+")"):s.style("stroke","url(#"+n+")"),s.style("fill-opacity",1),s.style("opacity",1);var c=function(t,n){u.selectAll("#base").data(function(n){return n[t]}).transition().duration(n).attr("y",function(t){return t[0]}).style("fill",function(t){return t[1]}).style("opacity",function(t){return t[2]}),u.selectAll("#transition").data(function(n){return n[t]}).transition().duration(n).attr("y",function(t){return t[0]>0?t[0]:"-1%"}).style("opacity",function(t){return t[2]}),u.selectAll("#overlay").data(function(n){return n[t]}).transition().duration(n).attr("fill",function(t){return null==t[3]?"none":"url(#"+t[3]+")"}).attr("y",function(t){return t[0]}).style("opacity",function(t){return t[2]})};return c}function o(t,n,e,r){if(t){var i=f.select(t.parentNode),o=t.getBBox(),a=f.scaleLinear().domain([0,n[0][0].length]).range([0,o.width]),u=f.scaleLinear().domain([0,n[0].length]).range([0,o.height]),l=i.append("g").attr("transform","translate("+o.x+","+o.y+")").append("g"),s=n.map(function(t){return t.map(function(t){return t.map(function(t){return e(t)})})});l.data([s]);var c=l.selectAll().data(function(t){return t[0]}).enter().append("g").attr("class","x_section").attr("stroke","black").attr("stroke-width","1px");c.selectAll(".bin").data(function(t){return t}).enter().append("rect").attr("class","bin").attr("x",function(t,n){return a(n)}).attr("width",function(t,n){return a(n+1)-a(n)}).style("fill",function(t){return t}).style("fill-opacity",function(){return r}).attr("height",o.height/n[0].length),c.each(function(t,n){f.select(this).selectAll(".bin").attr("y",u(n))});var h=function(t,n){var e=i.select("g").select("g"),r=e.selectAll(".x_section").data(function(n){return n[t]});r.selectAll(".bin").data(function(t){return t}).transition().duration(n).style("fill",function(t){return t})};return h}}function a(t,n,e,r,i){if(t){var o=f.select(t.parentNode),a=t.getBBox(),u=a.width,l=a.x,s=a.y;f.select(t).style("visibility","hidden");var c=o.append("g").attr("transform","translate("+l+","+s+")").append("foreignObject").attr("id","ssv-table").attr("width",u).attr("height",500).append("xhtml:table").attr("class","table").attr("id",n).datum(e);c.append("thead").append("tr").selectAll().data(r).enter().append("th").text(function(t){return t}).style("font-size",i.toString()+"em"),c.append("tbody");var h=function(t){var n=c.selectAll(".content-row").data(function(n){return n[t]});n.exit().remove(),n.enter().append("tr").merge(n).attr("class","content-row");var e=c.selectAll(".content-row").selectAll(".content-cell").data(function(t){return t});e.exit().remove(),e.enter().append("td").merge(e).text(function(t){return t}).style("font-size",i.toString()+"em").attr("class","content-cell")};return h}}function u(t,n,e,r,i){if(t){var o=f.select(t.parentNode);f.select(t).style("visibility","hidden");var a=t.getBBox(),u=a.width,l=a.x,s=a.y,o=f.select(t.parentNode),c=o.append("g").attr("transform","translate("+l+","+s+")").append("g").attr("font-size",i+"em").attr("stroke","black").attr("stroke-width","0.01em"),h=n.range().length,p=f.scaleLinear().domain([0,h]).range([0,u]),d=1.5,_=1,v=.1,y=c.append("text").text(e).attr("x",u/2).attr("y","1em").attr("text-anchor","middle").attr("font-size",d.toString()+"em"),g=y.node().getBBox().height,m=c.selectAll("rect").data(n.range());m.enter().append("rect").attr("x",function(t,n){return p(n)}).attr("y",(1+v)*g).attr("width",function(t,n){return p(n+1)-p(n)}).attr("height",g).attr("fill",function(t){return t}).style("fill-opacity",r).attr("font-size",d.toString()+"em"),m.enter().append("text").text(function(t){return n.invertExtent(t)[0].toFixed(0)}).attr("x",function(t,n){return p(n)}).attr("y",g*(2+v+_/d*(1+v))).attr("text-anchor","middle").attr("font-size",_.toString()+"em")}}function l(t,n,e,r){var i=t.append("div").style("background","#9E9E9E"),o=[150,50];"dims"in e&&(o=e.dims);var a=i.append("svg").attr("width",o[0]+"px").attr("height",o[1]+"px").style("font-size",r.toString()+"em").append("g");if(i.attr("class","ssv-popover").style("visibility","hidden"),"sparkline"==e.type)var u=s(a,o,e.x_series,e.data,e.label);return n.map(function(t){t.on("mouseover",function(){i.style("visibility","visible")}),t.on("mousemove",function(){i.style("top",f.event.pageY+"px").style("left",f.event.pageX+"px")}),t.on("mouseout",function(){i.style("visibility","hidden")})}),u}function s(t,n,e,r,i){var o=n[0],a=n[1],u=.05*o,l=u,s=f.line().x(function(t,n){return p(n)}).y(function(t){return d(t)});if(i){var c=t.append("text").attr("x",u).attr("y","1.05em").attr("fill","#FFFFFF").text(i),h=c.node().getBBox();l+=2*h.y+h.height}var p=f.scaleLinear().range([0,o-2*u]),d=f.scaleLinear().range([a-l-u,0]),_=t.append("g").attr("transform","translate("+u+","+l+")");p.domain([0,e.length]),d.domain([f.min(r),f.max(r)]),_.append("path").style("fill","none").style("stroke","#FFFFFF").style("stroke-width","0.1em").attr("d",s(r));var v=_.append("circle").attr("r","0.5em").attr("fill","orange"),y=function(t,n){v.transition().duration(n).attr("cx",p(t)).attr("cy",d(r[t]))};return y}var c=t("./ssv_utilities.js").num_format,f=t("d3");n.exports={render_report:r,render_pattern:i,render_color_scale:u,render_table:a,render_rect_heatmap:o,render_popover:l}},{"./ssv_utilities.js":7,d3:1}],6:[function(t,n,e){"use strict";var r=t("d3"),i=function(t){var n=r.select("#"+t),e={controls:{modebar:n.select(".modebar"),modebar_group:n.select(".modebar-group"),modebar_slider:n.select(".modebar-slider"),speed_btn:n.select("#speed-button"),play_btn:n.select("#play-button"),pan_zoom_btn:n.select("#pan-zoom-button"),center_btn:n.select("#center-button"),save_btn:n.select("#save-button"),vid_btn:n.select("#video-button"),pause_icon:n.select("#pause-icon"),play_icon:n.select("#play-icon"),pan_zoom_enabled_icon:n.select("#pan-zoom-enabled-icon"),pan_zoom_disabled_icon:n.select("#pan-zoom-disabled-icon")},title:{title:n.select("#title"),x_val:n.select("#x-val"),x_val_unit:n.select("#x-val-unit")},containers:{svg_container:n.select(".svg-container"),zoom_layer:n.select("#zoom-layer"),info_layer:n.select("#info-layer"),popover_div:n.select(".popover-spacer"),svg:n.select("#ssv-svg"),img:n.select("#img-space"),render:n.select("#render-space"),progress:n.select(".ssv-progress")}};return e};n.exports=i},{d3:1}],7:[function(t,n,e){"use strict";function r(t){return t>=1e3||t<.01?i.format(".2e")(t):i.format(".2f")(t)}var i=t("d3");n.exports={num_format:r}},{d3:1}]},{},[4])(4)});
\ No newline at end of file
+t):o},t.source=function(e){return arguments.length?(n=e,t):n},t.target=function(n){return arguments.length?(e=n,t):e},t.context=function(n){return arguments.length?(a=null==n?null:n,t):a},t},Gm=function(){return new Su};Su.prototype={constructor:Su,reset:function(){this.s=this.t=0},add:function(t){Tu(Tx,t,this.t),Tu(this,Tx.s,this.s),this.s?this.t+=Tx.t:this.s=Tx.t},valueOf:function(){return this.s}};var $m,Zm,Jm,Qm,Km,tx,nx,ex,rx,ix,ox,ax,ux,lx,sx,cx,fx,hx,px,dx,_x,vx,yx,gx,mx,xx,bx,wx,Mx,kx,Sx,Tx=new Su,Nx=1e-6,Ex=1e-12,Ax=Math.PI,zx=Ax/2,Cx=Ax/4,Px=2*Ax,Rx=180/Ax,Lx=Ax/180,qx=Math.abs,Fx=Math.atan,Ox=Math.atan2,Ux=Math.cos,Dx=Math.ceil,Bx=Math.exp,jx=Math.log,Ix=Math.pow,Yx=Math.sin,Hx=Math.sign||function(t){return t>0?1:t<0?-1:0},Xx=Math.sqrt,Vx=Math.tan,Wx={Feature:function(t,n){Cu(t.geometry,n)},FeatureCollection:function(t,n){for(var e=t.features,r=-1,i=e.length;++r<i;)Cu(e[r].geometry,n)}},Gx={Sphere:function(t,n){n.sphere()},Point:function(t,n){t=t.coordinates,n.point(t[0],t[1],t[2])},MultiPoint:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)t=e[r],n.point(t[0],t[1],t[2])},LineString:function(t,n){Pu(t.coordinates,n,0)},MultiLineString:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)Pu(e[r],n,0)},Polygon:function(t,n){Ru(t.coordinates,n)},MultiPolygon:function(t,n){for(var e=t.coordinates,r=-1,i=e.length;++r<i;)Ru(e[r],n)},GeometryCollection:function(t,n){for(var e=t.geometries,r=-1,i=e.length;++r<i;)Cu(e[r],n)}},$x=function(t,n){t&&Wx.hasOwnProperty(t.type)?Wx[t.type](t,n):Cu(t,n)},Zx=Gm(),Jx=Gm(),Qx={point:zu,lineStart:zu,lineEnd:zu,polygonStart:function(){Zx.reset(),Qx.lineStart=Lu,Qx.lineEnd=qu},polygonEnd:function(){var t=+Zx;Jx.add(t<0?Px+t:t),this.lineStart=this.lineEnd=this.point=zu},sphere:function(){Jx.add(Px)}},Kx=function(t){return Jx.reset(),$x(t,Qx),2*Jx},tb=Gm(),nb={point:Xu,lineStart:Wu,lineEnd:Gu,polygonStart:function(){nb.point=$u,nb.lineStart=Zu,nb.lineEnd=Ju,tb.reset(),Qx.polygonStart()},polygonEnd:function(){Qx.polygonEnd(),nb.point=Xu,nb.lineStart=Wu,nb.lineEnd=Gu,Zx<0?(tx=-(ex=180),nx=-(rx=90)):tb>Nx?rx=90:tb<-Nx&&(nx=-90),sx[0]=tx,sx[1]=ex}},eb=function(t){var n,e,r,i,o,a,u;if(rx=ex=-(tx=nx=1/0),lx=[],$x(t,nb),e=lx.length){for(lx.sort(Ku),n=1,r=lx[0],o=[r];n<e;++n)i=lx[n],tl(r,i[0])||tl(r,i[1])?(Qu(r[0],i[1])>Qu(r[0],r[1])&&(r[1]=i[1]),Qu(i[0],r[1])>Qu(r[0],r[1])&&(r[0]=i[0])):o.push(r=i);for(a=-(1/0),e=o.length-1,n=0,r=o[e];n<=e;r=i,++n)i=o[n],(u=Qu(r[1],i[0]))>a&&(a=u,tx=i[0],ex=r[1])}return lx=sx=null,tx===1/0||nx===1/0?[[NaN,NaN],[NaN,NaN]]:[[tx,nx],[ex,rx]]},rb={sphere:zu,point:nl,lineStart:rl,lineEnd:al,polygonStart:function(){rb.lineStart=ul,rb.lineEnd=ll},polygonEnd:function(){rb.lineStart=rl,rb.lineEnd=al}},ib=function(t){cx=fx=hx=px=dx=_x=vx=yx=gx=mx=xx=0,$x(t,rb);var n=gx,e=mx,r=xx,i=n*n+e*e+r*r;return i<Ex&&(n=_x,e=vx,r=yx,fx<Nx&&(n=hx,e=px,r=dx),i=n*n+e*e+r*r,i<Ex)?[NaN,NaN]:[Ox(e,n)*Rx,Eu(r/Xx(i))*Rx]},ob=function(t){return function(){return t}},ab=function(t,n){function e(e,r){return e=t(e,r),n(e[0],e[1])}return t.invert&&n.invert&&(e.invert=function(e,r){return e=n.invert(e,r),e&&t.invert(e[0],e[1])}),e};fl.invert=fl;var ub,lb,sb,cb,fb,hb,pb,db,_b,vb,yb,gb=function(t){function n(n){return n=t(n[0]*Lx,n[1]*Lx),n[0]*=Rx,n[1]*=Rx,n}return t=hl(t[0]*Lx,t[1]*Lx,t.length>2?t[2]*Lx:0),n.invert=function(n){return n=t.invert(n[0]*Lx,n[1]*Lx),n[0]*=Rx,n[1]*=Rx,n},n},mb=function(){function t(t,n){e.push(t=r(t,n)),t[0]*=Rx,t[1]*=Rx}function n(){var t=i.apply(this,arguments),n=o.apply(this,arguments)*Lx,l=a.apply(this,arguments)*Lx;return e=[],r=hl(-t[0]*Lx,-t[1]*Lx,0).invert,vl(u,n,l,1),t={type:"Polygon",coordinates:[e]},e=r=null,t}var e,r,i=ob([0,0]),o=ob(90),a=ob(6),u={point:t};return n.center=function(t){return arguments.length?(i="function"==typeof t?t:ob([+t[0],+t[1]]),n):i},n.radius=function(t){return arguments.length?(o="function"==typeof t?t:ob(+t),n):o},n.precision=function(t){return arguments.length?(a="function"==typeof t?t:ob(+t),n):a},n},xb=function(){var t,n=[];return{point:function(n,e){t.push([n,e])},lineStart:function(){n.push(t=[])},lineEnd:zu,rejoin:function(){n.length>1&&n.push(n.pop().concat(n.shift()))},result:function(){var e=n;return n=[],t=null,e}}},bb=function(t,n,e,r,i,o){var a,u=t[0],l=t[1],s=n[0],c=n[1],f=0,h=1,p=s-u,d=c-l;if(a=e-u,p||!(a>0)){if(a/=p,p<0){if(a<f)return;a<h&&(h=a)}else if(p>0){if(a>h)return;a>f&&(f=a)}if(a=i-u,p||!(a<0)){if(a/=p,p<0){if(a>h)return;a>f&&(f=a)}else if(p>0){if(a<f)return;a<h&&(h=a)}if(a=r-l,d||!(a>0)){if(a/=d,d<0){if(a<f)return;a<h&&(h=a)}else if(d>0){if(a>h)return;a>f&&(f=a)}if(a=o-l,d||!(a<0)){if(a/=d,d<0){if(a>h)return;a>f&&(f=a)}else if(d>0){if(a<f)return;a<h&&(h=a)}return f>0&&(t[0]=u+f*p,t[1]=l+f*d),h<1&&(n[0]=u+h*p,n[1]=l+h*d),!0}}}}},wb=function(t,n){return qx(t[0]-n[0])<Nx&&qx(t[1]-n[1])<Nx},Mb=function(t,n,e,r,i){var o,a,u=[],l=[];if(t.forEach(function(t){if(!((n=t.length-1)<=0)){var n,e,r=t[0],a=t[n];if(wb(r,a)){for(i.lineStart(),o=0;o<n;++o)i.point((r=t[o])[0],r[1]);return void i.lineEnd()}u.push(e=new gl(r,t,null,(!0))),l.push(e.o=new gl(r,null,e,(!1))),u.push(e=new gl(a,t,null,(!1))),l.push(e.o=new gl(a,null,e,(!0)))}}),u.length){for(l.sort(n),ml(u),ml(l),o=0,a=l.length;o<a;++o)l[o].e=e=!e;for(var s,c,f=u[0];;){for(var h=f,p=!0;h.v;)if((h=h.n)===f)return;s=h.z,i.lineStart();do{if(h.v=h.o.v=!0,h.e){if(p)for(o=0,a=s.length;o<a;++o)i.point((c=s[o])[0],c[1]);else r(h.x,h.n.x,1,i);h=h.n}else{if(p)for(s=h.p.z,o=s.length-1;o>=0;--o)i.point((c=s[o])[0],c[1]);else r(h.x,h.p.x,-1,i);h=h.p}h=h.o,s=h.z,p=!p}while(!h.v);i.lineEnd()}}},kb=1e9,Sb=-kb,Tb=function(){var t,n,e,r=0,i=0,o=960,a=500;return e={stream:function(e){return t&&n===e?t:t=xl(r,i,o,a)(n=e)},extent:function(u){return arguments.length?(r=+u[0][0],i=+u[0][1],o=+u[1][0],a=+u[1][1],t=n=null,e):[[r,i],[o,a]]}}},Nb=Gm(),Eb={sphere:zu,point:zu,lineStart:bl,lineEnd:zu,polygonStart:zu,polygonEnd:zu},Ab=function(t){return Nb.reset(),$x(t,Eb),+Nb},zb=[null,null],Cb={type:"LineString",coordinates:zb},Pb=function(t,n){return zb[0]=t,zb[1]=n,Ab(Cb)},Rb=function(t,n){var e=t[0]*Lx,r=t[1]*Lx,i=n[0]*Lx,o=n[1]*Lx,a=Ux(r),u=Yx(r),l=Ux(o),s=Yx(o),c=a*Ux(e),f=a*Yx(e),h=l*Ux(i),p=l*Yx(i),d=2*Eu(Xx(Au(o-r)+a*l*Au(i-e))),_=Yx(d),v=d?function(t){var n=Yx(t*=d)/_,e=Yx(d-t)/_,r=e*c+n*h,i=e*f+n*p,o=e*u+n*s;return[Ox(i,r)*Rx,Ox(o,Xx(r*r+i*i))*Rx]}:function(){return[e*Rx,r*Rx]};return v.distance=d,v},Lb=function(t){return t},qb=Gm(),Fb=Gm(),Ob={point:zu,lineStart:zu,lineEnd:zu,polygonStart:function(){Ob.lineStart=Al,Ob.lineEnd=Pl},polygonEnd:function(){Ob.lineStart=Ob.lineEnd=Ob.point=zu,qb.add(qx(Fb)),Fb.reset()},result:function(){var t=qb/2;return qb.reset(),t}},Ub=1/0,Db=Ub,Bb=-Ub,jb=Bb,Ib={point:Rl,lineStart:zu,lineEnd:zu,polygonStart:zu,polygonEnd:zu,result:function(){var t=[[Ub,Db],[Bb,jb]];return Bb=jb=-(Db=Ub=1/0),t}},Yb=0,Hb=0,Xb=0,Vb=0,Wb=0,Gb=0,$b=0,Zb=0,Jb=0,Qb={point:Ll,lineStart:ql,lineEnd:Ul,polygonStart:function(){Qb.lineStart=Dl,Qb.lineEnd=Bl},polygonEnd:function(){Qb.point=Ll,Qb.lineStart=ql,Qb.lineEnd=Ul},result:function(){var t=Jb?[$b/Jb,Zb/Jb]:Gb?[Vb/Gb,Wb/Gb]:Xb?[Yb/Xb,Hb/Xb]:[NaN,NaN];return Yb=Hb=Xb=Vb=Wb=Gb=$b=Zb=Jb=0,t}};Yl.prototype={_radius:4.5,pointRadius:function(t){return this._radius=t,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._context.closePath(),this._point=NaN},point:function(t,n){switch(this._point){case 0:this._context.moveTo(t,n),this._point=1;break;case 1:this._context.lineTo(t,n);break;default:this._context.moveTo(t+this._radius,n),this._context.arc(t,n,this._radius,0,Px)}},result:zu},Hl.prototype={_circle:Xl(4.5),pointRadius:function(t){return this._circle=Xl(t),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._string.push("Z"),this._point=NaN},point:function(t,n){switch(this._point){case 0:this._string.push("M",t,",",n),this._point=1;break;case 1:this._string.push("L",t,",",n);break;default:this._string.push("M",t,",",n,this._circle)}},result:function(){if(this._string.length){var t=this._string.join("");return this._string=[],t}}};var Kb=function(t,n){function e(t){return t&&("function"==typeof o&&i.pointRadius(+o.apply(this,arguments)),$x(t,r(i))),i.result()}var r,i,o=4.5;return e.area=function(t){return $x(t,r(Ob)),Ob.result()},e.bounds=function(t){return $x(t,r(Ib)),Ib.result()},e.centroid=function(t){return $x(t,r(Qb)),Qb.result()},e.projection=function(n){return arguments.length?(r=null==n?(t=null,Lb):(t=n).stream,e):t},e.context=function(t){return arguments.length?(i=null==t?(n=null,new Hl):new Yl(n=t),"function"!=typeof o&&i.pointRadius(o),e):n},e.pointRadius=function(t){return arguments.length?(o="function"==typeof t?t:(i.pointRadius(+t),+t),e):o},e.projection(t).context(n)},tw=Gm(),nw=function(t,n){var e=n[0],r=n[1],i=[Yx(e),-Ux(e),0],o=0,a=0;tw.reset();for(var u=0,l=t.length;u<l;++u)if(c=(s=t[u]).length)for(var s,c,f=s[c-1],h=f[0],p=f[1]/2+Cx,d=Yx(p),_=Ux(p),v=0;v<c;++v,h=g,d=x,_=b,f=y){var y=s[v],g=y[0],m=y[1]/2+Cx,x=Yx(m),b=Ux(m),w=g-h,M=w>=0?1:-1,k=M*w,S=k>Ax,T=d*x;if(tw.add(Ox(T*M*Yx(k),_*b+T*Ux(k))),o+=S?w+M*Px:w,S^h>=e^g>=e){var N=ju(Du(f),Du(y));Hu(N);var E=ju(i,N);Hu(E);var A=(S^w>=0?-1:1)*Eu(E[2]);(r>A||r===A&&(N[0]||N[1]))&&(a+=S^w>=0?1:-1)}}return(o<-Nx||o<Nx&&tw<-Nx)^1&a},ew=function(t,n,e,r){return function(i,o){function a(n,e){var r=i(n,e);t(n=r[0],e=r[1])&&o.point(n,e)}function u(t,n){var e=i(t,n);v.point(e[0],e[1])}function l(){b.point=u,v.lineStart()}function s(){b.point=a,v.lineEnd()}function c(t,n){_.push([t,n]);var e=i(t,n);m.point(e[0],e[1])}function f(){m.lineStart(),_=[]}function h(){c(_[0][0],_[0][1]),m.lineEnd();var t,n,e,r,i=m.clean(),a=g.result(),u=a.length;if(_.pop(),p.push(_),_=null,u)if(1&i){if(e=a[0],(n=e.length-1)>0){for(x||(o.polygonStart(),x=!0),o.lineStart(),t=0;t<n;++t)o.point((r=e[t])[0],r[1]);o.lineEnd()}}else u>1&&2&i&&a.push(a.pop().concat(a.shift())),d.push(a.filter(Vl))}var p,d,_,v=n(o),y=i.invert(r[0],r[1]),g=xb(),m=n(g),x=!1,b={point:a,lineStart:l,lineEnd:s,polygonStart:function(){b.point=c,b.lineStart=f,b.lineEnd=h,d=[],p=[]},polygonEnd:function(){b.point=a,b.lineStart=l,b.lineEnd=s,d=Js(d);var t=nw(p,y);d.length?(x||(o.polygonStart(),x=!0),Mb(d,Wl,t,e,o)):t&&(x||(o.polygonStart(),x=!0),o.lineStart(),e(null,null,1,o),o.lineEnd()),x&&(o.polygonEnd(),x=!1),d=p=null},sphere:function(){o.polygonStart(),o.lineStart(),e(null,null,1,o),o.lineEnd(),o.polygonEnd()}};return b}},rw=ew(function(){return!0},Gl,Zl,[-Ax,-zx]),iw=function(t,n){function e(e,r,i,o){vl(o,t,n,i,e,r)}function r(t,n){return Ux(t)*Ux(n)>u}function i(t){var n,e,i,u,c;return{lineStart:function(){u=i=!1,c=1},point:function(f,h){var p,d=[f,h],_=r(f,h),v=l?_?0:a(f,h):_?a(f+(f<0?Ax:-Ax),h):0;if(!n&&(u=i=_)&&t.lineStart(),_!==i&&(p=o(n,d),(wb(n,p)||wb(d,p))&&(d[0]+=Nx,d[1]+=Nx,_=r(d[0],d[1]))),_!==i)c=0,_?(t.lineStart(),p=o(d,n),t.point(p[0],p[1])):(p=o(n,d),t.point(p[0],p[1]),t.lineEnd()),n=p;else if(s&&n&&l^_){var y;v&e||!(y=o(d,n,!0))||(c=0,l?(t.lineStart(),t.point(y[0][0],y[0][1]),t.point(y[1][0],y[1][1]),t.lineEnd()):(t.point(y[1][0],y[1][1]),t.lineEnd(),t.lineStart(),t.point(y[0][0],y[0][1])))}!_||n&&wb(n,d)||t.point(d[0],d[1]),n=d,i=_,e=v},lineEnd:function(){i&&t.lineEnd(),n=null},clean:function(){return c|(u&&i)<<1}}}function o(t,n,e){var r=Du(t),i=Du(n),o=[1,0,0],a=ju(r,i),l=Bu(a,a),s=a[0],c=l-s*s;if(!c)return!e&&t;var f=u*l/c,h=-u*s/c,p=ju(o,a),d=Yu(o,f),_=Yu(a,h);Iu(d,_);var v=p,y=Bu(d,v),g=Bu(v,v),m=y*y-g*(Bu(d,d)-1);if(!(m<0)){var x=Xx(m),b=Yu(v,(-y-x)/g);if(Iu(b,d),b=Uu(b),!e)return b;var w,M=t[0],k=n[0],S=t[1],T=n[1];k<M&&(w=M,M=k,k=w);var N=k-M,E=qx(N-Ax)<Nx,A=E||N<Nx;if(!E&&T<S&&(w=S,S=T,T=w),A?E?S+T>0^b[1]<(qx(b[0]-M)<Nx?S:T):S<=b[1]&&b[1]<=T:N>Ax^(M<=b[0]&&b[0]<=k)){var z=Yu(v,(-y+x)/g);return Iu(z,d),[b,Uu(z)]}}}function a(n,e){var r=l?t:Ax-t,i=0;return n<-r?i|=1:n>r&&(i|=2),e<-r?i|=4:e>r&&(i|=8),i}var u=Ux(t),l=u>0,s=qx(u)>Nx;return ew(r,i,e,l?[0,-t]:[-Ax,t-Ax])},ow=function(t){return{stream:Jl(t)}};Ql.prototype={constructor:Ql,point:function(t,n){this.stream.point(t,n)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};var aw=16,uw=Ux(30*Lx),lw=function(t,n){return+n?es(t,n):ns(t)},sw=Jl({point:function(t,n){this.stream.point(t*Lx,n*Lx)}}),cw=function(){return os(us).scale(155.424).center([0,33.6442])},fw=function(){return cw().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])},hw=function(){function t(t){var n=t[0],e=t[1];return u=null,i.point(n,e),u||(o.point(n,e),u)||(a.point(n,e),u)}function n(){return e=r=null,t}var e,r,i,o,a,u,l=fw(),s=cw().rotate([154,0]).center([-2,58.5]).parallels([55,65]),c=cw().rotate([157,0]).center([-3,19.9]).parallels([8,18]),f={point:function(t,n){u=[t,n]}};return t.invert=function(t){var n=l.scale(),e=l.translate(),r=(t[0]-e[0])/n,i=(t[1]-e[1])/n;return(i>=.12&&i<.234&&r>=-.425&&r<-.214?s:i>=.166&&i<.234&&r>=-.214&&r<-.115?c:l).invert(t)},t.stream=function(t){return e&&r===t?e:e=ls([l.stream(r=t),s.stream(t),c.stream(t)])},t.precision=function(t){return arguments.length?(l.precision(t),s.precision(t),c.precision(t),n()):l.precision()},t.scale=function(n){return arguments.length?(l.scale(n),s.scale(.35*n),c.scale(n),t.translate(l.translate())):l.scale()},t.translate=function(t){if(!arguments.length)return l.translate();var e=l.scale(),r=+t[0],u=+t[1];return i=l.translate(t).clipExtent([[r-.455*e,u-.238*e],[r+.455*e,u+.238*e]]).stream(f),o=s.translate([r-.307*e,u+.201*e]).clipExtent([[r-.425*e+Nx,u+.12*e+Nx],[r-.214*e-Nx,u+.234*e-Nx]]).stream(f),a=c.translate([r-.205*e,u+.212*e]).clipExtent([[r-.214*e+Nx,u+.166*e+Nx],[r-.115*e-Nx,u+.234*e-Nx]]).stream(f),n()},t.fitExtent=function(n,e){return Kl(t,n,e)},t.fitSize=function(n,e){return ts(t,n,e)},t.scale(1070)},pw=ss(function(t){return Xx(2/(1+t))});pw.invert=cs(function(t){return 2*Eu(t/2)});var dw=function(){return rs(pw).scale(124.75).clipAngle(179.999)},_w=ss(function(t){return(t=Nu(t))&&t/Yx(t)});_w.invert=cs(function(t){return t});var vw=function(){return rs(_w).scale(79.4188).clipAngle(179.999)};fs.invert=function(t,n){return[t,2*Fx(Bx(n))-zx]};var yw=function(){return hs(fs).scale(961/Px)},gw=function(){return os(ds).scale(109.5).parallels([30,30])};_s.invert=_s;var mw=function(){return rs(_s).scale(152.63)},xw=function(){return os(vs).scale(131.154).center([0,13.9389])};ys.invert=cs(Fx);var bw=function(){return rs(ys).scale(144.049).clipAngle(60)},ww=function(){function t(){return i=o=null,a}var n,e,r,i,o,a,u=1,l=0,s=0,c=1,f=1,h=Lb,p=null,d=Lb;return a={stream:function(t){return i&&o===t?i:i=h(d(o=t))},clipExtent:function(i){return arguments.length?(d=null==i?(p=n=e=r=null,Lb):xl(p=+i[0][0],n=+i[0][1],e=+i[1][0],r=+i[1][1]),t()):null==p?null:[[p,n],[e,r]]},scale:function(n){return arguments.length?(h=gs((u=+n)*c,u*f,l,s),t()):u},translate:function(n){return arguments.length?(h=gs(u*c,u*f,l=+n[0],s=+n[1]),t()):[l,s]},reflectX:function(n){return arguments.length?(h=gs(u*(c=n?-1:1),u*f,l,s),t()):c<0},reflectY:function(n){return arguments.length?(h=gs(u*c,u*(f=n?-1:1),l,s),t()):f<0},fitExtent:function(t,n){return Kl(a,t,n)},fitSize:function(t,n){return ts(a,t,n)}}};ms.invert=cs(Eu);var Mw=function(){return rs(ms).scale(249.5).clipAngle(90+Nx)};xs.invert=cs(function(t){return 2*Fx(t)});var kw=function(){return rs(xs).scale(250).clipAngle(142)};bs.invert=function(t,n){return[-n,2*Fx(Bx(t))-zx]};var Sw=function(){var t=hs(bs),n=t.center,e=t.rotate;return t.center=function(t){return arguments.length?n([-t[1],t[0]]):(t=n(),[t[1],-t[0]])},t.rotate=function(t){return arguments.length?e([t[0],t[1],t.length>2?t[2]+90:90]):(t=e(),[t[0],t[1],t[2]-90])},e([0,0,90]).scale(159.155)};t.version=ws,t.bisect=Ts,t.bisectRight=Ts,t.bisectLeft=Ns,t.ascending=Ms,t.bisector=ks,t.descending=Es,t.deviation=Cs,t.extent=Ps,t.histogram=Hs,t.thresholdFreedmanDiaconis=Vs,t.thresholdScott=Ws,t.thresholdSturges=Ys,t.max=Gs,t.mean=$s,t.median=Zs,t.merge=Js,t.min=Qs,t.pairs=Ks,t.permute=tc,t.quantile=Xs,t.range=Us,t.scan=nc,t.shuffle=ec,t.sum=rc,t.ticks=Is,t.tickStep=e,t.transpose=ic,t.variance=zs,t.zip=oc,t.entries=fc,t.keys=sc,t.values=cc,t.map=o,t.set=f,t.nest=uc,t.randomUniform=hc,t.randomNormal=pc,t.randomLogNormal=dc,t.randomBates=vc,t.randomIrwinHall=_c,t.randomExponential=yc,t.easeLinear=h,t.easeQuad=_,t.easeQuadIn=p,t.easeQuadOut=d,t.easeQuadInOut=_,t.easeCubic=g,t.easeCubicIn=v,t.easeCubicOut=y,t.easeCubicInOut=g,t.easePoly=bc,t.easePolyIn=mc,t.easePolyOut=xc,t.easePolyInOut=bc,t.easeSin=b,t.easeSinIn=m,t.easeSinOut=x,t.easeSinInOut=b,t.easeExp=k,t.easeExpIn=w,t.easeExpOut=M,t.easeExpInOut=k,t.easeCircle=N,t.easeCircleIn=S,t.easeCircleOut=T,t.easeCircleInOut=N,t.easeBounce=A,t.easeBounceIn=E,t.easeBounceOut=A,t.easeBounceInOut=z,t.easeBack=Oc,t.easeBackIn=qc,t.easeBackOut=Fc,t.easeBackInOut=Oc,t.easeElastic=Ic,t.easeElasticIn=jc,t.easeElasticOut=Ic,t.easeElasticInOut=Yc,t.polygonArea=Hc,t.polygonCentroid=Xc,t.polygonHull=Wc,t.polygonContains=Gc,t.polygonLength=$c,t.path=L,t.quadtree=B,t.queue=$,t.arc=wf,t.area=Sf,t.line=kf,t.pie=Ef,t.radialArea=Cf,t.radialLine=zf,t.symbol=Jf,t.symbols=Zf,t.symbolCircle=Pf,t.symbolCross=Rf,t.symbolDiamond=Ff,t.symbolSquare=If,t.symbolStar=jf,t.symbolTriangle=Hf,t.symbolWye=$f,t.curveBasisClosed=th,t.curveBasisOpen=nh,t.curveBasis=Kf,t.curveBundle=eh,t.curveCardinalClosed=ih,t.curveCardinalOpen=oh,t.curveCardinal=rh,t.curveCatmullRomClosed=uh,t.curveCatmullRomOpen=lh,t.curveCatmullRom=ah,t.curveLinearClosed=sh,t.curveLinear=Mf,t.curveMonotoneX=Ct,t.curveMonotoneY=Pt,t.curveNatural=ch,t.curveStep=fh,t.curveStepAfter=Ot,t.curveStepBefore=Ft,t.stack=_h,t.stackOffsetExpand=vh,t.stackOffsetNone=ph,t.stackOffsetSilhouette=yh,t.stackOffsetWiggle=gh,t.stackOrderAscending=mh,t.stackOrderDescending=xh,t.stackOrderInsideOut=bh,t.stackOrderNone=dh,t.stackOrderReverse=wh,t.color=It,t.rgb=Vt,t.hsl=Zt,t.lab=tn,t.hcl=ln,t.cubehelix=fn,t.interpolate=mp,t.interpolateArray=hp,t.interpolateDate=pp,t.interpolateNumber=dp,t.interpolateObject=_p,t.interpolateRound=xp,t.interpolateString=gp,t.interpolateTransformCss=kp,t.interpolateTransformSvg=Sp,t.interpolateZoom=zp,t.interpolateRgb=sp,t.interpolateRgbBasis=cp,t.interpolateRgbBasisClosed=fp,t.interpolateHsl=Cp,t.interpolateHslLong=Pp,t.interpolateLab=An,t.interpolateHcl=Rp,t.interpolateHclLong=Lp,t.interpolateCubehelix=qp,t.interpolateCubehelixLong=Fp,t.interpolateBasis=ap,t.interpolateBasisClosed=up,t.quantize=Op,t.dispatch=Pn,t.dsvFormat=jp,t.csvParse=Yp,t.csvParseRows=Hp,t.csvFormat=Xp,t.csvFormatRows=Vp,t.tsvParse=Gp,t.tsvParseRows=$p,t.tsvFormat=Zp,t.tsvFormatRows=Jp,t.request=Qp,t.html=td,t.json=nd,t.text=ed,t.xml=rd,t.csv=od,t.tsv=ad,t.now=Yn,t.timer=Vn,t.timerFlush=Wn,t.timeout=vd,t.interval=yd,t.timeInterval=Qn,t.timeMillisecond=xd,t.timeMilliseconds=bd,t.timeSecond=Nd,t.timeSeconds=Ed,t.timeMinute=Ad,t.timeMinutes=zd,t.timeHour=Cd,t.timeHours=Pd,t.timeDay=Rd,t.timeDays=Ld,t.timeWeek=qd,t.timeWeeks=Id,t.timeSunday=qd,t.timeSundays=Id,t.timeMonday=Fd,t.timeMondays=Yd,t.timeTuesday=Od,t.timeTuesdays=Hd,t.timeWednesday=Ud,t.timeWednesdays=Xd,t.timeThursday=Dd,t.timeThursdays=Vd,t.timeFriday=Bd,t.timeFridays=Wd,t.timeSaturday=jd,t.timeSaturdays=Gd,t.timeMonth=$d,t.timeMonths=Zd,t.timeYear=Jd,t.timeYears=Qd,t.utcMillisecond=xd,t.utcMilliseconds=bd,t.utcSecond=Nd,t.utcSeconds=Ed,t.utcMinute=Kd,t.utcMinutes=t_,t.utcHour=n_,t.utcHours=e_,t.utcDay=r_,t.utcDays=i_,t.utcWeek=o_,t.utcWeeks=h_,t.utcSunday=o_,t.utcSundays=h_,t.utcMonday=a_,t.utcMondays=p_,t.utcTuesday=u_,t.utcTuesdays=d_,t.utcWednesday=l_,t.utcWednesdays=__,t.utcThursday=s_,t.utcThursdays=v_,t.utcFriday=c_,t.utcFridays=y_,t.utcSaturday=f_,t.utcSaturdays=g_,t.utcMonth=m_,t.utcMonths=x_,t.utcYear=b_,t.utcYears=M_,t.formatLocale=q_,t.formatDefaultLocale=re,t.formatSpecifier=P_,t.precisionFixed=O_,t.precisionPrefix=U_,t.precisionRound=D_,t.isoFormat=X_,t.isoParse=V_,t.timeFormatLocale=ue,t.timeFormatDefaultLocale=nr,t.scaleBand=or,t.scalePoint=ur,t.scaleIdentity=yr,t.scaleLinear=vr,t.scaleLog=kr,t.scaleOrdinal=ir,t.scaleImplicit=Z_,t.scalePow=Tr,t.scaleSqrt=Nr,t.scaleQuantile=Er,t.scaleQuantize=Ar,t.scaleThreshold=zr,t.scaleTime=sv,t.scaleUtc=cv,t.schemeCategory10=hv,t.schemeCategory20b=pv,t.schemeCategory20c=dv,t.schemeCategory20=_v,t.scaleSequential=qr,t.interpolateCubehelixDefault=vv,t.interpolateRainbow=xv,t.interpolateWarm=yv,t.interpolateCool=gv,t.interpolateViridis=bv,t.interpolateMagma=wv,t.interpolateInferno=Mv,t.interpolatePlasma=kv,t.creator=Ev,t.customEvent=Xr,t.local=Ur,t.matcher=Rv,t.mouse=Dv,t.namespace=Nv,t.namespaces=Tv,t.select=by,t.selectAll=wy,t.selection=Pi,t.selector=Bv,t.selectorAll=Iv,t.touch=My,t.touches=ky,t.window=uy,t.active=ug,t.interrupt=qy,t.transition=co,t.axisTop=mo,t.axisRight=xo,t.axisBottom=bo,t.axisLeft=wo,t.cluster=_g,t.hierarchy=Co,t.pack=zg,t.packSiblings=Eg,t.packEnclose=Ng,t.partition=Rg,t.stratify=Og,t.tree=Ug,t.treemap=Ig,t.treemapBinary=Yg,t.treemapDice=Pg,t.treemapSlice=Dg,t.treemapSliceDice=Hg,t.treemapSquarify=jg,t.treemapResquarify=Xg,t.forceCenter=Vg,t.forceCollide=$g,t.forceLink=Zg,t.forceManyBody=tm,t.forceSimulation=Kg,t.forceX=nm,t.forceY=em,t.drag=am,t.dragDisable=im,t.dragEnable=ma,t.voronoi=ym,t.zoom=bm,t.zoomIdentity=mm,t.zoomTransform=iu,t.brush=Om,t.brushX=vu,t.brushY=yu,t.brushSelection=_u,t.chord=Hm,t.ribbon=Wm,t.geoAlbers=fw,t.geoAlbersUsa=hw,t.geoArea=Kx,t.geoAzimuthalEqualArea=dw,t.geoAzimuthalEqualAreaRaw=pw,t.geoAzimuthalEquidistant=vw,t.geoAzimuthalEquidistantRaw=_w,t.geoBounds=eb,t.geoCentroid=ib,t.geoCircle=mb,t.geoClipExtent=Tb,t.geoConicConformal=gw,t.geoConicConformalRaw=ds,t.geoConicEqualArea=cw,t.geoConicEqualAreaRaw=us,t.geoConicEquidistant=xw,t.geoConicEquidistantRaw=vs,t.geoDistance=Pb,t.geoEquirectangular=mw,t.geoEquirectangularRaw=_s,t.geoGnomonic=bw,t.geoGnomonicRaw=ys,t.geoGraticule=Nl,t.geoGraticule10=El,t.geoIdentity=ww,t.geoInterpolate=Rb,t.geoLength=Ab,t.geoMercator=yw,t.geoMercatorRaw=fs,t.geoOrthographic=Mw,t.geoOrthographicRaw=ms,t.geoPath=Kb,t.geoProjection=rs,t.geoProjectionMutator=is,t.geoRotation=gb,t.geoStereographic=kw,t.geoStereographicRaw=xs,t.geoStream=$x,t.geoTransform=ow,t.geoTransverseMercator=Sw,t.geoTransverseMercatorRaw=bs,Object.defineProperty(t,"__esModule",{value:!0})})},{}],2:[function(c,d,g){"use strict";var e=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function b(a,c){if(!(a instanceof c)){throw new TypeError("Cannot call a class as a function");}}var a=c("./ssv_payload.js");var f=function(){function c(d,a){b(this,c);this.uuid=d;this.size=a.size;this.n_frames=a.n_frames;this.urls=a.urls;this.length=a.urls.length;this.loaded=new Map();this.pending=new Map();}e(c,[{key:"chunk_index",value:function h(a){return Math.min(Math.floor(a/this.size),this.length-1);}},{key:"get",value:function f(a){if(!this.loaded.has(a)){var b=this;var c=new Promise(function(e,d){b.pending.set(a,{resolve:e,reject:d});var c=document.createElement("script");c.src=b.urls[a]+"?"+b.uuid;c.onload=function(){c.remove();};c.onerror=function(){c.remove();b.pending.delete(a);b.loaded.delete(a);d(new Error("ssv chunk '"+b.urls[a]+"' could not be loaded"));};document.head.appendChild(c);});this.loaded.set(a,c);}return this.loaded.get(a);}},{key:"prefetch",value:function d(a){if(a>=0&&a<this.length){this.get(a).catch(function(){});}}},{key:"evict",value:function g(b){var a=this;Array.from(this.loaded.keys()).forEach(function(c){if(b.indexOf(c)<0&&!a.pending.has(c)){a.loaded.delete(c);}});}},{key:"add",value:function i(d,b,c){var e=this.pending.get(d);if(!e){return;}this.pending.delete(d);if(c){b=a.resolve(b,a.decode_base64(c));}e.resolve(b);}}]);return c;}();d.exports={ChunkLoader:f};},{"./ssv_payload.js":10}],3:[function(f,i,k){"use strict";var e=typeof Symbol==="function"&&typeof Symbol.iterator==="symbol"?function(a){return typeof a;}:function(a){return a&&typeof Symbol==="function"&&a.constructor===Symbol&&a!==Symbol.prototype?"symbol":typeof a;};var j=f("./ssv_inflate.js");var g=f("./ssv_payload.js");function c(b){var a=document.getElementById(b);if(!a){throw new Error("ssv payload block '"+b+"' not found");}return a.textContent;}function b(d,a){var c=new Uint8Array(g.decode_base64(d));if(typeof DecompressionStream!=="undefined"){var e=new Blob([c]).stream().pipeThrough(new DecompressionStream(a));return new Response(e).arrayBuffer();}return Promise.resolve(j.inflate(c,a).buffer);}function a(b){if(Array.isArray(b)){for(var c=0; c<b.length; c++){if(b[c]===null){b[c]=NaN;}else if(e(b[c])==="object"){a(b[c]);}}}else{for(var d in b){if(b[d]!==null&&e(b[d])==="object"){a(b[d]);}}}return b;}function d(c){var b=JSON.parse(c);return b!==null&&(typeof b==="undefined"?"undefined":e(b))==="object"?a(b):b;}function h(e,a){var f=[b(c(e.id),e.format)];if(a){f.push(b(c(a),e.format));}return Promise.all(f).then(function(c){var b=d(new TextDecoder().decode(c[0]));if(a){b.element_data=g.resolve(b.element_data,c[1]);}return b;});}i.exports={load_compressed:h,decompress:b,parse:d};},{"./ssv_inflate.js":7,"./ssv_payload.js":10}],4:[function(c,e,h){"use strict";var f=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function d(a,b){if(!(a instanceof b)){throw new TypeError("Cannot call a class as a function");}}var b=c("./ssv_utilities.js");var a=c("d3");var g=function(){function c(g,e,b,f,a){d(this,c);this.uuid=uuid;this.title=g;this.x_series=e;this.x_series_unit=b;this.update_callback=f;this.context=a;this.sels=a.sels;this.play_enabled=false;this.pan_zoom_enabled=false;this.slider_moving=false;this.current_x=0;this.target_x=0;this.play_speed=1;this.max_speed=8;this.min_speed=1;this.speed_mult=2;this.bbox_zoom=null;this.initialize();}f(c,[{key:"render_slider",value:function l(){var h=this.sels.controls.modebar.node().getBoundingClientRect();var i=h.height;var e=2;var f=8;var g=h.width-this.sels.controls.modebar_group.node().getBoundingClientRect().width;var b=a.scaleLinear().domain([0,this.x_series.length-1]).range([0,g-2*(e+f)]).clamp(true);this.sels.controls.modebar_slider.selectAll("svg").remove();var c=this.sels.controls.modebar_slider.append("svg").attr("width",g).append("g").attr("transform","translate("+(f+e).toString()+","+(i/2+e).toString()+")");var d=this;c.append("line").attr("class","slider-track").attr("x1",b.range()[0]).attr("x2",b.range()[1]).select(function(){return this.parentNode.appendChild(this.cloneNode(true));}).attr("class","slider-inset").select(function(){return this.parentNode.appendChild(this.cloneNode(true));}).attr("class","slider-overlay").call(a.drag().on("start.interrupt",function(){c.interrupt();}).on("start drag",function(){d.target_x=Math.round(b.invert(a.event.x));d.move(250);}));var j=c.append("circle").attr("class","slider-handle").attr("r",f);this.slider_dispatch=a.dispatch("change");this.slider_dispatch.on("change",function(){j.attr("cx",b(d.target_x));});}},{key:"play",value:function n(){if(this.play_enabled){this.play_enabled=false;this.sels.controls.pause_icon.attr('style','display:none');this.sels.controls.play_icon.attr('style','');}else{this.play_enabled=true;this.sels.controls.pause_icon.attr('style','');this.sels.controls.play_icon.attr('style','display:none');if(this.current_x>=this.x_series.length-1){this.current_x=0;}this.x_series_forward();}}},{key:"toggle_pan_zoom",value:function h(){if(this.pan_zoom_enabled){this.pan_zoom_enabled=false;this.sels.controls.pan_zoom_disabled_icon.attr('style','');this.sels.controls.pan_zoom_enabled_icon.attr('style','display:none');}else{this.pan_zoom_enabled=true;this.sels.controls.pan_zoom_disabled_icon.attr('style','display:none');this.sels.controls.pan_zoom_enabled_icon.attr('style','');}}},{key:"move",value:function o(b){this.slider_dispatch.call("change");this.current_x=this.target_x;if(this.slider_moving)return;this.slider_moving=true;this.update_callback.call(this.context,this.current_x,b);this.set_x_series_display(this.current_x);var c=this;a.timer(function(){c.slider_moving=false;},100);}},{key:"x_series_forward",value:function e(){var a=this;window.setTimeout(function(){if(a.play_enabled&&a.current_x<a.x_series.length-1){a.target_x=a.current_x+1;a.move(250);if(a.current_x<a.x_series.length-1){a.x_series_forward();}else{a.play();}}},1000/this.play_speed);}},{key:"set_x_series_display",value:function k(a){this.sels.title.x_val.html(b.num_format(this.x_series[a]));}},{key:"initialize",value:function q(){this.render_slider();this.update_viewbox();this.sels.title.title.html(this.title);this.set_x_series_display(0);this.sels.title.x_val_unit.html(this.x_series_unit);var b=this;a.select(window).on('resize',function(){b.render_slider();b.update_viewbox();});this.sels.controls.play_btn.attr('ssv-id',this.uuid).on("click",function(){b.play();});this.sels.controls.pan_zoom_btn.attr('ssv-id',this.uuid).on("click",function(){b.toggle_pan_zoom();});this.sels.controls.speed_btn.attr('ssv-id',this.uuid).on("click",function(){if(b.play_speed==b.max_speed){b.play_speed=b.min_speed;}else{b.play_speed*=b.speed_mult;}var a=b.play_speed.toString();b.sels.controls.speed_btn.select('span').html("<b>"+a+'x</b>');});this.initialize_pan_zoom();this.sels.controls.save_btn.attr('ssv-id',this.uuid).on("click",function(){b.to_image();});this.sels.controls.vid_btn.attr('ssv-id',this.uuid).on("click",function(){b.to_video();});}},{key:"initialize_pan_zoom",value:function p(){var b=this.sels.containers.info_layer.node().getBBox();var d=[b.x,b.y];var c=this;var e=a.zoom().scaleExtent([1,8]).on('zoom',function(){var e=a.event.transform.k;var g=0;var f=0;if(b.width*e<=c.bbox_zoom.width){g=Math.max(a.event.transform.x,c.bbox_zoom.x-b.x-d[0]*(e-1));g=Math.min(g,c.bbox_zoom.width-(b.x-c.bbox_zoom.x+d[0]*(e-1))-b.width*e);}else{g=Math.max(a.event.transform.x,c.bbox_zoom.x-b.x-(b.width*e-c.bbox_zoom.width)-d[0]*(e-1));g=Math.min(g,b.x-d[0]*(e-1)-c.bbox_zoom.x);}if(b.height*e<=c.bbox_zoom.height){f=Math.max(a.event.transform.y,c.bbox_zoom.y-b.y-d[1]*(e-1));f=Math.min(f,c.bbox_zoom.height-(b.y-c.bbox_zoom.y+d[1]*(e-1))-b.height*e);}else{f=Math.max(a.event.transform.y,c.bbox_zoom.y-b.y-(b.height*e-c.bbox_zoom.height)-d[1]*(e-1));f=Math.min(f,b.y-d[1]*(e-1)-c.bbox_zoom.y);}a.event.transform.x=g;a.event.transform.y=f;if(this.pan_zoom_enabled){c.sels.containers.info_layer.attr("transform",'translate('+[g,f]+')scale('+e+')');}});this.sels.containers.svg.call(e);this.sels.controls.center_btn.attr('ssv-id',this.uuid).on("click",function(){c.sels.containers.info_layer.attr("transform",'translate('+[b.x,b.y]+')scale(1)');e.transform(c.sels.containers.svg,a.zoomIdentity);});}},{key:"update_viewbox",value:function g(){var d=this.sels.containers.svg_container.node().getBoundingClientRect();var a=this.sels.containers.svg.attr('viewBox').split(' ').map(function(a){return parseFloat(a);});var b=0.05*a[3];var e=a[3]/d.height;var c=d.width*e-a[2];a[2]=a[2]+c;a[0]=a[0]-c/2;this.sels.containers.svg.attr('viewBox',a.join(' '));this.sels.containers.zoom_layer.attr('x',a[0]+b).attr('width',a[2]-2*b).attr('y',a[1]+b).attr('height',a[3]-2*b).style('fill','none');this.bbox_zoom=this.sels.containers.zoom_layer.node().getBBox();}},{key:"render_slice",value:function m(g,f){var j='<?xml version="1.0" standalone="no"?><!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" '+'"http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">';var i=new XMLSerializer().serializeToString(this.sels.containers.svg.node());var k=new Blob([j+i],{type:'image/svg+xml;charset=utf-8'});var h=window.URL.createObjectURL(k);var a=this.sels.containers.svg.node().getBoundingClientRect();var d=this.sels.containers.img.attr('width',a.width).attr('height',a.height).node();var c=4;var b=this.sels.containers.render.node();b.width=a.width*c;b.height=a.height*c;var e=b.getContext('2d');e.fillStyle='white';e.fillRect(0,0,a.width*c,a.height*c);d.onload=function(){e.drawImage(d,0,0);if(g=="image"){f(b.toDataURL());}else if(g=="video"){f(b.toDataURL('image/webp'));}};d.src=h;}},{key:"to_image",value:function j(){var a=this;var c=function c(f){var d=document.createElement("a");var e=b.num_format(a.x_series[a.current_x])+"_"+a.x_series_unit;d.download=a.title.replace(" ","_")+"_"+e+".jpeg";d.href=f;d.click();};this.render_slice("image",c);}},{key:"to_video",value:function i(){var a=this;a.frames=[];var b=0;a.sels.containers.progress.style("display","table");a.sels.containers.progress.select(".progress-bar").html("Generating Video");var d=function d(b){a.frames.push(b);};var c=false;function e(){c=b>a.frames.length;if(c){return;}a.target_x=b;a.move(0);a.set_x_series_display(b);a.render_slice("video",d);c=true;b+=1;}var f=setInterval(function(){if(b<a.x_series.length){e();var g=Math.ceil(b/a.x_series.length*100).toString()+"%";a.sels.containers.progress.select(".progress-bar").style("width",g);}else{var h=Whammy.fromImageArray(a.frames,15);var d=window.URL.createObjectURL(h);var c=document.createElement("a");c.download=a.title.replace(" ","_")+".webm";c.href=d;c.click();clearInterval(f);a.sels.containers.progress.select(".progress-bar").style("width",0);a.sels.containers.progress.style("display","none");}},100);}}]);return c;}();e.exports=function(){for(var c=arguments.length,b=Array(c),a=0; a<c; a++){b[a]=arguments[a];}return new (Function.prototype.bind.apply(g,[null].concat(b)))();};},{"./ssv_utilities.js":14,"d3":1}],5:[function(i,l,u){"use strict";var f=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function c(b,a){if(!b){throw new ReferenceError("this hasn't been initialised - super() hasn't been called");}return a&&(typeof a==="object"||typeof a==="function")?a:b;}function d(b,a){if(typeof a!=="function"&&a!==null){throw new TypeError("Super expression must either be null or a function, not "+typeof a);}b.prototype=Object.create(a&&a.prototype,{constructor:{value:b,enumerable:false,writable:true,configurable:true}});if(a)Object.setPrototypeOf?Object.setPrototypeOf(b,a):b.__proto__=a;}function b(a,c){if(!(a instanceof c)){throw new TypeError("Cannot call a class as a function");}}var e=i("./ssv_renderers.js");var h=i("./ssv_utilities.js");var a=i("d3");var g=function(){function c(d,e,i,j,f,g,h){b(this,c);this.uuid=d;this.selectors=[];if(e){this.ids=e;this.selectors=e.map(function(b){return a.select("#"+d+" #"+b);});}this.update_functions=[];f==""?this.report_sel=false:this.report_sel=a.select("#"+d+" #"+f);this.popover_div_sel=a.select("#"+d+" .popover-spacer");this.description=i;this.conditions=j;this.popover=g;this.font_scale=h;this.patterns_initialized=false;this.gen_color_scales();this.initialize();}f(c,[{key:"gen_color_scales",value:function i(){this.conditions.map(function(b){if('color_scale'in b&&'color_levels'in b&&b.color_indices){var d=b.color_scale;b.color_scale=function(a){return d[a];};}else if('color_scale'in b&&'color_levels'in b){var e=b.color_scale;var c=b.color_levels;b.color_scale=a.scaleQuantile().domain([a.min(c),a.max(c)]).range(e);};});}},{key:"initialize",value:function h(){if(this.report_sel&&!this.report_sel.empty()){console.log(this.report_sel.node(),this.font_scale,this.conditions,this.description);this.update_functions.push(e.render_report(this.report_sel.node(),this.font_scale,this.conditions,this.description));}if(this.popover){this.update_functions.push(e.render_popover(this.popover_div_sel,this.selectors,this.popover,this.font_scale));};this.initialize_hook();delete this.conditions;}},{key:"initialize_hook",value:function g(){}},{key:"update",value:function d(a,b){if(this.update_functions){this.update_functions.map(function(c){if(typeof c==="function"){c(a,b);}});};}}]);return c;}();var t=function(j){d(g,j);function g(){b(this,g);return c(this,(g.__proto__||Object.getPrototypeOf(g)).apply(this,arguments));}f(g,[{key:"initialize_hook",value:function i(){var b=this;b.selectors.map(function(d,i){var f='pattern_'+b.ids[i];if(!b.patterns_initialized){var c=[];var g='y';var j=[g,'color','opacity','overlay'];b.conditions.map(function(b){var g,j,i,d;var f=1.01;'overlay'in b&&b.overlay?d=b.overlay:d=null;if(b.type=='background'){c.push(h.map(b.color_data,function(a){return[f,b.color_scale(a),b.opacity,d];}));}else if(b.type=='levelstatic'){c.push(h.map(b.level_data,function(c){var a=(Math.min((c-b.min_height)/(b.max_height-b.min_height)),1);return[a,b.color,b.opacity,d];}));}else if(b.type=='dynamiclevel'){c.push(h.map(b.level_data,function(e,c){var a=Math.min((e-b.min_height)/(b.max_height-b.min_height),1);var f=b.color_scale(b.color_data[c]);return[a,f,b.opacity,d];}));}else if(b.type=='logical'){c.push(h.map(b.data,function(c){var a;c?a=b.true_color:a=b.false_color;return[f,a,b.opacity,d];}));}else if(b.type=='zonaly'){var e=[];e=e.concat(b.level_data.map(function(c,a){return h.map(c,function(f,e){var c=Math.min((f-b.min_height)/(b.max_height-b.min_height),1);var g=b.color_scale(b.color_data[a][e]);return[c,g,b.opacity,d];});}));c=c.concat(a.zip.apply(this,e));}});c=a.zip.apply(this,c);d.each(function(){b.update_functions.push(e.render_pattern(this,f,c,'fill'));});}});}}]);return g;}(g);var q=function(j){d(g,j);function g(){b(this,g);return c(this,(g.__proto__||Object.getPrototypeOf(g)).apply(this,arguments));}f(g,[{key:"initialize_hook",value:function i(){var b=this;b.selectors.map(function(d,g){var f='pattern_'+b.ids[g];var c=[];if(!b.patterns_initialized){b.conditions.map(function(b){var j,l,g,e;var k=1.01;var f='y';var i=[f,'color','opacity','overlay'];var g=b.opacity;var e=null;if(b.type=='equaly'){var d=[];var d=d.concat(b.color_data.map(function(a){return h.map(a,function(f,d){var c=d/a.length;var g=b.color_scale(f);return[c,g,b.opacity,e];});}));c=c.concat(a.zip.apply(this,d));}});c=a.zip.apply(this,c);d.each(function(){b.update_functions.push(e.render_pattern(this,f,c,'stroke'));});};});}}]);return g;}(g);var s=function(h){d(a,h);function a(){b(this,a);return c(this,(a.__proto__||Object.getPrototypeOf(a)).apply(this,arguments));}f(a,[{key:"initialize_hook",value:function g(){var d=this.conditions[0].color_data;var c=this.conditions[0].color_scale;var b=this.opacity;var a=this;a.selectors.map(function(f){f.each(function(){a.update_functions.push(e.render_rect_heatmap(this,d,c,b));});});}}]);return a;}(g);var n=function(g){d(a,g);function a(){b(this,a);return c(this,(a.__proto__||Object.getPrototypeOf(a)).apply(this,arguments));}f(a,[{key:"initialize_hook",value:function e(){var a=this;a.selectors.map(function(c){if(a.conditions[0].type=='showhide'){var d=a.conditions[0].data;c.datum(d);var b=function b(a){d[a]||d[a]>0?c.transition().attr('opacity',1):c.transition().attr('opacity',0);};a.update_functions.push(b);}});}}]);return a;}(g);var p=function(e){d(a,e);function a(){b(this,a);return c(this,(a.__proto__||Object.getPrototypeOf(a)).apply(this,arguments));}return a;}(g);var o=function(h){d(a,h);function a(){b(this,a);return c(this,(a.__proto__||Object.getPrototypeOf(a)).apply(this,arguments));}f(a,[{key:"initialize",value:function g(){var c=this.report_sel.node();var b='table_'+this.report_id;var a=this.conditions[0].tabular_data;var d=this.conditions[0].headers;this.update_functions.push(e.render_table(c,b,a,d,this.font_scale));}}]);return a;}(g);var r=function(h){d(a,h);function a(){b(this,a);return c(this,(a.__proto__||Object.getPrototypeOf(a)).apply(this,arguments));}f(a,[{key:"initialize",value:function g(){var c=this.conditions[0].color_scale;var b=this.report_sel.node();var a=this.conditions[0].opacity;e.render_color_scale(b,c,this.description,a,this.font_scale);}}]);return a;}(g);var m={"cell":t,"line":q,"heatmap":s,"toggle":n,"report":p,"table":o,"legend":r};function k(c,a,d){var b=new m[a.type](c,a.ids,a.description,a.conditions,a.report_id,a.popover,d);b.type=a.type;return b;}function j(b){a.selectAll("#"+b+" #element").attr('style',null);a.selectAll("#"+b+" defs").remove();}l.exports={"create_element":k,"remove_element":j};},{"./ssv_renderers.js":12,"./ssv_utilities.js":14,"d3":1}],6:[function(g,h,j){"use strict";var c=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function a(b,c){if(!(b instanceof c)){throw new TypeError("Cannot call a class as a function");}}var f=g("./ssv_utilities.js");var i=16;var e=function(){function b(c){a(this,b);this.length=c.shape[0];this.shape=c.shape;this.frame_size=c.shape.slice(1).reduce(function(b,a){return b*a;},1);this.keyframe_interval=c.keyframe_interval;this.keyframes=c.keyframes;this.delta_indices=c.delta_indices;this.delta_values=c.delta_values;this.offsets=new Float64Array(this.length+1);for(var d=0; d<this.length; d++){this.offsets[d+1]=this.offsets[d]+c.delta_counts[d];}this.cache=new Map();}c(b,[{key:"get",value:function e(a){var b=this.cache.get(a);if(b){this.cache.delete(a);}else{b=this.decode(a);}this.cache.set(a,b);if(this.cache.size>i){this.cache.delete(this.cache.keys().next().value);}return b.rows;}},{key:"decode",value:function h(c){var f=c-c%this.keyframe_interval;var g=f;var a=null;for(var b=c-1; b>f; b--){if(this.cache.has(b)){g=b;a=Float64Array.from(this.cache.get(b).flat);break;}}if(!a){a=this.flatten(this.keyframes[f/this.keyframe_interval]);}for(var d=g+1; d<=c; d++){for(var e=this.offsets[d];e<this.offsets[d+1];e++){a[this.delta_indices[e]]=this.delta_values[e];}}return{flat:a,rows:this.reshape(a)};}},{key:"flatten",value:function g(d){var c=new Float64Array(this.frame_size);var b=0;var a=function a(d){if(f.is_array(d[0])){for(var e=0; e<d.length; e++){a(d[e]);}}else{c.set(d,b);b+=d.length;}};a(d);return c;}},{key:"reshape",value:function d(e){var c=this.shape[this.shape.length-1];var b=[];for(var a=0; a<e.length; a+=c){b.push(e.subarray(a,a+c));}return b;}}]);return b;}();var d=function(){function b(c){a(this,b);this.length=c.length;this.data=c;}c(b,[{key:"get",value:function d(a){return this.data[a];}}]);return b;}();function b(a){if(a&&a.encoding=="delta"){return new e(a);}return new d(a);}h.exports={frames:b,DeltaFrames:e,FullFrames:d};},{"./ssv_utilities.js":14}],7:[function(p,j,q){"use strict";var n=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function c(a){if(Array.isArray(a)){for(var b=0,d=Array(a.length);b<a.length; b++){d[b]=a[b];}return d;}else{return Array.from(a);}}function i(a,b){if(!(a instanceof b)){throw new TypeError("Cannot call a class as a function");}}var e=[3,4,5,6,7,8,9,10,11,13,15,17,19,23,27,31,35,43,51,59,67,83,99,115,131,163,195,227,258];var k=[0,0,0,0,0,0,0,0,1,1,1,1,2,2,2,2,3,3,3,3,4,4,4,4,5,5,5,5,0];var h=[1,2,3,4,5,7,9,13,17,25,33,49,65,97,129,193,257,385,513,769,1025,1537,2049,3073,4097,6145,8193,12289,16385,24577];var l=[0,0,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13];var m=[16,17,18,0,8,7,9,6,10,5,11,4,12,3,13,2,14,1,15];function a(c){var d=new Uint16Array(16);for(var b=0; b<c.length; b++){d[c[b]]++;}d[0]=0;var e=new Uint16Array(16);for(var b=1; b<16; b++){e[b]=e[b-1]+d[b-1];}var f=new Uint16Array(c.length);for(var b=0; b<c.length; b++){if(c[b]){f[e[c[b]]++]=b;}}return{counts:d,symbols:f};}var b=null;function g(){if(!b){var c=new Uint8Array(288);c.fill(8,0,144);c.fill(9,144,256);c.fill(7,256,280);c.fill(8,280,288);b=[a(c),a(new Uint8Array(30).fill(5))];}return b;}var o=function(){function b(d,c,a){i(this,b);this.bytes=d;this.pos=c;this.bit_buf=0;this.bit_count=0;this.out=new Uint8Array(Math.max(a,1024));this.n=0;}n(b,[{key:"bits",value:function r(a){while(this.bit_count<a){if(this.pos>=this.bytes.length){throw new Error("ssv inflate: unexpected end of data");}this.bit_buf|=this.bytes[this.pos++]<<this.bit_count;this.bit_count+=8;}var b=this.bit_buf&(1<<a)-1;this.bit_buf>>>=a;this.bit_count-=a;return b;}},{key:"decode",value:function p(e){var b=0;var a=0;var f=0;for(var c=1; c<16; c++){b|=this.bits(1);var d=e.counts[c];if(b-a<d){return e.symbols[f+b-a];}f+=d;a=a+d<<1;b<<=1;}throw new Error("ssv inflate: invalid huffman code");}},{key:"reserve",value:function j(b){if(this.n+b>this.out.length){var a=new Uint8Array(Math.max(this.out.length*2,this.n+b));a.set(this.out.subarray(0,this.n));this.out=a;}}},{key:"stored_block",value:function d(){this.bit_buf=0;this.bit_count=0;if(this.pos+4>this.bytes.length){throw new Error("ssv inflate: unexpected end of data");}var a=this.bytes[this.pos]|this.bytes[this.pos+1]<<8;this.pos+=4;if(this.pos+a>this.bytes.length){throw new Error("ssv inflate: unexpected end of data");}this.reserve(a);this.out.set(this.bytes.subarray(this.pos,this.pos+a),this.n);this.n+=a;this.pos+=a;}},{key:"dynamic_tables",value:function o(){var d=this.bits(5)+257;var g=this.bits(5)+1;var j=this.bits(4)+4;var i=new Uint8Array(19);for(var b=0; b<j; b++){i[m[b]]=this.bits(3);}var k=a(i);var e=new Uint8Array(d+g);var b=0;while(b<d+g){var f=this.decode(k);if(f<16){e[b++]=f;continue;}var h=0;var c;if(f==16){if(b==0){throw new Error("ssv inflate: invalid code length repeat");}h=e[b-1];c=3+this.bits(2);}else if(f==17){c=3+this.bits(3);}else{c=11+this.bits(7);}if(b+c>d+g){throw new Error("ssv inflate: invalid code length repeat");}e.fill(h,b,b+c);b+=c;}return[a(e.subarray(0,d)),a(e.subarray(d))];}},{key:"compressed_block",value:function q(i,m){while(true){var a=this.decode(i);if(a<256){this.reserve(1);this.out[this.n++]=a;}else if(a==256){return;}else{a-=257;if(a>=e.length){throw new Error("ssv inflate: invalid length code");}var d=e[a]+this.bits(k[a]);var b=this.decode(m);if(b>=h.length){throw new Error("ssv inflate: invalid distance code");}var g=h[b]+this.bits(l[b]);if(g>this.n){throw new Error("ssv inflate: invalid distance");}this.reserve(d);var c=this.out;for(var f=this.n-g,j=this.n+d; this.n<j; f++){c[this.n++]=c[f];}}}}},{key:"run",value:function f(){var b=0;while(!b){b=this.bits(1);var a=this.bits(2);if(a==0){this.stored_block();}else if(a==1){this.compressed_block.apply(this,c(g()));}else if(a==2){this.compressed_block.apply(this,c(this.dynamic_tables()));}else{throw new Error("ssv inflate: invalid block type");}}return this.out.slice(0,this.n);}}]);return b;}();function d(a){if(a[0]!=0x1f||a[1]!=0x8b||a[2]!=8){throw new Error("ssv inflate: invalid gzip header");}var c=a[3];var b=10;if(c&4){b+=2+(a[b]|a[b+1]<<8);}var f=[8,16];for(var e=0; e<f.length; e++){var g=f[e];if(c&g){while(a[b++]!==0){if(b>=a.length){throw new Error("ssv inflate: invalid gzip header");}}}}if(c&2){b+=2;}return b;}function f(a,e){var c;var g=a.length*4;if(e=="gzip"){c=d(a);var b=a.length;g=(a[b-4]|a[b-3]<<8|a[b-2]<<16|a[b-1]<<24)>>>0;}else if(e=="deflate"){if((a[0]&0x0f)!=8||(a[0]<<8|a[1])%31||a[1]&0x20){throw new Error("ssv inflate: invalid zlib header");}c=2;}else{throw new Error("ssv inflate: unsupported format '"+e+"'");}return new o(a,c,g).run();}j.exports={inflate:f};},{}],8:[function(e,f,i){"use strict";var h=typeof Symbol==="function"&&typeof Symbol.iterator==="symbol"?function(a){return typeof a;}:function(a){return a&&typeof Symbol==="function"&&a.constructor===Symbol&&a!==Symbol.prototype?"symbol":typeof a;};var g=e("./ssv_compression.js");var d=["data","color_data","level_data","tabular_data"];function c(a,d){if(ArrayBuffer.isView(a)){var b=new a.constructor(a.length+d.length);b.set(a);b.set(d,a.length);return b;}return a.concat(d);}function a(f,e){for(var b in e){if(d.indexOf(b)>=0&&Array.isArray(e[b])){f[b]=c(f[b],e[b]);}else if(e[b]!==null&&h(e[b])==="object"&&f[b]){a(f[b],e[b]);}}}function b(a,e){var d=a.url+(a.url.indexOf("?")<0?"?":"&")+"from="+a.n_frames;var c=new EventSource(d);c.onmessage=function(a){e(g.parse(a.data));};return c;}f.exports={connect:b,merge:a};},{"./ssv_compression.js":3}],9:[function(a,j,u){"use strict";var s=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function g(a,b){if(!(a instanceof b)){throw new TypeError("Cannot call a class as a function");}}var f=a("./ssv_controls.js");var p=a("./ssv_chunks.js");var o=a("./ssv_compression.js");var d=a("./ssv_elements.js");var m=a("./ssv_selectors.js");var e=a("./ssv_live.js");var c=a("./ssv_payload.js");var i=a("./ssv_perf.js");var t=function(){function a(d,q,o,n,b,s,r,h,l,k,j,u){g(this,a);performance.mark("ssv-init-start");this.uuid=d;this.sels=m(d);this.perf=u?new i.PerfMonitor(this.sels.containers.perf_hud):null;this.sels.containers.svg_container.style("font-size",r.toString()+"px");this.sels.containers.svg.style("font-size",r.toString()+"px");this.elements=[];if(h&&!k){var v=performance.now();b=c.load_payload(b,h);if(this.perf){this.perf.add_decode(performance.now()-v);}}this.svg_overlays=s;this.target_x=0;this.chunks=null;if(l){this.chunks=new p.ChunkLoader(d,l);this.chunk=null;this.chunk_loading=false;}this.live=j;this.live_loading=false;this.live_stale=false;if(l||j){this.pristine_info_layer=this.sels.containers.info_layer.html();this.pristine_popover_div=this.sels.containers.popover_div.html();}if(k){this.set_font_scale();this.controls=f(q,o,n,this.update_elements,this);this.load_compressed(k,h);return;}this.initialize_overlays();this.set_font_scale();this.controls=f(q,o,n,this.update_elements,this);if(this.chunks){this.load_chunk(0);}else if(this.live){this.element_data=c.unpack_store(b);this.rebuild_elements();var t=this;e.connect(j,function(a){t.add_frames(a);});}else{this.initialize_elements(b);}}s(a,[{key:"load_compressed",value:function l(d,b){var a=this;var c=performance.now();o.load_compressed(d,b).then(function(b){if(a.perf){a.perf.add_decode(performance.now()-c);}a.svg_overlays=a.svg_overlays||b.svg_overlays;a.initialize_overlays();a.initialize_elements(b.element_data);}).catch(function(a){setTimeout(function(){throw a;},0);});}},{key:"initialize_overlays",value:function q(){if(this.sels.containers.svg.select('defs').empty()){this.sels.containers.svg.append('defs');}for(var a in this.svg_overlays){this.sels.containers.svg.select('defs').html(this.sels.containers.svg.select('defs').html()+this.svg_overlays[a]);}}},{key:"set_font_scale",value:function j(){var a=parseFloat(this.sels.containers.svg.attr('viewBox').split(' ')[3])/this.sels.containers.svg_container.node().getBoundingClientRect().height;this.font_scale=a;this.sels.containers.svg.attr('font-scale',a);}},{key:"initialize_elements",value:function r(a){var e=this.uuid;var g=this.font_scale;if(this.perf){var h=performance.now();a=c.unpack_store(a);this.perf.add_decode(performance.now()-h);this.perf.start_init();}else{a=c.unpack_store(a);}this.elements=[];var f=a.length;var b=this;a.forEach(function(a){setTimeout(function(){b.elements.push(d.create_element(e,a,g));b.update_loading_progress(f);},0);});}},{key:"update_loading_progress",value:function b(a){if(this.elements.length==a){this.sels.containers.progress.select(".progress-bar").style("width",0);this.sels.containers.progress.style("display","none");if(!this.first_frame_drawn){performance.mark("ssv-elements-ready");}this.chunk_loading=false;if(this.live){this.live_loading=false;if(this.live_stale){this.rebuild_elements();return;}}this.update_elements(this.target_x);if(this.perf){this.perf.end_init();}if(!this.first_frame_drawn){this.first_frame_drawn=true;performance.mark("ssv-first-frame");}}else{var c=Math.ceil(this.elements.length/a*100).toString()+"%";this.sels.containers.progress.select(".progress-bar").style("width",c);}}},{key:"update_elements",value:function h(a,c){this.target_x=a;if(this.chunks){if(this.chunk_loading){return;}var b=this.chunks.chunk_index(a);if(b!=this.chunk){this.load_chunk(b);return;}a-=b*this.chunks.size;}if(this.perf){this.perf.update(this.elements,a,c,this.controls);}else{this.elements.map(function(b){b.update(a,c);});}}},{key:"add_frames",value:function t(c){var a=this.controls;var d=a.x_series.length-1;for(var b=0; b<c.x_series.length; b++){a.x_series.push(c.x_series[b]);}e.merge(this.element_data,c.element_data);if(a.current_x==d&&!a.play_enabled){a.target_x=a.current_x=this.target_x=a.x_series.length-1;a.set_x_series_display(a.current_x);}a.render_slider();a.slider_dispatch.call("change");this.rebuild_elements();}},{key:"rebuild_elements",value:function k(){if(this.live_loading){this.live_stale=true;return;}this.live_loading=true;this.live_stale=false;this.sels.containers.info_layer.html(this.pristine_info_layer);this.sels.containers.popover_div.html(this.pristine_popover_div);this.initialize_elements(this.element_data);}},{key:"load_chunk",value:function n(b){this.chunk_loading=true;this.sels.containers.progress.style("display","table");var a=this;this.chunks.get(b).then(function(c){a.chunks.evict([b+1]);a.chunks.prefetch(b+1);if(a.chunk!==null){a.sels.containers.info_layer.html(a.pristine_info_layer);a.sels.containers.popover_div.html(a.pristine_popover_div);}a.chunk=b;a.initialize_elements(c);}).catch(function(b){a.chunk_loading=false;a.sels.containers.progress.style("display","none");console.error(b);});}}]);return a;}();window.onerror=function(a){document.body.setAttribute("JSError",a);};var b={};j.exports={add_element_context:function q(d){for(var c=arguments.length,e=Array(c>1?c-1:0),a=1; a<c; a++){e[a-1]=arguments[a];}b[d]=new (Function.prototype.bind.apply(t,[null].concat([d],e)))();},get_element_context:function l(a){return b[a];},add_chunk:function r(a,d,e,c){if(a in b&&b[a].chunks){b[a].chunks.add(d,e,c);}},create_demo_element:function n(a,b,c){return d.create_element(a,b,1);},remove_demo_element:function h(a){d.remove_element(a);},get_type_requirements:function k(){return{"cell":{"args":{"id":"str","description":"str","x_series":null},"conditions":{"background":{"args":{"x_len":{"input_type":"int","default":null},"color_data":{"input_type":null,"default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"unit_description_prepend":{"input_type":"str","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"color_data.float.1.1&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},"max_conditions":-1},"staticlevel":{"args":{"x_len":{"input_type":"int","default":null},"level_data":{"input_type":null,"default":null},"color":{"input_type":"validate_color","default":null},"min_height":{"input_type":["int","float"],"default":null},"max_height":{"input_type":["int","float"],"default":null},"unit_description_prepend":{"input_type":"str","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"level_data.float.1.1&x_len":"validate_array","min_height&max_height":"validate_heights"},"max_conditions":-1},"dynamiclevel":{"args":{"x_len":{"input_type":"int","default":null},"level_data":{"input_type":null,"default":null},"color_data":{"input_type":null,"default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"min_height":{"input_type":["int","float"],"default":null},"max_height":{"input_type":["int","float"],"default":null},"color_data_description":{"input_type":"str","default":null},"color_data_unit":{"input_type":"str","default":null},"unit_description_prepend":{"input_type":"str","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"level_data.float.1.1&x_len":"validate_array","color_data.float.1.1&x_len":"validate_array","color_scale&color_levels":"validate_color_scale","min_height&max_height":"validate_heights"},"max_conditions":-1},"zonaly":{"args":{"x_len":{"input_type":"int","default":null},"level_data":{"input_type":null,"default":null},"color_data":{"input_type":null,"default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"min_height":{"input_type":["int","float"],"default":null},"max_height":{"input_type":["int","float"],"default":null},"color_data_description":{"input_type":"str","default":null},"color_data_unit":{"input_type":"str","default":null},"unit_description_prepend":{"input_type":"str","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"level_data.float.2.2&x_len":"validate_array","color_data.float.2.2&x_len":"validate_array","color_scale&color_levels":"validate_color_scale","min_height&max_height":"validate_heights"},"max_conditions":-1}}},"line":{"args":{"line_id":null,"x_series":null,"line_description":null},"conditions":{"equaly":{"args":{"x_len":{"input_type":"int","default":null},"color_data":{"input_type":null,"default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"unit_description_prepend":{"input_type":"str","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"color_data.float.2.2&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},"max_conditions":1}}},"heatmap":{"args":{"id":"str","description":"str","x_series":null},"conditions":{"rect":{"args":{"x_len":{"input_type":"int","default":null},"color_data":{"input_type":null,"default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"unit_description_prepend":{"input_type":"str","default":null},"encoding":{"input_type":"str","default":null},"keyframe_interval":{"input_type":"int","default":null},"delta_tolerance":{"input_type":["int","float"],"default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"color_data.float.3.3&x_len":"validate_array","color_scale&color_levels":"validate_color_scale"},"max_conditions":1}}},"toggle":{"args":{"id":"str","description":"str","x_series":null},"conditions":{"showhide":{"args":{"x_len":{"input_type":"int","default":null},"data":{"input_type":null,"default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"data.float.1.1&x_len":"validate_array"},"max_conditions":1},"logical":{"args":{"x_len":{"input_type":"int","default":null},"data":{"input_type":null,"default":null},"true_color":{"input_type":"validate_color","default":null},"false_color":{"input_type":"validate_color","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"data.float.1.1&x_len":"validate_array"},"max_conditions":1}}},"report":{"args":{"id":"str","description":"str","x_series":null},"conditions":{"info":{"args":{"x_len":{"input_type":"int","default":null},"data":{"input_type":null,"default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"data.float.1.2&x_len":"validate_array"},"max_conditions":-1}}},"table":{"args":{"id":"str","description":"str","x_series":null},"conditions":{"tabularinfo":{"args":{"x_len":{"input_type":"int","default":null},"tabular_data":{"input_type":null,"default":null},"headers":{"input_type":null,"default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"tabular_data.str&x_len":"validate_array_slices","headers.str.1.1":"validate_array"},"max_conditions":1}}},"legend":{"args":{"id":"str","desc":null,"x_series":null},"conditions":{"colorscale":{"args":{"x_len":{"input_type":"int","default":null},"color_scale":{"input_type":null,"default":null},"color_levels":{"input_type":"validate_color_levels","default":null},"id":{"input_type":"str","default":null},"description":{"input_type":"str","default":null},"unit":{"input_type":"str","default":null},"opacity":{"input_type":["int","float"],"default":1.0},"report":{"input_type":"bool","default":true},"overlay":{"input_type":"str","default":null},"section_label":{"input_type":"str","default":"zone"}},"validators":{"color_scale&color_levels":"validate_color_scale"},"max_conditions":1}}}};}};},{"./ssv_chunks.js":2,"./ssv_compression.js":3,"./ssv_controls.js":4,"./ssv_elements.js":5,"./ssv_live.js":8,"./ssv_payload.js":10,"./ssv_perf.js":11,"./ssv_selectors.js":13}],10:[function(l,k,m){"use strict";var d=typeof Symbol==="function"&&typeof Symbol.iterator==="symbol"?function(a){return typeof a;}:function(a){return a&&typeof Symbol==="function"&&a.constructor===Symbol&&a!==Symbol.prototype?"symbol":typeof a;};var f="__ssv_buffer__";var g="__ssv_array__";var e="__ssv_store__";var j={"float32":Float32Array,"float64":Float64Array,"uint8":Uint8Array,"int32":Int32Array,"uint32":Uint32Array};function c(e){var b=window.atob(e.trim());var d=new Uint8Array(b.length);for(var a=0; a<b.length; a++){d[a]=b.charCodeAt(a);}return d.buffer;}function b(f,a){if(a.length<=1){return f;}var d=a.slice(1).reduce(function(b,a){return b*a;},1);var e=[];for(var c=0; c<a[0];c++){e.push(b(f.subarray(c*d,(c+1)*d),a.slice(1)));}return e;}function a(c,g){if(Array.isArray(c)){return c.map(function(b){return a(b,g);});}else if(c!==null&&(typeof c==="undefined"?"undefined":d(c))==="object"){if(f in c){var e=c[f];var i=new j[e.dtype](g,e.offset,e.length);return b(i,e.shape);}for(var h in c){c[h]=a(c[h],g);}}return c;}function i(e,b){var d=document.getElementById(b);if(!d){throw new Error("ssv payload block '"+b+"' not found");}return a(e,c(d.textContent));}function h(a){if(a===null||Array.isArray(a)||!(e in a)){return a;}var c=a[e];var b=function b(a){if(Array.isArray(a)){if(a.length==0||a[0]===null||d(a[0])!=="object"){return a;}for(var e=0; e<a.length; e++){a[e]=b(a[e]);}}else if(a!==null&&(typeof a==="undefined"?"undefined":d(a))==="object"&&!ArrayBuffer.isView(a)){if(g in a){return c[a[g]];}for(var f in a){a[f]=b(a[f]);}}return a;};return b(a.elements);}k.exports={load_payload:i,resolve:a,unpack_store:h,decode_base64:c,BUFFER_REF:f,ARRAY_REF:g,STORE_KEY:e};},{}],11:[function(h,d,i){"use strict";var f=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function b(a,c){if(!(a instanceof c)){throw new TypeError("Cannot call a class as a function");}}var e=2000;var c=250;var a=function a(b){return b===null?"-":b.toFixed(b<10?2:1)+" ms";};var g=function(){function d(a){b(this,d);this.hud_sel=a;this.decode_ms=null;this.init_ms=null;this.init_start=null;this.last_update_ms=null;this.max_update_ms=0;this.types={};this.play_times=[];this.table=a.append("table");this.rows={};this.last_render=null;this.render_timer=null;this.render();}f(d,[{key:"add_decode",value:function n(a){this.decode_ms=(this.decode_ms||0)+a;this.render();}},{key:"start_init",value:function i(){this.init_start=performance.now();}},{key:"end_init",value:function m(){if(this.init_start!==null){this.init_ms=performance.now()-this.init_start;this.init_start=null;this.render();}}},{key:"update",value:function g(k,h,j,d){var a={};var i=performance.now();k.forEach(function(b){var c=performance.now();b.update(h,j);var d=performance.now()-c;if(!(b.type in a)){a[b.type]={n:0,ms:0};}a[b.type].n+=1;a[b.type].ms+=d;});var f=performance.now();this.last_update_ms=f-i;this.max_update_ms=Math.max(this.max_update_ms,this.last_update_ms);for(var b in a){if(!(b in this.types)){this.types[b]={n:0,calls:0,total:0,max:0};}var c=this.types[b];c.n=a[b].n;c.calls+=1;c.total+=a[b].ms;c.max=Math.max(c.max,a[b].ms);}if(d&&d.play_enabled){this.play_times.push(f);while(f-this.play_times[0]>e){this.play_times.shift();}}else{this.play_times=[];}this.play_speed=d?d.play_speed:null;this.throttled_render();}},{key:"fps",value:function l(){var a=this.play_times.length;if(a<2){return null;}return(a-1)/(this.play_times[a-1]-this.play_times[0])*1000;}},{key:"set_row",value:function j(a,e,c){if(!(a in this.rows)){var d=this.table.append("tr");this.rows[a]={label:document.createTextNode(""),value:document.createTextNode("")};d.append("td").node().appendChild(this.rows[a].label);d.append("td").node().appendChild(this.rows[a].value);}var b=this.rows[a];if(b.label.nodeValue!==e){b.label.nodeValue=e;}if(b.value.nodeValue!==c){b.value.nodeValue=c;}}},{key:"render",value:function k(){if(this.render_timer!==null){clearTimeout(this.render_timer);this.render_timer=null;}this.last_render=performance.now();var d=this.fps();this.set_row("decode","decode",a(this.decode_ms));this.set_row("init","init",a(this.init_ms));this.set_row("fps","fps",d===null?"-":d.toFixed(1)+" / "+this.play_speed);this.set_row("update","update",a(this.last_update_ms)+" (max "+a(this.max_update_ms)+")");for(var c in this.types){var b=this.types[c];this.set_row("type:"+c,c+" \xD7"+b.n,a(b.total/b.calls)+" (max "+a(b.max)+")");}}},{key:"throttled_render",value:function h(){if(this.render_timer!==null){return;}var a=this.last_render===null?0:this.last_render+c-performance.now();if(a<=0){this.render();}else{var b=this;this.render_timer=setTimeout(function(){b.render();},a);}}}]);return d;}();d.exports={"PerfMonitor":g};},{}],12:[function(c,l,n){"use strict";var b=c("./ssv_utilities.js");var m=c("./ssv_frames.js");var k=b.num_format;var a=c("d3");function f(n,L,C,N){if(n){var A=a.select(n.parentNode);var x=n.getBBox();var c=x.width;var F=x.x;var E=x.y;var B=1.2;var l=1;var o=0.1;var K='#FFC107';var M='#00BFA5';var D='#FFFFFF';var H='#FFFFFF';var G='#FFEB3B';var z='#616161';var J='Sizing...';a.select(n).style('visibility','hidden');var g=A.append('g').attr('transform','translate('+F+','+E+')').append('g').attr('id','ssv-report').attr('font-size',L.toString()+'em');var I=g.append('rect').attr('width',c).attr('fill',z).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge');var t=g.append('text').attr('width',c).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','baseline').attr('x',c/2).attr('fill',K).style('font-size',B.toString()+'em').text(J);var s=t.node().getBBox().height;t.attr('y',s*(1+o));var y=s*l/B;var e=s*(1+2*o);I.attr('height',e);var j=y*(1+1*o);var q=j+y*o;t.text(N);for(var v=0; v<C.length; v++){var d=C[v];if("report"in d&&d.report){var m=d.data?d.data:d.level_data?d.level_data:d.color_data;if(m.encoding){continue;}var i=1;if(b.is_array(m[0])){i=m[0].length;}g.append('rect').attr('width',c).attr('fill',z).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge').attr('y',e).attr('height',(i+1)*q);g.append('text').attr('width',c).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge').attr('x',c/2).attr('y',e+j).attr('fill',M).style('font-size',l.toString()+'em').attr('font-style','oblique').text(d.description);var u;'section_label'in d&&d.section_label!=''?u=d.section_label:u='Section';e+=q;for(var p=0; p<i; p++){var h;i>1?h=3:h=2;if(i>1){g.append('text').attr('width',c).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge').attr('x',c/(h*2)).attr('y',e+j).attr('fill',D).style('font-size',l.toString()+'em').text(u+' #'+(p+1).toString());}var w;i>1?w=b.map(m,function(a){return k(a[p]);}):w=b.map(m,function(a){return k(a);});g.append('text').attr('width',c).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge').attr('class','value-text').datum(w).attr('x',c/(2*(4-h))).attr('y',e+j).attr('fill',G).style('font-size',l.toString()+'em');g.append('text').attr('width',c).attr('fill-opacity','1').attr('text-anchor','middle').attr('alignment-baseline','after-edge').attr('x',(h*2-1)*c/(2*h)).attr('y',e+j).attr('fill',H).style('font-size',l.toString()+'em').text(d.unit);e+=q;}}}}var r=function r(a){A.selectAll('.value-text').text(function(b){return b[a];});};return r;};function i(h,f,c,j){var g=a.select(h.parentNode);if(g.select('defs').empty()){g.append('defs');}var l=h.getBBox().height;if(c[0].length>1){c=c.map(function(a){return a.sort(function(b,a){return-(b[0]-a[0]);});});}var c=c.map(function(a){return a.map(function(a){var b=Math.max(0,1-a[0])*l;return[b].concat(a.slice(1,a.length));});});var m=g.select('defs');var b=m.append('pattern').attr('id',f).attr('x',0).attr('y',0).attr('width','100%').attr('height','100%').attr('patternContentUnits','userSpaceOnUse').datum(c);var k=b.selectAll().data(function(a){return a[0];}).enter();k.each(function(){b.append('rect').attr('id','base').attr('x','0').attr('width','100%').attr('height','100%');b.append('rect').attr('id','transition').attr('x','0').attr('width','100%').attr('height','1px').attr('fill','#FFFFFF');b.append('rect').attr('id','overlay').attr('x','0').attr('width','100%').attr('height','100%');});var d=a.select(h);j=='fill'?d.style('fill','url(#'+f+')'):d.style('stroke','url(#'+f+')');d.style('fill-opacity',1);d.style('opacity',1);var e=function e(a,c){b.selectAll('#base').data(function(b){return b[a];}).transition().duration(c).attr('y',function(a){return a[0];}).style('fill',function(a){return a[1];}).style('opacity',function(a){return a[2];});b.selectAll('#transition').data(function(b){return b[a];}).transition().duration(c).attr('y',function(a){if(a[0]>0){return a[0];}else{return'-1%';}}).style('opacity',function(a){return a[2];});b.selectAll('#overlay').data(function(b){return b[a];}).transition().duration(c).attr('fill',function(a){if(a[3]==null){return'none';}else{return'url(#'+a[3]+')';}}).attr('y',function(a){return a[0];}).style('opacity',function(a){return a[2];});};return e;};function g(i,q,r,o){if(i){var n=a.select(i.parentNode);var c=i.getBBox();var p=m.frames(q);var e=function e(a){return b.map(p.get(a),function(a){return b.map(a,function(a){return r(a);});});};var d=e(0);var f=a.scaleLinear().domain([0,d[0].length]).range([0,c.width]);var l=a.scaleLinear().domain([0,d.length]).range([0,c.height]);var k=n.append('g').attr('transform','translate('+c.x+','+c.y+')').append('g');var j=k.selectAll().data(d).enter().append('g').attr('class','x_section').attr('stroke','black').attr('stroke-width','1px');j.selectAll('.bin').data(function(a){return a;}).enter().append('rect').attr('class','bin').attr('x',function(b,a){return f(a);}).attr('width',function(b,a){return f(a+1)-f(a);}).style('fill',function(a){return a;}).style('fill-opacity',function(){return o;}).attr('height',c.height/d.length);j.each(function(c,b){a.select(this).selectAll(".bin").attr("y",l(b));});var h=function h(b,c){var a=k.selectAll('.x_section').data(e(b));a.selectAll('.bin').data(function(a){return a;}).transition().duration(c).style('fill',function(a){return a;});};return h;}};function d(c,l,k,n,g){if(c){var m=a.select(c.parentNode);var f=c.getBBox();var j=f.width;var i=f.x;var h=f.y;a.select(c).style('visibility','hidden');var b=m.append('g').attr('transform','translate('+i+','+h+')').append('foreignObject').attr('id','ssv-table').attr("width",j).attr("height",500).append('xhtml:table').attr('class','table').attr('id',l).datum(k);b.append('thead').append('tr').selectAll().data(n).enter().append('th').text(function(a){return a;}).style('font-size',g.toString()+'em');b.append('tbody');var e=function e(d){var a=b.selectAll('.content-row').data(function(a){return a[d];});a.exit().remove();a.enter().append('tr').merge(a).attr('class','content-row');var c=b.selectAll('.content-row').selectAll('.content-cell').data(function(a){return a;});c.exit().remove();c.enter().append('td').merge(c).text(function(a){return a;}).style('font-size',g.toString()+'em').attr('class','content-cell');};return e;}};function j(b,g,u,r,t){if(b){var k=a.select(b.parentNode);a.select(b).style('visibility','hidden');var h=b.getBBox();var i=h.width;var q=h.x;var p=h.y;var v=this;var k=a.select(b.parentNode);var l=k.append('g').attr('transform','translate('+q+','+p+')').append('g').attr('font-size',t+'em').attr('stroke','black').attr('stroke-width','0.01em');var o=g.range().length;var c=a.scaleLinear().domain([0,o]).range([0,i]);var f=1.5;var m=1;var d=0.1;var s=l.append('text').text(u).attr('x',i/2).attr('y','1em').attr('text-anchor','middle').attr('font-size',f.toString()+'em');var e=s.node().getBBox().height;var n=l.selectAll('rect').data(g.range());n.enter().append('rect').attr('x',function(b,a){return c(a);}).attr('y',(1+d)*e).attr('width',function(b,a){return c(a+1)-c(a);}).attr('height',e).attr('fill',function(a){return a;}).style('fill-opacity',r).attr('font-size',f.toString()+'em');n.enter().append('text').text(function(a){return g.invertExtent(a)[0].toFixed(0);}).attr('x',function(b,a){return c(a);}).attr('y',e*(2+d+m/f*(1+d))).attr('text-anchor','middle').attr('font-size',m.toString()+'em');}}function h(i,g,b,k){var c=i.append("div").style("background","#9E9E9E");var d=[150,50];if("dims"in b){d=b.dims;}var j=c.append("svg").attr("width",d[0]+"px").attr("height",d[1]+"px").style("font-size",k.toString()+'em').append("g");c.attr("class","ssv-popover").style("visibility","hidden");if(b.type=="sparkline"){var f=e(j,d,b.data,b.label);}g.map(function(b){b.on("mouseover",function(){c.style("visibility","visible");});b.on("mousemove",function(){c.style("top",a.event.pageY+"px").style("left",a.event.pageX+"px");});b.on("mouseout",function(){c.style("visibility","hidden");});});return f;}function e(j,m,c,k){var i=m[0];var r=m[1];var b=i*0.05;var h=b;var o=a.line().x(function(b,a){return f(a);}).y(function(a){return d(a);});if(k){var p=j.append("text").attr("x",b).attr("y","1.05em").attr("fill","#FFFFFF").text(k);var n=p.node().getBBox();h+=2*n.y+n.height;}var f=a.scaleLinear().range([0,i-2*b]);var d=a.scaleLinear().range([r-h-b,0]);var l=j.append("g").attr("transform","translate("+b+","+h+")");f.domain([0,c.length]);d.domain([a.min(c),a.max(c)]);l.append("path").style("fill","none").style("stroke","#FFFFFF").style("stroke-width","0.1em").attr("d",o(c));var q=l.append("circle").attr("r","0.5em").attr("fill","orange");var g=function g(a,b){q.transition().duration(b).attr("cx",f(a)).attr("cy",d(c[a]));};return g;}l.exports={render_report:f,render_pattern:i,render_color_scale:j,render_table:d,render_rect_heatmap:g,render_popover:h};},{"./ssv_frames.js":6,"./ssv_utilities.js":14,"d3":1}],13:[function(b,c,e){"use strict";var d=b("d3");var a=function a(c){var b=d.select("#"+c);var e={controls:{modebar:b.select(".modebar"),modebar_group:b.select(".modebar-group"),modebar_slider:b.select(".modebar-slider"),speed_btn:b.select("#speed-button"),play_btn:b.select("#play-button"),pan_zoom_btn:b.select("#pan-zoom-button"),center_btn:b.select("#center-button"),save_btn:b.select("#save-button"),vid_btn:b.select("#video-button"),pause_icon:b.select("#pause-icon"),play_icon:b.select("#play-icon"),pan_zoom_enabled_icon:b.select("#pan-zoom-enabled-icon"),pan_zoom_disabled_icon:b.select("#pan-zoom-disabled-icon")},title:{title:b.select("#title"),x_val:b.select("#x-val"),x_val_unit:b.select("#x-val-unit")},containers:{svg_container:b.select(".svg-container"),zoom_layer:b.select("#zoom-layer"),info_layer:b.select("#info-layer"),popover_div:b.select(".popover-spacer"),svg:b.select("#ssv-svg"),img:b.select("#img-space"),render:b.select("#render-space"),progress:b.select(".ssv-progress"),perf_hud:b.select(".ssv-perf-hud")}};return e;};c.exports=a;},{"d3":1}],14:[function(e,f,g){'use strict';var d=e("d3");function a(b){if(b>=1000||b<0.01){return d.format('.2e')(b);}else{return d.format('.2f')(b);}};function c(a){return Array.isArray(a)||ArrayBuffer.isView(a);};function b(c,a){return Array.prototype.map.call(c,a);};f.exports={num_format:a,is_array:c,map:b};},{"d3":1}]},{},[9])(9)});
\ No newline at end of file
@@ -1,10 +1,17 @@
+import base64
+import bisect
 import itertools
 import json
 import os
 import random
+import re
 import string
 import time
+import tracemalloc
+import urllib.request
 import xml.etree.ElementTree as ET
+import zlib
+from importlib import metadata
 
 import numpy as np
 import pytest
@@ -12,9 +19,15 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 
 from ssv import SSV
-from ssv.data_validators import validate_array, validate_colors, validate_array_slices, validate_color
+from ssv.data_validators import validate_array, validate_colors, validate_array_slices, validate_color, \
+    validate_color_scale
+from ssv import array_sources, resources, serializers
+from ssv import decimation as decimation_lib
+from ssv.serializers import BinaryPayload, BUFFER_REF
 from tests.data import data_generator
 from ssv.elements import Element
+from ssv.conditions import Condition, Background, Info
+from ssv.type_check import type_check
 
 
 def get_subclass_from_name(cls, name):
@@ -68,6 +81,15 @@ class TestDataValidators:
         with pytest.raises(ValueError):
             validate_array(arr_num, 'float', 0, len(arr_num.shape) - 1, arr_num.shape[0]-1)
 
+    def test_validate_array_no_copy(self, arr_num):
+        arr_out = validate_array(arr_num, 'float', None)
+        assert isinstance(arr_out, np.ndarray)
+        assert np.shares_memory(arr_out, arr_num)
+
+        # Non-contiguous input is copied to a contiguous array
+        arr_out = validate_array(arr_num[::2], 'float', None)
+        assert arr_out.flags.c_contiguous
+
     def test_validate_array_dim_mismatch(self):
         arr = [[1, 2, 3, 0], [0, 0, 3]]
         with pytest.raises(ValueError):
@@ -99,6 +121,205 @@ class TestDataValidators:
     def test_validate_color(self):
         validate_color('#FFFFFF')
 
+    @pytest.mark.parametrize("color", ['#FFF\n', 'FFFFFF#', '#GGG', '#FFFF', '#FF\x00FFF', '', 5])
+    def test_validate_color_fail(self, color):
+        with pytest.raises(ValueError):
+            validate_color(color)
+        with pytest.raises(ValueError):
+            validate_colors(['#abc', color])
+
+    def test_validate_color_scale_interned(self):
+        color_scale = ['#%06X' % i for i in range(256)]
+        scale_out = validate_color_scale(color_scale, range(256))
+        assert validate_color_scale(list(color_scale), range(256)) is scale_out
+        assert not scale_out.flags.writeable
+
+        with pytest.raises(ValueError):
+            validate_color_scale(color_scale, range(10))
+        with pytest.raises(ValueError):
+            validate_color_scale(color_scale[:-1] + ['#XYZ'], range(256))
+
+    def test_validate_array_file_backed(self, tmpdir):
+        arr = np.random.rand(20, 4, 5)
+        npy_path = str(tmpdir.join('arr.npy'))
+        np.save(npy_path, arr.astype('float32'))
+        np.savez(str(tmpdir.join('arrs.npz')), heat=arr, level=np.arange(20))
+        np.savez_compressed(str(tmpdir.join('compressed.npz')), heat=arr)
+
+        # Numeric files stay memory-mapped in their own dtype - only their shape is checked
+        arr_out = validate_array(npy_path, 'float', 3, 3, 20)
+        assert array_sources.is_file_backed(arr_out) and arr_out.dtype == np.float32
+        assert np.allclose(arr_out, arr)
+        with pytest.raises(ValueError):
+            validate_array(npy_path, 'float', 1, 2, 20)
+
+        heat = array_sources.open_array(str(tmpdir.join('arrs.npz')), 'heat')
+        assert isinstance(heat, np.memmap) and np.array_equal(heat, arr)
+        assert np.array_equal(validate_array(heat[:, 1:3], 'float', 3, 3, 20), arr[:, 1:3])
+        with pytest.raises(ValueError):
+            array_sources.open_array(str(tmpdir.join('arrs.npz')))
+        with pytest.raises(ValueError):
+            array_sources.open_array(str(tmpdir.join('compressed.npz')))
+
+        # Buffers are wrapped without a copy
+        buffer = np.arange(20.)
+        assert np.shares_memory(validate_array(memoryview(buffer), 'float', 1, 1, 20), buffer)
+
+        str_path = str(tmpdir.join('str.npy'))
+        np.save(str_path, np.array([['1.5', 'x']]))
+        with pytest.raises(ValueError):
+            validate_array(str_path, 'float', None)
+
+
+class TestSerializers:
+    @pytest.mark.parametrize("dtype", ['float32', 'float64'])
+    def test_binary_payload(self, dtype):
+        arr = np.random.rand(4, 3, 2)
+        delta = serializers.delta_encode(np.random.rand(30, 2, 2) > 0.5, 10)
+        delta['delta_indices'] = delta['delta_indices'] + (1 << 24) + 1
+        level_data = np.arange(3, dtype='uint64') + (1 << 31)
+        element_data = [{'ids': ['id_1'], 'conditions': [{'color_data': arr.tolist(), 'color_scale': ['#FFFFFF'],
+                                                          'data': [1, 2, 3], 'color_levels': [0.5, 1]},
+                                                         {'color_data': delta, 'level_data': level_data}],
+                         'popover': {'data': np.random.rand(3), 'dims': [200, 100]}}]
+        packer = BinaryPayload(dtype)
+        packed = packer.pack(element_data)
+        buffer = base64.b64decode(packer.dumps())
+
+        # Only x-series indexed arrays are packed - small arrays are left as JSON
+        assert packed[0]['ids'] == ['id_1']
+        assert packed[0]['conditions'][0]['color_scale'] == ['#FFFFFF']
+        assert packed[0]['conditions'][0]['color_levels'] == [0.5, 1]
+        assert packed[0]['conditions'][1]['color_data']['shape'] == [30, 2, 2]
+        assert packed[0]['popover']['dims'] == [200, 100]
+
+        # Integer arrays are packed with an exact integer dtype
+        conditions = packed[0]['conditions']
+        for value, expected, expected_dtype in [
+                (conditions[0]['color_data'], arr, dtype), (conditions[0]['data'], np.array([1, 2, 3]), 'int32'),
+                (conditions[1]['level_data'], level_data, 'uint32'),
+                (conditions[1]['color_data']['delta_indices'], delta['delta_indices'], 'int32'),
+                (conditions[1]['color_data']['delta_counts'], delta['delta_counts'], 'int32'),
+                (packed[0]['popover']['data'], element_data[0]['popover']['data'], dtype)]:
+            ref = value[BUFFER_REF]
+            assert ref['offset'] % 8 == 0 and ref['dtype'] == expected_dtype
+            out = np.frombuffer(buffer, dtype=serializers._packed_dtypes[ref['dtype']], count=ref['length'],
+                                offset=ref['offset']).reshape(ref['shape'])
+            assert np.allclose(out, expected) and (expected_dtype == dtype or np.array_equal(out, expected))
+
+    def test_iterencode(self):
+        element_data = [{'ids': ['id_1'], 'x': 1.5, 'none': None, 'nan': float('nan'), 'scalar': np.float64(2),
+                         'conditions': [{'color_data': np.random.rand(4, 3, 2), 'data': np.arange(3),
+                                         'tabular_data': [np.array([['a', 'b']]), np.array([['c', 'd']])],
+                                         'empty': np.zeros((0, 2)), 'description': 'Temp \u00b0C'}]}]
+        assert ''.join(serializers.iterencode(element_data)) == serializers.dumps(element_data)
+
+    def test_strict_json(self):
+        obj = {'NaN': [np.nan, np.inf, -np.inf, 1.5], 'description': 'Infinity "NaN" \\"NaN'}
+        text = serializers.strict_json(serializers.dumps(obj))
+        out = json.loads(text, parse_constant=lambda name: pytest.fail('Non-finite literal %s' % name))
+        assert out == {'NaN': [None, np.inf, -np.inf, 1.5], 'description': obj['description']}
+        assert serializers.strict_json('[1.0, 2.0]') == '[1.0, 2.0]'
+
+    def test_binary_payload_iter_base64(self):
+        packer = BinaryPayload('float32')
+        packer.pack([{'data': np.random.rand(7), 'color_data': np.random.rand(5, 3), 'level_data': [1, 2, 3, 4, 5]}])
+        assert packer.n_bytes > 0 and ''.join(packer.iter_base64()) == packer.dumps()
+
+    def test_dedupe_arrays(self):
+        data = np.random.rand(20)
+        colors = np.array(['#FFFFFF'] * 10)
+        element_data = [{'conditions': [{'data': data, 'color_scale': colors, 'small': np.arange(3.)},
+                                        {'data': data.copy(), 'info': [data]}]},
+                         {'conditions': [{'color_scale': colors.copy(), 'small': np.arange(3.),
+                                          'unique': np.random.rand(20)}]}]
+        deduped = serializers.dedupe_arrays(element_data)
+
+        store = deduped[serializers.STORE_KEY]
+        assert len(store) == 2
+        elements = deduped['elements']
+        refs = [elements[0]['conditions'][0]['data'], elements[0]['conditions'][1]['data'],
+                elements[0]['conditions'][1]['info'][0]]
+        assert all(store[ref[serializers.ARRAY_REF]] is data for ref in refs)
+        assert np.array_equal(store[elements[1]['conditions'][0]['color_scale'][serializers.ARRAY_REF]], colors)
+        # Small and unique arrays are left in place
+        assert isinstance(elements[1]['conditions'][0]['small'], np.ndarray)
+        assert isinstance(elements[1]['conditions'][0]['unique'], np.ndarray)
+
+        unique_data = element_data[1:]
+        assert serializers.dedupe_arrays(unique_data) is unique_data
+
+    def test_quantize_colors(self):
+        color_scale = ['#000000', '#444444', '#888888', '#CCCCCC', '#FFFFFF']
+        color_data = np.random.rand(100) * 12 - 1
+        color_data[5] = np.nan
+        element_data = [{'conditions': [{'color_data': color_data, 'color_scale': color_scale,
+                                         'color_levels': [0, 10]}]},
+                        {'report_id': 'report-1',
+                         'conditions': [{'color_data': color_data, 'color_scale': color_scale,
+                                         'color_levels': [0, 10], 'report': True}]}]
+        quantized = serializers.quantize_colors(element_data)
+
+        # Same bins as the d3 quantile scale of the browser
+        indices = quantized[0]['conditions'][0]['color_data']
+        thresholds = [2, 4, 6, 8]
+        expected = [bisect.bisect_right(thresholds, d) for d in color_data]
+        assert indices.dtype == np.uint8
+        assert indices[5] == 255
+        assert np.array_equal(np.delete(indices, 5), np.delete(expected, 5))
+        assert quantized[0]['conditions'][0]['color_indices']
+        # Reported color data is kept
+        assert quantized[1]['conditions'][0]['color_data'] is color_data
+
+        ref = BinaryPayload().pack(quantized[:1])[0]['conditions'][0]['color_data']
+        assert ref[BUFFER_REF]['dtype'] == 'uint8'
+
+    @pytest.mark.parametrize("tolerance", [0, 0.25])
+    def test_delta_encode(self, tolerance):
+        frames = np.cumsum(np.random.rand(60, 5, 4) * (np.random.rand(60, 5, 4) < 0.1), axis=0)
+        frames[10:12, 0, 0] = np.nan
+        encoded = serializers.delta_encode(frames, 20, tolerance)
+        assert encoded['keyframes'].shape == (3, 5, 4)
+        assert len(encoded['delta_values']) < frames.size / 5
+
+        # Rebuild frames the way the browser does
+        offsets = np.concatenate([[0], np.cumsum(encoded['delta_counts'])])
+        decoded = np.empty(frames.shape)
+        for i in range(len(frames)):
+            flat = encoded['keyframes'][i // 20].ravel().copy() if i % 20 == 0 else decoded[i - 1].ravel().copy()
+            flat[encoded['delta_indices'][offsets[i]:offsets[i + 1]]] = \
+                encoded['delta_values'][offsets[i]:offsets[i + 1]]
+            decoded[i] = flat.reshape(frames.shape[1:])
+        assert np.array_equal(np.isnan(decoded), np.isnan(frames))
+        assert np.nanmax(np.abs(decoded - frames)) <= tolerance
+
+    @pytest.mark.parametrize("tolerance", [0, 0.25])
+    def test_delta_encode_file_backed(self, tmpdir, monkeypatch, tolerance):
+        frames = np.zeros((200, 50, 100), dtype='float32')
+        frames[:, 0, :10] = np.random.rand(200, 10)
+        npy_path = str(tmpdir.join('frames.npy'))
+        np.save(npy_path, frames)
+        monkeypatch.setattr(array_sources, '_block_bytes', 1 << 15)
+
+        # Frames are encoded a block at a time - far less memory than the 4 MB file (8 MB as float64) is used
+        source = array_sources.open_array(npy_path)
+        tracemalloc.start()
+        try:
+            encoded = serializers.delta_encode(source, 50, tolerance)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < frames.nbytes / 4
+
+        expected = serializers.delta_encode(frames.astype('float64'), 50, tolerance)
+        assert encoded.keys() == expected.keys()
+        for k, v in expected.items():
+            assert np.array_equal(encoded[k], v)
+
+    def test_binary_payload_bad_dtype(self):
+        with pytest.raises(ValueError):
+            BinaryPayload('int8')
+
 
 class TestElements:
     @pytest.fixture(scope='class', params=[cls for cls in Element.__subclasses__()])
@@ -147,6 +368,45 @@ class TestElements:
                         print(error_cls, condition_type, args_kwargs[0], args_kwargs[1])
                         cls(*cls_args).add_condition(condition_type, *args_kwargs[0], **args_kwargs[1])
 
+    def test_registry(self, monkeypatch):
+        assert Element.create('CELL') is Element.create('cell')
+        with pytest.raises(ValueError):
+            Element.create('not_an_element')
+
+        # Registrations of the test are undone with the patched registry dict
+        registry = Condition._registry
+        monkeypatch.setattr(registry, '_classes', dict(registry._classes))
+
+        # Indirect subclasses are registered on definition
+        class ShadedBackground(Background):
+            pass
+        condition = Condition.create('shadedbackground', 3, [1, 2, 3], ['#FFFFFF'], [0], id='c')
+        assert isinstance(condition, ShadedBackground)
+
+        # Entry point types are loaded on first use
+        monkeypatch.setattr(registry, '_entry_points', {'plugininfo': metadata.EntryPoint(
+            name='PluginInfo', value='ssv.conditions:Info', group='ssv.conditions')})
+        assert 'plugininfo' in registry.names()
+        assert isinstance(Condition.create('PluginInfo', 3, [1, 2, 3]), Info)
+
+    def test_type_check_binding(self):
+        class Checked:
+            @type_check("data.float.1.1&x_len")
+            def __init__(self, x_len, data, description='', **kwargs):
+                self.inputs = x_len, data, description, kwargs
+
+        # Keywords override positional args, missing inputs are None and extra kwargs are checked and forwarded
+        x_len, data, description, kwargs = Checked(2, [1, 2], 'a', description='b', unit='u').inputs
+        assert x_len == 2 and description == 'b' and kwargs == {'unit': 'u'}
+        assert isinstance(data, np.ndarray) and data.dtype == np.float64
+        assert Checked(data=[1, 2]).inputs == (None, [1, 2], '', {})
+        with pytest.raises(TypeError):
+            Checked(2, [1, 2], description=1)
+        with pytest.raises(TypeError):
+            Checked(2, [1, 2], unit=1)
+        with pytest.raises(ValueError):
+            Checked(3, [1, 2])
+
     """
     _condition_test_classes = [cls for cls in Element.__subclasses__() if cls.__name__ not in ['Table', 'ColorScale']]
 
@@ -225,11 +485,459 @@ class TestSSV:
             vis.add_element('cell', 'id_1')
             vis.add_element('heatmap', 'id_1')
 
+    def test_prepare_svg(self):
+        svg = ET.fromstring('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+                            '<g><rect id="rect-1"/><rect id="rect-2"/></g>'
+                            '<g id="group-1"><path id="path-1"/><g><circle id="circle-1"/></g></g></svg>')
+        vis = SSV.create_vis([0, 1], 'x', svg)
+        vis.add_element('cell', 'rect-1')
+        vis.add_element('cell', 'group-1')
+        vis.add_element('cell', ['missing-1', 'rect-2'])
+        vis.add_element('cell', 'missing-2')
+        vis._prepare_svg()
+
+        ns = '{http://www.w3.org/2000/svg}'
+        # Bound element with siblings is wrapped in a g element
+        wrapped = [g for g in vis._svg_root.iter('g') if len(g) == 1 and g[0].get('id') == 'rect-1']
+        assert len(wrapped) == 1
+        # Group id is propagated to all nested supported elements
+        assert vis._svg_root.find(".//%sg[@id='group-1']" % ns) is None
+        assert len(vis._svg_root.findall(".//*[@id='group-1']")) == 2
+        # Missing ids are removed from their elements
+        assert [e.ids for e in vis._elements] == [['rect-1'], ['group-1'], ['rect-2']]
+
+    @pytest.mark.parametrize("payload", ['json', 'binary'])
+    def test_save_visualization(self, tmpdir, payload):
+        vis = SSV.create_vis(*[i[0] for i in self._valid_inputs])
+        element = vis.add_element('heatmap', 'tank-1')
+        element.add_condition('rect', np.random.rand(3, 4, 5), ['#FFFFFF', '#000000'], [0, 1])
+        file_path = str(tmpdir.join('vis.html'))
+        vis.save_visualization(file_path, mode='html', payload=payload)
+
+        # Streamed file matches the rendered string (up to the generated uuid)
+        uuid_re = re.compile('s[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+        with open(file_path) as f:
+            saved = uuid_re.sub('uuid', f.read())
+        assert saved == uuid_re.sub('uuid', vis.render_model(mode='html', payload=payload))
+
+    @pytest.mark.parametrize("decimation", ['uniform', 'lttb', 'minmax'])
+    def test_render_max_frames(self, decimation):
+        vis = SSV.create_vis(list(range(100)), 'x', self._good_svg_path)
+        color_data = np.zeros((100, 4, 5))
+        color_data[37, 1, 2] = 1
+        element = vis.add_element('heatmap', 'tank-1')
+        element.add_condition('rect', color_data, ['#FFFFFF', '#000000'], [0, 1])
+        html = vis.render_model(mode='html', max_frames=10, decimation=decimation)
+
+        element_data = json.loads(re.search('var element_data = (.*);', html).group(1))
+        x_series = json.loads(re.search('var x_series = (.*);', html).group(1))
+        assert len(x_series) <= 10 and x_series[0] == 0 and x_series[-1] == 99
+        assert len(element_data[0]['conditions'][0]['color_data']) == len(x_series)
+        if decimation != 'uniform':
+            assert 37 in x_series
+
+        with pytest.raises(ValueError):
+            vis.render_model(max_frames=1)
+        with pytest.raises(ValueError):
+            vis.render_model(max_frames=10, decimation='random')
+
+    @pytest.mark.parametrize("decimation", ['uniform', 'lttb', 'minmax'])
+    @pytest.mark.parametrize("max_frames", [2, 3, 4, 5])
+    def test_select_frames_max_frames(self, decimation, max_frames):
+        signals = [np.random.rand(50), np.random.rand(50, 3)]
+        frames = decimation_lib.select_frames(50, signals, max_frames, decimation)
+        assert 2 <= len(frames) <= max_frames
+        assert frames[0] == 0 and frames[-1] == 49 and np.all(np.diff(frames) > 0)
+
+    def test_render_delta_encoding(self):
+        vis = SSV.create_vis(list(range(100)), 'x', self._good_svg_path)
+        element = vis.add_element('heatmap', 'tank-1')
+        element.add_condition('rect', np.zeros((100, 4, 5)), ['#FFFFFF', '#000000'], [0, 1], encoding='delta',
+                              keyframe_interval=30)
+        html = vis.render_model(mode='html', max_frames=50)
+
+        condition = json.loads(re.search('var element_data = (.*);', html).group(1))[0]['conditions'][0]
+        assert 'keyframe_interval' not in condition and 'delta_tolerance' not in condition
+        assert condition['color_data']['encoding'] == 'delta'
+        assert condition['color_data']['shape'] == [50, 4, 5]
+        assert len(condition['color_data']['keyframes']) == 2
+        assert condition['color_data']['delta_values'] == []
+
+        # Quantized keyframes hold palette indices
+        html = vis.render_model(mode='html', max_frames=50, quantize_colors=True)
+        condition = json.loads(re.search('var element_data = (.*);', html).group(1))[0]['conditions'][0]
+        assert condition['color_indices']
+        assert np.array_equal(condition['color_data']['keyframes'], np.zeros((2, 4, 5)))
+        with pytest.raises(TypeError):
+            vis.render_model(quantize_colors='yes')
+
+        with pytest.raises(ValueError):
+            element.add_condition('rect', np.zeros((100, 4, 5)), ['#FFFFFF'], [0], encoding='sparse')
+
+    def test_render_dedupe_arrays(self):
+        vis = SSV.create_vis(list(range(20)), 'x', self._good_svg_path)
+        color_scale = ['#FFFFFF', '#CCCCCC', '#999999', '#666666', '#333333', '#000000']
+        data = np.random.rand(20)
+        vis.add_element('cell', 'tank-1').add_condition('background', data, color_scale)
+        vis.add_element('cell', 'path4160').add_condition('background', data, color_scale)
+
+        # Element data keeps its plain list shape unless shared arrays are requested
+        element_data = json.loads(re.search('var element_data = (.*);', vis.render_model(mode='html')).group(1))
+        assert isinstance(element_data, list) and len(element_data) == 2
+
+        html = vis.render_model(mode='html', dedupe_arrays=True)
+        element_data = json.loads(re.search('var element_data = (.*);', html).group(1))
+        assert element_data[serializers.STORE_KEY] and len(element_data['elements']) == 2
+        with pytest.raises(TypeError):
+            vis.render_model(dedupe_arrays='yes')
+
+    def test_x_series_shared(self):
+        vis = SSV.create_vis([0, 0.5, 1e5], 'x', self._good_svg_path)
+        element = vis.add_element('heatmap', 'tank-1')
+        element.add_popover('sparkline', [1, 2, 3])
+        assert element.x_series is vis._x_series and element.popover.x_series is vis._x_series
+        assert vis._x_series.dtype == np.float64 and not vis._x_series.flags.writeable
+
+        element_data = element.dump_attr()
+        assert 'x_series' not in element_data and 'x_series' not in element_data['popover']
+        html = vis.render_model(mode='html')
+        assert json.loads(re.search('var x_series = (.*);', html).group(1)) == [0, 0.5, 1e5]
+
+    def test_append(self):
+        x = np.arange(30.)
+        level, color, background = np.random.rand(30), np.random.rand(30), np.random.rand(30)
+
+        def build(n):
+            vis = SSV.create_vis(x[:n], 'x', self._good_svg_path)
+            tank = vis.add_element('cell', 'tank-1')
+            tank.add_condition('dynamiclevel', level[:n], color[:n], ['#FFFFFF', '#000000'], [0, 1], 0, 1,
+                               color_data_description='Temperature')
+            valve = vis.add_element('cell', 'relief-valve')
+            valve.add_condition('background', background[:n], ['#FFFFFF', '#000000'], [0, 1])
+            valve.add_popover('sparkline', background[:n])
+            return vis
+
+        def rendered(vis, **kwargs):
+            html = vis.render_model(mode='html', **kwargs)
+            return [re.search('\n    var %s = (.*);' % name, html).group(1) for name in ['x_series', 'element_data']]
+
+        vis = build(10)
+        rendered(vis)
+        for start in range(10, 30, 5):
+            vis.append(x[start:start + 5], {
+                'tank-1_0': {'level_data': level[start:start + 5], 'color_data': color[start:start + 5]},
+                'relief-valve_0': background[start:start + 5],
+                'relief-valve_popover': background[start:start + 5]})
+            assert rendered(vis) == rendered(build(start + 5))
+
+        # The info condition and additional info share the level data buffer, which grows by doubling
+        tank = vis._elements[0]
+        assert tank.conditions[0].data is tank.conditions[1].level_data is tank.conditions[1].additional_info['data']
+        assert tank.conditions[1].level_data.buffer.capacity == 32
+        assert vis._elements[1].x_series is vis._x_series and not vis._x_series.flags.writeable
+        # Encoded rows are cached
+        assert len(vis._x_series.buffer.json_segments) == 4
+        assert rendered(vis, payload='binary') == rendered(build(30), payload='binary')
+
+        rows = {'tank-1_0': {'level_data': [0.5], 'color_data': [0.5]}, 'relief-valve_0': [0.5],
+                'relief-valve_popover': [0.5]}
+        for bad_rows in [dict(rows, **{'relief-valve_0': [0.5, 0.5]}), dict(rows, **{'tank-1_0': [0.5]}),
+                         {k: v for k, v in rows.items() if k != 'relief-valve_0'}, dict(rows, missing=[0.5])]:
+            with pytest.raises((TypeError, ValueError)):
+                vis.append([30], bad_rows)
+        assert len(vis._x_series) == 30
+
+    def test_append_file_backed(self, tmpdir):
+        npy_path = str(tmpdir.join('level.npy'))
+        np.save(npy_path, np.random.rand(10))
+        vis = SSV.create_vis(np.arange(10.), 'x', self._good_svg_path)
+        tank = vis.add_element('cell', 'tank-1')
+        tank.add_condition('background', np.random.rand(10), ['#FFFFFF', '#000000'], [0, 1])
+        tank.add_condition('info', npy_path, description='Level')
+
+        # File-backed data is not loaded to grow it - the append is refused before any data is changed
+        with pytest.raises(ValueError, match='read from a file'):
+            vis.append([10], {'tank-1_0': [0.5], 'tank-1_1': [0.5]})
+        assert len(vis._x_series) == 10 and len(tank.conditions[0].color_data) == 10
+        assert array_sources.is_file_backed(tank.conditions[1].data)
+
+    def test_live_server(self):
+        vis = SSV.create_vis(np.arange(10.), 'x', self._good_svg_path)
+        vis.add_element('cell', 'tank-1').add_condition('background', np.random.rand(10), ['#FFFFFF', '#000000'],
+                                                        [0, 1])
+        with pytest.raises(ValueError):
+            vis.serve(max_frames=5)
+
+        with vis.serve() as server:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                html = response.read().decode('utf-8')
+            assert json.loads(re.search('\n    var live = (.*);', html).group(1)) == {'url': 'events', 'n_frames': 10}
+
+            server.append([10, 11], {'tank-1_0': [0.25, np.nan]})
+            events = urllib.request.urlopen(server.url + 'events?from=10', timeout=5)
+            assert events.readline() == b'id: 12\n'
+            # Frames are strict JSON for JSON.parse, with NaN written as null
+            frames = json.loads(events.readline().decode('utf-8')[len('data: '):],
+                                parse_constant=lambda name: pytest.fail('Non-finite literal %s' % name))
+            assert frames['x_series'] == [10, 11]
+            color_data = frames['element_data'][0]['conditions'][0]['color_data']
+            assert color_data == [0.25, None]
+            assert list(frames['element_data'][0]['conditions'][0]) == ['color_data']
+
+            # Frames appended later are pushed to open streams
+            events.readline()
+            server.append([12], {'tank-1_0': [0.5]})
+            assert events.readline() == b'id: 13\n'
+            assert json.loads(events.readline().decode('utf-8')[len('data: '):])['x_series'] == [12]
+            events.close()
+
+    @pytest.mark.parametrize("compress", ['gzip', 'deflate'])
+    def test_render_compressed(self, compress):
+        vis = SSV.create_vis(list(range(20)), 'x', self._good_svg_path)
+        data = np.random.rand(20)
+        data[[3, 4]] = [np.nan, np.inf]
+        vis.add_element('cell', 'tank-1').add_condition('background', data, ['#FFFFFF', '#000000'], [0, 1])
+        wbits = {'gzip': 31, 'deflate': 15}[compress]
+
+        for payload in ['json', 'binary']:
+            html = vis.render_model(mode='html', payload=payload, compress=compress)
+            assert ''.join(vis._generate_model(mode='html', payload=payload, compress=compress)).count('-compressed"') \
+                == html.count('-compressed"') == 2
+            assert 'var element_data = null;' in html and 'var svg_overlays = null;' in html
+            assert 'format: "%s"' % compress in html
+
+            blob = re.search('-compressed">(.*)</script>', html).group(1)
+            document = json.loads(zlib.decompress(base64.b64decode(blob), wbits),
+                                  parse_constant=lambda name: pytest.fail('Non-finite literal %s' % name))
+            assert document['svg_overlays'] == resources.get_svg_overlays()
+            color_data = document['element_data'][0]['conditions'][0]['color_data']
+            if payload == 'binary':
+                ref = color_data[BUFFER_REF]
+                buffer = zlib.decompress(base64.b64decode(re.search('-payload">(.*)</script>', html).group(1)), wbits)
+                color_data = np.frombuffer(buffer, dtype='<f8', count=ref['length'], offset=ref['offset'])
+            assert np.allclose(np.array(color_data, dtype='float'), data, equal_nan=True)
+
+        with pytest.raises(ValueError):
+            vis.render_model(compress='bz2')
+
+    def test_render_chunks(self, tmpdir):
+        vis = SSV.create_vis(list(range(25)), 'x', self._good_svg_path)
+        data = np.arange(25, dtype='float')
+        vis.add_element('cell', 'relief-valve').add_condition('background', data, ['#FFFFFF', '#000000'], [0, 24])
+        vis.add_element('heatmap', 'tank-1').add_condition('rect', np.random.rand(25, 4, 5), ['#FFFFFF', '#000000'],
+                                                           [0, 1], encoding='delta', keyframe_interval=4)
+        file_path = str(tmpdir.join('vis.html'))
+        vis.save_visualization(file_path, chunk_size=10)
+
+        with open(file_path) as f:
+            html = f.read()
+        assert 'var element_data = null;' in html
+        chunk_info = json.loads(re.search('\n    var chunks = (.*);', html).group(1))
+        assert chunk_info['size'] == 10 and chunk_info['n_frames'] == 25
+        assert chunk_info['urls'] == ['vis_data/chunk_%05d.js' % k for k in range(3)]
+
+        uuid = re.search('\n    var uuid = "(.*)";', html).group(1)
+        for k, url in enumerate(chunk_info['urls']):
+            with open(str(tmpdir.join(url))) as f:
+                match = re.match(r'ssv\.add_chunk\("(.*)", (\d+), (.*), null\);', f.read())
+            assert match.group(1) == uuid and int(match.group(2)) == k
+            element_data = json.loads(match.group(3))
+            assert element_data[0]['conditions'][0]['color_data'] == data[k * 10:(k + 1) * 10].tolist()
+            # Every chunk starts with its own keyframe
+            assert element_data[1]['conditions'][0]['color_data']['shape'] == [min(10, 25 - k * 10), 4, 5]
+            assert len(element_data[1]['conditions'][0]['color_data']['keyframes']) == (3 if k < 2 else 2)
+
+        html = vis.render_model(payload='binary', chunk_size=20, chunk_dir=str(tmpdir.join('binary')),
+                                chunk_url='https://cdn.test/data/')
+        assert 'https://cdn.test/data/chunk_00001.js' in html
+        with open(str(tmpdir.join('binary', 'chunk_00001.js'))) as f:
+            assert serializers.BUFFER_REF in f.read()
+
+        with pytest.raises(ValueError):
+            vis.render_model(chunk_size=0, chunk_dir=str(tmpdir))
+        with pytest.raises(TypeError):
+            vis.render_model(chunk_size=10)
+
+    @pytest.mark.parametrize("payload", ['json', 'binary'])
+    def test_render_profile(self, tmpdir, payload):
+        vis = SSV.create_vis(list(range(20)), 'x', self._good_svg_path)
+        vis.add_element('cell', 'tank-1').add_condition('zonaly', np.random.rand(20, 10), np.random.rand(20, 10),
+                                                        ['#FFFFFF', '#000000'], [0, 1])
+        vis.add_element('cell', 'path4160').add_condition('background', np.random.rand(20), ['#FFFFFF', '#000000'],
+                                                        [0, 1])
+        html, stats = vis.render_model(mode='html', payload=payload, profile=True)
+
+        uuid_re = re.compile('s[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+        assert uuid_re.sub('uuid', html) == uuid_re.sub('uuid', vis.render_model(mode='html', payload=payload))
+        assert list(stats.phases)[:2] == ['prepare_svg', 'dump_attr'] and 'template' in stats.phases
+        assert ('binary_encode' in stats.phases) == (payload == 'binary')
+        assert stats.total_time_s == pytest.approx(sum(m['time_s'] for m in stats.phases.values()))
+        assert stats.page_bytes == len(html)
+        assert [e['conditions'] for e in stats.elements] == [['ZonalY'], ['Background']]
+        assert stats.elements[0]['payload_bytes'] > 5 * stats.elements[1]['payload_bytes'] > 0
+        if payload == 'json':
+            # Element sizes are the UTF-8 sizes of their text in the embedded element data (a list of elements)
+            element_json = re.search('var element_data = (.*);', html).group(1)
+            assert sum(e['payload_bytes'] for e in stats.elements) + 4 == len(element_json.encode('utf-8'))
+        assert 'cell tank-1 (ZonalY)' in stats.report()
+        json.dumps(stats.to_dict())
+
+        file_path = str(tmpdir.join('vis.html'))
+        stats = vis.save_visualization(file_path, payload=payload, compress='gzip', profile=True)
+        assert {'write', 'compress'} <= set(stats.phases)
+        assert stats.page_bytes == os.path.getsize(file_path)
+        assert vis.save_visualization(file_path) is None
+
+        with pytest.raises(TypeError):
+            vis.render_model(profile='yes')
+
+    @pytest.mark.parametrize("payload", ['json', 'binary'])
+    def test_render_file_backed(self, tmpdir, monkeypatch, payload):
+        color_data = np.random.rand(30, 4, 5)
+        data = np.random.rand(30)
+        np.savez(str(tmpdir.join('results.npz')), heat=color_data, temp=data)
+        # Small blocks, so arrays are read, encoded and packed in several blocks
+        monkeypatch.setattr(array_sources, '_block_bytes', 200)
+        monkeypatch.setattr(serializers, '_encode_block_bytes', 100)
+
+        uuid_re = re.compile('s[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+        html = []
+        for heat, temp in [(color_data, data), (array_sources.open_array(str(tmpdir.join('results.npz')), 'heat'),
+                                                 array_sources.open_array(str(tmpdir.join('results.npz')), 'temp'))]:
+            vis = SSV.create_vis(list(range(30)), 'x', self._good_svg_path)
+            vis.add_element('heatmap', 'tank-1').add_condition('rect', heat, ['#FFFFFF', '#000000'], [0, 1])
+            vis.add_element('cell', 'path4160').add_condition('dynamiclevel', temp, temp, ['#FFFFFF', '#000000'],
+                                                              [0, 1], 0, 1)
+            html.append([uuid_re.sub('uuid', vis.render_model(mode='html', payload=payload, **kwargs))
+                         for kwargs in [{}, {'max_frames': 10}, {'quantize_colors': True}]])
+
+        assert html[0] == html[1]
+
+    def test_render_perf_overlay(self):
+        vis = SSV.create_vis(*[i[0] for i in self._valid_inputs])
+        html = vis.render_model(mode='html', perf_overlay=True)
+        assert 'class="ssv-perf-hud"' in html and 'var perf_overlay = true;' in html
+
+        html = vis.render_model(mode='html')
+        assert 'class="ssv-perf-hud"' not in html and 'var perf_overlay = false;' in html
+        with pytest.raises(TypeError):
+            vis.render_model(perf_overlay=1)
+
+    def test_template_cache(self, tmpdir):
+        assert resources.get_template('templates/ssv.html') is resources.get_template('templates/ssv.html')
+        assert resources.get_static_assets() is resources.get_static_assets()
+
+        try:
+            resources.set_bytecode_cache(str(tmpdir))
+            SSV.create_vis(*[i[0] for i in self._valid_inputs]).render_model()
+            assert len(tmpdir.listdir()) > 0
+        finally:
+            resources.set_bytecode_cache(None)
+
+    def test_external_assets(self, tmpdir):
+        vis = SSV.create_vis(*[i[0] for i in self._valid_inputs])
+        file_path = str(tmpdir.join('vis.html'))
+        vis.save_visualization(file_path, assets='external')
+
+        asset_dir = tmpdir.join('ssv_assets')
+        asset_names = resources.get_static_asset_names()
+        assert sorted(f.basename for f in asset_dir.listdir()) == sorted(asset_names.values())
+        with open(file_path) as f:
+            html = f.read()
+        for name, file_name in asset_names.items():
+            assert 'ssv_assets/' + file_name in html
+            assert resources.get_static_assets()[name] not in html
+
+        # Re-exports must not copy existing assets again
+        mtimes = {f.basename: f.mtime() for f in asset_dir.listdir()}
+        os.utime(str(asset_dir.join(asset_names['ssv_js'])), (0, 0))
+        vis.save_visualization(file_path, assets='external')
+        assert asset_dir.join(asset_names['ssv_js']).mtime() == 0
+        assert len(asset_dir.listdir()) == len(mtimes)
+
+        html = vis.render_model(assets='external', asset_dir=str(asset_dir), asset_url='https://cdn.test/ssv/')
+        assert 'https://cdn.test/ssv/' + asset_names['ssv_js'] in html
+
+        with pytest.raises(ValueError):
+            vis.render_model(assets='cdn')
+        with pytest.raises(TypeError):
+            vis.render_model(assets='external')
+
+    def test_render_dashboard(self):
+        vis_list = [SSV.create_vis([1, 2, 3], 'x', self._good_svg_path, 'Panel %d' % i) for i in range(3)]
+        html = SSV.render_dashboard(vis_list, layout=2)
+
+        assert html.count('class="ssv-panel"') == 3
+        assert html.count('ssv-dashboard-row') == 2
+        assert html.count(resources.get_static_assets()['ssv_js']) == 1
+        assert html.count(resources.get_svg_overlays_json()) == 1
+        assert html.count(serializers.dumps(vis_list[0]._x_series)) == 1
+
+        html = SSV.render_dashboard(vis_list, layout=[[2], [0, 1]])
+        assert html.index('Panel 2') < html.index('Panel 0')
+
+        # Compressed panels reference the shared overlays instead of compressing their own copy
+        html = SSV.render_dashboard(vis_list, compress='gzip')
+        assert html.count(resources.get_svg_overlays_json()) == 1
+        assert html.count('var svg_overlays = ssv_shared_') == 3
+        blocks = re.findall('id="[^"]*-compressed">([^<]*)<', html)
+        assert len(blocks) == 3
+        for block in blocks:
+            payload = json.loads(zlib.decompress(base64.b64decode(block), 16 + zlib.MAX_WBITS))
+            assert payload['svg_overlays'] is None
+
+        with pytest.raises(ValueError):
+            SSV.render_dashboard(vis_list, layout=[[0, 0]])
+        with pytest.raises(ValueError):
+            SSV.render_dashboard(vis_list, layout=[[3]])
+        with pytest.raises(TypeError):
+            SSV.render_dashboard(vis_list, layout='grid')
+        with pytest.raises(TypeError):
+            SSV.render_dashboard([])
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_render_many(self, tmpdir, monkeypatch, workers):
+        from ssv import batch
+        monkeypatch.setattr(batch, '_shared_memory_min_bytes', 0)
+
+        with open('tests/data/data.json') as f:
+            data = json.load(f)
+        condition = data['elements'][0]['conditions'][0]
+        condition['color_data'] = np.array(condition['color_data'], dtype='float')
+        bad_data = json.loads(serializers.dumps(data))
+        bad_data['elements'][0]['type'] = 'not_an_element'
+
+        results = SSV.render_many([dict(data, file_name='good'), bad_data], str(tmpdir), workers=workers,
+                                  payload='binary')
+        assert results[0]['error'] is None
+        assert results[0]['file_path'] == os.path.join(str(tmpdir), 'good.html')
+        assert os.path.isfile(results[0]['file_path'])
+        assert results[0]['build_time'] > 0 and results[0]['render_time'] > 0
+        assert results[1]['error'] is not None and results[1]['render_time'] is None
+
+        # Specs are not modified
+        assert isinstance(condition['color_data'], np.ndarray) and 'type' in condition
+
     def test_from_json(self):
         with open('tests/data/data.json') as f:
             data = json.load(f)
         SSV.from_json(data)
 
+    def test_static_bundle(self):
+        # ssv.min.js must be rebuilt ('gulp scripts') with every change of the javascript sources
+        js_dir = os.path.join('ssv', 'static', 'js')
+        source_dir = os.path.join(js_dir, 'source')
+        with open(os.path.join(source_dir, 'ssv_main.template')) as f:
+            prefix, suffix = f.read().split('{{{ type_requirements }}}')
+        with open(os.path.join(source_dir, 'ssv_main.es6')) as f:
+            main = f.read()
+        assert main.startswith(prefix) and main.endswith(suffix)
+
+        with open(os.path.join(js_dir, 'ssv.min.js')) as f:
+            bundle = f.read()
+        modules = [f[:-len('.es6')] for f in os.listdir(source_dir) if f.endswith('.es6') and f != 'ssv_main.es6']
+        assert all('"./%s.js":' % module in bundle for module in modules)
+
 
 class TestSystem:
     def test_build_examples(self):